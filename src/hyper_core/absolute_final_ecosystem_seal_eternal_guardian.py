@@ -3,13 +3,16 @@ import logging
 from typing import Dict, List, Any
 import json
 import os
-from transformers import pipeline  # For eternal AI audits
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: Eternal controls
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For eternal AI audits
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: Eternal controls
 from ultimate_ecosystem_guardian_summary_script import UltimateEcosystemGuardianSummaryScript  # File 15
 from master_control_final_integration_script import MasterControlFinalIntegrationScript  # File 14
 from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  # File 10
 from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalOverseer  # File 12
 import random
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Eternal Guardian: %(message)s')
@@ -18,40 +21,47 @@ class AbsoluteFinalEcosystemSealEternalGuardian:
     def __init__(self, guardian: UltimateEcosystemGuardianSummaryScript):
         self.guardian = guardian
         self.master_control = guardian.master_control
-        self.eternal_rgb = RGBLED(red=11, green=12, blue=13)  # RGB: White=sealed, Red=breach, Blue=eternal
-        self.seal_button = Button(14)  # Manual eternal seal
-        self.eternal_buzzer = Buzzer(15)
-        self.eternal_auditor = pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")  # For eternal audits
+        self.eternal_rgb = LazyObject(RGBLED, red=11, green=12, blue=13)  # RGB: White=sealed, Red=breach, Blue=eternal
+        self.seal_button = LazyObject(Button, 14)  # Manual eternal seal
+        self.eternal_buzzer = LazyObject(Buzzer, 15)
+        self.eternal_auditor = shared_pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")  # For eternal audits
         self.seal_status = 'Active'  # 'Sealed' or 'Active'
         self.eternal_reports: List[Dict] = []
 
     async def enforce_eternal_seal(self):
         """Enforces the absolute final seal: Stablecoin-Only, Zero-Crime, Founder-Proof."""
-        while self.seal_status == 'Active':
-            # Eternal rejection of tainted PI: exchange, bought, entered, unclear
-            tainted_tests = [
-                {'source': 'exchange', 'amount': 100},
-                {'source': 'bought_exchange', 'amount': 200},
-                {'source': 'entered_exchange', 'amount': 300},
-                {'source': 'unclear_party', 'amount': 400}
-            ]
-            for test in tainted_tests:
-                tx = {'id': f'eternal_test_{test["source"]}', **test}
-                if not await self.master_control.modules['purity_enforcer'].enforce_pi_purity(tx):
-                    logging.warning(f"Eternal seal enforced: Rejected {test['source']} PI.")
-            # Eternal zero-crime audit
-            crime_sim = random.random()
-            if crime_sim < 0.01:  # 1% chance simulation
-                logging.critical("Eternal crime vulnerability detected. Sealing ecosystem.")
-                await self._eternal_seal("Zero-crime breach.")
-                break
-            # Eternal founder accountability
-            if self.master_control.modules['purity_enforcer'].founder_watchlist['violations']:
-                logging.critical("Eternal founder manipulation/exploitation/cheat detected. Freezing and returning all PI to supply.")
-                await self.master_control.modules['purity_enforcer']._freeze_and_return_all_pi()
-                await self._eternal_seal("Founder violation.")
-                break
-            await asyncio.sleep(1200)  # Eternal check every 20 minutes
+        job = default_scheduler.every('AbsoluteFinalEcosystemSealEternalGuardian.enforce_eternal_seal', 1200, self._seal_check)  # Eternal check every 20 minutes
+        await job.finished.wait()
+
+    async def _seal_check(self) -> bool:
+        """One eternal seal check; returns False once the ecosystem is sealed."""
+        if self.seal_status != 'Active':
+            return False
+        # Eternal rejection of tainted PI: exchange, bought, entered, unclear
+        tainted_tests = [
+            {'source': 'exchange', 'amount': 100},
+            {'source': 'bought_exchange', 'amount': 200},
+            {'source': 'entered_exchange', 'amount': 300},
+            {'source': 'unclear_party', 'amount': 400}
+        ]
+        tainted_txs = [{'id': f'eternal_test_{test["source"]}', **test} for test in tainted_tests]
+        verdicts = await self.master_control.modules['purity_enforcer'].enforce_pi_purity_batch(tainted_txs)
+        for test, pure in zip(tainted_tests, verdicts):
+            if not pure:
+                logging.warning(f"Eternal seal enforced: Rejected {test['source']} PI.")
+        # Eternal zero-crime audit
+        crime_sim = random.random()
+        if crime_sim < 0.01:  # 1% chance simulation
+            logging.critical("Eternal crime vulnerability detected. Sealing ecosystem.")
+            await self._eternal_seal("Zero-crime breach.")
+            return False
+        # Eternal founder accountability
+        if self.master_control.modules['purity_enforcer'].founder_watchlist['violations']:
+            logging.critical("Eternal founder manipulation/exploitation/cheat detected. Freezing and returning all PI to supply.")
+            await self.master_control.modules['purity_enforcer']._freeze_and_return_all_pi()
+            await self._eternal_seal("Founder violation.")
+            return False
+        return True
 
     async def _eternal_seal(self, reason: str):
         """Initiates absolute eternal seal: Permanent isolation."""
@@ -76,7 +86,7 @@ class AbsoluteFinalEcosystemSealEternalGuardian:
         }
         # AI audit
         audit_text = f"Audit: {report}"
-        sentiment = self.eternal_auditor(audit_text)[0]['label']
+        sentiment = (await infer(self.eternal_auditor, audit_text))[0]['label']
         report['eternal_verdict'] = 'Secure' if sentiment == 'POSITIVE' else 'Sealed'
         self.eternal_reports.append(report)
         with open('./eternal_seal_hologram.json', 'w') as f:
@@ -87,17 +97,13 @@ class AbsoluteFinalEcosystemSealEternalGuardian:
 
     async def manual_eternal_seal(self):
         """Handles manual eternal seal via button."""
-        while True:
-            if self.seal_button.is_pressed:
-                logging.info("Manual eternal seal triggered.")
-                await self._eternal_seal("Manual eternal seal.")
-                break
-            await asyncio.sleep(1)
+        logging.info("Manual eternal seal triggered.")
+        await self._eternal_seal("Manual eternal seal.")
 
     async def run_eternal_guardian(self):
         """Main eternal guardian loop."""
         asyncio.create_task(self.enforce_eternal_seal())
-        asyncio.create_task(self.manual_eternal_seal())
+        default_scheduler.on_press('AbsoluteFinalEcosystemSealEternalGuardian.manual_eternal_seal', self.seal_button, self.manual_eternal_seal, once=True)
         # Initial audit
         await self.generate_eternal_audit_report()
         logging.info("Absolute Final Ecosystem Seal and Eternal Guardian active. Ecosystem is eternally secure.")
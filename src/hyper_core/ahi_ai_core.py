@@ -2,12 +2,14 @@ import asyncio
 import logging
 from typing import Dict, List, Any
 import numpy as np
-import tensorflow as tf  # For neural network-based filtering
-from qiskit import QuantumCircuit, Aer, execute  # Quantum-inspired optimization for hyper-speed decisions
-from stellar_sdk import Server, Keypair  # For Stellar monitoring (to be halted if non-compliant)
-from pi_network_sdk import PiNetworkClient  # Hypothetical Pi Network SDK for compliance checks
-from gpiozero import LED  # For Pi hardware integration (e.g., status LEDs)
+from lazy_loader import LazyObject, lazy_from, lazy_import
+tf = lazy_import('tensorflow')  # For neural network-based filtering
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum-inspired optimization for hyper-speed decisions
+Server, Keypair = lazy_from('stellar_sdk', 'Server', 'Keypair')  # For Stellar monitoring (to be halted if non-compliant)
+PiNetworkClient = lazy_from('pi_network_sdk', 'PiNetworkClient')  # Hypothetical Pi Network SDK for compliance checks
+LED = lazy_from('gpiozero', 'LED')  # For Pi hardware integration (e.g., status LEDs)
 import hashlib  # For secure hashing in PI transactions
+from task_scheduler import default_scheduler
 
 # Configure logging for hyper-traceability
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - AHI AI: %(message)s')
@@ -16,14 +18,14 @@ class AutonomousHyperIntelligenceAI:
     def __init__(self, pi_client: PiNetworkClient, stellar_server: Server, pi_led_pin: int = 17):
         self.pi_client = pi_client  # Pi Network client for compliance
         self.stellar_server = stellar_server  # Stellar server (to be monitored/halted)
-        self.pi_led = LED(pi_led_pin)  # Pi LED for status (green: compliant, red: halted)
-        self.compliance_model = self._build_neural_filter()  # Neural net for input/output filtering
-        self.quantum_optimizer = self._init_quantum_circuit()  # Quantum circuit for optimization
+        self.pi_led = LazyObject(LED, pi_led_pin)  # Pi LED for status (green: compliant, red: halted)
+        self.compliance_model = LazyObject(self._build_neural_filter)  # Neural net for input/output filtering
+        self.quantum_optimizer = LazyObject(self._init_quantum_circuit)  # Quantum circuit for optimization
         self.stellar_halted = False  # Flag for Stellar halt status
         self.pi_stable_value = 314159  # Fixed PI value in cents (dual system)
         self.allowed_sources = ['mining', 'contribution_rewards', 'p2p']  # Exclusive PI sources
 
-    def _build_neural_filter(self) -> tf.keras.Model:
+    def _build_neural_filter(self) -> 'tf.keras.Model':
         """Builds a hyper-advanced neural network for real-time filtering of volatile technologies."""
         model = tf.keras.Sequential([
             tf.keras.layers.Dense(512, activation='relu', input_shape=(100,)),  # Input: encoded transaction data
@@ -105,24 +107,28 @@ class AutonomousHyperIntelligenceAI:
 
     async def monitor_pi_compliance(self):
         """Autonomously monitors Pi Network compliance and halts Stellar if breached."""
-        while True:
-            try:
-                # Check Pi Network status
-                pi_status = await self.pi_client.get_network_status()
-                if not pi_status['compliant']:  # Hypothetical compliance flag
-                    logging.critical("Pi Network non-compliance detected. Halting Stellar support.")
-                    self._halt_stellar()
-                    self.pi_led.off()  # Red status
+        job = default_scheduler.every('AutonomousHyperIntelligenceAI.monitor_pi_compliance', 60, self._check_pi_compliance)  # Real-time monitoring every minute
+        await job.finished.wait()
+
+    async def _check_pi_compliance(self) -> bool:
+        """One compliance check; returns False once Stellar support has been halted for good."""
+        try:
+            # Check Pi Network status
+            pi_status = await self.pi_client.get_network_status()
+            if not pi_status['compliant']:  # Hypothetical compliance flag
+                logging.critical("Pi Network non-compliance detected. Halting Stellar support.")
+                self._halt_stellar()
+                self.pi_led.off()  # Red status
+                return False
+            # Check for volatile infiltrations
+            transactions = await self.pi_client.get_recent_transactions()
+            for tx in transactions:
+                if not await self.filter_transaction(tx):
+                    self._halt_stellar()  # Halt on violation
                     break
-                # Check for volatile infiltrations
-                transactions = await self.pi_client.get_recent_transactions()
-                for tx in transactions:
-                    if not await self.filter_transaction(tx):
-                        self._halt_stellar()  # Halt on violation
-                        break
-                await asyncio.sleep(60)  # Real-time monitoring every minute
-            except Exception as e:
-                logging.error(f"AHI AI monitoring error: {e}")
+        except Exception as e:
+            logging.error(f"AHI AI monitoring error: {e}")  # Retried on the next tick instead of spinning
+        return True
 
     def _halt_stellar(self):
         """Autonomously halts all Stellar support."""
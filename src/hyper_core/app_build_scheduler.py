@@ -0,0 +1,201 @@
+import argparse
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+from lazy_loader import LazyObject, lazy_from
+from_env = lazy_from('docker', 'from_env')  # Docker client for containerization on Pi
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - App Build Scheduler: %(message)s')
+
+def context_hash(files: Dict[str, str]) -> str:
+    """SHA-256 of a build context (file name -> content), independent of dict order."""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        data = files[name].encode('utf-8')
+        digest.update(name.encode('utf-8') + b'\0' + str(len(data)).encode('ascii') + b'\0' + data)
+    return digest.hexdigest()
+
+class ContainerClient(ABC):
+    """Blocking container operations used by the app builder; the scheduler calls them on worker threads."""
+
+    @abstractmethod
+    def image_exists(self, tag: str) -> bool:
+        """Whether an image tagged tag exists locally."""
+
+    @abstractmethod
+    def build(self, path: str, tag: str) -> str:
+        """Builds the context directory at path as tag; returns the image id."""
+
+    @abstractmethod
+    def run(self, tag: str, ports: Dict[str, int]) -> str:
+        """Starts a detached container; returns its id."""
+
+    @abstractmethod
+    def status(self, container_id: str) -> str:
+        """Container state, e.g. 'running' or 'exited'."""
+
+    @abstractmethod
+    def stop(self, container_id: str):
+        """Stops the container."""
+
+class DockerContainerClient(ContainerClient):
+    def __init__(self):
+        self.docker = LazyObject(from_env)  # Connects on first use
+
+    def image_exists(self, tag: str) -> bool:
+        try:
+            self.docker.images.get(tag)
+            return True
+        except Exception:  # docker.errors.ImageNotFound, without importing docker here
+            return False
+
+    def build(self, path: str, tag: str) -> str:
+        image, logs = self.docker.images.build(path=path, tag=tag)
+        return image.id
+
+    def run(self, tag: str, ports: Dict[str, int]) -> str:
+        return self.docker.containers.run(tag, detach=True, ports=ports).id
+
+    def status(self, container_id: str) -> str:
+        return self.docker.containers.get(container_id).status
+
+    def stop(self, container_id: str):
+        self.docker.containers.get(container_id).stop()
+
+class FakeContainerClient(ContainerClient):
+    """In-process container client: builds take build_seconds of (GIL-free) sleep, containers are dict entries."""
+
+    def __init__(self, build_seconds: float = 0.0, fail_tags: Optional[List[str]] = None):
+        self.build_seconds = build_seconds
+        self.fail_tags = set(fail_tags or [])  # Tags whose build raises
+        self.images: Dict[str, str] = {}  # Tag -> image id
+        self.containers: Dict[str, Dict[str, Any]] = {}  # Container id -> {'tag', 'status'}
+        self.builds: List[str] = []  # Tags in build order
+        self.max_concurrent_builds = 0
+        self._active_builds = 0
+        self._lock = threading.Lock()
+
+    def image_exists(self, tag: str) -> bool:
+        return tag in self.images
+
+    def build(self, path: str, tag: str) -> str:
+        with self._lock:
+            self._active_builds += 1
+            self.max_concurrent_builds = max(self.max_concurrent_builds, self._active_builds)
+        try:
+            time.sleep(self.build_seconds)
+            if tag in self.fail_tags:
+                raise RuntimeError(f"build of {tag} failed")
+            with open(os.path.join(path, 'Dockerfile')) as f:  # Like docker, a context without a Dockerfile fails
+                image_id = 'sha256:' + hashlib.sha256(f.read().encode('utf-8') + tag.encode('utf-8')).hexdigest()
+            with self._lock:
+                self.images[tag] = image_id
+                self.builds.append(tag)
+            return image_id
+        finally:
+            with self._lock:
+                self._active_builds -= 1
+
+    def run(self, tag: str, ports: Dict[str, int]) -> str:
+        if tag not in self.images:
+            raise RuntimeError(f"image {tag} not found")
+        container_id = f'fake_{len(self.containers)}'
+        self.containers[container_id] = {'tag': tag, 'status': 'running'}
+        return container_id
+
+    def status(self, container_id: str) -> str:
+        return self.containers[container_id]['status']
+
+    def stop(self, container_id: str):
+        self.containers[container_id]['status'] = 'exited'
+
+class BuildScheduler:
+    """Builds app images on a bounded worker pool, skipping contexts that were already built.
+
+    Images are tagged <app>:<first 12 hex digits of the context hash>, so an unchanged context maps to a tag that
+    already exists and no build (or context write) happens; builds of the same app are serialized, different apps
+    build concurrently up to max_workers.
+    """
+
+    def __init__(self, client: ContainerClient, apps_dir: str = './apps', max_workers: int = 2):
+        self.client = client
+        self.apps_dir = apps_dir
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='app-build')
+        self._app_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.stats: Dict[str, float] = {'builds': 0, 'skipped': 0, 'failures': 0, 'build_seconds': 0.0}
+
+    @staticmethod
+    def image_tag(app_name: str, digest: str) -> str:
+        return f'{app_name}:{digest[:12]}'
+
+    def _write_and_build(self, app_name: str, files: Dict[str, str], tag: str) -> str:
+        path = os.path.join(self.apps_dir, app_name)
+        os.makedirs(path, exist_ok=True)
+        for name, content in files.items():
+            with open(os.path.join(path, name), 'w') as f:
+                f.write(content)
+        return self.client.build(path, tag)
+
+    async def build(self, app_name: str, files: Dict[str, str]) -> Dict[str, Any]:
+        """Builds app_name from files unless that exact context was built before; raises if the build fails."""
+        digest = context_hash(files)
+        tag = self.image_tag(app_name, digest)
+        loop = asyncio.get_running_loop()
+        async with self._app_locks[app_name]:
+            if await loop.run_in_executor(self._executor, self.client.image_exists, tag):
+                self.stats['skipped'] += 1
+                logging.info(f"App {app_name} unchanged ({tag}); build skipped.")
+                return {'app': app_name, 'context_hash': digest, 'image': tag, 'built': False, 'seconds': 0.0}
+            start = time.perf_counter()
+            try:
+                await loop.run_in_executor(self._executor, self._write_and_build, app_name, files, tag)
+            except Exception:
+                self.stats['failures'] += 1
+                raise
+            seconds = time.perf_counter() - start
+        self.stats['builds'] += 1
+        self.stats['build_seconds'] += seconds
+        logging.info(f"App {app_name} built as {tag} in {seconds:.2f}s.")
+        return {'app': app_name, 'context_hash': digest, 'image': tag, 'built': True, 'seconds': seconds}
+
+    async def build_many(self, apps: Dict[str, Dict[str, str]]) -> List[Any]:
+        """Builds several apps concurrently; a failed build shows up as its exception in the result list."""
+        return await asyncio.gather(*(self.build(app_name, files) for app_name, files in apps.items()), return_exceptions=True)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+def benchmark_app_builds(apps: int = 8, build_seconds: float = 0.1, max_workers: int = 4) -> Dict[str, float]:
+    """One-at-a-time builds (previous path) vs the pooled scheduler, and a rebuild of unchanged apps, on the fake client."""
+    contexts = {f'app_{i}': {'Dockerfile': 'FROM python:3.9-slim\n', 'app.py': f'print({i})\n'} for i in range(apps)}
+
+    def timed(scheduler: BuildScheduler) -> float:
+        start = time.perf_counter()
+        asyncio.run(scheduler.build_many(contexts))
+        return time.perf_counter() - start
+
+    serial = BuildScheduler(FakeContainerClient(build_seconds), tempfile.mkdtemp(), max_workers=1)
+    serial_s = timed(serial)
+    pooled = BuildScheduler(FakeContainerClient(build_seconds), tempfile.mkdtemp(), max_workers=max_workers)
+    pooled_s = timed(pooled)
+    unchanged_s = timed(pooled)
+    serial.close()
+    pooled.close()
+    return {'apps': apps, 'serial_s': serial_s, 'pooled_s': pooled_s, 'unchanged_s': unchanged_s, 'skipped': pooled.stats['skipped']}
+
+# Usage: python app_build_scheduler.py [--apps N] [--workers N]; compares serial, pooled and unchanged rebuilds
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pooled, content-hashed app builds on the in-process container client.")
+    parser.add_argument('--apps', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    print(benchmark_app_builds(args.apps, max_workers=args.workers))
@@ -4,26 +4,39 @@ from typing import Dict, List, Any, Optional
 import subprocess
 import os
 import json
-from transformers import pipeline  # For generative AI app code creation
-from docker import from_env  # Docker client for containerization on Pi
-from kubernetes import client, config  # For orchestration (if scaled; optional for Pi)
-from gpiozero import LED, Buzzer  # Pi hardware: LED for build status, Buzzer for alerts
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For generative AI app code creation
+from inference_queue import infer
+client, config = lazy_from('kubernetes', 'client', 'config')  # For orchestration (if scaled; optional for Pi)
+LED, Buzzer = lazy_from('gpiozero', 'LED', 'Buzzer')  # Pi hardware: LED for build status, Buzzer for alerts
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
+from app_build_scheduler import BuildScheduler, ContainerClient, DockerContainerClient  # Content-hashed, pooled image builds
 import random
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - App Builder: %(message)s')
 
+DOCKERFILE_TEMPLATE = """
+FROM python:3.9-slim
+WORKDIR /app
+COPY . /app
+RUN pip install -r requirements.txt
+CMD ["python", "app.py"]
+"""
+
 class AutonomousAppBuilder:
-    def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager, led_pin: int = 19, buzzer_pin: int = 24):
+    def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager, led_pin: int = 19, buzzer_pin: int = 24,
+                 container_client: Optional[ContainerClient] = None, apps_dir: str = './apps', max_parallel_builds: int = 2):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
-        self.docker_client = from_env()  # Docker for Pi-based containers
-        self.code_generator = pipeline("text-generation", model="gpt2")  # Generative AI for app code (hyper-simplified; use advanced models like GPT-4 in prod)
+        self.containers = container_client or DockerContainerClient()  # Docker for Pi-based containers; FakeContainerClient offline
+        self.build_scheduler = BuildScheduler(self.containers, apps_dir, max_parallel_builds)  # Unchanged contexts skip the build
+        self.code_generator = shared_pipeline("text-generation", model="gpt2")  # Generative AI for app code (hyper-simplified; use advanced models like GPT-4 in prod)
         self.apps: Dict[str, Dict] = self._load_apps()
-        self.pi_led = LED(led_pin)  # Blue: building, Green: deployed, Red: failed
-        self.alert_buzzer = Buzzer(buzzer_pin)  # Buzz on failures or halts
+        self.pi_led = LazyObject(LED, led_pin)  # Blue: building, Green: deployed, Red: failed
+        self.alert_buzzer = LazyObject(Buzzer, buzzer_pin)  # Buzz on failures or halts
         self.reinforcement_model = self._build_reinforcement_learner()  # For self-healing and optimization
 
     def _load_apps(self) -> Dict[str, Dict]:
@@ -50,7 +63,7 @@ class AutonomousAppBuilder:
             return None
         # Enforce PI-exclusive: All apps must use PI for transactions
         prompt = f"Generate Python code for a Pi app: {app_spec['description']}. Must use PI Coin exclusively for payments. Integrate with PI Manager. No gambling features."
-        generated_code = self.code_generator(prompt, max_length=500, num_return_sequences=1)[0]['generated_text']
+        generated_code = (await infer(self.code_generator, prompt, max_length=500, num_return_sequences=1))[0]['generated_text']
         # Hyper-enhance: Add PI imports and compliance checks
         enhanced_code = self._enhance_code_with_pi(generated_code)
         return enhanced_code
@@ -62,27 +75,22 @@ class AutonomousAppBuilder:
         return pi_imports + code + compliance_check
 
     async def build_and_deploy_app(self, app_name: str, app_code: str) -> bool:
-        """Builds and deploys the app in a Docker container on Pi."""
+        """Builds and deploys the app in a Docker container on Pi; an unchanged, running app is left as it is."""
         self.pi_led.blink(on_time=0.2, off_time=0.2)  # Blue: building
-        # Create Dockerfile dynamically
-        dockerfile_content = f"""
-FROM python:3.9-slim
-WORKDIR /app
-COPY . /app
-RUN pip install -r requirements.txt
-CMD ["python", "app.py"]
-"""
-        os.makedirs(f'./apps/{app_name}', exist_ok=True)
-        with open(f'./apps/{app_name}/Dockerfile', 'w') as f:
-            f.write(dockerfile_content)
-        with open(f'./apps/{app_name}/app.py', 'w') as f:
-            f.write(app_code)
-        # Build Docker image
+        build_context = {'Dockerfile': DOCKERFILE_TEMPLATE, 'app.py': app_code}
+        loop = asyncio.get_running_loop()
         try:
-            image, logs = self.docker_client.images.build(path=f'./apps/{app_name}', tag=f'{app_name}:latest')
+            # Build Docker image (skipped when this exact context was built before)
+            build = await self.build_scheduler.build(app_name, build_context)
+            deployed = self.apps.get(app_name, {})
+            if deployed.get('image') == build['image'] and await self._container_running(deployed.get('container_id')):
+                self.pi_led.on()  # Green: success
+                logging.info(f"App {app_name} unchanged and running; deployment skipped.")
+                return True
             # Deploy container
-            container = self.docker_client.containers.run(f'{app_name}:latest', detach=True, ports={'5000/tcp': 5000})
-            self.apps[app_name] = {'container_id': container.id, 'status': 'deployed', 'code': app_code}
+            container_id = await loop.run_in_executor(None, self.containers.run, build['image'], {'5000/tcp': 5000})
+            self.apps[app_name] = {'container_id': container_id, 'status': 'deployed', 'code': app_code,
+                                   'image': build['image'], 'context_hash': build['context_hash']}
             self._save_apps()
             self.pi_led.on()  # Green: success
             logging.info(f"App {app_name} deployed successfully.")
@@ -97,34 +105,48 @@ CMD ["python", "app.py"]
             self.reinforcement_model['deploy_fail'] -= 0.1
             return False
 
+    async def build_and_deploy_apps(self, apps: Dict[str, str]) -> Dict[str, bool]:
+        """Builds and deploys several apps (name -> code) concurrently; the scheduler bounds parallel builds."""
+        results = await asyncio.gather(*(self.build_and_deploy_app(app_name, app_code) for app_name, app_code in apps.items()))
+        return dict(zip(apps, results))
+
+    async def _container_running(self, container_id: Optional[str]) -> bool:
+        if not container_id:
+            return False
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, self.containers.status, container_id) == 'running'
+        except Exception:
+            return False
+
     async def monitor_and_manage_apps(self):
         """Autonomously monitors and manages deployed apps, scaling or healing as needed."""
-        while True:
-            for app_name, app_data in self.apps.items():
-                try:
-                    container = self.docker_client.containers.get(app_data['container_id'])
-                    if container.status != 'running':
-                        logging.warning(f"App {app_name} not running. Self-healing...")
-                        # RL decision: Retry or rebuild
-                        if random.random() < 0.8:  # Based on RL rewards
-                            await self.build_and_deploy_app(app_name, app_data.get('code', ''))
-                        else:
-                            logging.info(f"Scaling app {app_name}...")  # Simulate scaling
-                except Exception as e:
-                    logging.error(f"Error monitoring app {app_name}: {e}")
-                # Check Pi compliance
-                if self.ahi_ai.stellar_halted:  # From File 1
-                    logging.critical("Pi compliance breached. Halting all apps.")
-                    self._halt_all_apps()
-                    break
-            await asyncio.sleep(300)  # Monitor every 5 minutes
+        job = default_scheduler.every('AutonomousAppBuilder.monitor_and_manage_apps', 300, self._monitor_pass)  # Monitor every 5 minutes
+        await job.finished.wait()
+
+    async def _monitor_pass(self):
+        """One pass over the deployed apps: heals stopped ones and halts all on a compliance breach."""
+        for app_name, app_data in list(self.apps.items()):  # Snapshot: apps may be deployed while a pass awaits
+            try:
+                if not await self._container_running(app_data['container_id']):
+                    logging.warning(f"App {app_name} not running. Self-healing...")
+                    # RL decision: Retry or rebuild
+                    if random.random() < 0.8:  # Based on RL rewards
+                        await self.build_and_deploy_app(app_name, app_data.get('code', ''))
+                    else:
+                        logging.info(f"Scaling app {app_name}...")  # Simulate scaling
+            except Exception as e:
+                logging.error(f"Error monitoring app {app_name}: {e}")
+            # Check Pi compliance
+            if self.ahi_ai.stellar_halted:  # From File 1
+                logging.critical("Pi compliance breached. Halting all apps.")
+                self._halt_all_apps()
+                break
 
     def _halt_all_apps(self):
         """Halts all apps on compliance breach."""
         for app_name, app_data in self.apps.items():
             try:
-                container = self.docker_client.containers.get(app_data['container_id'])
-                container.stop()
+                self.containers.stop(app_data['container_id'])
                 logging.info(f"App {app_name} halted.")
             except Exception as e:
                 logging.error(f"Error halting app {app_name}: {e}")
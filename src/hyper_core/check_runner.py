@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Any, Awaitable, Callable, Optional
+import numpy as np
+from journal import Journal
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Check Runner: %(message)s')
+
+class _CpuTimed:
+    """Awaitable wrapper that adds up the CPU time spent inside one coroutine's own steps.
+
+    Concurrent checks share the event loop thread, so process CPU time cannot be split between them; timing each
+    send/throw into the coroutine can. Work the check hands to executor threads is not included.
+    """
+
+    def __init__(self, coro: Awaitable):
+        self.coro = coro
+        self.cpu_seconds = 0.0
+
+    def __await__(self):
+        inner = self.coro.__await__()
+        step, message = inner.send, None
+        while True:
+            start = time.thread_time()
+            try:
+                future = step(message)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.cpu_seconds += time.thread_time() - start
+            try:
+                message = yield future
+                step = inner.send
+            except BaseException as e:  # Cancellation and errors go to the check, which may handle them
+                step, message = inner.throw, e
+
+class CheckRunner:
+    """Runs independent async checks concurrently, each under a timeout, timing wall and CPU seconds per check.
+
+    Durations go to an append-only journal; a rolling window per check (rebuilt from the journal at startup) gives
+    the historical p95, and a check whose wall time exceeds it by more than regression_factor is flagged.
+    """
+
+    def __init__(self, history_dir: str, timeout: float = 30.0, max_concurrency: int = 8, window: int = 100,
+                 min_history: int = 5, regression_factor: float = 1.2):
+        self.timeout = timeout  # Per-check limit (seconds)
+        self.max_concurrency = max_concurrency
+        self.min_history = min_history  # Runs needed before a check can be flagged
+        self.regression_factor = regression_factor  # Slack over p95 before flagging, against scheduler noise
+        self.history = Journal(history_dir)
+        self._durations: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window))  # Check -> recent wall seconds
+        for record in self.history:
+            self._durations[record['test']].append(record['wall_seconds'])
+
+    def p95(self, name: str) -> Optional[float]:
+        durations = self._durations.get(name)
+        if not durations or len(durations) < self.min_history:
+            return None
+        return float(np.percentile(np.fromiter(durations, dtype=np.float64), 95))
+
+    async def _run_one(self, name: str, check: Callable[[], Awaitable[Dict[str, Any]]], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        async with semaphore:
+            timed = _CpuTimed(check())
+            result: Dict[str, Any] = {'test': name, 'status': 'failed', 'timed_out': False}
+            start = time.perf_counter()
+            try:
+                result.update(await asyncio.wait_for(timed, self.timeout))
+            except asyncio.TimeoutError:
+                result.update({'timed_out': True, 'error': f"timed out after {self.timeout}s"})
+            except Exception as e:
+                result['error'] = str(e)
+            result['wall_seconds'] = time.perf_counter() - start
+            result['cpu_seconds'] = timed.cpu_seconds
+        return result
+
+    async def run(self, checks: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Runs every check (name -> coroutine function returning a result dict); results come back in input order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(*(self._run_one(name, check, semaphore) for name, check in checks.items()))
+        timestamp = time.time()
+        for result in results:
+            p95 = self.p95(result['test'])  # Baseline excludes this run
+            result['p95_seconds'] = p95
+            result['regressed'] = p95 is not None and result['wall_seconds'] > p95 * self.regression_factor
+            if result['regressed']:
+                logging.warning(f"Check {result['test']} took {result['wall_seconds']:.3f}s, over its p95 of {p95:.3f}s.")
+            if not result['timed_out']:  # A timeout says nothing about latency; keep it out of the baseline
+                self._durations[result['test']].append(result['wall_seconds'])
+                self.history.append({'timestamp': timestamp, 'test': result['test'], 'status': result['status'],
+                                     'wall_seconds': result['wall_seconds'], 'cpu_seconds': result['cpu_seconds']})
+        return results
+
+    def close(self):
+        self.history.close()
+
+def benchmark_check_runner(checks: int = 10, seconds: float = 0.05) -> Dict[str, float]:
+    """Sequential awaits (previous loop) vs the concurrent runner, for checks that mostly wait on I/O."""
+    async def check() -> Dict[str, Any]:
+        await asyncio.sleep(seconds)
+        return {'status': 'passed'}
+
+    async def sequential() -> float:
+        start = time.perf_counter()
+        for _ in range(checks):
+            await check()
+        return time.perf_counter() - start
+
+    runner = CheckRunner(tempfile.mkdtemp())
+
+    async def concurrent() -> float:
+        start = time.perf_counter()
+        await runner.run({f'check_{i}': check for i in range(checks)})
+        return time.perf_counter() - start
+
+    sequential_s, concurrent_s = asyncio.run(sequential()), asyncio.run(concurrent())
+    runner.close()
+    return {'checks': checks, 'sequential_s': sequential_s, 'concurrent_s': concurrent_s}
+
+# Usage: python check_runner.py [--checks N]; compares sequential checks with the concurrent runner
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the concurrent check runner against sequential awaits.")
+    parser.add_argument('--checks', type=int, default=10)
+    args = parser.parse_args()
+    print(benchmark_check_runner(args.checks))
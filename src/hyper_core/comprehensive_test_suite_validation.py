@@ -5,9 +5,12 @@ import json
 import os
 import random
 import unittest
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for test validation
-from transformers import pipeline  # AI for test predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for test status, Buzzer for alerts, Button for test trigger
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for test validation
+from model_registry import shared_pipeline  # AI for test predictions
+from journal import Journal
+from check_runner import CheckRunner  # Concurrent checks with timeouts, timings and p95 regression flags
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for test status, Buzzer for alerts, Button for test trigger
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
@@ -25,13 +28,15 @@ from ultimate_pi_mainnet_activation_eternal_stability import UltimatePiMainnetAc
 from final_pi_mainnet_supremacy_global_domination import FinalPiMainnetSupremacyGlobalDomination  # File 22
 from infinite_pi_ecosystem_expansion_universal_integration import InfinitePiEcosystemExpansionUniversalIntegration  # File 23
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Test Suite: %(message)s')
 
 class ComprehensiveTestSuiteValidation:
     def __init__(self, core: UltimateIntegrationCore,
-                 rgb_led_pins: tuple = (5, 6, 7), alert_buzzer_pin: int = 8, trigger_button_pin: int = 9):
+                 rgb_led_pins: tuple = (5, 6, 7), alert_buzzer_pin: int = 8, trigger_button_pin: int = 9,
+                 journal_dir: str = './journals', test_timeout: float = 30.0, max_concurrency: int = 8):
         self.core = core
         self.ahi_ai = core.ahi_ai
         self.pi_manager = core.pi_manager
@@ -48,12 +53,13 @@ class ComprehensiveTestSuiteValidation:
         self.eternal_activation = core.modules.get('eternal_activation')
         self.supremacy_module = core.modules.get('supremacy_module')
         self.infinite_expansion = core.modules.get('infinite_expansion')
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=passed, Blue=running, Red=failed
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.trigger_button = Button(trigger_button_pin)  # Manual test trigger
-        self.quantum_test_circuit = self._init_quantum_test()
-        self.test_results: List[Dict] = []
-        self.test_ai = pipeline("text-generation", model="gpt2")  # AI for test predictions
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=passed, Blue=running, Red=failed
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.trigger_button = LazyObject(Button, trigger_button_pin)  # Manual test trigger
+        self.quantum_test_circuit = LazyObject(self._init_quantum_test)
+        self.test_results = Journal(os.path.join(journal_dir, 'test_suite_results'), legacy_path='./test_suite_results.json')
+        self.check_runner = CheckRunner(os.path.join(journal_dir, 'test_durations'), timeout=test_timeout, max_concurrency=max_concurrency)
+        self.test_ai = shared_pipeline("text-generation", model="gpt2")  # AI for test predictions
 
     def _init_quantum_test(self) -> QuantumCircuit:
         """Initializes quantum circuit for test validation."""
@@ -80,15 +86,13 @@ class ComprehensiveTestSuiteValidation:
             self._test_supremacy_domination,
             self._test_infinite_expansion
         ]
-        results = []
-        for test in test_cases:
-            try:
-                result = await test()
-                results.append(result)
-                logging.info(f"Test {test.__name__}: {'PASSED' if result['status'] == 'passed' else 'FAILED'}")
-            except Exception as e:
-                results.append({'test': test.__name__, 'status': 'failed', 'error': str(e)})
-                logging.error(f"Test {test.__name__} failed: {e}")
+        # Checks are independent: run concurrently, each under a timeout, timed against its own history
+        results = await self.check_runner.run({test.__name__[len('_test_'):]: test for test in test_cases})
+        for result in results:
+            if result['status'] == 'passed':
+                logging.info(f"Test {result['test']}: PASSED ({result['wall_seconds']:.3f}s wall, {result['cpu_seconds']:.3f}s CPU)")
+            else:
+                logging.error(f"Test {result['test']} failed: {result.get('error', 'assertion')}")
         # Quantum validation of results
         overall_valid = self._run_quantum_test_validation(results)
         if overall_valid > 0.5:
@@ -101,8 +105,6 @@ class ComprehensiveTestSuiteValidation:
             await self.core._trigger_system_rebirth()
         # Log results
         self.test_results.append({'timestamp': asyncio.get_event_loop().time(), 'results': results, 'overall_valid': overall_valid})
-        with open('./test_suite_results.json', 'w') as f:
-            json.dump(self.test_results, f)
 
     async def _test_ahi_ai_anti_gambling(self) -> Dict[str, Any]:
         """Test AHI AI anti-gambling filter."""
@@ -169,12 +171,9 @@ class ComprehensiveTestSuiteValidation:
 
     async def manual_test_trigger(self):
         """Handles manual test trigger."""
-        while True:
-            if self.trigger_button.is_pressed:
-                logging.info("Manual test suite triggered.")
-                await self.run_comprehensive_tests()
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual test suite triggered.")
+        await self.run_comprehensive_tests()
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_test_dashboard(self) -> Dict[str, Any]:
         """Generates holographic test dashboard."""
@@ -183,6 +182,7 @@ class ComprehensiveTestSuiteValidation:
             'overall_status': 'Validated' if self.test_results and self.test_results[-1]['overall_valid'] > 0.5 else 'Failed',
             'purity_verified': self.purity_enforcer.frozen_pi_supply == 0,
             'gambling_free': 'Tested',
+            'latency_regressions': [r['test'] for r in self.test_results[-1]['results'] if r.get('regressed')] if self.test_results else [],
             'mainnet_open': self.mainnet_sync.mainnet_status == 'Open'
         }
         with open('./test_dashboard_hologram.json', 'w') as f:
@@ -192,7 +192,7 @@ class ComprehensiveTestSuiteValidation:
 
     async def run_test_suite(self):
         """Main test suite loop."""
-        asyncio.create_task(self.manual_test_trigger())
+        default_scheduler.on_press('ComprehensiveTestSuiteValidation.manual_test_trigger', self.trigger_button, self.manual_test_trigger)
         # Initial test run
         await self.run_comprehensive_tests()
         # Initial dashboard
@@ -0,0 +1,72 @@
+import logging
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+import numpy as np
+from lazy_loader import lazy_from
+Figure = lazy_from('matplotlib.figure', 'Figure')  # Object-oriented API: safe off the main thread, unlike pyplot
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Dashboard Renderer: %(message)s')
+
+def render_metrics_png(series: Dict[str, np.ndarray], output_path: str, title: str = "Pi Ecosystem Metrics Dashboard"):
+    """Plots every metric series into a PNG for the Pi display."""
+    figure = Figure(figsize=(10, 6))
+    axes = figure.add_subplot()
+    for key, values in series.items():
+        axes.plot(values, label=key)
+    axes.set_title(title)
+    axes.legend()
+    figure.savefig(output_path)
+
+class DashboardRenderer:
+    """Renders on a worker thread at a capped frame rate; requests made while busy are coalesced into the latest one."""
+
+    def __init__(self, output_path: str = './ecosystem_dashboard.png', max_fps: float = 0.2,
+                 render: Callable[[Dict[str, np.ndarray], str], Any] = render_metrics_png):
+        self.output_path = output_path
+        self.min_interval = 1.0 / max_fps  # Seconds between frames
+        self.render = render
+        self._pending: Optional[Dict[str, np.ndarray]] = None
+        self._wakeup = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._last_render = 0.0
+        self.stats: Dict[str, int] = {'requested': 0, 'rendered': 0, 'coalesced': 0, 'failed': 0}
+
+    def request(self, series: Dict[str, np.ndarray]):
+        """Queues a frame; series should be a snapshot (copies), since rendering happens later on another thread."""
+        with self._wakeup:
+            if self._pending is not None:
+                self.stats['coalesced'] += 1  # An unrendered frame is superseded
+            self._pending = series
+            self.stats['requested'] += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='dashboard-renderer', daemon=True)
+                self._worker.start()
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while self._pending is None and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                delay = self._last_render + self.min_interval - time.monotonic()
+                if delay > 0:
+                    self._wakeup.wait(delay)  # Frame cap; newer requests replace the pending frame meanwhile
+                    continue
+                series, self._pending = self._pending, None
+            try:
+                self.render(series, self.output_path)
+                self.stats['rendered'] += 1
+            except Exception as e:
+                self.stats['failed'] += 1
+                logging.error(f"Dashboard render failed: {e}")
+            self._last_render = time.monotonic()
+
+    def close(self):
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
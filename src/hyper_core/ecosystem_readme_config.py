@@ -3,8 +3,10 @@ import logging
 from typing import Dict, List, Any
 import json
 import os
-from transformers import pipeline  # For AI-generated docs
-from gpiozero import Button, LED  # Pi hardware: Button for config reset, LED for update status
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For AI-generated docs
+from inference_queue import infer
+Button, LED = lazy_from('gpiozero', 'Button', 'LED')  # Pi hardware: Button for config reset, LED for update status
 from ultimate_deployment_script import UltimateDeploymentScript  # File 8
 from final_hyper_expansion_module import FinalHyperExpansionModule  # File 7
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
@@ -13,6 +15,7 @@ from hyper_ecosystem_monitor import HyperEcosystemMonitor  # File 4
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - README Config: %(message)s')
@@ -20,10 +23,10 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - README Config: %(m
 class EcosystemREADMEConfig:
     def __init__(self, deployer: UltimateDeploymentScript):
         self.deployer = deployer
-        self.doc_generator = pipeline("text-generation", model="gpt2")  # AI for dynamic docs
+        self.doc_generator = shared_pipeline("text-generation", model="gpt2")  # AI for dynamic docs
         self.config_data: Dict[str, Any] = self._load_config()
-        self.reset_button = Button(21)  # Manual config reset
-        self.update_led = LED(22)  # Green: updated, Red: error
+        self.reset_button = LazyObject(Button, 21)  # Manual config reset
+        self.update_led = LazyObject(LED, 22)  # Green: updated, Red: error
         self.readme_path = './ECOSYSTEM_README.md'
         self.config_path = './ecosystem_config.json'
 
@@ -51,7 +54,7 @@ class EcosystemREADMEConfig:
         compliance = self.deployer.modules['core'].ahi_ai.stellar_halted
         # AI-generate content
         prompt = f"Generate a README for a hyper-tech Pi Ecosystem with {pi_balance} PI balance, {active_apps} apps, {global_nodes} nodes, compliance: {not compliance}."
-        generated = self.doc_generator(prompt, max_length=1000, num_return_sequences=1)[0]['generated_text']
+        generated = (await infer(self.doc_generator, prompt, max_length=1000, num_return_sequences=1))[0]['generated_text']
         readme_content = f"""
 # Hyper-Tech Pi Ecosystem Super App
 
@@ -107,25 +110,25 @@ MIT - PI Exclusive.
 
     async def monitor_and_update(self):
         """Autonomously monitors and updates docs/config."""
-        while True:
-            await self.generate_readme()
-            await self.update_config()
-            await asyncio.sleep(3600)  # Update hourly
+        job = default_scheduler.every('EcosystemREADMEConfig.monitor_and_update', 3600, self._update_docs)  # Update hourly
+        await job.finished.wait()
+
+    async def _update_docs(self):
+        """Regenerates the README and the config."""
+        await self.generate_readme()
+        await self.update_config()
 
     async def manual_reset(self):
         """Handles manual config reset."""
-        while True:
-            if self.reset_button.is_pressed:
-                logging.info("Manual config reset triggered.")
-                self.config_data = self._load_config()  # Reset to defaults
-                await self.update_config()
-                self.update_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual config reset triggered.")
+        self.config_data = self._load_config()  # Reset to defaults
+        await self.update_config()
+        self.update_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def run_config(self):
         """Main config loop."""
         asyncio.create_task(self.monitor_and_update())
-        asyncio.create_task(self.manual_reset())
+        default_scheduler.on_press('EcosystemREADMEConfig.manual_reset', self.reset_button, self.manual_reset)
         logging.info("Ecosystem README and Config active.")
 
 # Usage example (integrate into deployment)
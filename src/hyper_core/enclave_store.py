@@ -0,0 +1,370 @@
+import argparse
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from envelope_crypto import EnvelopeKeyring, EnvelopeSealer, open_envelope  # Segment records are sealed envelopes
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Enclave Store: %(message)s')
+
+# On disk: length-prefixed envelopes; inside each envelope: key length | flags | key | value
+RECORD_LENGTH = struct.Struct('>I')
+RECORD_HEADER = struct.Struct('>HB')
+TOMBSTONE = 1
+SEGMENT_SUFFIX = '.seg'
+
+class _Segment:
+    __slots__ = ('number', 'path', 'size', 'live_bytes', 'sealer', 'reader')
+
+    def __init__(self, number: int, path: str):
+        self.number = number
+        self.path = path
+        self.size = 0  # Bytes written, live or not
+        self.live_bytes = 0  # Bytes of records still referenced by the index
+        self.sealer: Optional[EnvelopeSealer] = None  # Only the active segment seals
+        self.reader = None
+
+class SecureEnclaveStore:
+    """Bounded enclave: recent entries in an in-memory LRU, every entry in encrypted append-only segment files.
+
+    Lookups are O(1) through an in-memory index of (segment, offset, length); segments whose live data falls
+    below `compact_ratio` are rewritten in the background.
+    """
+
+    def __init__(self, directory: str, keyring: EnvelopeKeyring, memory_entries: int = 4096,
+                 segment_bytes: int = 4 * 1024 * 1024, compact_ratio: float = 0.5):
+        self.directory = directory
+        self.keyring = keyring  # Seals new segments with its current key; retired keys still open old ones
+        self.memory_entries = memory_entries  # LRU bound: the resident memory cap
+        self.segment_bytes = segment_bytes  # Active segment is sealed and a new one started past this size
+        self.compact_ratio = compact_ratio
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._memory_bytes = 0
+        self._index: Dict[str, Tuple[int, int, int]] = {}  # key -> (segment, offset, length)
+        self._tombstones: Dict[str, Tuple[int, int, int, int]] = {}  # key -> (segment, offset, length, shadowed segment)
+        self._segments: Dict[int, _Segment] = {}
+        self._active: Optional[_Segment] = None
+        self._writer = None
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._compacting: set = set()
+        self.stats: Dict[str, int] = {'hits': 0, 'disk_reads': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'compactions': 0}
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+        self._start_segment()
+        for segment in list(self._segments.values()):
+            self._maybe_compact(segment)  # Garbage left by a previous run
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{number:08d}{SEGMENT_SUFFIX}")
+
+    def _recover(self):
+        """Rebuilds the index from existing segments (later records win; a torn tail is ignored)."""
+        numbers = sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(self.directory) if name.endswith(SEGMENT_SUFFIX))
+        for number in numbers:
+            segment = self._segments[number] = _Segment(number, self._segment_path(number))
+            with open(segment.path, 'rb') as f:
+                data = f.read()
+            offset = 0
+            while offset + RECORD_LENGTH.size <= len(data):
+                (length,) = RECORD_LENGTH.unpack_from(data, offset)
+                end = offset + RECORD_LENGTH.size + length
+                if end > len(data):
+                    break
+                try:
+                    key, flags, _ = self._decode(data[offset + RECORD_LENGTH.size:end])
+                except Exception as e:
+                    logging.error(f"Stopping recovery of {segment.path} at offset {offset}: {e}")
+                    break
+                shadowed = self._index.get(key)
+                self._unlink(key, compact=False)
+                self._release_tombstone(key)
+                if not flags & TOMBSTONE:
+                    self._index[key] = (number, offset, end - offset)
+                    segment.live_bytes += end - offset
+                elif shadowed is not None:  # Only needed while the put it hides may still be on disk
+                    self._tombstones[key] = (number, offset, end - offset, shadowed[0])
+                    segment.live_bytes += end - offset
+                offset = end
+            segment.size = offset
+        if numbers:
+            logging.info(f"Recovered {len(self._index)} enclave entries from {len(numbers)} segments.")
+
+    def _start_segment(self):
+        """Seals the active segment for writing and opens a new one with a fresh data key."""
+        if self._writer is not None:
+            self._writer.close()
+        number = max(self._segments, default=-1) + 1
+        segment = self._segments[number] = _Segment(number, self._segment_path(number))
+        segment.sealer = EnvelopeSealer(self.keyring.public_key)  # One key agreement per segment
+        self._writer = open(segment.path, 'ab')
+        if self._active is not None:
+            self._active.sealer = None
+            self._maybe_compact(self._active)
+        self._active = segment
+
+    def _encode(self, key: str, value: str, flags: int = 0, sealer: Optional[EnvelopeSealer] = None) -> bytes:
+        raw_key = key.encode()
+        plaintext = RECORD_HEADER.pack(len(raw_key), flags) + raw_key + value.encode()
+        envelope = (sealer or self._active.sealer).seal(plaintext)
+        return RECORD_LENGTH.pack(len(envelope)) + envelope
+
+    def _decode(self, envelope: bytes) -> Tuple[str, int, str]:
+        plaintext = open_envelope(self.keyring, envelope)
+        key_length, flags = RECORD_HEADER.unpack_from(plaintext)
+        start = RECORD_HEADER.size
+        return plaintext[start:start + key_length].decode(), flags, plaintext[start + key_length:].decode()
+
+    def _append(self, record: bytes) -> Tuple[int, int, int]:
+        if self._active.size and self._active.size + len(record) > self.segment_bytes:
+            self._start_segment()
+        segment = self._active
+        location = (segment.number, segment.size, len(record))
+        self._writer.write(record)
+        segment.size += len(record)
+        return location
+
+    def _unlink(self, key: str, compact: bool = True):
+        """Drops a key's current on-disk location from the live-byte accounting."""
+        location = self._index.pop(key, None)
+        if location is not None:
+            segment = self._segments[location[0]]
+            segment.live_bytes -= location[2]
+            if compact and segment is not self._active:
+                self._maybe_compact(segment)
+
+    def _release_tombstone(self, key: str):
+        """Stops counting a key's tombstone as live (a newer put supersedes it, or no older record remains)."""
+        tombstone = self._tombstones.pop(key, None)
+        if tombstone is not None:
+            self._segments[tombstone[0]].live_bytes -= tombstone[2]
+
+    def _tombstone_needed(self, shadowed: int, ignore: Optional[int] = None) -> bool:
+        """A put hidden by a tombstone can only live in its shadowed segment or an older one."""
+        return any(number <= shadowed for number in self._segments if number != ignore)
+
+    def _remember(self, key: str, value: str):
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = value
+        self._memory_bytes += len(value)
+        while len(self._memory) > self.memory_entries:
+            _, evicted = self._memory.popitem(last=False)  # Already on disk: eviction is free
+            self._memory_bytes -= len(evicted)
+            self.stats['evictions'] += 1
+
+    def put(self, key: str, value: str):
+        """Writes through to the active segment and keeps the entry resident."""
+        with self._lock:
+            record = self._encode(key, value)
+            self._unlink(key)
+            self._release_tombstone(key)
+            self._index[key] = location = self._append(record)
+            self._segments[location[0]].live_bytes += location[2]
+            self._remember(key, value)
+            self.stats['writes'] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._memory[key]
+            location = self._index.get(key)
+            if location is None:
+                self.stats['misses'] += 1
+                return default
+            _, _, value = self._decode(self._read(location)[RECORD_LENGTH.size:])
+            self._remember(key, value)
+            self.stats['disk_reads'] += 1
+            return value
+
+    def _read(self, location: Tuple[int, int, int]) -> bytes:
+        number, offset, length = location
+        segment = self._segments[number]
+        if segment is self._active:
+            self._writer.flush()
+        if segment.reader is None:
+            segment.reader = open(segment.path, 'rb')
+        segment.reader.seek(offset)
+        return segment.reader.read(length)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._index:
+                return False
+            record = self._encode(key, '', TOMBSTONE)  # Keeps recovery from resurrecting the key
+            shadowed = self._index[key][0]
+            self._unlink(key)
+            location = self._append(record)
+            self._tombstones[key] = location + (shadowed,)  # Live until no segment can hold the old put
+            self._segments[location[0]].live_bytes += location[2]
+            if key in self._memory:
+                self._memory_bytes -= len(self._memory.pop(key))
+            return True
+
+    def _maybe_compact(self, segment: _Segment):
+        if segment.size and segment.live_bytes / segment.size < self.compact_ratio and segment.number not in self._compacting:
+            self._compacting.add(segment.number)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='enclave-compact')
+            self._executor.submit(self._compact, segment)
+
+    def _compact(self, segment: _Segment):
+        """Copies a sealed segment's live records into the active segment, then deletes its file.
+
+        Live entries are snapshotted under the lock, decrypted and re-sealed without it, and the lock is re-taken
+        only to append the copies and swap the index; entries written or deleted meanwhile keep their newer state.
+        Tombstones are carried forward while an older segment may still hold the put they hide.
+        """
+        try:
+            with self._lock:
+                live = [(key, location) for key, location in self._index.items() if location[0] == segment.number]
+                tombstones = [(key, tombstone) for key, tombstone in self._tombstones.items() if tombstone[0] == segment.number]
+            with open(segment.path, 'rb') as f:  # Sealed: nothing appends to it any more
+                data = f.read()
+            sealer = EnvelopeSealer(self.keyring.public_key)
+            copies = []
+            for key, (_, offset, length) in live:
+                _, _, value = self._decode(data[offset + RECORD_LENGTH.size:offset + length])
+                copies.append((key, (segment.number, offset, length), self._encode(key, value, sealer=sealer)))
+            tombstone_copies = [(key, tombstone, self._encode(key, '', TOMBSTONE, sealer=sealer)) for key, tombstone in tombstones]
+            with self._lock:
+                moved = 0
+                for key, location, record in copies:
+                    if self._index.get(key) != location:
+                        continue  # Overwritten or deleted while re-sealing
+                    self._index[key] = new_location = self._append(record)
+                    self._segments[new_location[0]].live_bytes += new_location[2]
+                    moved += 1
+                for key, tombstone, record in tombstone_copies:
+                    if self._tombstones.get(key) != tombstone:
+                        continue  # Superseded by a newer put
+                    del self._tombstones[key]
+                    if self._tombstone_needed(tombstone[3], ignore=segment.number):
+                        new_location = self._append(record)
+                        self._tombstones[key] = new_location + (tombstone[3],)
+                        self._segments[new_location[0]].live_bytes += new_location[2]
+                self._writer.flush()
+                os.fsync(self._writer.fileno())  # Copies are durable before the original goes away
+                if segment.reader is not None:
+                    segment.reader.close()
+                del self._segments[segment.number]
+                os.remove(segment.path)
+                for key in [key for key, tombstone in self._tombstones.items() if not self._tombstone_needed(tombstone[3])]:
+                    self._release_tombstone(key)  # The put it hid was in the segment just removed
+                self.stats['compactions'] += 1
+                logging.info(f"Compacted segment {segment.number}: moved {moved} live entries.")
+        except Exception as e:
+            logging.error(f"Compacting segment {segment.number} failed: {e}")
+        finally:
+            self._compacting.discard(segment.number)
+
+    def flush(self):
+        with self._lock:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._index)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Every entry, read from memory or disk (cold entries do not displace resident ones)."""
+        for key in self.keys():
+            with self._lock:
+                if key in self._memory:
+                    value = self._memory[key]
+                elif key in self._index:
+                    _, _, value = self._decode(self._read(self._index[key])[RECORD_LENGTH.size:])
+                else:
+                    continue  # Deleted meanwhile
+            yield key, value
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['disk_reads'] + self.stats['misses']
+            return {
+                **self.stats,
+                'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+                'entries': len(self._index),
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'segments': len(self._segments),
+                'disk_bytes': sum(segment.size for segment in self._segments.values()),
+                'live_disk_bytes': sum(segment.live_bytes for segment in self._segments.values())
+            }
+
+    def __setitem__(self, key: str, value: str):
+        self.put(key, value)
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self._index:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __delitem__(self, key: str):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        with self._lock:
+            self.flush()
+            self._writer.close()
+            for segment in self._segments.values():
+                if segment.reader is not None:
+                    segment.reader.close()
+                    segment.reader = None
+
+def benchmark_enclave(transactions: int = 100_000, memory_entries: int = 4096, lookups: int = 10_000) -> Dict[str, Any]:
+    """Resident memory of a dict enclave vs the bounded store, and lookup latency for hot and cold entries."""
+    import random
+    import tracemalloc
+    envelope = os.urandom(180).hex()  # Typical sealed PI transaction
+    tracemalloc.start()
+    plain = {f"tx{i}": envelope[:-8] + f"{i:08x}" for i in range(transactions)}
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del plain
+    directory = tempfile.mkdtemp()
+    tracemalloc.start()
+    store = SecureEnclaveStore(directory, EnvelopeKeyring(), memory_entries=memory_entries)
+    start = time.perf_counter()
+    for i in range(transactions):
+        store.put(f"tx{i}", envelope[:-8] + f"{i:08x}")
+    write_seconds = time.perf_counter() - start
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rng = random.Random(42)
+    results = {'dict_mb': dict_bytes / 1e6, 'store_mb': store_bytes / 1e6, 'put_us': write_seconds / transactions * 1e6}
+    for label, pool in (('hot', range(transactions - memory_entries // 2, transactions)), ('cold', range(transactions // 2))):
+        keys = [f"tx{rng.choice(pool)}" for _ in range(lookups)]
+        start = time.perf_counter()
+        for key in keys:
+            store.get(key)
+        results[f'{label}_get_us'] = (time.perf_counter() - start) / lookups * 1e6
+    results.update(store.metrics())
+    store.close()
+    return results
+
+# Usage: python enclave_store.py [--transactions N] [--memory-entries N]; compares a dict enclave with the bounded store
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the bounded secure enclave store against an in-memory dict.")
+    parser.add_argument('--transactions', type=int, default=100_000)
+    parser.add_argument('--memory-entries', type=int, default=4096)
+    args = parser.parse_args()
+    print(benchmark_enclave(args.transactions, args.memory_entries))
@@ -0,0 +1,155 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import struct
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from lazy_loader import lazy_from
+X25519PrivateKey, X25519PublicKey = lazy_from('cryptography.hazmat.primitives.asymmetric.x25519', 'X25519PrivateKey', 'X25519PublicKey')
+AESGCM = lazy_from('cryptography.hazmat.primitives.ciphers.aead', 'AESGCM')
+HKDF = lazy_from('cryptography.hazmat.primitives.kdf.hkdf', 'HKDF')
+hashes, serialization = lazy_from('cryptography.hazmat.primitives', 'hashes', 'serialization')
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Envelope Crypto: %(message)s')
+
+# Envelope: version | recipient key id | ephemeral X25519 public key | AES-GCM nonce | ciphertext+tag
+ENVELOPE_VERSION = 1
+ENVELOPE_HEADER = struct.Struct('>B8s32s12s')
+HKDF_INFO = b'pi-quantum-security/envelope/v1'
+
+def _raw_public(public_key: Any) -> bytes:
+    return public_key.public_bytes(encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw)
+
+def key_id(public_key: Any) -> bytes:
+    """Short fingerprint identifying which recipient key sealed an envelope."""
+    return hashlib.sha256(_raw_public(public_key)).digest()[:8]
+
+def _derive_data_key(shared_secret: bytes, ephemeral_public: bytes, recipient_public: bytes) -> bytes:
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=ephemeral_public + recipient_public, info=HKDF_INFO).derive(shared_secret)
+
+class EnvelopeKeyring:
+    """Recipient X25519 keys persisted to disk (0600); retired keys are kept so old envelopes stay readable."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._keys: Dict[bytes, Any] = {}
+        self.current_id: Optional[bytes] = None
+        if path and os.path.exists(path):
+            self._load()
+        else:
+            self.rotate()
+
+    def _load(self):
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        for private_hex in data['keys']:
+            private_key = X25519PrivateKey.from_private_bytes(bytes.fromhex(private_hex))
+            self._keys[key_id(private_key.public_key())] = private_key
+        self.current_id = bytes.fromhex(data['current'])
+        logging.info(f"Loaded {len(self._keys)} envelope keys from {self.path}.")
+
+    def _save(self):
+        if not self.path:
+            return
+        raw = [key.private_bytes(encoding=serialization.Encoding.Raw, format=serialization.PrivateFormat.Raw,
+                                 encryption_algorithm=serialization.NoEncryption()).hex() for key in self._keys.values()]
+        tmp_path = self.path + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'current': self.current_id.hex(), 'keys': raw}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def rotate(self) -> bytes:
+        """Issues a new current key (milliseconds, unlike RSA-4096 generation) and persists the keyring."""
+        private_key = X25519PrivateKey.generate()
+        self.current_id = key_id(private_key.public_key())
+        self._keys[self.current_id] = private_key
+        self._save()
+        return self.current_id
+
+    @property
+    def public_key(self) -> Any:
+        return self._keys[self.current_id].public_key()
+
+    def private_key(self, kid: bytes) -> Any:
+        if kid not in self._keys:
+            raise KeyError(f"Unknown envelope key {kid.hex()}")
+        return self._keys[kid]
+
+class EnvelopeSealer:
+    """Seals many payloads for one recipient: the key agreement and data key derivation happen once per sealer."""
+
+    def __init__(self, recipient_public: Any):
+        ephemeral = X25519PrivateKey.generate()
+        self._ephemeral_public = _raw_public(ephemeral.public_key())
+        recipient_raw = _raw_public(recipient_public)
+        self._kid = key_id(recipient_public)
+        self._aead = AESGCM(_derive_data_key(ephemeral.exchange(recipient_public), self._ephemeral_public, recipient_raw))
+
+    def seal(self, plaintext: bytes, associated_data: bytes = b'') -> bytes:
+        nonce = os.urandom(12)  # Random 96-bit nonce per payload under the shared data key
+        header = ENVELOPE_HEADER.pack(ENVELOPE_VERSION, self._kid, self._ephemeral_public, nonce)
+        return header + self._aead.encrypt(nonce, plaintext, header + associated_data)
+
+_data_key_cache: Dict[Tuple[bytes, bytes], Any] = {}  # (key id, ephemeral key) -> AESGCM; batches share one derivation
+
+def open_envelope(keyring: EnvelopeKeyring, envelope: bytes, associated_data: bytes = b'') -> bytes:
+    """Decrypts an envelope; raises on tampering or an unknown key."""
+    version, kid, ephemeral_public, nonce = ENVELOPE_HEADER.unpack_from(envelope)
+    if version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported envelope version {version}")
+    aead = _data_key_cache.get((kid, ephemeral_public))
+    if aead is None:
+        private_key = keyring.private_key(kid)
+        shared = private_key.exchange(X25519PublicKey.from_public_bytes(ephemeral_public))
+        aead = AESGCM(_derive_data_key(shared, ephemeral_public, _raw_public(private_key.public_key())))
+        if len(_data_key_cache) >= 256:
+            _data_key_cache.clear()
+        _data_key_cache[(kid, ephemeral_public)] = aead
+    header = envelope[:ENVELOPE_HEADER.size]
+    return aead.decrypt(nonce, envelope[ENVELOPE_HEADER.size:], header + associated_data)
+
+def benchmark_envelopes(transactions: int = 1000) -> Dict[str, float]:
+    """Per-transaction cost of RSA-4096 OAEP (previous path) vs a sealer per transaction vs one sealer per batch."""
+    rsa, padding = lazy_from('cryptography.hazmat.primitives.asymmetric', 'rsa', 'padding')
+    payloads = [json.dumps({'id': f"tx{i}", 'amount': 100, 'currency': 'PI', 'memo': 'x' * 64}).encode() for i in range(transactions)]
+    start = time.perf_counter()
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=4096)
+    rsa_keygen = time.perf_counter() - start
+    oaep = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+    start = time.perf_counter()
+    for payload in payloads:
+        rsa_key.public_key().encrypt(payload, oaep)
+    rsa_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    keyring = EnvelopeKeyring()
+    x25519_keygen = time.perf_counter() - start
+    start = time.perf_counter()
+    for payload in payloads:
+        EnvelopeSealer(keyring.public_key).seal(payload)
+    single_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    sealer = EnvelopeSealer(keyring.public_key)
+    envelopes = [sealer.seal(payload) for payload in payloads]
+    batch_seconds = time.perf_counter() - start
+    assert open_envelope(keyring, envelopes[-1]) == payloads[-1]
+    return {
+        'rsa4096_keygen_s': rsa_keygen,
+        'x25519_keygen_s': x25519_keygen,
+        'rsa_oaep_us_per_tx': rsa_seconds / transactions * 1e6,
+        'envelope_us_per_tx': single_seconds / transactions * 1e6,
+        'batch_envelope_us_per_tx': batch_seconds / transactions * 1e6,
+        'largest_rsa_payload_bytes': 4096 // 8 - 2 * 32 - 2
+    }
+
+# Usage: python envelope_crypto.py [--transactions N]; compares RSA-OAEP with hybrid envelopes
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark hybrid envelope encryption against RSA-4096 OAEP.")
+    parser.add_argument('--transactions', type=int, default=1000)
+    args = parser.parse_args()
+    print(benchmark_envelopes(args.transactions))
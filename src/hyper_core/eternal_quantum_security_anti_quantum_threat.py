@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for security and threats
-from transformers import pipeline  # AI for threat predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for security status, Buzzer for alerts, Button for threat check
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for security and threats
+from model_registry import shared_pipeline  # AI for threat predictions
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for security status, Buzzer for alerts, Button for threat check
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from quantum_security_layer import QuantumSecurityLayer  # File 5
@@ -15,6 +17,7 @@ from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  #
 from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalOverseer  # File 12
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Eternal Quantum Security: %(message)s')
@@ -29,13 +32,13 @@ class EternalQuantumSecurityAntiQuantumThreat:
         self.purity_enforcer = core.modules.get('purity_enforcer')
         self.governance = core.modules.get('governance')
         self.swarm_hub = core.modules.get('swarm_hub')
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Blue=secure, Green=threat_detected, Red=breach
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.check_button = Button(check_button_pin)  # Manual threat check
-        self.quantum_threat_circuit = self._init_quantum_threat()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Blue=secure, Green=threat_detected, Red=breach
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.check_button = LazyObject(Button, check_button_pin)  # Manual threat check
+        self.quantum_threat_circuit = LazyObject(self._init_quantum_threat)
         self.security_status = 'Secure'  # 'Secure', 'Threat_Detected', 'Breached'
         self.threat_logs: List[Dict] = []
-        self.threat_ai = pipeline("text-generation", model="gpt2")  # AI for threat predictions
+        self.threat_ai = shared_pipeline("text-generation", model="gpt2")  # AI for threat predictions
 
     def _init_quantum_threat(self) -> QuantumCircuit:
         """Initializes quantum circuit for threat detection."""
@@ -108,25 +111,28 @@ class EternalQuantumSecurityAntiQuantumThreat:
 
     async def monitor_quantum_threats(self):
         """Monitors for quantum threats eternally."""
-        while self.security_status != 'Breached':
-            threat_level = self._detect_quantum_threats()
-            if threat_level > 0.5:
-                await self._mitigate_quantum_threat()
-            # AI threat prediction
-            prompt = "Predict quantum threats to Pi Ecosystem security."
-            prediction = self.threat_ai(prompt, max_length=50)[0]['generated_text']
-            logging.info(f"Quantum Threat Prediction: {prediction}")
-            await asyncio.sleep(3600)  # Monitor hourly
+        job = default_scheduler.every('EternalQuantumSecurityAntiQuantumThreat.monitor_quantum_threats', 3600, self._threat_check)  # Monitor hourly
+        await job.finished.wait()
+
+    async def _threat_check(self) -> bool:
+        """One quantum threat check and prediction; returns False once security is breached."""
+        if self.security_status == 'Breached':
+            return False
+        threat_level = self._detect_quantum_threats()
+        if threat_level > 0.5:
+            await self._mitigate_quantum_threat()
+        # AI threat prediction
+        prompt = "Predict quantum threats to Pi Ecosystem security."
+        prediction = (await infer(self.threat_ai, prompt, max_length=50))[0]['generated_text']
+        logging.info(f"Quantum Threat Prediction: {prediction}")
+        return True
 
     async def manual_threat_check(self):
         """Handles manual quantum threat check."""
-        while True:
-            if self.check_button.is_pressed:
-                logging.info("Manual quantum threat check triggered.")
-                threat_level = self._detect_quantum_threats()
-                logging.info(f"Current threat level: {threat_level}")
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual quantum threat check triggered.")
+        threat_level = self._detect_quantum_threats()
+        logging.info(f"Current threat level: {threat_level}")
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_security_dashboard(self) -> Dict[str, Any]:
         """Generates holographic security dashboard."""
@@ -144,7 +150,7 @@ class EternalQuantumSecurityAntiQuantumThreat:
 
     async def run_eternal_security(self):
         """Main eternal security loop."""
-        asyncio.create_task(self.manual_threat_check())
+        default_scheduler.on_press('EternalQuantumSecurityAntiQuantumThreat.manual_threat_check', self.check_button, self.manual_threat_check)
         await self.enforce_eternal_quantum_security()
         if self.security_status != 'Breached':
             asyncio.create_task(self.monitor_quantum_threats())
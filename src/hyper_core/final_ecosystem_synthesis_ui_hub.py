@@ -3,8 +3,10 @@ import logging
 from typing import Dict, List, Any
 import json
 import os
-from transformers import pipeline  # For voice synthesis and UI generation
-from gpiozero import LED, Buzzer, Button, DistanceSensor, RGBLED  # Pi hardware: Full suite for interactive UI
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For voice synthesis and UI generation
+from inference_queue import infer
+LED, Buzzer, Button, DistanceSensor, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'Button', 'DistanceSensor', 'RGBLED')  # Pi hardware: Full suite for interactive UI
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
@@ -18,6 +20,7 @@ from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  #
 from global_pi_oracle_compliance_verifier import GlobalPIOracleComplianceVerifier  # File 11
 from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalOverseer  # File 12
 import random
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Ecosystem Synthesis UI: %(message)s')
@@ -38,12 +41,12 @@ class FinalEcosystemSynthesisUIHub:
         self.oracle = core.modules.get('oracle', None)
         self.governance = core.modules.get('governance', None)
         # Pi hardware for UI
-        self.status_rgb = RGBLED(red=17, green=18, blue=19)  # RGB: Status indicator
-        self.voice_button = Button(20)  # Activate voice UI
-        self.touch_sensor = DistanceSensor(echo=21, trigger=22)  # Proximity for touch
-        self.alert_buzzer = Buzzer(23)
-        self.voice_synthesizer = pipeline("text-to-speech", model="microsoft/speecht5_tts")  # For voice output
-        self.ui_generator = pipeline("text-generation", model="gpt2")  # For dynamic UI text
+        self.status_rgb = LazyObject(RGBLED, red=17, green=18, blue=19)  # RGB: Status indicator
+        self.voice_button = LazyObject(Button, 20)  # Activate voice UI
+        self.touch_sensor = LazyObject(DistanceSensor, echo=21, trigger=22)  # Proximity for touch
+        self.alert_buzzer = LazyObject(Buzzer, 23)
+        self.voice_synthesizer = shared_pipeline("text-to-speech", model="microsoft/speecht5_tts")  # For voice output
+        self.ui_generator = shared_pipeline("text-generation", model="gpt2")  # For dynamic UI text
         self.synthesized_data: Dict[str, Any] = {}
 
     async def synthesize_ecosystem_data(self) -> Dict[str, Any]:
@@ -69,16 +72,13 @@ class FinalEcosystemSynthesisUIHub:
 
     async def voice_ui_interaction(self):
         """Handles voice-based UI interactions."""
-        while True:
-            if self.voice_button.is_pressed:
-                logging.info("Voice UI activated.")
-                # Simulate voice input (in hyper-tech: integrate microphone)
-                command = "Show PI balance"  # Placeholder
-                response = await self._process_voice_command(command)
-                # Synthesize voice output
-                audio = self.voice_synthesizer(response)[0]['audio']  # Hypothetical
-                print(f"Voice Response: {response}")  # Output to Pi speaker
-            await asyncio.sleep(5)
+        logging.info("Voice UI activated.")
+        # Simulate voice input (in hyper-tech: integrate microphone)
+        command = "Show PI balance"  # Placeholder
+        response = await self._process_voice_command(command)
+        # Synthesize voice output
+        audio = (await infer(self.voice_synthesizer, response))[0]['audio']  # Hypothetical
+        print(f"Voice Response: {response}")  # Output to Pi speaker
 
     async def _process_voice_command(self, command: str) -> str:
         """Processes voice commands and generates responses."""
@@ -92,34 +92,41 @@ class FinalEcosystemSynthesisUIHub:
             await self.core._trigger_system_rebirth()
             return "Ecosystem rebirth initiated due to non-compliance."
         else:
-            generated = self.ui_generator(f"Respond to: {command}", max_length=50)[0]['generated_text']
+            generated = (await infer(self.ui_generator, f"Respond to: {command}", max_length=50))[0]['generated_text']
             return generated
 
     async def touch_ui_interaction(self):
         """Handles touch-based UI via proximity sensor."""
-        while True:
-            distance = self.touch_sensor.distance
-            if distance < 0.1:  # Close touch
-                logging.info("Touch UI activated. Displaying synthesis.")
-                synthesis = await self.synthesize_ecosystem_data()
-                print(f"Touch Display: {json.dumps(synthesis, indent=2)}")  # Output to Pi screen
-                self.alert_buzzer.beep(on_time=0.2, off_time=0.2, n=2)
-            await asyncio.sleep(2)
+        job = default_scheduler.every('FinalEcosystemSynthesisUIHub.touch_ui_interaction', 2, self._touch_check)
+        await job.finished.wait()
+
+    async def _touch_check(self):
+        """Shows the synthesis when the proximity sensor reports a touch."""
+        distance = self.touch_sensor.distance
+        if distance < 0.1:  # Close touch
+            logging.info("Touch UI activated. Displaying synthesis.")
+            synthesis = await self.synthesize_ecosystem_data()
+            print(f"Touch Display: {json.dumps(synthesis, indent=2)}")  # Output to Pi screen
+            self.alert_buzzer.beep(on_time=0.2, off_time=0.2, n=2)
 
     async def monitor_ui_and_synthesis(self):
         """Monitors and updates the UI hub autonomously."""
-        while True:
-            await self.synthesize_ecosystem_data()
-            if not self.synthesized_data.get('compliance', True):
-                logging.critical("Non-compliance detected in synthesis. Halting UI.")
-                self.status_rgb.color = (1, 0, 0)  # Red: halt
-                self.alert_buzzer.beep(on_time=1, off_time=0, n=10)
-                break
-            await asyncio.sleep(600)  # Update every 10 minutes
+        job = default_scheduler.every('FinalEcosystemSynthesisUIHub.monitor_ui_and_synthesis', 600, self._synthesis_check)  # Update every 10 minutes
+        await job.finished.wait()
+
+    async def _synthesis_check(self) -> bool:
+        """Refreshes the synthesis; returns False once non-compliance has halted the UI."""
+        await self.synthesize_ecosystem_data()
+        if not self.synthesized_data.get('compliance', True):
+            logging.critical("Non-compliance detected in synthesis. Halting UI.")
+            self.status_rgb.color = (1, 0, 0)  # Red: halt
+            self.alert_buzzer.beep(on_time=1, off_time=0, n=10)
+            return False
+        return True
 
     async def run_ui_hub(self):
         """Main UI hub loop."""
-        asyncio.create_task(self.voice_ui_interaction())
+        default_scheduler.on_press('FinalEcosystemSynthesisUIHub.voice_ui_interaction', self.voice_button, self.voice_ui_interaction)
         asyncio.create_task(self.touch_ui_interaction())
         asyncio.create_task(self.monitor_ui_and_synthesis())
         logging.info("Final Ecosystem Synthesis and User Interface Hub active.")
@@ -1,10 +1,11 @@
 import asyncio
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import json
 import os
-from swarm import Swarm  # Hypothetical swarm intelligence library (hyper-tech: use real swarm AI)
-from gpiozero import LED, Buzzer, RGBLED  # Pi hardware: RGB LED for global status, Buzzer for expansion alerts
+from lazy_loader import LazyObject, lazy_from
+Swarm = lazy_from('swarm', 'Swarm')  # Hypothetical swarm intelligence library (hyper-tech: use real swarm AI)
+LED, Buzzer, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED')  # Pi hardware: RGB LED for global status, Buzzer for expansion alerts
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
@@ -12,17 +13,19 @@ from hyper_ecosystem_monitor import HyperEcosystemMonitor  # File 4
 from quantum_security_layer import QuantumSecurityLayer  # File 5
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
 import random
+from node_registry import NodeRegistry, default_registry  # Columnar node table shared with the swarm and oracle
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Hyper Expansion: %(message)s')
 
 class FinalHyperExpansionModule:
-    def __init__(self, core: UltimateIntegrationCore):
+    def __init__(self, core: UltimateIntegrationCore, registry: Optional[NodeRegistry] = None):
         self.core = core  # Integrates the Ultimate Core (File 6)
-        self.swarm_intelligence = Swarm(nodes=10)  # Simulated swarm for global coordination
-        self.global_nodes: Dict[str, Dict] = {}  # Tracks synced Pi devices worldwide
-        self.rgb_led = RGBLED(red=17, green=18, blue=19)  # RGB: Green=expanding, Red=purge, Blue=rebirth
-        self.expansion_buzzer = Buzzer(20)
+        self.swarm_intelligence = LazyObject(Swarm, nodes=10)  # Simulated swarm for global coordination
+        self.global_nodes = registry if registry is not None else default_registry  # Tracks synced Pi devices worldwide
+        self.rgb_led = LazyObject(RGBLED, red=17, green=18, blue=19)  # RGB: Green=expanding, Red=purge, Blue=rebirth
+        self.expansion_buzzer = LazyObject(Buzzer, 20)
         self.evolution_ai = self._build_evolution_ai()  # For AI-driven ecosystem growth
         self.global_compliance = True
 
@@ -32,36 +35,41 @@ class FinalHyperExpansionModule:
 
     async def global_synchronization(self):
         """Autonomously syncs the ecosystem across global Pi nodes."""
-        while True:
-            # Simulate discovering new nodes (in hyper-tech: use P2P discovery)
-            new_nodes = [f'pi_node_{random.randint(1000, 9999)}' for _ in range(random.randint(1, 5))]
-            for node in new_nodes:
-                self.global_nodes[node] = {'status': 'syncing', 'pi_balance': 0}
-                logging.info(f"Syncing new global node: {node}")
-                # Sync PI data from Manager (File 2)
-                self.global_nodes[node]['pi_balance'] = self.core.pi_manager.get_balance()
-                # Deploy core app via Builder (File 3)
-                spec = {'name': f'global_pi_app_{node}', 'description': 'PI app for global node.'}
-                await self.core.app_builder.create_app_from_spec(spec)
-            # Swarm coordination
-            self.swarm_intelligence.coordinate(self.global_nodes)
-            await asyncio.sleep(3600)  # Sync hourly
+        job = default_scheduler.every('FinalHyperExpansionModule.global_synchronization', 3600, self._sync_new_nodes)  # Sync hourly
+        await job.finished.wait()
+
+    async def _sync_new_nodes(self):
+        """Registers newly discovered nodes, deploys their app and coordinates the swarm."""
+        # Simulate discovering new nodes (in hyper-tech: use P2P discovery)
+        new_nodes = [f'pi_node_{random.randint(1000, 9999)}' for _ in range(random.randint(1, 5))]
+        for node in new_nodes:
+            logging.info(f"Syncing new global node: {node}")
+            # Sync PI data from Manager (File 2)
+            self.global_nodes.add(node, status='syncing', pi_balance=self.core.pi_manager.get_balance())
+            # Deploy core app via Builder (File 3)
+            spec = {'name': f'global_pi_app_{node}', 'description': 'PI app for global node.'}
+            await self.core.app_builder.create_app_from_spec(spec)
+        # Swarm coordination
+        self.swarm_intelligence.coordinate(self.global_nodes)
 
     async def predictive_expansion(self):
         """Uses AI to predict and execute ecosystem expansions."""
-        while True:
-            # Predict based on Monitor metrics (File 4)
-            metrics = self.core.monitor.metrics
-            if len(metrics['pi_transactions']) > 50 and sum(metrics['pi_transactions'][-10:]) > 500:
-                logging.info("Predictive expansion triggered: Scaling globally.")
-                self.rgb_led.color = (0, 1, 0)  # Green: expanding
-                self.expansion_buzzer.beep(on_time=0.5, off_time=0.5, n=3)
-                # Evolve AI
-                self.evolution_ai['generations'] += 1
-                self.evolution_ai['fitness'] *= 1.1
-                # Add new features autonomously
-                await self._add_hyper_feature()
-            await asyncio.sleep(1800)  # Predict every 30 minutes
+        job = default_scheduler.every('FinalHyperExpansionModule.predictive_expansion', 1800, self._predict_expansion)  # Predict every 30 minutes
+        await job.finished.wait()
+
+    async def _predict_expansion(self):
+        """One expansion prediction from the monitor's metrics."""
+        # Predict based on Monitor metrics (File 4)
+        metrics = self.core.monitor.metrics
+        if len(metrics['pi_transactions']) > 50 and sum(metrics['pi_transactions'][-10:]) > 500:
+            logging.info("Predictive expansion triggered: Scaling globally.")
+            self.rgb_led.color = (0, 1, 0)  # Green: expanding
+            self.expansion_buzzer.beep(on_time=0.5, off_time=0.5, n=3)
+            # Evolve AI
+            self.evolution_ai['generations'] += 1
+            self.evolution_ai['fitness'] *= 1.1
+            # Add new features autonomously
+            await self._add_hyper_feature()
 
     async def _add_hyper_feature(self):
         """Autonomously adds hyper-features to the ecosystem."""
@@ -74,15 +82,19 @@ class FinalHyperExpansionModule:
 
     async def global_compliance_monitor(self):
         """Monitors global Pi Network compliance and triggers purges."""
-        while True:
-            # Simulate global check (in hyper-tech: query Pi Network API)
-            compliance = random.random() > 0.05  # 95% compliant
-            if not compliance:
-                logging.critical("Global Pi compliance breached. Initiating ecosystem purge.")
-                self.global_compliance = False
-                self._global_purge_and_rebirth()
-                break
-            await asyncio.sleep(7200)  # Check every 2 hours
+        job = default_scheduler.every('FinalHyperExpansionModule.global_compliance_monitor', 7200, self._check_global_compliance)  # Check every 2 hours
+        await job.finished.wait()
+
+    def _check_global_compliance(self) -> bool:
+        """One global compliance check; returns False once a breach has triggered the purge."""
+        # Simulate global check (in hyper-tech: query Pi Network API)
+        compliance = random.random() > 0.05  # 95% compliant
+        if not compliance:
+            logging.critical("Global Pi compliance breached. Initiating ecosystem purge.")
+            self.global_compliance = False
+            self._global_purge_and_rebirth()
+            return False
+        return True
 
     def _global_purge_and_rebirth(self):
         """Purges and reboots the global ecosystem."""
@@ -101,7 +113,7 @@ class FinalHyperExpansionModule:
         """Generates a global holographic dashboard."""
         dashboard = {
             'total_nodes': len(self.global_nodes),
-            'global_pi_volume': sum(node['pi_balance'] for node in self.global_nodes.values()),
+            'global_pi_volume': self.global_nodes.sum('pi_balance'),  # Maintained on write, no scan
             'evolution_score': self.evolution_ai['fitness'],
             'compliance': self.global_compliance
         }
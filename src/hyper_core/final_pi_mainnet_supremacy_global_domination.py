@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for global domination
-from transformers import pipeline  # AI for conquest predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for domination status, Buzzer for alerts, Button for conquest confirm
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for global domination
+from model_registry import shared_pipeline  # AI for conquest predictions
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for domination status, Buzzer for alerts, Button for conquest confirm
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
@@ -15,6 +17,7 @@ from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalO
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 from ultimate_pi_mainnet_activation_eternal_stability import UltimatePiMainnetActivationEternalStability  # File 21
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Pi Mainnet Supremacy: %(message)s')
@@ -32,13 +35,13 @@ class FinalPiMainnetSupremacyGlobalDomination:
         self.governance = governance
         self.swarm_hub = swarm_hub
         self.eternal_activation = eternal_activation
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Gold=dominated, Green=dominating, Red=threatened
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.confirm_button = Button(confirm_button_pin)  # Manual conquest confirm
-        self.quantum_domination_circuit = self._init_quantum_domination()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Gold=dominated, Green=dominating, Red=threatened
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.confirm_button = LazyObject(Button, confirm_button_pin)  # Manual conquest confirm
+        self.quantum_domination_circuit = LazyObject(self._init_quantum_domination)
         self.domination_status = 'Emerging'  # 'Emerging', 'Dominating', 'Supreme'
         self.conquest_logs: List[Dict] = []
-        self.domination_ai = pipeline("text-generation", model="gpt2")  # AI for conquest strategies
+        self.domination_ai = shared_pipeline("text-generation", model="gpt2")  # AI for conquest strategies
 
     def _init_quantum_domination(self) -> QuantumCircuit:
         """Initializes quantum circuit for global domination."""
@@ -93,30 +96,33 @@ class FinalPiMainnetSupremacyGlobalDomination:
 
     async def monitor_global_supremacy(self):
         """Monitors global supremacy of the mainnet."""
-        while self.domination_status == 'Supreme':
-            # AI conquest prediction
-            prompt = "Predict global supremacy of fully open Pi mainnet with Stablecoin-Only."
-            prediction = self.domination_ai(prompt, max_length=50)[0]['generated_text']
-            logging.info(f"Supremacy Prediction: {prediction}")
-            # Check for global threats
-            if not self.eternal_activation.eternal_status == 'Eternal':
-                logging.critical("Global supremacy threatened. Initiating mainnet conquest rebirth.")
-                self.domination_status = 'Emerging'
-                self.rgb_led.color = (1, 0, 0)  # Red: threatened
-                self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
-                await self.core._trigger_system_rebirth()
-                break
-            await asyncio.sleep(86400)  # Monitor daily
+        job = default_scheduler.every('FinalPiMainnetSupremacyGlobalDomination.monitor_global_supremacy', 86400, self._supremacy_check)  # Monitor daily
+        await job.finished.wait()
+
+    async def _supremacy_check(self) -> bool:
+        """One supremacy prediction and threat check; returns False once supremacy is lost."""
+        if self.domination_status != 'Supreme':
+            return False
+        # AI conquest prediction
+        prompt = "Predict global supremacy of fully open Pi mainnet with Stablecoin-Only."
+        prediction = (await infer(self.domination_ai, prompt, max_length=50))[0]['generated_text']
+        logging.info(f"Supremacy Prediction: {prediction}")
+        # Check for global threats
+        if not self.eternal_activation.eternal_status == 'Eternal':
+            logging.critical("Global supremacy threatened. Initiating mainnet conquest rebirth.")
+            self.domination_status = 'Emerging'
+            self.rgb_led.color = (1, 0, 0)  # Red: threatened
+            self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
+            await self.core._trigger_system_rebirth()
+            return False
+        return True
 
     async def manual_conquest_confirm(self):
         """Handles manual confirmation for global domination."""
-        while True:
-            if self.confirm_button.is_pressed:
-                logging.info("Manual confirmation for global Pi mainnet domination.")
-                if self.domination_status == 'Emerging':
-                    await self.achieve_global_domination()
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual confirmation for global Pi mainnet domination.")
+        if self.domination_status == 'Emerging':
+            await self.achieve_global_domination()
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_domination_dashboard(self) -> Dict[str, Any]:
         """Generates holographic global domination dashboard."""
@@ -135,7 +141,7 @@ class FinalPiMainnetSupremacyGlobalDomination:
 
     async def run_supremacy_module(self):
         """Main supremacy module loop."""
-        asyncio.create_task(self.manual_conquest_confirm())
+        default_scheduler.on_press('FinalPiMainnetSupremacyGlobalDomination.manual_conquest_confirm', self.confirm_button, self.manual_conquest_confirm)
         if self.domination_status == 'Emerging':
             await self.achieve_global_domination()
         if self.domination_status == 'Supreme':
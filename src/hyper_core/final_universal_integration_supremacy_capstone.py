@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for universal supremacy
-from transformers import pipeline  # AI for capstone predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for capstone status, Buzzer for alerts, Button for capstone trigger
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for universal supremacy
+from model_registry import shared_pipeline  # AI for capstone predictions
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for capstone status, Buzzer for alerts, Button for capstone trigger
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 from final_pi_mainnet_supremacy_global_domination import FinalPiMainnetSupremacyGlobalDomination  # File 22
@@ -15,6 +17,7 @@ from comprehensive_test_suite_validation import ComprehensiveTestSuiteValidation
 from ultimate_ecosystem_documentation_holographic_archive import UltimateEcosystemDocumentationHolographicArchive  # File 25
 from eternal_quantum_security_anti_quantum_threat import EternalQuantumSecurityAntiQuantumThreat  # File 26
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Universal Capstone: %(message)s')
@@ -29,13 +32,13 @@ class FinalUniversalIntegrationSupremacyCapstone:
         self.test_suite = core.modules.get('test_suite')
         self.documentation_archive = core.modules.get('documentation_archive')
         self.eternal_security = core.modules.get('eternal_security')
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: White=supreme, Green=integrating, Red=failed
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.trigger_button = Button(trigger_button_pin)  # Manual capstone trigger
-        self.quantum_capstone_circuit = self._init_quantum_capstone()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: White=supreme, Green=integrating, Red=failed
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.trigger_button = LazyObject(Button, trigger_button_pin)  # Manual capstone trigger
+        self.quantum_capstone_circuit = LazyObject(self._init_quantum_capstone)
         self.capstone_status = 'Integrating'  # 'Integrating', 'Supreme', 'Failed'
         self.capstone_logs: List[Dict] = []
-        self.capstone_ai = pipeline("text-generation", model="gpt2")  # AI for capstone predictions
+        self.capstone_ai = shared_pipeline("text-generation", model="gpt2")  # AI for capstone predictions
 
     def _init_quantum_capstone(self) -> QuantumCircuit:
         """Initializes quantum circuit for universal capstone."""
@@ -97,30 +100,33 @@ class FinalUniversalIntegrationSupremacyCapstone:
 
     async def monitor_capstone_supremacy(self):
         """Monitors universal supremacy eternally."""
-        while self.capstone_status == 'Supreme':
-            # AI capstone prediction
-            prompt = "Predict eternal supremacy of Pi Ecosystem capstone."
-            prediction = self.capstone_ai(prompt, max_length=50)[0]['generated_text']
-            logging.info(f"Capstone Supremacy Prediction: {prediction}")
-            # Check for capstone threats
-            if not self.supremacy_module.domination_status == 'Supreme':
-                logging.critical("Capstone supremacy threatened. Initiating universal capstone rebirth.")
-                self.capstone_status = 'Integrating'
-                self.rgb_led.color = (1, 0, 0)  # Red: failed
-                self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
-                await self.core._trigger_system_rebirth()
-                break
-            await asyncio.sleep(86400)  # Monitor daily
+        job = default_scheduler.every('FinalUniversalIntegrationSupremacyCapstone.monitor_capstone_supremacy', 86400, self._capstone_check)  # Monitor daily
+        await job.finished.wait()
+
+    async def _capstone_check(self) -> bool:
+        """One capstone prediction and threat check; returns False once the capstone is lost."""
+        if self.capstone_status != 'Supreme':
+            return False
+        # AI capstone prediction
+        prompt = "Predict eternal supremacy of Pi Ecosystem capstone."
+        prediction = (await infer(self.capstone_ai, prompt, max_length=50))[0]['generated_text']
+        logging.info(f"Capstone Supremacy Prediction: {prediction}")
+        # Check for capstone threats
+        if not self.supremacy_module.domination_status == 'Supreme':
+            logging.critical("Capstone supremacy threatened. Initiating universal capstone rebirth.")
+            self.capstone_status = 'Integrating'
+            self.rgb_led.color = (1, 0, 0)  # Red: failed
+            self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
+            await self.core._trigger_system_rebirth()
+            return False
+        return True
 
     async def manual_capstone_trigger(self):
         """Handles manual capstone trigger."""
-        while True:
-            if self.trigger_button.is_pressed:
-                logging.info("Manual universal capstone trigger activated.")
-                if self.capstone_status == 'Integrating':
-                    await self.achieve_universal_supremacy_capstone()
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual universal capstone trigger activated.")
+        if self.capstone_status == 'Integrating':
+            await self.achieve_universal_supremacy_capstone()
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_capstone_dashboard(self) -> Dict[str, Any]:
         """Generates holographic capstone dashboard."""
@@ -140,7 +146,7 @@ class FinalUniversalIntegrationSupremacyCapstone:
 
     async def run_universal_capstone(self):
         """Main universal capstone loop."""
-        asyncio.create_task(self.manual_capstone_trigger())
+        default_scheduler.on_press('FinalUniversalIntegrationSupremacyCapstone.manual_capstone_trigger', self.trigger_button, self.manual_capstone_trigger)
         if self.capstone_status == 'Integrating':
             await self.achieve_universal_supremacy_capstone()
         if self.capstone_status == 'Supreme':
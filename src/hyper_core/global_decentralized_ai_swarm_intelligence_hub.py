@@ -1,12 +1,17 @@
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Sequence
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for swarm consensus
-from transformers import pipeline  # AI for swarm intelligence
-from gpiozero import LED, Buzzer, RGBLED  # Pi hardware: RGB LED for swarm status, Buzzer for alerts
+import numpy as np
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for swarm consensus
+from model_registry import shared_pipeline  # AI for swarm intelligence
+from inference_queue import infer
+from journal import Journal
+LED, Buzzer, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED')  # Pi hardware: RGB LED for swarm status, Buzzer for alerts
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from final_hyper_expansion_module import FinalHyperExpansionModule  # File 7
@@ -15,16 +20,41 @@ from ultimate_ecosystem_guardian_summary_script import UltimateEcosystemGuardian
 from quantum_ai_optimizer_predictive_maintenance import QuantumAIOptimizerPredictiveMaintenance  # File 17
 from pi_mainnet_integration_real_time_synchronization import PiMainnetIntegrationRealTimeSynchronization  # File 18
 import hashlib
+from node_registry import NODE_STATUSES, NodeRegistry, default_registry  # Columnar node table shared with expansion and the oracle
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - AI Swarm Hub: %(message)s')
 
+VOTE_OPTIONS = ('Approve', 'Reject', 'Optimize')
+
+def tally_votes(votes: np.ndarray, weights: Optional[np.ndarray] = None, options: Sequence[str] = VOTE_OPTIONS) -> Dict[str, Any]:
+    """Counts (and intelligence-weighted totals) per option for an array of option indexes; size is independent of node count."""
+    counts = np.bincount(votes, minlength=len(options))
+    weighted = np.bincount(votes, weights=weights, minlength=len(options)) if weights is not None else counts.astype(np.float64)
+    winner = int(np.argmax(weighted))
+    total = float(weighted.sum())
+    return {
+        'nodes': int(len(votes)),
+        'counts': dict(zip(options, counts.tolist())),
+        'weighted': dict(zip(options, weighted.round(3).tolist())),
+        'winner': options[winner],
+        'share': float(weighted[winner] / total) if total else 0.0
+    }
+
+def consensus_prompt(decision_topic: str, tally: Dict[str, Any], topic_chars: int = 200) -> str:
+    """Fixed-size model prompt: the topic (truncated) and the vote summary, never the per-node inputs."""
+    votes = ', '.join(f"{option} {count}" for option, count in tally['counts'].items())
+    return (f"Swarm consensus on: {decision_topic[:topic_chars]}. Votes from {tally['nodes']} nodes: {votes}. "
+            f"Majority: {tally['winner']} ({tally['share']:.0%}).")
+
 class GlobalDecentralizedAISwarmIntelligenceHub:
     def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager,
                  expansion: FinalHyperExpansionModule, oracle: GlobalPIOracleComplianceVerifier,
                  guardian: UltimateEcosystemGuardianSummaryScript, optimizer: QuantumAIOptimizerPredictiveMaintenance,
                  mainnet_sync: PiMainnetIntegrationRealTimeSynchronization,
-                 rgb_led_pins: tuple = (9, 10, 11), alert_buzzer_pin: int = 12):
+                 rgb_led_pins: tuple = (9, 10, 11), alert_buzzer_pin: int = 12, journal_dir: str = './journals',
+                 consensus_attempts: int = 4, consensus_backoff: float = 0.5):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.expansion = expansion
@@ -32,12 +62,18 @@ class GlobalDecentralizedAISwarmIntelligenceHub:
         self.guardian = guardian
         self.optimizer = optimizer
         self.mainnet_sync = mainnet_sync
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=swarm_active, Blue=consensus, Red=disruption
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.swarm_nodes: Dict[str, Dict] = {}  # Decentralized swarm nodes
-        self.quantum_swarm_circuit = self._init_quantum_swarm()
-        self.swarm_intelligence = pipeline("text-generation", model="gpt2")  # AI for swarm decisions
-        self.swarm_consensus_logs: List[Dict] = []
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=swarm_active, Blue=consensus, Red=disruption
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.swarm_nodes: NodeRegistry = expansion.global_nodes if expansion is not None else default_registry  # Decentralized swarm nodes
+        self.quantum_swarm_circuit = LazyObject(self._init_quantum_swarm)
+        self.swarm_intelligence = shared_pipeline("text-generation", model="gpt2")  # AI for swarm decisions
+        self.swarm_consensus_logs = Journal(os.path.join(journal_dir, 'swarm_consensus_logs'), legacy_path='./swarm_consensus_logs.json')
+        # One pass at start, then counted on append; entries from before the vote tally only have the model text
+        self.gambling_rejections = sum(1 for log in self.swarm_consensus_logs if (log['winner'] == 'Reject' if 'winner' in log else 'Reject' in log['consensus']))
+        self.consensus_attempts = consensus_attempts  # Quantum validations per decision before giving up
+        self.consensus_backoff = consensus_backoff  # Seconds before the first retry; doubles per attempt
+        self.last_consensus: Dict[str, Any] = {}
+        self._rng = np.random.default_rng()
 
     def _init_quantum_swarm(self) -> QuantumCircuit:
         """Initializes quantum circuit for swarm consensus."""
@@ -50,32 +86,54 @@ class GlobalDecentralizedAISwarmIntelligenceHub:
 
     async def initialize_swarm_nodes(self):
         """Initializes decentralized swarm nodes from expansion module."""
-        for node in self.expansion.global_nodes.keys():
-            self.swarm_nodes[node] = {'status': 'active', 'intelligence_score': random.uniform(0.8, 1.0), 'last_consensus': None}
+        self.swarm_nodes.set_column('status', 'active')
+        self.swarm_nodes.set_column('intelligence_score', self._rng.uniform(0.8, 1.0, len(self.swarm_nodes)))
         logging.info(f"Swarm initialized with {len(self.swarm_nodes)} nodes.")
 
+    def _member_scores(self) -> np.ndarray:
+        """Intelligence scores of the swarm members: rows made active by initialize_swarm_nodes, not nodes the expansion
+        module registered (as 'syncing', unscored) since."""
+        members = self.swarm_nodes.column('status') == NODE_STATUSES.index('active')
+        return self.swarm_nodes.column('intelligence_score')[members]
+
+    def _collect_votes(self) -> Dict[str, Any]:
+        """Collects one vote per swarm member as option indexes and tallies them, weighted by intelligence score."""
+        scores = self._member_scores()
+        # Simulate node inputs (in hyper-tech: each node's own model)
+        votes = self._rng.integers(0, len(VOTE_OPTIONS), size=len(scores))
+        return tally_votes(votes, scores)
+
     async def swarm_consensus_decision(self, decision_topic: str) -> str:
-        """Achieves swarm consensus on decisions using quantum and AI."""
+        """Achieves swarm consensus on decisions using quantum and AI; returns '' if no consensus is validated."""
         self.rgb_led.color = (0, 0, 1)  # Blue: consensus
-        # Collect inputs from nodes
-        inputs = [f"Node {node}: {random.choice(['Approve', 'Reject', 'Optimize'])} {decision_topic}" for node in self.swarm_nodes]
-        # AI swarm intelligence
-        prompt = f"Swarm consensus on: {decision_topic}. Inputs: {inputs}"
-        consensus = self.swarm_intelligence(prompt, max_length=50)[0]['generated_text']
-        # Quantum validation
-        quantum_valid = self._run_quantum_consensus()
-        if quantum_valid > 0.5:
-            self.rgb_led.color = (0, 1, 0)  # Green: consensus achieved
-            logging.info(f"Swarm consensus: {consensus}")
-            # Log consensus
-            log = {'topic': decision_topic, 'consensus': consensus, 'quantum_valid': quantum_valid}
-            self.swarm_consensus_logs.append(log)
-            with open('./swarm_consensus_logs.json', 'w') as f:
-                json.dump(self.swarm_consensus_logs, f)
-            return consensus
+        start = time.perf_counter()
+        tally = self._collect_votes()
+        # Quantum validation, retried a bounded number of times with exponential backoff
+        for attempt in range(self.consensus_attempts):
+            quantum_valid = self._run_quantum_consensus()
+            if quantum_valid > 0.5:
+                break
+            if attempt + 1 < self.consensus_attempts:
+                delay = self.consensus_backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+                logging.warning(f"Swarm consensus failed (attempt {attempt + 1}/{self.consensus_attempts}). Retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
         else:
-            logging.warning("Swarm consensus failed. Retrying...")
-            return await self.swarm_consensus_decision(decision_topic)
+            logging.error(f"Swarm consensus on '{decision_topic}' not validated after {self.consensus_attempts} attempts.")
+            self.rgb_led.color = (1, 0, 0)  # Red: disruption
+            self.last_consensus = {**tally, 'topic': decision_topic, 'attempts': self.consensus_attempts, 'validated': False,
+                                   'latency_s': time.perf_counter() - start}
+            return ''
+        # AI swarm intelligence, once per decision, on a fixed-size summary
+        consensus = (await infer(self.swarm_intelligence, consensus_prompt(decision_topic, tally), max_new_tokens=30))[0]['generated_text']
+        self.rgb_led.color = (0, 1, 0)  # Green: consensus achieved
+        logging.info(f"Swarm consensus: {consensus}")
+        # Log consensus
+        log = {'topic': decision_topic, 'consensus': consensus, 'quantum_valid': quantum_valid, 'winner': tally['winner'], 'counts': tally['counts']}
+        self.swarm_consensus_logs.append(log)
+        self.gambling_rejections += tally['winner'] == 'Reject'  # The model echoes every option name, so count the tally
+        self.last_consensus = {**tally, 'topic': decision_topic, 'attempts': attempt + 1, 'validated': True,
+                               'latency_s': time.perf_counter() - start}
+        return consensus
 
     def _run_quantum_consensus(self) -> float:
         """Runs quantum simulation for consensus validation."""
@@ -86,41 +144,50 @@ class GlobalDecentralizedAISwarmIntelligenceHub:
 
     async def swarm_optimize_ecosystem(self):
         """Uses swarm intelligence to optimize the ecosystem globally."""
-        while True:
-            # Swarm decision on optimization
-            decision = await self.swarm_consensus_decision("Optimize PI transactions and reject gambling")
-            if "Optimize" in decision:
-                await self.optimizer._perform_predictive_maintenance()
-            elif "Reject" in decision:
-                # Reinforce anti-gambling
-                for tx in self.pi_manager.transactions[-10:]:
-                    if not self.ahi_ai._check_gambling_filter(tx):
-                        await self.guardian.purity_enforcer._isolate_tainted_pi(tx)
-            await asyncio.sleep(3600)  # Optimize every hour
+        job = default_scheduler.every('GlobalDecentralizedAISwarmIntelligenceHub.swarm_optimize_ecosystem', 3600, self._optimize_pass)  # Optimize every hour
+        await job.finished.wait()
+
+    async def _optimize_pass(self):
+        """One swarm decision on optimization, acted on by its winning vote."""
+        # Swarm decision on optimization
+        decision = await self.swarm_consensus_decision("Optimize PI transactions and reject gambling")
+        winner = self.last_consensus['winner'] if decision else None  # Branch on the vote, not on the model's echo of it
+        if winner == 'Optimize':
+            await self.optimizer._perform_predictive_maintenance()
+        elif winner == 'Reject':
+            # Reinforce anti-gambling
+            for tx in self.pi_manager.transactions.recent(10):
+                if not self.ahi_ai._check_gambling_filter(tx):
+                    await self.guardian.purity_enforcer._isolate_tainted_pi(tx)
 
     async def swarm_monitor_global_compliance(self):
         """Monitors global compliance via swarm, enforcing Stablecoin-Only."""
-        while True:
-            # Swarm check on mainnet sync (File 18)
-            if self.mainnet_sync.mainnet_status == 'Open':
-                decision = await self.swarm_consensus_decision("Verify PI purity on mainnet")
-                if "Verify" in decision:
-                    report = await self.oracle.generate_compliance_report()
-                    if not report['global_compliance']:
-                        logging.critical("Swarm detected compliance breach. Initiating lockdown.")
-                        self.rgb_led.color = (1, 0, 0)  # Red: disruption
-                        self.alert_buzzer.beep(on_time=2, off_time=1, n=5)
-                        await self.guardian._halt_ecosystem("Swarm compliance breach.")
-                        break
-            await asyncio.sleep(1800)  # Monitor every 30 minutes
+        job = default_scheduler.every('GlobalDecentralizedAISwarmIntelligenceHub.swarm_monitor_global_compliance', 1800, self._compliance_check)  # Monitor every 30 minutes
+        await job.finished.wait()
+
+    async def _compliance_check(self) -> bool:
+        """One swarm compliance check on the open mainnet; returns False once a breach has locked the ecosystem down."""
+        # Swarm check on mainnet sync (File 18)
+        if self.mainnet_sync.mainnet_status == 'Open':
+            decision = await self.swarm_consensus_decision("Verify PI purity on mainnet")
+            if "Verify" in decision:
+                report = await self.oracle.generate_compliance_report()
+                if not report['global_compliance']:
+                    logging.critical("Swarm detected compliance breach. Initiating lockdown.")
+                    self.rgb_led.color = (1, 0, 0)  # Red: disruption
+                    self.alert_buzzer.beep(on_time=2, off_time=1, n=5)
+                    await self.guardian._halt_ecosystem("Swarm compliance breach.")
+                    return False
+        return True
 
     async def generate_swarm_dashboard(self) -> Dict[str, Any]:
         """Generates holographic swarm intelligence dashboard."""
+        scores = self._member_scores()
         dashboard = {
-            'active_nodes': len(self.swarm_nodes),
+            'active_nodes': len(scores),
             'consensus_count': len(self.swarm_consensus_logs),
-            'average_intelligence': sum(node['intelligence_score'] for node in self.swarm_nodes.values()) / len(self.swarm_nodes) if self.swarm_nodes else 0,
-            'gambling_rejections': sum(1 for log in self.swarm_consensus_logs if 'Reject' in log['consensus']),
+            'average_intelligence': float(scores.mean()) if len(scores) else 0.0,
+            'gambling_rejections': self.gambling_rejections,
             'mainnet_sync_status': self.mainnet_sync.mainnet_status
         }
         with open('./swarm_dashboard_hologram.json', 'w') as f:
@@ -137,6 +204,26 @@ class GlobalDecentralizedAISwarmIntelligenceHub:
         await self.generate_swarm_dashboard()
         logging.info("Global Decentralized AI Swarm Intelligence Hub active. Ecosystem optimized by swarm.")
 
+def benchmark_swarm_consensus(node_counts: Sequence[int] = (100, 1000, 10000, 100000)) -> List[Dict[str, float]]:
+    """Vote collection and prompt size per node count: per-node prompt strings (previous path) vs tallied votes."""
+    rows = []
+    rng = np.random.default_rng(0)
+    for nodes in node_counts:
+        swarm_nodes = {f'node_{i}': {'status': 'active', 'intelligence_score': float(score)} for i, score in enumerate(rng.uniform(0.8, 1.0, nodes))}
+        start = time.perf_counter()
+        inputs = [f"Node {node}: {random.choice(VOTE_OPTIONS)} Optimize PI transactions" for node in swarm_nodes]
+        old_prompt = f"Swarm consensus on: Optimize PI transactions. Inputs: {inputs}"
+        old_ms = (time.perf_counter() - start) * 1000
+        registry = NodeRegistry()
+        registry.add_many(list(swarm_nodes), status='active', intelligence_score=rng.uniform(0.8, 1.0, nodes))
+        start = time.perf_counter()
+        scores = registry.column('intelligence_score')
+        new_prompt = consensus_prompt("Optimize PI transactions", tally_votes(rng.integers(0, len(VOTE_OPTIONS), size=nodes), scores))
+        new_ms = (time.perf_counter() - start) * 1000
+        rows.append({'nodes': nodes, 'per_node_prompt_ms': old_ms, 'per_node_prompt_chars': len(old_prompt),
+                     'tally_ms': new_ms, 'tally_prompt_chars': len(new_prompt)})
+    return rows
+
 # Usage example (integrate into main app)
 if __name__ == "__main__":
     from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
@@ -1,36 +1,63 @@
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import json
 import os
-import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for secure oracle consensus
-from gpiozero import LED, Buzzer, RGBLED  # Pi hardware: RGB LED for oracle status, Buzzer for alerts
+import numpy as np
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for secure oracle consensus
+LED, Buzzer, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED')  # Pi hardware: RGB LED for oracle status, Buzzer for alerts
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from quantum_security_layer import QuantumSecurityLayer  # File 5
 from final_hyper_expansion_module import FinalHyperExpansionModule  # File 7
 from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  # File 10
+from task_scheduler import default_scheduler
 import hashlib
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Global PI Oracle: %(message)s')
 
+def oracle_consensus(values: np.ndarray, fixed_value: float, tolerance: float = 0.0, trim: float = 0.1) -> Tuple[np.ndarray, Dict[str, float]]:
+    """Deviation mask and robust consensus (median, trimmed mean) over all reported values in one vectorized pass."""
+    values = np.asarray(values, dtype=np.float64)
+    deviating = np.abs(values - fixed_value) > tolerance
+    if not len(values):
+        return deviating, {'nodes': 0, 'deviating': 0, 'median': fixed_value, 'trimmed_mean': fixed_value, 'max_abs_deviation': 0.0}
+    ordered = np.sort(values)
+    cut = int(len(ordered) * trim)  # Drop this many outliers from each end
+    kept = ordered[cut:len(ordered) - cut] if len(ordered) > 2 * cut else ordered
+    summary = {
+        'nodes': int(len(values)),
+        'deviating': int(np.count_nonzero(deviating)),
+        'median': float(np.median(ordered)),
+        'trimmed_mean': float(kept.mean()),
+        'max_abs_deviation': float(max(fixed_value - ordered[0], ordered[-1] - fixed_value, 0.0))
+    }
+    return deviating, summary
+
 class GlobalPIOracleComplianceVerifier:
     def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager,
                  security: QuantumSecurityLayer, expansion: FinalHyperExpansionModule,
                  purity_enforcer: PIPurityAccountabilityEnforcer,
-                 rgb_led_pins: tuple = (17, 18, 19), alert_buzzer_pin: int = 20):
+                 rgb_led_pins: tuple = (17, 18, 19), alert_buzzer_pin: int = 20,
+                 tolerance: float = 0.0, trim: float = 0.1, max_concurrency: int = 32, followup_batch: int = 1024):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.security = security
         self.expansion = expansion
         self.purity_enforcer = purity_enforcer
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=verified, Red=breach, Blue=verifying
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=verified, Red=breach, Blue=verifying
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
         self.fixed_pi_value = 314159  # Fixed value in cents
-        self.oracle_nodes: Dict[str, float] = {}  # Global oracle nodes with PI values
-        self.quantum_consensus = self._build_quantum_consensus()
+        self.tolerance = tolerance  # Allowed |reported - fixed| before a node counts as deviating
+        self.trim = trim  # Fraction trimmed from each end for the consensus mean
+        self.max_concurrency = max_concurrency  # Follow-up coroutines in flight at once
+        self.followup_batch = followup_batch  # Deviating nodes isolated per secure_pi_transactions call
+        self.last_consensus: Dict[str, float] = {}
+        self._rng = np.random.default_rng()
+        self.quantum_consensus = LazyObject(self._build_quantum_consensus)
         self.compliance_reports: List[Dict] = []
 
     def _build_quantum_consensus(self) -> QuantumCircuit:
@@ -63,23 +90,77 @@ class GlobalPIOracleComplianceVerifier:
         # Secure via Quantum Layer (File 5)
         await self.security.secure_pi_transaction({'id': 'deviation_isolate', 'value': self.fixed_pi_value})
 
+    async def verify_pi_values(self, node_ids: Sequence[str], reported_values: Sequence[float]) -> np.ndarray:
+        """Batch path of verify_pi_value: returns a per-node verified mask.
+
+        Deviations and consensus are computed in one vectorized step; isolations and purity checks then run
+        concurrently, bounded by max_concurrency. Nodes reporting the same value share one entry in a single batched
+        purity check.
+        """
+        values = np.asarray(reported_values, dtype=np.float64)
+        deviating, self.last_consensus = oracle_consensus(values, self.fixed_pi_value, self.tolerance, self.trim)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        isolations = []
+        deviating_index = np.flatnonzero(deviating)
+        if len(deviating_index):
+            logging.warning(f"PI value deviation detected on {len(deviating_index)}/{len(values)} nodes "
+                            f"(consensus median {self.last_consensus['median']:.2f}). Rejecting.")
+            self.rgb_led.color = (1, 0, 0)  # Red: breach
+            self.alert_buzzer.beep(on_time=1, off_time=1, n=3)  # Once per batch, not once per node
+            for start in range(0, len(deviating_index), self.followup_batch):
+                chunk = deviating_index[start:start + self.followup_batch]
+                isolations.append(bounded(self._isolate_deviations([node_ids[i] for i in chunk], values[chunk])))
+        verified = ~deviating
+        # Check purity via Enforcer (File 10)
+        distinct, inverse = np.unique(values[verified], return_inverse=True)
+        purity_checks = []
+        if len(distinct):
+            purity_checks.append(bounded(self.purity_enforcer.enforce_pi_purity_batch(
+                [{'value': float(value), 'source': 'oracle'} for value in distinct])))
+        results = await asyncio.gather(*isolations, *purity_checks)
+        pure = np.array(results[-1] if purity_checks else [], dtype=bool)
+        verified[verified] = pure[inverse] if len(pure) else False
+        if verified.all():
+            self.rgb_led.color = (0, 1, 0)  # Green: verified
+        return verified
+
+    async def _isolate_deviations(self, node_ids: List[str], reported_values: np.ndarray):
+        """Isolates a batch of deviating nodes with one secured record each, enforcing the fixed value."""
+        # Secure via Quantum Layer (File 5)
+        await self.security.secure_pi_transactions([
+            {'id': f'deviation_isolate_{node}', 'node': node, 'reported': float(value), 'value': self.fixed_pi_value}
+            for node, value in zip(node_ids, reported_values)
+        ])
+
+    async def sync_cycle(self) -> int:
+        """One oracle sync over every global node; returns how many nodes were isolated."""
+        self.rgb_led.color = (0, 0, 1)  # Blue: verifying
+        registry = self.expansion.global_nodes
+        node_ids = registry.ids()
+        # Simulate global node reports (in hyper-tech: P2P network)
+        reported = self.fixed_pi_value + self._rng.uniform(-100, 100, len(node_ids))  # Simulate deviations
+        registry.set_column('reported_value', reported)  # Rows align with node_ids until the first await
+        verified = await self.verify_pi_values(node_ids, reported)
+        # Halt nodes via Expansion (File 7), by id after the scan: rows may have moved while verifying
+        isolated = [node_ids[i] for i in np.flatnonzero(~verified)]
+        registry.remove_many(isolated)
+        if isolated:
+            logging.info(f"{len(isolated)} nodes isolated for PI deviation.")
+        # Quantum consensus
+        consensus_value = self._quantum_consensus_check()
+        if consensus_value == self.fixed_pi_value:
+            logging.info("Global PI oracle consensus achieved.")
+        return len(isolated)
+
     async def global_oracle_sync(self):
         """Syncs PI values across global nodes via swarm (File 7)."""
-        while True:
-            self.rgb_led.color = (0, 0, 1)  # Blue: verifying
-            # Simulate global node reports (in hyper-tech: P2P network)
-            for node in self.expansion.global_nodes.keys():
-                reported_value = self.fixed_pi_value + random.uniform(-100, 100)  # Simulate deviations
-                self.oracle_nodes[node] = reported_value
-                if not await self.verify_pi_value(reported_value):
-                    # Halt node via Expansion (File 7)
-                    del self.expansion.global_nodes[node]
-                    logging.info(f"Node {node} isolated for PI deviation.")
-            # Quantum consensus
-            consensus_value = self._quantum_consensus_check()
-            if consensus_value == self.fixed_pi_value:
-                logging.info("Global PI oracle consensus achieved.")
-            await asyncio.sleep(3600)  # Sync hourly
+        job = default_scheduler.every('GlobalPIOracleComplianceVerifier.global_oracle_sync', 3600, self.sync_cycle)  # Sync hourly
+        await job.finished.wait()
 
     def _quantum_consensus_check(self) -> float:
         """Runs quantum consensus for PI value agreement."""
@@ -93,8 +174,9 @@ class GlobalPIOracleComplianceVerifier:
         """Generates holographic compliance report."""
         report = {
             'fixed_pi_value': self.fixed_pi_value,
-            'oracle_nodes': len(self.oracle_nodes),
-            'deviations_detected': len([v for v in self.oracle_nodes.values() if v != self.fixed_pi_value]),
+            'oracle_nodes': self.last_consensus.get('nodes', 0),
+            'deviations_detected': self.last_consensus.get('deviating', 0),
+            'consensus': self.last_consensus,
             'purity_status': 'Pure' if self.purity_enforcer.frozen_pi_supply == 0 else 'Tainted Isolated',
             'global_compliance': not self.ahi_ai.stellar_halted
         }
@@ -107,16 +189,20 @@ class GlobalPIOracleComplianceVerifier:
 
     async def monitor_pi_compliance(self):
         """Monitors global Pi Network compliance and halts if breached."""
-        while True:
-            # Check via AHI AI (File 1)
-            if self.ahi_ai.stellar_halted:
-                logging.critical("Pi Network non-compliance detected. Halting oracle and ecosystem.")
-                self.rgb_led.color = (1, 0, 0)  # Red: halt
-                self.alert_buzzer.beep(on_time=2, off_time=1, n=10)
-                # Trigger halt via Expansion (File 7)
-                self.expansion._global_purge_and_rebirth()
-                break
-            await asyncio.sleep(7200)  # Check every 2 hours
+        job = default_scheduler.every('GlobalPIOracleComplianceVerifier.monitor_pi_compliance', 7200, self._check_pi_compliance)  # Check every 2 hours
+        await job.finished.wait()
+
+    def _check_pi_compliance(self) -> bool:
+        """One compliance check; returns False once a breach has halted the oracle."""
+        # Check via AHI AI (File 1)
+        if self.ahi_ai.stellar_halted:
+            logging.critical("Pi Network non-compliance detected. Halting oracle and ecosystem.")
+            self.rgb_led.color = (1, 0, 0)  # Red: halt
+            self.alert_buzzer.beep(on_time=2, off_time=1, n=10)
+            # Trigger halt via Expansion (File 7)
+            self.expansion._global_purge_and_rebirth()
+            return False
+        return True
 
     async def run_oracle(self):
         """Main oracle loop."""
@@ -126,6 +212,24 @@ class GlobalPIOracleComplianceVerifier:
         await self.generate_compliance_report()
         logging.info("Global PI Oracle and Compliance Verifier active.")
 
+def benchmark_oracle_consensus(nodes: int = 100000) -> Dict[str, float]:
+    """Per-cycle cost of the per-node comparison loop (previous path, without its awaits) vs the vectorized check."""
+    fixed_value = 314159
+    node_ids = [f'node_{i}' for i in range(nodes)]
+    reported = fixed_value + np.random.default_rng(0).uniform(-100, 100, nodes)
+    start = time.perf_counter()
+    oracle_nodes, deviating = {}, []
+    for node, value in zip(node_ids, reported.tolist()):
+        oracle_nodes[node] = value
+        if value != fixed_value:
+            deviating.append(node)
+    loop_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    mask, summary = oracle_consensus(reported, fixed_value)
+    vectorized_ms = (time.perf_counter() - start) * 1000
+    assert summary['deviating'] == len(deviating)
+    return {'nodes': nodes, 'loop_ms': loop_ms, 'vectorized_ms': vectorized_ms, 'median': summary['median']}
+
 # Usage example (integrate into main app)
 if __name__ == "__main__":
     from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
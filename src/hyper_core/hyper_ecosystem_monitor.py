@@ -1,15 +1,19 @@
 import asyncio
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import time
 import json
-import matplotlib.pyplot as plt  # For basic visualization (hyper-tech: integrate with holographic APIs)
-from sklearn.ensemble import IsolationForest  # Anomaly detection
-from gpiozero import LED, Buzzer, DistanceSensor  # Pi hardware: LEDs for status, Buzzer for alerts, Sensor for proximity-based interactions
+import numpy as np
+from lazy_loader import LazyObject, lazy_from
+IsolationForest = lazy_from('sklearn.ensemble', 'IsolationForest')  # Anomaly detection
+LED, Buzzer, DistanceSensor = lazy_from('gpiozero', 'LED', 'Buzzer', 'DistanceSensor')  # Pi hardware: LEDs for status, Buzzer for alerts, Sensor for proximity-based interactions
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
-import threading
+from metric_store import MetricStore  # Ring-buffer time series with downsampled tiers
+from streaming_anomaly import StreamingAnomalyDetector  # O(1) per-sample anomaly scoring
+from dashboard_renderer import DashboardRenderer  # Off-loop plot rendering (hyper-tech: integrate with holographic APIs)
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Ecosystem Monitor: %(message)s')
@@ -20,59 +24,57 @@ class HyperEcosystemMonitor:
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.app_builder = app_builder
-        self.status_led = LED(status_led_pin)  # Multi-color simulation: On=healthy, Blink=warning, Off=critical
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.proximity_sensor = DistanceSensor(echo=sensor_pins[0], trigger=sensor_pins[1])  # For interactive monitoring (e.g., wave hand to refresh)
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)  # Trained on historical data
-        self.metrics: Dict[str, List[float]] = {'pi_transactions': [], 'app_deployments': [], 'ai_filters': []}
+        self.status_led = LazyObject(LED, status_led_pin)  # Multi-color simulation: On=healthy, Blink=warning, Off=critical
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.proximity_sensor = LazyObject(DistanceSensor, echo=sensor_pins[0], trigger=sensor_pins[1])  # For interactive monitoring (e.g., wave hand to refresh)
+        # EWMA z-scores per sample; IsolationForest retrained on recent history in a background thread
+        self.anomaly_detector = StreamingAnomalyDetector(model_factory=lambda: IsolationForest(contamination=0.1, random_state=42))
+        self.metrics = MetricStore(['pi_transactions', 'app_deployments', 'ai_filters'])  # Raw day + 1m/1h aggregates
         self.holographic_sim = {}  # Simulated holographic dashboard
+        self.dashboard_renderer = DashboardRenderer('./ecosystem_dashboard.png')  # Save as image for Pi display
+        self._dashboard_metrics_version = -1  # Metrics version the last frame was requested for
+        self._dashboard_json: Optional[str] = None  # Cached serialization, reset whenever the dashboard changes
+        self._shown_dashboard: Optional[str] = None  # Last dashboard printed by interactive_monitoring
         self.compliance_breached = False
 
-    async def collect_metrics(self):
+    def collect_metrics(self):
         """Collects real-time metrics from all modules."""
-        while True:
-            # From PI Manager (File 2)
-            pi_tx_count = len(self.pi_manager.transactions)
-            self.metrics['pi_transactions'].append(pi_tx_count)
-            # From App Builder (File 3)
-            app_count = len(self.app_builder.apps)
-            self.metrics['app_deployments'].append(app_count)
-            # From AHI AI (File 1)
-            ai_filters = 1 if not self.ahi_ai.stellar_halted else 0  # Simplified metric
-            self.metrics['ai_filters'].append(ai_filters)
-            # Limit to last 100 points for efficiency
-            for key in self.metrics:
-                if len(self.metrics[key]) > 100:
-                    self.metrics[key].pop(0)
-            await asyncio.sleep(60)  # Collect every minute
+        # From PI Manager (File 2)
+        now = time.time()
+        pi_tx_count = len(self.pi_manager.transactions)
+        self._record_metric('pi_transactions', pi_tx_count, now)
+        # From App Builder (File 3)
+        app_count = len(self.app_builder.apps)
+        self._record_metric('app_deployments', app_count, now)
+        # From AHI AI (File 1)
+        ai_filters = 1 if not self.ahi_ai.stellar_halted else 0  # Simplified metric
+        self._record_metric('ai_filters', ai_filters, now)
+
+    def _record_metric(self, key: str, value: float, timestamp: float):
+        """Stores a sample and scores it incrementally."""
+        self.metrics.record(key, value, timestamp)
+        self.anomaly_detector.update(key, value)
 
     def detect_anomalies(self) -> List[str]:
-        """Uses AI to detect anomalies in metrics."""
-        anomalies = []
-        for key, values in self.metrics.items():
-            if len(values) > 10:
-                predictions = self.anomaly_detector.fit_predict([[v] for v in values])
-                if -1 in predictions[-5:]:  # Anomalies in last 5 points
-                    anomalies.append(f"Anomaly in {key}: Possible volatile infiltration.")
-        return anomalies
+        """Uses AI to detect anomalies in metrics (verdicts were computed as samples arrived)."""
+        return [f"Anomaly in {key}: Possible volatile infiltration." for key in self.anomaly_detector.anomalous_series()]
 
-    async def monitor_compliance(self):
-        """Monitors overall Pi compliance and triggers halts."""
-        while True:
-            if self.ahi_ai.stellar_halted or self.compliance_breached:
-                logging.critical("Ecosystem compliance breached. Initiating system-wide halt.")
-                self._system_halt()
-                break
-            anomalies = self.detect_anomalies()
-            if anomalies:
-                logging.warning(f"Anomalies detected: {anomalies}")
-                self.alert_buzzer.beep(on_time=0.5, off_time=0.5, n=5)  # Alert
-                self.status_led.blink(on_time=0.5, off_time=0.5)  # Warning blink
-                # Autonomous optimization: Adjust AI filters
-                await self.ahi_ai.filter_transaction({'action': 'anomaly_response', 'data': anomalies})
-            else:
-                self.status_led.on()  # Healthy
-            await asyncio.sleep(120)  # Check every 2 minutes
+    async def monitor_compliance(self) -> bool:
+        """Monitors overall Pi compliance and triggers halts (returns False once halted)."""
+        if self.ahi_ai.stellar_halted or self.compliance_breached:
+            logging.critical("Ecosystem compliance breached. Initiating system-wide halt.")
+            self._system_halt()
+            return False
+        anomalies = self.detect_anomalies()
+        if anomalies:
+            logging.warning(f"Anomalies detected: {anomalies}")
+            self.alert_buzzer.beep(on_time=0.5, off_time=0.5, n=5)  # Alert
+            self.status_led.blink(on_time=0.5, off_time=0.5)  # Warning blink
+            # Autonomous optimization: Adjust AI filters
+            await self.ahi_ai.filter_transaction({'action': 'anomaly_response', 'data': anomalies})
+        else:
+            self.status_led.on()  # Healthy
+        return True
 
     def _system_halt(self):
         """Triggers autonomous system-wide halt."""
@@ -87,40 +89,45 @@ class HyperEcosystemMonitor:
         self.alert_buzzer.beep(on_time=1, off_time=0, n=10)  # Continuous alert
 
     def generate_holographic_dashboard(self) -> Dict[str, Any]:
-        """Generates a simulated holographic dashboard with visualizations."""
+        """Generates a simulated holographic dashboard with visualizations, only redoing work whose inputs changed."""
         # Hyper-tech: In real impl, use AR/VR APIs or Pi display for holograms
-        plt.figure(figsize=(10, 6))
-        for key, values in self.metrics.items():
-            plt.plot(values, label=key)
-        plt.title("Pi Ecosystem Metrics Dashboard")
-        plt.legend()
-        plt.savefig('./ecosystem_dashboard.png')  # Save as image for Pi display
-        plt.close()
+        if self.metrics.version != self._dashboard_metrics_version:
+            self._dashboard_metrics_version = self.metrics.version
+            self.dashboard_renderer.request({key: np.array(values) for key, values in self.metrics.items()})  # Snapshot for the render thread
         # Simulated holographic data
-        self.holographic_sim = {
+        dashboard = {
             'pi_balance': self.pi_manager.get_balance(),
             'active_apps': len(self.app_builder.apps),
             'ai_status': 'Active' if not self.ahi_ai.stellar_halted else 'Halted',
             'anomalies': self.detect_anomalies()
         }
+        if dashboard != self.holographic_sim:
+            self.holographic_sim = dashboard
+            self._dashboard_json = None
         return self.holographic_sim
 
-    async def interactive_monitoring(self):
+    def dashboard_json(self) -> str:
+        """Serialized dashboard, cached until the dashboard changes."""
+        if self._dashboard_json is None:
+            self._dashboard_json = json.dumps(self.holographic_sim, indent=2)
+        return self._dashboard_json
+
+    def interactive_monitoring(self):
         """Handles proximity-based interactions for real-time dashboard refresh."""
-        while True:
-            distance = self.proximity_sensor.distance
-            if distance < 0.1:  # Close proximity (e.g., hand wave)
+        distance = self.proximity_sensor.distance
+        if distance < 0.1:  # Close proximity (e.g., hand wave)
+            self.generate_holographic_dashboard()
+            if self.dashboard_json() is not self._shown_dashboard:  # Only print when something changed
                 logging.info("Proximity detected. Refreshing dashboard...")
-                dashboard = self.generate_holographic_dashboard()
-                print(f"Live Dashboard: {json.dumps(dashboard, indent=2)}")  # Print to console/Pi display
-            await asyncio.sleep(5)
+                self._shown_dashboard = self.dashboard_json()
+                print(f"Live Dashboard: {self._shown_dashboard}")  # Print to console/Pi display
 
     async def run_monitor(self):
         """Main monitoring loop."""
-        # Start background tasks
-        asyncio.create_task(self.collect_metrics())
-        asyncio.create_task(self.monitor_compliance())
-        asyncio.create_task(self.interactive_monitoring())
+        # Start background jobs
+        default_scheduler.every('HyperEcosystemMonitor.collect_metrics', 60, self.collect_metrics)  # Collect every minute
+        default_scheduler.every('HyperEcosystemMonitor.monitor_compliance', 120, self.monitor_compliance)  # Check every 2 minutes
+        default_scheduler.every('HyperEcosystemMonitor.interactive_monitoring', 5, self.interactive_monitoring)
         # Initial dashboard
         self.generate_holographic_dashboard()
         logging.info("Hyper Ecosystem Monitor active.")
@@ -0,0 +1,111 @@
+import copy
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Inference Cache: %(message)s')
+
+# Tasks whose output depends only on (weights, input, params)
+DETERMINISTIC_TASKS = {'text-classification', 'sentiment-analysis', 'summarization', 'automatic-speech-recognition', 'text-to-speech'}
+# Tasks that sample by default (GPT-2 text generation sets do_sample=True): cached only when do_sample=False is passed
+SAMPLING_TASKS = {'text-generation'}
+
+def _hash_input(item: Any) -> str:
+    """Content hash of a model input (text, audio bytes, arrays, ...)."""
+    if isinstance(item, str):
+        data = item.encode('utf-8')
+    elif isinstance(item, (bytes, bytearray)):
+        data = bytes(item)
+    else:
+        try:
+            data = pickle.dumps(item, protocol=4)
+        except Exception:
+            data = repr(item).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def model_id(model: Any) -> Any:
+    """Stable identity of a model: the registry key for SharedModel handles, else the object id."""
+    return getattr(model, 'key', None) or id(model)
+
+def is_cacheable(model: Any, params: Dict[str, Any]) -> bool:
+    """Only deterministic calls are cached: a known deterministic task with no sampling requested."""
+    key = getattr(model, 'key', None)
+    if not isinstance(key, tuple):
+        return False
+    if key[0] in SAMPLING_TASKS:
+        return params.get('do_sample') is False  # Greedy decoding only when explicitly requested
+    if key[0] not in DETERMINISTIC_TASKS:
+        return False
+    return not params.get('do_sample')  # temperature/top_k/top_p only matter when sampling
+
+class InferenceCache:
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 3600):
+        self.max_entries = max_entries  # LRU bound
+        self.ttl = ttl  # Seconds a result stays valid (None: until evicted)
+        self._entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    @staticmethod
+    def make_key(model: Any, item: Any, params: Dict[str, Any]) -> Tuple:
+        return (model_id(model), _hash_input(item), tuple(sorted((name, repr(value)) for name, value in params.items())))
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Returns (hit, result); results are copies so callers cannot corrupt the cache."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                entry = None
+            if entry is None:
+                self.stats['misses'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return True, copy.deepcopy(entry[1])
+
+    def put(self, key: Tuple, result: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    async def get_or_compute(self, model: Any, item: Any, params: Dict[str, Any], compute: Callable[[], Any]) -> Any:
+        """Serves a deterministic call from cache, awaiting compute() only on a miss."""
+        if not is_cacheable(model, params):
+            return await compute()
+        key = self.make_key(model, item, params)
+        hit, result = self.get(key)
+        if hit:
+            return result
+        result = await compute()
+        self.put(key, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Hit/miss counters plus current size and hit rate, for dashboards and logs."""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {**self.stats, 'size': len(self._entries), 'max_entries': self.max_entries, 'hit_rate': self.stats['hits'] / lookups if lookups else 0.0}
+
+default_cache = InferenceCache()  # Process-wide cache used by inference_queue.infer
+
+# Usage example
+if __name__ == "__main__":
+    cache = InferenceCache(max_entries=2, ttl=60)
+    key = InferenceCache.make_key('sentiment', "Pi decision: approve", {})
+    print(cache.get(key))
+    cache.put(key, [{'label': 'POSITIVE', 'score': 0.98}])
+    print(cache.get(key), cache.metrics())
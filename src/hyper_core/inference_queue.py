@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from inference_cache import default_cache, model_id  # Deterministic results are reused across cycles
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Inference Queue: %(message)s')
+
+class _InferenceRequest:
+    __slots__ = ('item', 'params', 'params_key', 'future', 'loop', 'enqueued_at')
+
+    def __init__(self, item: Any, params: Dict[str, Any], future: asyncio.Future, loop: asyncio.AbstractEventLoop):
+        self.item = item
+        self.params = params
+        self.params_key = tuple(sorted((key, repr(value)) for key, value in params.items()))  # Only identical params share a batch
+        self.future = future
+        self.loop = loop
+        self.enqueued_at = time.monotonic()
+
+class InferenceQueue:
+    def __init__(self, model: Callable[..., Any], name: str = 'model', batch_window: float = 0.02, max_batch_size: int = 16):
+        self.model = model  # Pipeline (or SharedModel handle) that accepts a list of inputs
+        self.name = name
+        self.batch_window = batch_window  # Seconds to wait for more requests after the first one arrives
+        self.max_batch_size = max_batch_size
+        self._requests: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._closed = False
+        self.stats: Dict[str, float] = {'requests': 0, 'batches': 0, 'largest_batch': 0, 'busy_seconds': 0.0}
+
+    def _ensure_worker(self):
+        """Starts the model worker thread on first submission."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run_worker, name=f"inference-{self.name}", daemon=True)
+                self._worker.start()
+
+    def submit(self, item: Any, **params) -> asyncio.Future:
+        """Queues one input and returns a future resolved with the same shape a single pipeline call returns."""
+        if self._closed:
+            raise RuntimeError(f"Inference queue {self.name} is closed.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._requests.put(_InferenceRequest(item, params, future, loop))
+        self._ensure_worker()
+        return future
+
+    def _collect_batch(self, first: _InferenceRequest) -> List[_InferenceRequest]:
+        """Gathers requests arriving within the batch window (up to max_batch_size)."""
+        batch = [first]
+        deadline = first.enqueued_at + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:  # Close sentinel: finish this batch, then stop
+                self._requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run_worker(self):
+        """Worker thread: batches requests and runs the model off the event loop."""
+        while True:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch = self._collect_batch(first)
+            groups: Dict[Tuple, List[_InferenceRequest]] = {}
+            for request in batch:
+                groups.setdefault(request.params_key, []).append(request)
+            for group in groups.values():
+                self._run_group(group)
+
+    def _run_group(self, group: List[_InferenceRequest]):
+        """Runs one micro-batch and resolves each caller's future on its own loop."""
+        start = time.perf_counter()
+        try:
+            outputs = self.model([request.item for request in group], **group[0].params)
+            if len(outputs) != len(group):
+                raise ValueError(f"{self.name} returned {len(outputs)} outputs for {len(group)} inputs")
+            results = [output if isinstance(output, list) else [output] for output in outputs]  # Match single-call shape
+            for request, result in zip(group, results):
+                _deliver(request, result, None)
+        except Exception as e:
+            logging.error(f"Batch of {len(group)} on {self.name} failed: {e}")
+            for request in group:
+                _deliver(request, None, e)
+        self.stats['requests'] += len(group)
+        self.stats['batches'] += 1
+        self.stats['largest_batch'] = max(self.stats['largest_batch'], len(group))
+        self.stats['busy_seconds'] += time.perf_counter() - start
+
+    def close(self):
+        """Stops the worker once queued requests are served."""
+        self._closed = True
+        self._requests.put(None)
+
+def _deliver(request: _InferenceRequest, result: Any, error: Optional[Exception]):
+    """Hands a result back to the caller's event loop (ignored if that loop has shut down)."""
+    try:
+        request.loop.call_soon_threadsafe(_resolve_future, request.future, result, error)
+    except RuntimeError:
+        pass
+
+def _resolve_future(future: asyncio.Future, result: Any, error: Optional[Exception]):
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+_queues: Dict[Any, InferenceQueue] = {}
+_queues_lock = threading.Lock()
+
+def inference_queue_for(model: Callable[..., Any]) -> InferenceQueue:
+    """Returns the queue for a model; SharedModel handles of the same (task, model) share one queue."""
+    key = model_id(model)
+    with _queues_lock:
+        if key not in _queues:
+            name = '/'.join(str(part) for part in key[:2]) if isinstance(key, tuple) else getattr(model, '__name__', 'model')
+            _queues[key] = InferenceQueue(model, name=name)
+        return _queues[key]
+
+async def infer(model: Callable[..., Any], item: Any, **params) -> Any:
+    """Awaitable replacement for `model(item, **params)` that batches concurrent callers off the event loop."""
+    return await default_cache.get_or_compute(model, item, params, lambda: inference_queue_for(model).submit(item, **params))
+
+# Usage example
+if __name__ == "__main__":
+    def echo_model(inputs: List[str], max_length: int = 50) -> List[List[Dict[str, str]]]:
+        time.sleep(0.05)  # Stand-in for a blocking forward pass
+        return [[{'generated_text': text[:max_length]}] for text in inputs]
+
+    async def demo():
+        results = await asyncio.gather(*(infer(echo_model, f"PI prompt {i}", max_length=20) for i in range(10)))
+        print(results[0], inference_queue_for(echo_model).stats)
+
+    asyncio.run(demo())
@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for universal integration
-from transformers import pipeline  # AI for infinite expansion predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for infinite status, Buzzer for alerts, Button for expansion confirm
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for universal integration
+from model_registry import shared_pipeline  # AI for infinite expansion predictions
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for infinite status, Buzzer for alerts, Button for expansion confirm
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
@@ -15,6 +17,7 @@ from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalO
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 from final_pi_mainnet_supremacy_global_domination import FinalPiMainnetSupremacyGlobalDomination  # File 22
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Infinite Expansion: %(message)s')
@@ -32,13 +35,13 @@ class InfinitePiEcosystemExpansionUniversalIntegration:
         self.governance = governance
         self.swarm_hub = swarm_hub
         self.supremacy_module = supremacy_module
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Purple=infinite, Green=expanding, Red=limited
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.confirm_button = Button(confirm_button_pin)  # Manual expansion confirm
-        self.quantum_universal_circuit = self._init_quantum_universal()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Purple=infinite, Green=expanding, Red=limited
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.confirm_button = LazyObject(Button, confirm_button_pin)  # Manual expansion confirm
+        self.quantum_universal_circuit = LazyObject(self._init_quantum_universal)
         self.expansion_status = 'Finite'  # 'Finite', 'Expanding', 'Infinite'
         self.expansion_logs: List[Dict] = []
-        self.universal_ai = pipeline("text-generation", model="gpt2")  # AI for universal predictions
+        self.universal_ai = shared_pipeline("text-generation", model="gpt2")  # AI for universal predictions
 
     def _init_quantum_universal(self) -> QuantumCircuit:
         """Initializes quantum circuit for universal integration."""
@@ -93,30 +96,33 @@ class InfinitePiEcosystemExpansionUniversalIntegration:
 
     async def monitor_infinite_integration(self):
         """Monitors infinite integration of the ecosystem."""
-        while self.expansion_status == 'Infinite':
-            # AI universal prediction
-            prompt = "Predict infinite integration of fully open Pi mainnet with Stablecoin-Only."
-            prediction = self.universal_ai(prompt, max_length=50)[0]['generated_text']
-            logging.info(f"Universal Prediction: {prediction}")
-            # Check for universal threats
-            if not self.supremacy_module.domination_status == 'Supreme':
-                logging.critical("Infinite integration threatened. Initiating ecosystem infinite rebirth.")
-                self.expansion_status = 'Finite'
-                self.rgb_led.color = (1, 0, 0)  # Red: limited
-                self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
-                await self.core._trigger_system_rebirth()
-                break
-            await asyncio.sleep(86400)  # Monitor daily
+        job = default_scheduler.every('InfinitePiEcosystemExpansionUniversalIntegration.monitor_infinite_integration', 86400, self._integration_check)  # Monitor daily
+        await job.finished.wait()
+
+    async def _integration_check(self) -> bool:
+        """One universal prediction and threat check; returns False once the expansion is no longer infinite."""
+        if self.expansion_status != 'Infinite':
+            return False
+        # AI universal prediction
+        prompt = "Predict infinite integration of fully open Pi mainnet with Stablecoin-Only."
+        prediction = (await infer(self.universal_ai, prompt, max_length=50))[0]['generated_text']
+        logging.info(f"Universal Prediction: {prediction}")
+        # Check for universal threats
+        if not self.supremacy_module.domination_status == 'Supreme':
+            logging.critical("Infinite integration threatened. Initiating ecosystem infinite rebirth.")
+            self.expansion_status = 'Finite'
+            self.rgb_led.color = (1, 0, 0)  # Red: limited
+            self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
+            await self.core._trigger_system_rebirth()
+            return False
+        return True
 
     async def manual_expansion_confirm(self):
         """Handles manual confirmation for infinite expansion."""
-        while True:
-            if self.confirm_button.is_pressed:
-                logging.info("Manual confirmation for infinite Pi ecosystem expansion.")
-                if self.expansion_status == 'Finite':
-                    await self.expand_to_infinity()
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual confirmation for infinite Pi ecosystem expansion.")
+        if self.expansion_status == 'Finite':
+            await self.expand_to_infinity()
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_infinite_dashboard(self) -> Dict[str, Any]:
         """Generates holographic infinite expansion dashboard."""
@@ -135,7 +141,7 @@ class InfinitePiEcosystemExpansionUniversalIntegration:
 
     async def run_infinite_expansion(self):
         """Main infinite expansion loop."""
-        asyncio.create_task(self.manual_expansion_confirm())
+        default_scheduler.on_press('InfinitePiEcosystemExpansionUniversalIntegration.manual_expansion_confirm', self.confirm_button, self.manual_expansion_confirm)
         if self.expansion_status == 'Finite':
             await self.expand_to_infinity()
         if self.expansion_status == 'Infinite':
@@ -0,0 +1,287 @@
+import argparse
+import atexit
+import bisect
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Dict, List, Any, Iterator, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Journal: %(message)s')
+
+ACTIVE_SUFFIX = '.jsonl'
+COMPRESSED_SUFFIX = '.jsonl.gz'
+
+_open_journals = weakref.WeakSet()  # Closed at interpreter exit, so buffered records reach disk
+
+@atexit.register
+def _close_open_journals():
+    for journal in list(_open_journals):
+        journal.close()
+
+class _Segment:
+    __slots__ = ('first', 'path', 'count', 'size', 'opened')
+
+    def __init__(self, first: int, path: str, count: int = 0, size: int = 0, opened: Optional[float] = None):
+        self.first = first  # Index of the segment's first record; also its file name
+        self.path = path
+        self.count = count
+        self.size = size
+        self.opened = time.time() if opened is None else opened
+
+class Journal:
+    """Append-only JSONL journal: O(1) appends, buffered flushes off the caller's thread, rotated (optionally gzipped) segments.
+
+    Reads look list-like (`len`, `[-1]`, slices, iteration) so it can replace an in-memory list of log records;
+    recent records are served from memory, older ones by seeking to the segment that holds them.
+    """
+
+    def __init__(self, directory: str, max_segment_bytes: int = 4 * 1024 * 1024, max_segment_age: float = 86400.0,
+                 compress: bool = True, flush_interval: float = 1.0, flush_records: int = 256, memory_tail: int = 64,
+                 legacy_path: Optional[str] = None):
+        self.directory = directory
+        self.name = os.path.basename(os.path.normpath(directory))
+        self.max_segment_bytes = max_segment_bytes  # Size-based rotation
+        self.max_segment_age = max_segment_age  # Time-based rotation (seconds)
+        self.compress = compress  # Gzip segments once they are closed
+        self.flush_interval = flush_interval  # Longest a record waits in the buffer
+        self.flush_records = flush_records  # Buffer size that triggers an early flush
+        self._segments: List[_Segment] = []
+        self._buffer: List[str] = []
+        self._tail: deque = deque(maxlen=memory_tail)  # Most recent records, decoded
+        self._count = 0
+        self._lock = threading.Lock()  # Buffer, counters and segment list
+        self._io_lock = threading.RLock()  # Segment files: writes, rotation and reads
+        self._wakeup = threading.Condition(self._lock)
+        self._writer = None
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+        if legacy_path and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+        _open_journals.add(self)
+
+    def _segment_path(self, first: int, compressed: bool = False) -> str:
+        return os.path.join(self.directory, f"{self.name}.{first:012d}{COMPRESSED_SUFFIX if compressed else ACTIVE_SUFFIX}")
+
+    def _recover(self):
+        """Finds segments by name; only the last (active) one is scanned, and a torn final line is cut off."""
+        firsts = {}
+        for name in os.listdir(self.directory):
+            for suffix in (COMPRESSED_SUFFIX, ACTIVE_SUFFIX):
+                if name.startswith(self.name + '.') and name.endswith(suffix):
+                    first = int(name[len(self.name) + 1:-len(suffix)])
+                    if suffix == ACTIVE_SUFFIX or first not in firsts:  # A crash mid-compression leaves both: keep the original
+                        firsts[first] = os.path.join(self.directory, name)
+                    break
+        for first in sorted(firsts):
+            path = firsts[first]
+            if path.endswith(ACTIVE_SUFFIX) and os.path.exists(path[:-len(ACTIVE_SUFFIX)] + COMPRESSED_SUFFIX):
+                os.remove(path[:-len(ACTIVE_SUFFIX)] + COMPRESSED_SUFFIX)  # Partial compression output
+            if self._segments:
+                self._segments[-1].count = first - self._segments[-1].first
+            self._segments.append(_Segment(first, path, size=os.path.getsize(path), opened=os.path.getmtime(path)))
+        if not self._segments:
+            return
+        active = self._segments[-1]
+        if active.path.endswith(COMPRESSED_SUFFIX):
+            self._count = active.first + self._read_count(active.path)
+            active.count = self._count - active.first
+            return
+        with open(active.path, 'rb') as f:
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            logging.warning(f"Dropping torn record at the end of {active.path}.")
+            with open(active.path, 'r+b') as f:
+                f.truncate(end)
+        active.count, active.size = data.count(b'\n', 0, end), end
+        self._count = active.first + active.count
+        for line in data[:end].splitlines()[-self._tail.maxlen:]:
+            self._tail.append(json.loads(line))
+
+    def _read_count(self, path: str) -> int:
+        with gzip.open(path, 'rb') as f:
+            return sum(1 for _ in f)
+
+    def _import_legacy(self, legacy_path: str):
+        """Moves records from a rewritten-in-full JSON array file into the journal (once)."""
+        try:
+            with open(legacy_path, 'r') as f:
+                records = json.load(f)
+        except ValueError as e:
+            logging.error(f"Legacy log {legacy_path} is unreadable ({e}); leaving it in place.")
+            return
+        for record in records:
+            self.append(record)
+        self.flush()
+        os.replace(legacy_path, legacy_path + '.legacy')
+        logging.info(f"Imported {len(records)} records from {legacy_path} into journal {self.name}.")
+
+    def append(self, record: Any):
+        """Buffers one record; a background thread writes it within flush_interval."""
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._buffer.append(line)
+            self._tail.append(record)
+            self._count += 1
+            if self._flusher is None and not self._closed:
+                self._flusher = threading.Thread(target=self._run, name=f'journal-{self.name}', daemon=True)
+                self._flusher.start()
+            if len(self._buffer) >= self.flush_records:
+                self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._buffer and not self._closed:
+                    self._wakeup.wait(self.flush_interval)
+                if self._closed and not self._buffer:
+                    return
+            self.flush()
+
+    def flush(self, fsync: bool = False):
+        """Writes buffered records to the active segment, rotating first if it is too big or too old."""
+        with self._io_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+                first = self._count - len(lines)
+            if not lines:
+                return
+            active = self._segments[-1] if self._segments else None
+            if (active is None or active.path.endswith(COMPRESSED_SUFFIX) or active.size >= self.max_segment_bytes
+                    or time.time() - active.opened >= self.max_segment_age):
+                self._rotate(first)
+                active = self._segments[-1]
+            elif self._writer is None:
+                self._writer = open(active.path, 'ab')  # Resume the active segment found on recovery
+            data = ''.join(lines).encode()
+            self._writer.write(data)
+            self._writer.flush()
+            if fsync:
+                os.fsync(self._writer.fileno())
+            with self._lock:
+                active.size += len(data)
+                active.count += len(lines)
+
+    def _rotate(self, first: int):
+        """Closes the active segment (compressing it if configured) and starts a new one at record `first`."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._segments and self.compress and self._segments[-1].path.endswith(ACTIVE_SUFFIX):
+            self._compress(self._segments[-1])
+        segment = _Segment(first, self._segment_path(first))
+        self._writer = open(segment.path, 'ab')
+        with self._lock:
+            self._segments.append(segment)
+
+    def _compress(self, segment: _Segment):
+        compressed = segment.path[:-len(ACTIVE_SUFFIX)] + COMPRESSED_SUFFIX
+        with open(segment.path, 'rb') as source, gzip.open(compressed, 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.remove(segment.path)  # Only after the compressed copy is complete
+        segment.path = compressed
+
+    def _read_segment(self, segment: _Segment) -> List[bytes]:
+        opener = gzip.open if segment.path.endswith(COMPRESSED_SUFFIX) else open
+        with opener(segment.path, 'rb') as f:
+            return f.read().splitlines()
+
+    def range(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Any]:
+        """Records [start, stop) in order, reading only the segments that overlap the range."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        with self._lock:
+            memory_start = self._count - len(self._tail)
+            tail = list(self._tail) if stop > memory_start else []
+        if start >= memory_start:
+            yield from tail[start - memory_start:stop - memory_start]
+            return
+        self.flush()
+        with self._io_lock:
+            segments = list(self._segments)
+            index = bisect.bisect_right([segment.first for segment in segments], start) - 1
+            for segment in segments[index:]:
+                if segment.first >= stop:
+                    break
+                lines = self._read_segment(segment)
+                for line in lines[max(start - segment.first, 0):stop - segment.first]:
+                    yield json.loads(line)
+
+    def tail(self, n: int) -> List[Any]:
+        """Last n records, oldest first."""
+        return list(self.range(max(len(self) - n, 0)))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.range(0, len(self))
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            return list(self.range(start, stop))[::step] if step > 0 else list(self.range(stop + 1, start + 1))[::step]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('journal index out of range')
+        return next(self.range(index, index + 1))
+
+    def close(self):
+        _open_journals.discard(self)
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush(fsync=True)
+        with self._io_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+def benchmark_journal(events: int = 5000, record_bytes: int = 200) -> Dict[str, float]:
+    """Per-event cost of rewriting a JSON array (previous pattern) vs appending to a journal."""
+    directory = tempfile.mkdtemp()
+    record = {'timestamp': 0.0, 'status': 'Open', 'payload': 'x' * record_bytes}
+    history, path = [], os.path.join(directory, 'rewrite.json')
+    start = time.perf_counter()
+    for i in range(events):
+        history.append({**record, 'timestamp': float(i)})
+        with open(path, 'w') as f:
+            json.dump(history, f)
+    rewrite_seconds = time.perf_counter() - start
+    journal = Journal(os.path.join(directory, 'journal'), max_segment_bytes=256 * 1024)
+    start = time.perf_counter()
+    for i in range(events):
+        journal.append({**record, 'timestamp': float(i)})
+    append_seconds = time.perf_counter() - start
+    journal.close()
+    start = time.perf_counter()
+    recent = journal.tail(10)
+    tail_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    middle = list(journal.range(events // 2, events // 2 + 100))
+    range_ms = (time.perf_counter() - start) * 1000
+    assert recent[-1]['timestamp'] == events - 1 and middle[0]['timestamp'] == events // 2
+    disk = sum(os.path.getsize(os.path.join(journal.directory, name)) for name in os.listdir(journal.directory))
+    return {'rewrite_us_per_event': rewrite_seconds / events * 1e6, 'journal_us_per_event': append_seconds / events * 1e6,
+            'tail_ms': tail_ms, 'range_ms': range_ms, 'rewrite_file_mb': os.path.getsize(path) / 1e6, 'journal_disk_mb': disk / 1e6}
+
+# Usage: python journal.py [--events N]; compares full-file JSON rewrites with journal appends
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the JSONL journal against rewriting a JSON array per event.")
+    parser.add_argument('--events', type=int, default=5000)
+    args = parser.parse_args()
+    print(benchmark_journal(args.events))
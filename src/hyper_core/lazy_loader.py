@@ -0,0 +1,114 @@
+import importlib
+import logging
+import threading
+import time
+from typing import Dict, List, Any, Callable, Tuple, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Lazy Loader: %(message)s')
+
+_load_events: List[Dict[str, Any]] = []  # Resolution timings, read by the startup profiler
+_events_lock = threading.Lock()
+
+class LazyObject:
+    """Defers building a model, backend or device until it is first used."""
+
+    __slots__ = ('_lazy_factory', '_lazy_args', '_lazy_kwargs', '_lazy_label', '_lazy_instance', '_lazy_loaded', '_lazy_lock')
+
+    def __init__(self, factory: Callable[..., Any], *args, **kwargs):
+        object.__setattr__(self, '_lazy_factory', factory)
+        object.__setattr__(self, '_lazy_args', args)
+        object.__setattr__(self, '_lazy_kwargs', kwargs)
+        object.__setattr__(self, '_lazy_label', _describe(factory, args, kwargs))
+        object.__setattr__(self, '_lazy_instance', None)
+        object.__setattr__(self, '_lazy_loaded', False)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+
+    def _resolve(self) -> Any:
+        """Builds the wrapped object on first access (thread-safe) and records the cost."""
+        if object.__getattribute__(self, '_lazy_loaded'):
+            return object.__getattribute__(self, '_lazy_instance')
+        with object.__getattribute__(self, '_lazy_lock'):
+            if not object.__getattribute__(self, '_lazy_loaded'):
+                label = object.__getattribute__(self, '_lazy_label')
+                start = time.perf_counter()
+                factory = resolve(object.__getattribute__(self, '_lazy_factory'))
+                args = [resolve(arg) for arg in object.__getattribute__(self, '_lazy_args')]
+                kwargs = {key: resolve(value) for key, value in object.__getattribute__(self, '_lazy_kwargs').items()}
+                instance = factory(*args, **kwargs)
+                elapsed = time.perf_counter() - start
+                object.__setattr__(self, '_lazy_instance', instance)
+                object.__setattr__(self, '_lazy_loaded', True)
+                with _events_lock:
+                    _load_events.append({'label': label, 'seconds': elapsed, 'thread': threading.current_thread().name})
+                logging.info(f"Loaded {label} on first use in {elapsed:.3f}s")
+        return object.__getattribute__(self, '_lazy_instance')
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._resolve(), name, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._resolve()[key]
+
+    def __call__(self, *args, **kwargs) -> Any:
+        # Lazy arguments (e.g. a deferred QuantumCircuit passed to execute) are unwrapped before the real call
+        return self._resolve()(*[resolve(arg) for arg in args], **{key: resolve(value) for key, value in kwargs.items()})
+
+    def __repr__(self) -> str:
+        state = 'loaded' if object.__getattribute__(self, '_lazy_loaded') else 'pending'
+        return f"<LazyObject {object.__getattribute__(self, '_lazy_label')} ({state})>"
+
+def _describe(factory: Any, args: Tuple, kwargs: Dict[str, Any]) -> str:
+    """Builds a short human-readable label for load reports."""
+    if isinstance(factory, LazyObject):
+        name = object.__getattribute__(factory, '_lazy_label')
+    else:
+        name = getattr(factory, '__qualname__', None) or getattr(factory, '__name__', None) or repr(factory)
+    if factory in (importlib.import_module, _import_attribute):
+        return '.'.join(str(arg) for arg in args)
+    params = [repr(arg) for arg in args] + [f"{key}={value!r}" for key, value in kwargs.items()]
+    return f"{name}({', '.join(params)})"
+
+def _import_attribute(module_name: str, attribute: str) -> Any:
+    """Imports a module and returns one of its attributes (or submodules, as `from pkg import sub` does)."""
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        return importlib.import_module(f"{module_name}.{attribute}")
+
+def resolve(obj: Any) -> Any:
+    """Returns the real object behind a LazyObject (building it if needed), or obj unchanged."""
+    if isinstance(obj, LazyObject):
+        return obj._resolve()
+    return obj
+
+def is_loaded(obj: Any) -> bool:
+    """Reports whether a LazyObject has been built yet (plain objects always count as loaded)."""
+    if isinstance(obj, LazyObject):
+        return object.__getattribute__(obj, '_lazy_loaded')
+    return True
+
+def lazy_import(module_name: str) -> LazyObject:
+    """Lazy equivalent of `import module_name`; the import runs on first attribute access."""
+    return LazyObject(importlib.import_module, module_name)
+
+def lazy_from(module_name: str, *attributes: str) -> Union[LazyObject, Tuple[LazyObject, ...]]:
+    """Lazy equivalent of `from module_name import a, b`; returns one proxy per name."""
+    proxies = tuple(LazyObject(_import_attribute, module_name, attribute) for attribute in attributes)
+    return proxies[0] if len(proxies) == 1 else proxies
+
+def load_report() -> List[Dict[str, Any]]:
+    """Returns every deferred load seen so far, most expensive first."""
+    with _events_lock:
+        return sorted(_load_events, key=lambda event: event['seconds'], reverse=True)
+
+# Usage example
+if __name__ == "__main__":
+    JSONEncoder = lazy_from('json', 'JSONEncoder')
+    encoder = LazyObject(JSONEncoder, sort_keys=True)  # Nothing is imported or built yet
+    print(encoder.encode({'pi': 314159, 'currency': 'PI'}))
+    print(load_report())
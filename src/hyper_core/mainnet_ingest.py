@@ -0,0 +1,264 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Awaitable, Callable, Iterable, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Mainnet Ingest: %(message)s')
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string ids (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity: int = 1000000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self.count = 0  # Ids added since the last clear
+
+    def _positions(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._array[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def clear(self):
+        self._array = bytearray(len(self._array))
+        self.count = 0
+
+class SeenIds:
+    """Two-tier seen-id set: a Bloom filter answers "definitely new" cheaply; an exact LRU decides the rest.
+
+    A Bloom hit that the LRU does not hold is either a false positive or an id older than the LRU window; `confirm`
+    (e.g. a store lookup) settles it when given, otherwise the id is treated as new and counted under `bloom_only`.
+    """
+
+    def __init__(self, capacity: int = 1000000, error_rate: float = 0.001, exact_entries: int = 50000,
+                 confirm: Optional[Callable[[str], bool]] = None):
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.exact_entries = exact_entries
+        self.confirm = confirm
+        self._recent: 'OrderedDict[str, None]' = OrderedDict()
+        self.stats: Dict[str, int] = {'new': 0, 'duplicates': 0, 'bloom_only': 0, 'bloom_resets': 0}
+
+    def seen(self, item: str) -> bool:
+        if item not in self.bloom:
+            self.stats['new'] += 1
+            return False
+        if item in self._recent:
+            self._recent.move_to_end(item)
+            self.stats['duplicates'] += 1
+            return True
+        if self.confirm is not None and self.confirm(item):
+            self.stats['duplicates'] += 1
+            return True
+        self.stats['bloom_only'] += 1
+        return False
+
+    def add(self, item: str):
+        if self.bloom.count >= self.bloom.capacity:  # Saturated: rebuild from the exact window
+            self.bloom.clear()
+            for recent in self._recent:
+                self.bloom.add(recent)
+            self.stats['bloom_resets'] += 1
+        self.bloom.add(item)
+        self._recent[item] = None
+        self._recent.move_to_end(item)
+        if len(self._recent) > self.exact_entries:
+            self._recent.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+class MainnetIngest:
+    """fetch -> dedupe -> filter -> persist over bounded asyncio queues, resuming from a persisted cursor.
+
+    `fetch(cursor, limit)` returns (transactions, next_cursor); `filter(tx)` is an async verdict; `persist(accepted,
+    rejected)` commits one page. The cursor is saved only after its page is persisted, so a restart refetches at
+    most one page, and the seen-id set drops the overlap.
+    """
+
+    def __init__(self, fetch: Callable[[Any, int], Awaitable[Tuple[List[Dict[str, Any]], Any]]],
+                 filter: Callable[[Dict[str, Any]], Awaitable[bool]],
+                 persist: Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], Awaitable[Any]],
+                 cursor_path: str = './mainnet_cursor.json', page_size: int = 100, queue_size: int = 8,
+                 filter_concurrency: int = 16, seen: Optional[SeenIds] = None, seed_ids: Iterable[str] = ()):
+        self.fetch = fetch
+        self.filter = filter
+        self.persist = persist
+        self.cursor_path = cursor_path
+        self.page_size = page_size
+        self.queue_size = queue_size  # Pages buffered between stages: a full queue pauses fetching
+        self.filter_concurrency = filter_concurrency
+        self.seen = seen or SeenIds()
+        for tx_id in seed_ids:  # Recently persisted ids, so the first overlap after a restart is dropped too
+            self.seen.add(tx_id)
+        self.cursor = self._load_cursor()
+        self._inflight: set = set()  # Passed dedupe, not yet persisted
+        self.last_event_time: Optional[float] = None
+        self.stats: Dict[str, float] = {'fetched': 0, 'pages': 0, 'duplicates': 0, 'committed': 0, 'rejected': 0, 'syncs': 0,
+                                        'last_sync_seconds': 0.0, 'last_sync_tx_per_s': 0.0, 'lag_seconds': 0.0}
+
+    def _load_cursor(self) -> Any:
+        if os.path.exists(self.cursor_path):
+            with open(self.cursor_path, 'r') as f:
+                return json.load(f).get('cursor')
+        return None
+
+    def _save_cursor(self):
+        directory = os.path.dirname(os.path.abspath(self.cursor_path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.cursor-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'cursor': self.cursor, 'updated': time.time()}, f)
+        os.replace(tmp, self.cursor_path)  # Atomic: a crash leaves the old or the new cursor, never a torn file
+
+    async def sync(self) -> Dict[str, Any]:
+        """Ingests until fetch is caught up; returns metrics."""
+        start = time.perf_counter()
+        processed = self.stats['committed'] + self.stats['rejected']
+        dedupe_queue, filter_queue, persist_queue = (asyncio.Queue(maxsize=self.queue_size) for _ in range(3))
+        stages = [asyncio.create_task(self._fetch_stage(dedupe_queue)),
+                  asyncio.create_task(self._dedupe_stage(dedupe_queue, filter_queue)),
+                  asyncio.create_task(self._filter_stage(filter_queue, persist_queue)),
+                  asyncio.create_task(self._persist_stage(persist_queue))]
+        try:
+            await asyncio.gather(*stages)  # A failing stage raises here instead of leaving the others blocked on a full queue
+        finally:
+            for stage in stages:
+                stage.cancel()
+            self._inflight.clear()  # Unpersisted ids stay unseen, so the next sync retries them
+        elapsed = time.perf_counter() - start
+        self.stats['syncs'] += 1
+        self.stats['last_sync_seconds'] = elapsed
+        self.stats['last_sync_tx_per_s'] = (self.stats['committed'] + self.stats['rejected'] - processed) / elapsed if elapsed else 0.0
+        return self.metrics()
+
+    async def _fetch_stage(self, output: asyncio.Queue):
+        cursor = self.cursor
+        while True:
+            page, next_cursor = await self.fetch(cursor, self.page_size)
+            self.stats['fetched'] += len(page)
+            self.stats['pages'] += 1
+            await output.put((page, next_cursor if next_cursor is not None else cursor))
+            if next_cursor is None or next_cursor == cursor or len(page) < self.page_size:
+                break
+            cursor = next_cursor
+        await output.put(None)
+
+    async def _dedupe_stage(self, source: asyncio.Queue, output: asyncio.Queue):
+        while (item := await source.get()) is not None:
+            page, next_cursor = item
+            fresh = []
+            for tx in page:
+                if tx['id'] in self._inflight or self.seen.seen(tx['id']):
+                    self.stats['duplicates'] += 1
+                    continue
+                self._inflight.add(tx['id'])
+                fresh.append(tx)
+            await output.put((fresh, next_cursor))
+        await output.put(None)
+
+    async def _filter_stage(self, source: asyncio.Queue, output: asyncio.Queue):
+        semaphore = asyncio.Semaphore(self.filter_concurrency)
+
+        async def bounded(tx: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self.filter(tx)
+
+        while (item := await source.get()) is not None:
+            page, next_cursor = item
+            verdicts = await asyncio.gather(*(bounded(tx) for tx in page))
+            accepted = [tx for tx, ok in zip(page, verdicts) if ok]
+            rejected = [tx for tx, ok in zip(page, verdicts) if not ok]
+            await output.put((accepted, rejected, next_cursor))
+        await output.put(None)
+
+    async def _persist_stage(self, source: asyncio.Queue):
+        while (item := await source.get()) is not None:
+            accepted, rejected, next_cursor = item
+            if accepted or rejected:
+                await self.persist(accepted, rejected)
+            for tx in accepted + rejected:
+                self.seen.add(tx['id'])
+                self._inflight.discard(tx['id'])
+            self.stats['committed'] += len(accepted)
+            self.stats['rejected'] += len(rejected)
+            timestamps = [tx['timestamp'] for tx in accepted + rejected if 'timestamp' in tx]
+            if timestamps:
+                self.last_event_time = max(timestamps)
+                self.stats['lag_seconds'] = time.time() - self.last_event_time  # Event time to commit time
+            if next_cursor != self.cursor:
+                self.cursor = next_cursor
+                self._save_cursor()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Throughput, lag and dedupe counters, for dashboards and logs."""
+        return {**self.stats, 'cursor': self.cursor, 'seen_exact': len(self.seen), **{f'seen_{k}': v for k, v in self.seen.stats.items()}}
+
+def benchmark_ingest(transactions: int = 5000, page_size: int = 200, overlap: int = 50, filter_latency: float = 0.001) -> Dict[str, float]:
+    """Overlapping pages through the per-transaction loop (previous path, no dedupe) vs the ingest pipeline.
+
+    The filter is simulated as an awaited call taking filter_latency seconds.
+    """
+    filtered = []
+
+    async def filter_tx(tx: Dict[str, Any]) -> bool:
+        filtered.append(tx['id'])
+        await asyncio.sleep(filter_latency)
+        return tx['amount'] % 10 != 0
+
+    async def fetch(cursor: Any, limit: int) -> Tuple[List[Dict[str, Any]], Any]:
+        start = max((cursor or 0) - overlap, 0)  # Each page re-delivers the tail of the previous one
+        stop = min(start + limit, transactions)
+        page = [{'id': f'mainnet_{seq}', 'amount': seq % 97, 'timestamp': time.time()} for seq in range(start, stop)]
+        return page, (stop if stop < transactions else None)
+
+    async def run() -> Dict[str, float]:
+        stored: List[Dict[str, Any]] = []
+        start, cursor = time.perf_counter(), None
+        while True:
+            page, cursor = await fetch(cursor, page_size)
+            for tx in page:
+                if await filter_tx(tx):
+                    stored.append(tx)
+            if cursor is None:
+                break
+        loop_seconds, loop_filtered, loop_stored = time.perf_counter() - start, len(filtered), len(stored)
+        stored_loop, stored = stored, []
+        filtered.clear()
+
+        async def persist(accepted: List[Dict[str, Any]], rejected: List[Dict[str, Any]]):
+            stored.extend(accepted)
+
+        ingest = MainnetIngest(fetch, filter_tx, persist, os.path.join(tempfile.mkdtemp(), 'cursor.json'), page_size=page_size)
+        start = time.perf_counter()
+        metrics = await ingest.sync()
+        pipeline_seconds = time.perf_counter() - start
+        assert len(stored) == len({tx['id'] for tx in stored})
+        return {'loop_tx_per_s': loop_filtered / loop_seconds, 'loop_stored_unique': len({tx['id'] for tx in stored_loop}), 'loop_filtered': loop_filtered, 'loop_stored': loop_stored,
+                'pipeline_tx_per_s': len(filtered) / pipeline_seconds, 'pipeline_stored_tx_per_s': len(stored) / pipeline_seconds, 'pipeline_filtered': len(filtered), 'pipeline_stored': len(stored),
+                'duplicates_dropped': metrics['duplicates']}
+
+    return asyncio.run(run())
+
+# Usage: python mainnet_ingest.py [--transactions N]; compares the per-transaction loop with the ingest pipeline
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the mainnet ingest pipeline against per-transaction syncing.")
+    parser.add_argument('--transactions', type=int, default=5000)
+    args = parser.parse_args()
+    print(benchmark_ingest(args.transactions))
@@ -3,7 +3,8 @@ import logging
 import sys
 import os
 from typing import Dict, List, Any
-from gpiozero import LED, Buzzer, Button, RGBLED  # Pi hardware: Master controls
+from lazy_loader import LazyObject, lazy_from
+LED, Buzzer, Button, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'Button', 'RGBLED')  # Pi hardware: Master controls
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
@@ -17,20 +18,45 @@ from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  #
 from global_pi_oracle_compliance_verifier import GlobalPIOracleComplianceVerifier  # File 11
 from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalOverseer  # File 12
 from final_ecosystem_synthesis_ui_hub import FinalEcosystemSynthesisUIHub  # File 13
+from model_registry import default_registry  # Shared transformer pipelines
+from inference_cache import default_cache  # Inference result cache metrics
+from task_scheduler import default_scheduler
+from startup_graph import StartupGraph  # Independent modules constructed concurrently, with a startup trace
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Master Control: %(message)s')
 
+# Module name -> (class, constructor dependencies in argument order); pi_client and stellar_server are provided at boot
+ECOSYSTEM_MODULES = {
+    'ahi_ai': (AutonomousHyperIntelligenceAI, ['pi_client', 'stellar_server']),
+    'pi_manager': (PIStablecoinManager, ['ahi_ai']),
+    'app_builder': (AutonomousAppBuilder, ['ahi_ai', 'pi_manager']),
+    'monitor': (HyperEcosystemMonitor, ['ahi_ai', 'pi_manager', 'app_builder']),
+    'security': (QuantumSecurityLayer, ['ahi_ai', 'pi_manager', 'app_builder', 'monitor']),
+    'core': (UltimateIntegrationCore, ['pi_client', 'stellar_server']),
+    'expansion': (FinalHyperExpansionModule, ['core']),
+    'deployer': (UltimateDeploymentScript, []),
+    'config': (EcosystemREADMEConfig, ['deployer']),
+    'purity_enforcer': (PIPurityAccountabilityEnforcer, ['ahi_ai', 'pi_manager', 'security', 'core']),
+    'oracle': (GlobalPIOracleComplianceVerifier, ['ahi_ai', 'pi_manager', 'security', 'expansion', 'purity_enforcer']),
+    'governance': (UltimateAIGovernanceEthicalOverseer, ['ahi_ai', 'pi_manager', 'security', 'core', 'purity_enforcer', 'oracle']),
+    'ui_hub': (FinalEcosystemSynthesisUIHub, ['core'])
+}
+
 class MasterControlFinalIntegrationScript:
-    def __init__(self):
-        self.master_rgb = RGBLED(red=1, green=2, blue=3)  # Master status: Green=active, Red=halt, Blue=booting
-        self.emergency_button = Button(4)  # Emergency halt
-        self.alert_buzzer = Buzzer(5)
+    def __init__(self, startup_workers: int = 4, trace_path: str = './startup_trace.json'):
+        self.master_rgb = LazyObject(RGBLED, red=1, green=2, blue=3)  # Master status: Green=active, Red=halt, Blue=booting
+        self.emergency_button = LazyObject(Button, 4)  # Emergency halt
+        self.alert_buzzer = LazyObject(Buzzer, 5)
         self.modules: Dict[str, Any] = {}
         self.ecosystem_active = False
+        self.startup = StartupGraph(max_workers=startup_workers)  # Constructors run on worker threads once their dependencies exist
+        for name, (module_class, depends_on) in ECOSYSTEM_MODULES.items():
+            self.startup.add(name, module_class, depends_on)
+        self.trace_path = trace_path  # Per-module start/end and critical path of the last boot
 
     async def initialize_ecosystem(self):
-        """Initializes all modules in sequence."""
+        """Initializes all modules, independent ones concurrently, and writes the startup trace."""
         logging.info("Initializing Master Control for Pi Ecosystem...")
         self.master_rgb.color = (0, 0, 1)  # Blue: booting
         try:
@@ -38,20 +64,13 @@ class MasterControlFinalIntegrationScript:
             pi_client = None
             stellar_server = None
             # Initialize core modules
-            self.modules['ahi_ai'] = AutonomousHyperIntelligenceAI(pi_client, stellar_server)
-            self.modules['pi_manager'] = PIStablecoinManager(self.modules['ahi_ai'])
-            self.modules['app_builder'] = AutonomousAppBuilder(self.modules['ahi_ai'], self.modules['pi_manager'])
-            self.modules['monitor'] = HyperEcosystemMonitor(self.modules['ahi_ai'], self.modules['pi_manager'], self.modules['app_builder'])
-            self.modules['security'] = QuantumSecurityLayer(self.modules['ahi_ai'], self.modules['pi_manager'], self.modules['app_builder'], self.modules['monitor'])
-            self.modules['core'] = UltimateIntegrationCore(pi_client, stellar_server)
-            self.modules['expansion'] = FinalHyperExpansionModule(self.modules['core'])
-            self.modules['deployer'] = UltimateDeploymentScript()
-            self.modules['config'] = EcosystemREADMEConfig(self.modules['deployer'])
-            self.modules['purity_enforcer'] = PIPurityAccountabilityEnforcer(self.modules['ahi_ai'], self.modules['pi_manager'], self.modules['security'], self.modules['core'])
-            self.modules['oracle'] = GlobalPIOracleComplianceVerifier(self.modules['ahi_ai'], self.modules['pi_manager'], self.modules['security'], self.modules['expansion'], self.modules['purity_enforcer'])
-            self.modules['governance'] = UltimateAIGovernanceEthicalOverseer(self.modules['ahi_ai'], self.modules['pi_manager'], self.modules['security'], self.modules['core'], self.modules['purity_enforcer'], self.modules['oracle'])
-            self.modules['ui_hub'] = FinalEcosystemSynthesisUIHub(self.modules['core'])
+            try:
+                modules = await self.startup.initialize({'pi_client': pi_client, 'stellar_server': stellar_server})
+            finally:
+                self.startup.write_trace(self.trace_path)  # Written on failure too: shows which constructor broke
+            self.modules.update((name, modules[name]) for name in ECOSYSTEM_MODULES)
             logging.info("All modules initialized.")
+            self.report_model_memory()
             self.ecosystem_active = True
             self.master_rgb.color = (0, 1, 0)  # Green: active
         except Exception as e:
@@ -60,11 +79,26 @@ class MasterControlFinalIntegrationScript:
             self.alert_buzzer.beep(on_time=1, off_time=1, n=5)
             sys.exit(1)
 
+    def report_model_memory(self) -> Dict[str, Any]:
+        """Logs how much RAM the shared model registry saves across the initialized stack."""
+        report = default_registry.memory_report()
+        for model in report['models']:
+            logging.info(f"Model {model['task']}/{model['model']}: {model['holders']} holders, {model['size_mb']} MB, loaded={model['loaded']}")
+        logging.info(f"Model memory: {report['shared_mb']} MB shared vs {report['unshared_mb']} MB unshared ({report['saved_mb']} MB saved)")
+        return report
+
+    def report_inference_cache(self) -> Dict[str, Any]:
+        """Logs hit/miss metrics of the shared inference result cache."""
+        metrics = default_cache.metrics()
+        logging.info(f"Inference cache: {metrics['hits']} hits, {metrics['misses']} misses ({metrics['hit_rate']:.0%}), {metrics['size']}/{metrics['max_entries']} entries, {metrics['evictions']} evicted, {metrics['expirations']} expired")
+        return metrics
+
     async def orchestrate_ecosystem(self):
         """Orchestrates all modules in parallel."""
         if not self.ecosystem_active:
             return
         logging.info("Orchestrating Pi Ecosystem...")
+        default_scheduler.on_press('MasterControlFinalIntegrationScript.emergency_halt', self.emergency_button, self._emergency_halt_handler, once=True)
         tasks = [
             self.modules['core'].orchestrate_ecosystem(),
             self.modules['expansion'].run_expansion(),
@@ -72,37 +106,40 @@ class MasterControlFinalIntegrationScript:
             self.modules['oracle'].run_oracle(),
             self.modules['governance'].run_governance(),
             self.modules['ui_hub'].run_ui_hub(),
-            self._master_monitoring(),
-            self._emergency_halt_handler()
+            self._master_monitoring()
         ]
         await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _master_monitoring(self):
         """Master-level monitoring for PI purity and compliance."""
-        while self.ecosystem_active:
-            # Enforce Stablecoin-Only: Reject exchange/unclear PI
-            sample_tx = {'id': 'monitor_tx', 'source': 'mining', 'amount': 100}  # Pure
-            if not await self.modules['purity_enforcer'].enforce_pi_purity(sample_tx):
-                logging.warning("PI purity breach detected in monitoring.")
-            # Check for founder manipulations
-            if self.modules['purity_enforcer'].founder_watchlist['violations']:
-                await self.modules['purity_enforcer']._freeze_and_return_all_pi()
-                await self._halt_ecosystem("Founder manipulation detected.")
-                break
-            # Ensure no crime vulnerabilities (simulate audit)
-            if random.random() < 0.01:  # Rare simulation
-                logging.critical("Crime vulnerability detected. Securing ecosystem.")
-                await self.modules['security']._isolate_system()
-            await asyncio.sleep(300)  # Monitor every 5 minutes
+        job = default_scheduler.every('MasterControlFinalIntegrationScript.master_monitoring', 300, self._master_monitoring_check)  # Monitor every 5 minutes
+        await job.finished.wait()
+
+    async def _master_monitoring_check(self) -> bool:
+        """One monitoring pass; returns False once the ecosystem is halted."""
+        if not self.ecosystem_active:
+            return False
+        # Enforce Stablecoin-Only: Reject exchange/unclear PI
+        sample_tx = {'id': 'monitor_tx', 'source': 'mining', 'amount': 100}  # Pure
+        if not await self.modules['purity_enforcer'].enforce_pi_purity(sample_tx):
+            logging.warning("PI purity breach detected in monitoring.")
+        # Check for founder manipulations
+        if self.modules['purity_enforcer'].founder_watchlist['violations']:
+            await self.modules['purity_enforcer']._freeze_and_return_all_pi()
+            await self._halt_ecosystem("Founder manipulation detected.")
+            return False
+        # Ensure no crime vulnerabilities (simulate audit)
+        if random.random() < 0.01:  # Rare simulation
+            logging.critical("Crime vulnerability detected. Securing ecosystem.")
+            await self.modules['security']._isolate_system()
+        self.report_inference_cache()
+        default_scheduler.log_report()  # Which control loops cost the most
+        return True
 
     async def _emergency_halt_handler(self):
         """Handles emergency halts via button."""
-        while True:
-            if self.emergency_button.is_pressed:
-                logging.critical("Emergency halt triggered.")
-                await self._halt_ecosystem("Manual emergency halt.")
-                break
-            await asyncio.sleep(0.1)
+        logging.critical("Emergency halt triggered.")
+        await self._halt_ecosystem("Manual emergency halt.")
 
     async def _halt_ecosystem(self, reason: str):
         """Halts the entire ecosystem."""
@@ -0,0 +1,142 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Metric Store: %(message)s')
+
+AGGREGATE_COLUMNS = ('timestamp', 'min', 'max', 'mean', 'p95', 'count')
+# (tier name, bucket seconds, buckets kept): 1 week of minutes, 1 year of hours
+DEFAULT_TIERS = (('1m', 60, 7 * 24 * 60), ('1h', 3600, 365 * 24))
+DEFAULT_RAW_CAPACITY = 24 * 60  # One day of per-minute samples
+
+class RingBuffer:
+    """Fixed-size ring of float64 rows; every row is written twice so any recent window is one contiguous (zero-copy) slice."""
+
+    def __init__(self, capacity: int, columns: int = 1):
+        self.capacity = capacity
+        self._data = np.zeros((2 * capacity, columns), dtype=np.float64)
+        self._next = 0  # Slot for the next row, in [0, capacity)
+        self.count = 0  # Rows currently held (<= capacity)
+
+    def append(self, row: Any):
+        self._data[self._next] = row
+        self._data[self._next + self.capacity] = row
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """Last n rows, oldest first, as a read-only view into the buffer (no copy)."""
+        n = self.count if n is None else min(n, self.count)
+        end = self._next + self.capacity
+        window = self._data[end - n:end]
+        window.flags.writeable = False
+        return window
+
+    def __len__(self) -> int:
+        return self.count
+
+class TimeSeries:
+    """Raw samples plus downsampled tiers (min, max, mean, p95, count per bucket)."""
+
+    def __init__(self, name: str, raw_capacity: int = DEFAULT_RAW_CAPACITY, tiers: Tuple = DEFAULT_TIERS):
+        self.name = name
+        self.raw = RingBuffer(raw_capacity, 2)  # (timestamp, value)
+        self.tiers: Dict[str, RingBuffer] = {}
+        self.bucket_seconds: Dict[str, float] = {}
+        self._open_bucket: Dict[str, Optional[float]] = {}
+        for tier, seconds, capacity in tiers:
+            self.tiers[tier] = RingBuffer(capacity, len(AGGREGATE_COLUMNS))
+            self.bucket_seconds[tier] = seconds
+            self._open_bucket[tier] = None
+
+    def append(self, value: float, timestamp: float):
+        finer = None
+        for tier in self.tiers:
+            bucket = timestamp - timestamp % self.bucket_seconds[tier]
+            open_bucket = self._open_bucket[tier]
+            if open_bucket is not None and bucket > open_bucket:
+                self._close_bucket(tier, open_bucket, finer)
+            if open_bucket is None or bucket > open_bucket:
+                self._open_bucket[tier] = bucket
+            finer = tier
+        self.raw.append((timestamp, value))
+
+    def _close_bucket(self, tier: str, start: float, finer: Optional[str]):
+        """Aggregates a finished bucket from raw samples, or from the finer tier if raw no longer covers it."""
+        end = start + self.bucket_seconds[tier]
+        raw = self.raw.view()
+        if len(raw) and (raw[0, 0] <= start or finer is None):
+            lo, hi = np.searchsorted(raw[:, 0], (start, end))
+            values = raw[lo:hi, 1]
+            if len(values):
+                self.tiers[tier].append((start, values.min(), values.max(), values.mean(), np.percentile(values, 95), len(values)))
+            return
+        rows = self.tiers[finer].view()
+        lo, hi = np.searchsorted(rows[:, 0], (start, end))
+        rows = rows[lo:hi]
+        if len(rows):
+            counts = rows[:, 5]
+            # p95 from finer buckets is approximated by the 95th percentile of their p95s
+            self.tiers[tier].append((start, rows[:, 1].min(), rows[:, 2].max(), np.average(rows[:, 3], weights=counts),
+                                     np.percentile(rows[:, 4], 95), counts.sum()))
+
+    def window(self, n: Optional[int] = None, since: Optional[float] = None, tier: str = 'raw') -> np.ndarray:
+        """Zero-copy view of the last n rows (or rows since a timestamp) of the raw series or a tier."""
+        rows = self.raw.view(n) if tier == 'raw' else self.tiers[tier].view(n)
+        if since is not None:
+            rows = rows[np.searchsorted(rows[:, 0], since):]
+        return rows
+
+class MetricStore:
+    """Named time series; `store[name]` is a view of raw values, so list-style `len()`, `[-10:]` and `sum()` keep working."""
+
+    def __init__(self, names: List[str], raw_capacity: int = DEFAULT_RAW_CAPACITY, tiers: Tuple = DEFAULT_TIERS):
+        self.raw_capacity = raw_capacity
+        self.tier_spec = tiers
+        self.series: Dict[str, TimeSeries] = {name: TimeSeries(name, raw_capacity, tiers) for name in names}
+        self._lock = threading.Lock()
+        self.version = 0  # Bumped on every sample: readers compare it to skip work when nothing changed
+
+    def record(self, name: str, value: float, timestamp: Optional[float] = None):
+        with self._lock:
+            if name not in self.series:
+                self.series[name] = TimeSeries(name, self.raw_capacity, self.tier_spec)
+            self.series[name].append(value, time.time() if timestamp is None else timestamp)
+            self.version += 1
+
+    def window(self, name: str, n: Optional[int] = None, since: Optional[float] = None, tier: str = 'raw') -> np.ndarray:
+        return self.series[name].window(n, since, tier)
+
+    def values(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Last n raw values (view)."""
+        return self.series[name].raw.view(n)[:, 1]
+
+    def aggregates(self, name: str, tier: str, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Column views (timestamp, min, max, mean, p95, count) of a downsampled tier."""
+        rows = self.window(name, n, tier=tier)
+        return {column: rows[:, index] for index, column in enumerate(AGGREGATE_COLUMNS)}
+
+    def names(self) -> List[str]:
+        return list(self.series)
+
+    def items(self) -> Iterator[Tuple[str, np.ndarray]]:
+        for name in self.series:
+            yield name, self.values(name)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.values(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.series
+
+# Usage example
+if __name__ == "__main__":
+    store = MetricStore(['pi_transactions'])
+    start = 1_700_000_000.0
+    for second in range(0, 3 * 3600, 10):  # Three hours of 10-second samples
+        store.record('pi_transactions', second / 10 + np.sin(second), start + second)
+    print(len(store['pi_transactions']), store['pi_transactions'][-3:])
+    print({column: values[-1] for column, values in store.aggregates('pi_transactions', '1h').items()})
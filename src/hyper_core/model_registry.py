@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+import weakref
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from lazy_loader import LazyObject, is_loaded, lazy_from
+pipeline = lazy_from('transformers', 'pipeline')  # Shared transformer pipelines
+from task_scheduler import default_scheduler
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Model Registry: %(message)s')
+
+# Approximate resident size per model (fp32 weights + runtime), used until a loaded model reports its own footprint
+MODEL_MEMORY_ESTIMATES_MB = {
+    'gpt2': 550,
+    'cardiffnlp/twitter-roberta-base-sentiment': 500,
+    'openai/whisper-small': 970,
+    'microsoft/speecht5_tts': 590
+}
+DEFAULT_MODEL_MEMORY_MB = 500
+
+class _RegistryEntry:
+    __slots__ = ('task', 'model', 'options', 'instance', 'refcount', 'last_used', 'loads')
+
+    def __init__(self, task: str, model: Optional[str], options: Dict[str, Any]):
+        self.task = task
+        self.model = model
+        self.options = options
+        self.instance: Optional[LazyObject] = None
+        self.refcount = 0
+        self.last_used = time.monotonic()
+        self.loads = 0
+
+class SharedModel:
+    """Handle to a registry-owned model; calls and attribute access go to the one shared instance."""
+
+    def __init__(self, registry: 'ModelRegistry', key: Tuple):
+        self._registry = registry
+        self._key = key
+        self._finalizer = weakref.finalize(self, registry._release, key)  # Owner garbage-collected: give the reference back
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._registry._instance(self._key)(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._registry._instance(self._key), name)
+
+    @property
+    def key(self) -> Tuple:
+        return self._key
+
+    def release(self):
+        """Drops this holder's reference; the model is unloaded once nobody holds it."""
+        self._finalizer()  # Runs at most once, whether called here or at garbage collection
+
+    def __repr__(self) -> str:
+        return f"<SharedModel task={self._key[0]!r} model={self._key[1]!r}>"
+
+class ModelRegistry:
+    def __init__(self, loader: Callable[..., Any] = pipeline, idle_timeout: Optional[float] = None):
+        self.loader = loader  # transformers.pipeline by default; injectable for tests
+        self.idle_timeout = idle_timeout  # Seconds before an unused model's weights are dropped (None: never)
+        self._entries: Dict[Tuple, _RegistryEntry] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _make_key(task: str, model: Optional[str], options: Dict[str, Any]) -> Tuple:
+        return (task, model, tuple(sorted(options.items())))
+
+    def acquire(self, task: str, model: Optional[str] = None, **options) -> SharedModel:
+        """Returns a handle to the shared (task, model) instance, registering it on first request."""
+        key = self._make_key(task, model, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _RegistryEntry(task, model, options)
+                self._entries[key] = entry
+            entry.refcount += 1
+        return SharedModel(self, key)
+
+    def _instance(self, key: Tuple) -> LazyObject:
+        """Returns the (lazily built) instance for key, rebuilding it if it was evicted."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                raise KeyError(f"Model {key[:2]} was released from the registry.")
+            if entry.instance is None:
+                model_kwargs = {'model': entry.model} if entry.model is not None else {}
+                entry.instance = LazyObject(self.loader, entry.task, **model_kwargs, **entry.options)
+                entry.loads += 1
+            entry.last_used = time.monotonic()
+            return entry.instance
+
+    def _release(self, key: Tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount <= 0:
+                del self._entries[key]
+                logging.info(f"Unloaded {entry.task}/{entry.model}: no holders left.")
+
+    def evict_idle(self, max_idle_seconds: Optional[float] = None) -> List[Tuple]:
+        """Drops weights of models unused for max_idle_seconds; they reload transparently on next call."""
+        max_idle = self.idle_timeout if max_idle_seconds is None else max_idle_seconds
+        if max_idle is None:
+            return []
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry.instance is not None and is_loaded(entry.instance) and now - entry.last_used >= max_idle:
+                    entry.instance = None
+                    evicted.append(key)
+        for key in evicted:
+            logging.info(f"Evicted idle model {key[0]}/{key[1]}.")
+        return evicted
+
+    async def run_idle_eviction(self, interval: float = 300):
+        """Periodically evicts idle models (only when idle_timeout is set)."""
+        job = default_scheduler.every('ModelRegistry.idle_eviction', interval, self._evict_if_enabled)
+        await job.finished.wait()
+
+    def _evict_if_enabled(self) -> bool:
+        """One eviction pass; returns False once idle_timeout is unset."""
+        if self.idle_timeout is None:
+            return False
+        self.evict_idle()
+        return True
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Reports per-model holders and the RAM saved by sharing one instance per (task, model)."""
+        models = []
+        with self._lock:
+            for entry in self._entries.values():
+                loaded = entry.instance is not None and is_loaded(entry.instance)
+                size_mb = self._footprint_mb(entry, loaded)
+                models.append({
+                    'task': entry.task,
+                    'model': entry.model,
+                    'holders': entry.refcount,
+                    'loaded': loaded,
+                    'loads': entry.loads,
+                    'size_mb': size_mb
+                })
+        shared_mb = sum(m['size_mb'] for m in models)
+        unshared_mb = sum(m['size_mb'] * m['holders'] for m in models)
+        return {
+            'models': sorted(models, key=lambda m: m['holders'] * m['size_mb'], reverse=True),
+            'resident_mb': sum(m['size_mb'] for m in models if m['loaded']),
+            'shared_mb': shared_mb,
+            'unshared_mb': unshared_mb,
+            'saved_mb': unshared_mb - shared_mb
+        }
+
+    def _footprint_mb(self, entry: _RegistryEntry, loaded: bool) -> float:
+        """Uses the loaded model's own footprint when available, else the estimate table."""
+        if loaded:
+            model = getattr(entry.instance, 'model', None)
+            if model is not None and hasattr(model, 'get_memory_footprint'):
+                return round(model.get_memory_footprint() / (1024 * 1024), 1)
+        return MODEL_MEMORY_ESTIMATES_MB.get(entry.model, DEFAULT_MODEL_MEMORY_MB)
+
+default_registry = ModelRegistry()  # Process-wide registry shared by every hyper_core module
+
+def shared_pipeline(task: str, model: Optional[str] = None, **options) -> SharedModel:
+    """Drop-in for transformers.pipeline(...) that hands out the process-wide shared instance."""
+    return default_registry.acquire(task, model, **options)
+
+# Usage example
+if __name__ == "__main__":
+    first = shared_pipeline("text-generation", model="gpt2")
+    second = shared_pipeline("text-generation", model="gpt2")  # Same weights, second holder
+    auditor = shared_pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")
+    print(default_registry.memory_report())
@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import numpy as np
+from lazy_loader import lazy_from
+joblib_load = lazy_from('joblib', 'load')
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Model Trainer: %(message)s')
+
+MODEL_FILE = re.compile(r'^model-(\d{6})\.joblib$')
+
+def _build_model(spec: Tuple[str, str, Dict[str, Any]]) -> Any:
+    module, name, params = spec
+    return getattr(importlib.import_module(module), name)(**params)
+
+def _fit_and_save(spec: Tuple[str, str, Dict[str, Any]], features: np.ndarray, targets: np.ndarray, path: str) -> Dict[str, float]:
+    """Worker-process entry point: fits a fresh model and publishes it at path with an atomic rename."""
+    import joblib
+    model = _build_model(spec)
+    start = time.perf_counter()
+    model.fit(features, targets)
+    fit_seconds = time.perf_counter() - start
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.model-')
+    with os.fdopen(fd, 'wb') as f:
+        joblib.dump(model, f)
+    os.replace(tmp, path)  # Readers see the previous version or this one, never a partial file
+    return {'fit_seconds': fit_seconds, 'samples': len(targets)}
+
+class BackgroundTrainer:
+    """Separates training from inference for a scikit-learn style model.
+
+    Samples accumulate in a bounded window; retrain() fits a fresh model in a worker process and writes it to disk as
+    the next version (model-NNNNNN.joblib); the loaded model is swapped in with a single reference assignment, so
+    predict() always sees a complete model and never waits for a fit.
+    """
+
+    def __init__(self, model_dir: str, model_spec: Tuple[str, str, Dict[str, Any]], max_samples: int = 10000,
+                 min_samples: int = 10, keep_versions: int = 3, executor: Optional[Executor] = None):
+        self.model_dir = model_dir
+        self.model_spec = model_spec  # (module, class, params): picklable, so the worker builds the model itself
+        self.min_samples = min_samples  # Samples needed before the first fit
+        self.keep_versions = keep_versions  # Older model files are pruned
+        self._samples: deque = deque(maxlen=max_samples)  # Bounded training window: (features, target)
+        self._executor = executor
+        self._training = False
+        self._model: Any = None
+        self._loaded = False
+        self.version = 0
+        self.stats: Dict[str, float] = {'samples': 0, 'retrains': 0, 'failures': 0, 'last_fit_seconds': 0.0, 'last_retrain_seconds': 0.0}
+        os.makedirs(model_dir, exist_ok=True)
+
+    def _versions(self) -> List[int]:
+        return sorted(int(match.group(1)) for match in map(MODEL_FILE.match, os.listdir(self.model_dir)) if match)
+
+    def _path(self, version: int) -> str:
+        return os.path.join(self.model_dir, f'model-{version:06d}.joblib')
+
+    def _ensure_loaded(self):
+        """Picks up the newest persisted version the first time a model is needed (not at construction)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        versions = self._versions()
+        if versions:
+            self._model, self.version = joblib_load(self._path(versions[-1])), versions[-1]
+            logging.info(f"Loaded predictive model version {self.version} from {self.model_dir}.")
+
+    @property
+    def model(self) -> Any:
+        self._ensure_loaded()
+        return self._model
+
+    def add_sample(self, features: Sequence[float], target: float):
+        self._samples.append((tuple(features), float(target)))
+        self.stats['samples'] += 1
+
+    def ready(self) -> bool:
+        return len(self._samples) >= self.min_samples
+
+    def predict(self, features: Sequence[float]) -> Optional[float]:
+        """Prediction from the current model, or None until one has been trained."""
+        model = self.model  # One read: a concurrent swap cannot split this call across versions
+        if model is None:
+            return None
+        return float(model.predict(np.asarray([features], dtype=np.float64))[0])
+
+    async def retrain(self) -> Optional[int]:
+        """Fits on a snapshot of the window off the event loop and swaps the result in; returns the new version."""
+        if self._training or not self.ready():
+            return None
+        self._training = True
+        start = time.perf_counter()
+        try:
+            self._ensure_loaded()
+            if self._executor is None:
+                # spawn: the worker never inherits the event loop's threads or locks
+                self._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+            samples = list(self._samples)
+            features = np.array([sample[0] for sample in samples], dtype=np.float64)
+            targets = np.array([sample[1] for sample in samples], dtype=np.float64)
+            version = max(self._versions(), default=self.version) + 1
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, _fit_and_save, self.model_spec, features, targets, self._path(version))
+            model = await loop.run_in_executor(None, joblib_load, self._path(version))
+            self._model, self.version = model, version  # Atomic swap
+            self._prune()
+            self.stats['retrains'] += 1
+            self.stats['last_fit_seconds'] = result['fit_seconds']
+            self.stats['last_retrain_seconds'] = time.perf_counter() - start
+            logging.info(f"Predictive model version {version} trained on {result['samples']} samples in {result['fit_seconds']:.2f}s.")
+            return version
+        except Exception as e:
+            self.stats['failures'] += 1
+            logging.error(f"Predictive model retraining failed: {e}")
+            return None
+        finally:
+            self._training = False
+
+    def _prune(self):
+        for version in self._versions()[:-self.keep_versions]:
+            os.remove(self._path(version))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+def benchmark_predictive_model(samples: int = 200, calls: int = 5) -> Dict[str, float]:
+    """Per-prediction latency: fitting a 100-tree forest on every call (previous path) vs predict on a trained model."""
+    from sklearn.ensemble import RandomForestRegressor
+    rng = np.random.default_rng(0)
+    features, targets = rng.uniform(0, 100, (samples, 5)), rng.random(samples)
+    start = time.perf_counter()
+    for i in range(calls):
+        model = RandomForestRegressor(n_estimators=100, random_state=42)
+        model.fit(features, targets)
+        model.predict(features[i:i + 1])
+    fit_per_call_ms = (time.perf_counter() - start) / calls * 1000
+    trainer = BackgroundTrainer(tempfile.mkdtemp(), ('sklearn.ensemble', 'RandomForestRegressor', {'n_estimators': 100, 'random_state': 42}))
+    for row, target in zip(features, targets):
+        trainer.add_sample(row, target)
+
+    async def run() -> Tuple[float, float]:
+        start = time.perf_counter()
+        await trainer.retrain()
+        retrain_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(calls * 20):
+            trainer.predict(features[i % samples])
+        return retrain_seconds, (time.perf_counter() - start) / (calls * 20) * 1000
+
+    retrain_seconds, predict_ms = asyncio.run(run())
+    trainer.close()
+    return {'fit_per_call_ms': fit_per_call_ms, 'predict_ms': predict_ms, 'background_retrain_s': retrain_seconds,
+            'worker_fit_s': trainer.stats['last_fit_seconds']}
+
+# Usage: python model_trainer.py [--samples N]; compares fit-per-prediction with background training
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark background model training against fitting on every prediction.")
+    parser.add_argument('--samples', type=int, default=200)
+    args = parser.parse_args()
+    print(benchmark_predictive_model(args.samples))
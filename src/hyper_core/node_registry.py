@@ -0,0 +1,236 @@
+import argparse
+import logging
+import time
+import tracemalloc
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Node Registry: %(message)s')
+
+NODE_STATUSES = ('syncing', 'active', 'isolated')  # Stored as int8 codes
+NODE_COLUMNS = {
+    'status': np.int8,
+    'pi_balance': np.float64,
+    'intelligence_score': np.float32,
+    'reported_value': np.float64
+}
+NODE_DEFAULTS = {'status': 0, 'pi_balance': 0.0, 'intelligence_score': 0.0, 'reported_value': np.nan}
+
+class NodeRegistry:
+    """Columnar registry of global Pi nodes: one typed NumPy array per field, rows addressed through an id -> row map.
+
+    Adds append a row, removes move the last row into the hole, so both are O(1); column sums and status counts
+    are kept up to date on every write, so dashboard aggregates never scan.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._ids: List[str] = []  # Row -> id
+        self._rows: Dict[str, int] = {}  # Id -> row
+        self._columns: Dict[str, np.ndarray] = {name: np.full(capacity, NODE_DEFAULTS[name], dtype=dtype) for name, dtype in NODE_COLUMNS.items()}
+        self._sums: Dict[str, float] = {name: 0.0 for name in NODE_COLUMNS if name != 'status'}  # NaN rows excluded
+        self._status_counts = np.zeros(len(NODE_STATUSES), dtype=np.int64)
+
+    def _grow(self, needed: int):
+        capacity = len(self._columns['status'])
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        for name, column in self._columns.items():
+            grown = np.full(capacity, NODE_DEFAULTS[name], dtype=column.dtype)
+            grown[:len(self._ids)] = column[:len(self._ids)]
+            self._columns[name] = grown
+
+    @staticmethod
+    def _encode(name: str, value: Any) -> Any:
+        return NODE_STATUSES.index(value) if name == 'status' and isinstance(value, str) else value
+
+    def _account(self, row: int, sign: int):
+        """Adds (sign=1) or removes (sign=-1) one row's contribution to the aggregates."""
+        self._status_counts[self._columns['status'][row]] += sign
+        for name in self._sums:
+            value = float(self._columns[name][row])
+            if value == value:  # Skip NaN
+                self._sums[name] += sign * value
+
+    def add(self, node_id: str, **values: Any) -> int:
+        """Adds a node (or updates it if present); returns its row."""
+        if node_id in self._rows:
+            self.update(node_id, **values)
+            return self._rows[node_id]
+        row = len(self._ids)
+        self._grow(row + 1)
+        for name in NODE_COLUMNS:
+            self._columns[name][row] = self._encode(name, values.get(name, NODE_DEFAULTS[name]))
+        self._ids.append(node_id)
+        self._rows[node_id] = row
+        self._account(row, 1)
+        return row
+
+    def add_many(self, node_ids: Sequence[str], **columns: Any):
+        """Bulk add of new ids; each keyword is a scalar or an array aligned with node_ids.
+
+        Raises KeyError, leaving the registry unchanged, if any id is already registered or repeated in node_ids.
+        """
+        node_ids = list(node_ids)
+        seen = set()
+        for node_id in node_ids:
+            if node_id in self._rows or node_id in seen:
+                raise KeyError(f"Node {node_id} is already registered")
+            seen.add(node_id)
+        start = len(self._ids)
+        self._grow(start + len(node_ids))
+        for name in NODE_COLUMNS:
+            value = columns.get(name, NODE_DEFAULTS[name])
+            self._columns[name][start:start + len(node_ids)] = self._encode(name, value)
+        self._rows.update((node_id, row) for row, node_id in enumerate(node_ids, start=start))
+        self._ids.extend(node_ids)
+        self._recompute()
+
+    def update(self, node_id: str, **values: Any):
+        row = self._rows[node_id]
+        self._account(row, -1)
+        for name, value in values.items():
+            self._columns[name][row] = self._encode(name, value)
+        self._account(row, 1)
+
+    def set_column(self, name: str, values: Any, rows: Optional[np.ndarray] = None):
+        """Vectorized write of a whole column (or of the given rows), with the aggregates adjusted by the delta."""
+        target = self._columns[name][:len(self._ids)]
+        if rows is None:
+            rows = slice(None)
+        target[rows] = self._encode(name, values)
+        if name == 'status':
+            self._status_counts = np.bincount(target, minlength=len(NODE_STATUSES)).astype(np.int64)
+        else:
+            self._sums[name] = float(np.nansum(target, dtype=np.float64))
+
+    def remove(self, node_id: str) -> bool:
+        """Removes a node by moving the last row into its slot; returns False if it was not registered."""
+        row = self._rows.pop(node_id, None)
+        if row is None:
+            return False
+        self._account(row, -1)
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            for column in self._columns.values():
+                column[row] = column[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+        for name, column in self._columns.items():
+            column[last] = NODE_DEFAULTS[name]
+        return True
+
+    def remove_many(self, node_ids: Iterable[str]) -> int:
+        return sum(self.remove(node_id) for node_id in node_ids)
+
+    def pop(self, node_id: str, default: Any = None) -> Any:
+        """Mapping-style removal: returns the node's fields, or default if it was not registered."""
+        if node_id not in self._rows:
+            return default
+        node = self[node_id]
+        self.remove(node_id)
+        return node
+
+    def clear(self):
+        for name, column in self._columns.items():
+            column[:len(self._ids)] = NODE_DEFAULTS[name]
+        self._ids.clear()
+        self._rows.clear()
+        self._recompute()
+
+    def _recompute(self):
+        """Rebuilds the aggregates from the columns (bulk writes, and a guard against float drift)."""
+        count = len(self._ids)
+        self._status_counts = np.bincount(self._columns['status'][:count], minlength=len(NODE_STATUSES)).astype(np.int64)
+        for name in self._sums:
+            self._sums[name] = float(np.nansum(self._columns[name][:count], dtype=np.float64))
+
+    def column(self, name: str) -> np.ndarray:
+        """Live view of one column for the registered rows (row order matches ids())."""
+        return self._columns[name][:len(self._ids)]
+
+    def ids(self) -> List[str]:
+        """Snapshot of the registered ids in row order."""
+        return list(self._ids)
+
+    def rows(self, node_ids: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self._rows[node_id] for node_id in node_ids), dtype=np.int64)
+
+    def sum(self, name: str) -> float:
+        return self._sums[name]
+
+    def mean(self, name: str) -> float:
+        return self._sums[name] / len(self._ids) if self._ids else 0.0
+
+    def status_counts(self) -> Dict[str, int]:
+        return dict(zip(NODE_STATUSES, self._status_counts.tolist()))
+
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (the id map adds roughly 150 bytes per node on top)."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def __getitem__(self, node_id: str) -> Dict[str, Any]:
+        row = self._rows[node_id]
+        node = {name: self._columns[name][row].item() for name in NODE_COLUMNS}
+        node['status'] = NODE_STATUSES[node['status']]
+        return node
+
+    def __setitem__(self, node_id: str, node: Dict[str, Any]):
+        self.add(node_id, **node)
+
+    def __delitem__(self, node_id: str):
+        if not self.remove(node_id):
+            raise KeyError(node_id)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._ids))  # Snapshot, so callers may remove while iterating
+
+    def keys(self) -> List[str]:
+        return self.ids()
+
+default_registry = NodeRegistry()  # Shared by the expansion, swarm and oracle modules
+
+def benchmark_registry(nodes: int = 1000000) -> Dict[str, float]:
+    """Memory and aggregate cost of a dict of per-node dicts (previous layout) vs the columnar registry."""
+    node_ids = [f'pi_node_{i}' for i in range(nodes)]
+    scores = np.random.default_rng(0).uniform(0.8, 1.0, nodes)
+    tracemalloc.start()
+    nodes_dict = {node_id: {'status': 'active', 'pi_balance': 100.0, 'intelligence_score': float(score), 'last_consensus': None}
+                  for node_id, score in zip(node_ids, scores.tolist())}
+    dict_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    start = time.perf_counter()
+    total = sum(node['pi_balance'] for node in nodes_dict.values())
+    average = sum(node['intelligence_score'] for node in nodes_dict.values()) / len(nodes_dict)
+    dict_aggregate_ms = (time.perf_counter() - start) * 1000
+    del nodes_dict
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    registry = NodeRegistry()
+    registry.add_many(node_ids, status='active', pi_balance=100.0, intelligence_score=scores)
+    registry_mb = (tracemalloc.get_traced_memory()[0] - baseline) / 1e6
+    tracemalloc.stop()
+    start = time.perf_counter()
+    assert registry.sum('pi_balance') == total and abs(registry.mean('intelligence_score') - average) < 1e-4
+    registry_aggregate_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for node_id in node_ids[:10000]:
+        registry.remove(node_id)
+    remove_us = (time.perf_counter() - start) / 10000 * 1e6
+    return {'nodes': nodes, 'dict_mb': dict_mb, 'registry_mb': registry_mb, 'registry_column_mb': registry.nbytes() / 1e6,
+            'dict_aggregate_ms': dict_aggregate_ms, 'registry_aggregate_ms': registry_aggregate_ms, 'registry_remove_us': remove_us}
+
+# Usage: python node_registry.py [--nodes N]; compares dict-of-dicts with the columnar registry
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the columnar node registry against a dict of node dicts.")
+    parser.add_argument('--nodes', type=int, default=1000000)
+    args = parser.parse_args()
+    print(benchmark_registry(args.nodes))
@@ -4,9 +4,15 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for secure mainnet sync
-from transformers import pipeline  # AI for sync predictions
-from gpiozero import LED, Buzzer, RGBLED  # Pi hardware: RGB LED for sync status, Buzzer for mainnet alerts
+import time
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for secure mainnet sync
+from model_registry import shared_pipeline  # AI for sync predictions
+from inference_queue import infer
+from journal import Journal
+from mainnet_ingest import MainnetIngest  # fetch -> dedupe -> filter -> persist with a persisted cursor
+from task_scheduler import default_scheduler
+LED, Buzzer, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED')  # Pi hardware: RGB LED for sync status, Buzzer for mainnet alerts
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from quantum_security_layer import QuantumSecurityLayer  # File 5
@@ -22,19 +28,30 @@ class PiMainnetIntegrationRealTimeSynchronization:
     def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager,
                  security: QuantumSecurityLayer, oracle: GlobalPIOracleComplianceVerifier,
                  guardian: UltimateEcosystemGuardianSummaryScript, optimizer: QuantumAIOptimizerPredictiveMaintenance,
-                 rgb_led_pins: tuple = (5, 6, 7), alert_buzzer_pin: int = 8):
+                 rgb_led_pins: tuple = (5, 6, 7), alert_buzzer_pin: int = 8, journal_dir: str = './journals',
+                 cursor_path: str = './mainnet_cursor.json'):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.security = security
         self.oracle = oracle
         self.guardian = guardian
         self.optimizer = optimizer
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=synced, Blue=syncing, Red=desync
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.quantum_sync_circuit = self._init_quantum_sync()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=synced, Blue=syncing, Red=desync
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.quantum_sync_circuit = LazyObject(self._init_quantum_sync)
         self.mainnet_status = 'Closed'  # 'Open' or 'Closed'
-        self.sync_logs: List[Dict] = []
-        self.mainnet_oracle = pipeline("text-generation", model="gpt2")  # AI for mainnet predictions
+        self.sync_logs = Journal(os.path.join(journal_dir, 'mainnet_sync_logs'), legacy_path='./mainnet_sync_logs.json')
+        self.rejected_ids = Journal(os.path.join(journal_dir, 'mainnet_rejected_ids'))  # Rejected tx never reach the ledger
+        self.mainnet_oracle = shared_pipeline("text-generation", model="gpt2")  # AI for mainnet predictions
+        self.ingest = LazyObject(self._build_ingest, cursor_path)
+        self._simulated_head = 0  # Simulated mainnet ledger height
+
+    def _build_ingest(self, cursor_path: str) -> MainnetIngest:
+        """Ingest pipeline seeded with recently stored and rejected ids, so the overlap after a restart is not re-filtered."""
+        seed_ids = [tx['id'] for tx in self.pi_manager.transactions.recent(1000) if 'id' in tx]
+        seed_ids += [record['id'] for record in self.rejected_ids.tail(1000)]
+        return MainnetIngest(self._fetch_mainnet_page, self.ahi_ai.filter_transaction, self._persist_mainnet_batch,
+                             cursor_path, seed_ids=seed_ids)
 
     def _init_quantum_sync(self) -> QuantumCircuit:
         """Initializes quantum circuit for secure mainnet synchronization."""
@@ -46,45 +63,59 @@ class PiMainnetIntegrationRealTimeSynchronization:
 
     async def synchronize_with_mainnet(self):
         """Synchronizes ecosystem with Pi mainnet in real-time."""
-        while True:
-            self.rgb_led.color = (0, 0, 1)  # Blue: syncing
-            # Simulate mainnet check (in hyper-tech: integrate with Pi Network API)
-            mainnet_open = random.random() > 0.1  # 90% chance open (simulate full open)
-            if mainnet_open:
-                self.mainnet_status = 'Open'
-                # Sync PI transactions
-                await self._sync_pi_transactions()
-                # Verify compliance
-                if not await self.oracle.verify_pi_value(314159):  # Fixed value
-                    logging.error("Mainnet sync failed: PI value deviation.")
-                    await self._handle_desync()
-                else:
-                    self.rgb_led.color = (0, 1, 0)  # Green: synced
-                    logging.info("Successfully synced with open Pi mainnet.")
+        job = default_scheduler.every('PiMainnetIntegrationRealTimeSynchronization.synchronize_with_mainnet', 300, self._sync_pass)  # Sync every 5 minutes
+        await job.finished.wait()
+
+    async def _sync_pass(self):
+        """One mainnet synchronization and its sync log entry."""
+        self.rgb_led.color = (0, 0, 1)  # Blue: syncing
+        # Simulate mainnet check (in hyper-tech: integrate with Pi Network API)
+        mainnet_open = random.random() > 0.1  # 90% chance open (simulate full open)
+        if mainnet_open:
+            self.mainnet_status = 'Open'
+            # Sync PI transactions
+            await self._sync_pi_transactions()
+            # Verify compliance
+            if not await self.oracle.verify_pi_value(314159):  # Fixed value
+                logging.error("Mainnet sync failed: PI value deviation.")
+                await self._handle_desync()
             else:
-                self.mainnet_status = 'Closed'
-                logging.warning("Pi mainnet not fully open. Awaiting synchronization.")
-                self.rgb_led.color = (1, 0, 0)  # Red: desync
-                self.alert_buzzer.beep(on_time=1, off_time=1, n=2)
-            # Log sync
-            log = {'timestamp': asyncio.get_event_loop().time(), 'status': self.mainnet_status, 'synced_tx': len(self.pi_manager.transactions)}
-            self.sync_logs.append(log)
-            with open('./mainnet_sync_logs.json', 'w') as f:
-                json.dump(self.sync_logs, f)
-            await asyncio.sleep(300)  # Sync every 5 minutes
+                self.rgb_led.color = (0, 1, 0)  # Green: synced
+                logging.info("Successfully synced with open Pi mainnet.")
+        else:
+            self.mainnet_status = 'Closed'
+            logging.warning("Pi mainnet not fully open. Awaiting synchronization.")
+            self.rgb_led.color = (1, 0, 0)  # Red: desync
+            self.alert_buzzer.beep(on_time=1, off_time=1, n=2)
+        # Log sync
+        log = {'timestamp': asyncio.get_event_loop().time(), 'status': self.mainnet_status, 'synced_tx': len(self.pi_manager.transactions)}
+        self.sync_logs.append(log)  # O(1) append instead of rewriting the whole history
 
     async def _sync_pi_transactions(self):
         """Syncs PI transactions with mainnet, enforcing purity."""
+        metrics = await self.ingest.sync()
+        logging.info(f"Synced mainnet PI: {metrics['committed']} committed, {metrics['rejected']} rejected, "
+                     f"{metrics['duplicates']} duplicates dropped, {metrics['last_sync_tx_per_s']:.0f} tx/s, lag {metrics['lag_seconds']:.1f}s.")
+
+    async def _fetch_mainnet_page(self, cursor: Optional[int], limit: int) -> tuple:
+        """Returns (transactions, next_cursor) from the mainnet ledger; pages overlap like a re-polled API."""
         # Simulate fetching mainnet tx (in prod: API call)
-        mainnet_tx = [{'id': f'mainnet_{random.randint(1000, 9999)}', 'amount': random.randint(10, 100), 'source': 'mining', 'currency': 'PI'} for _ in range(5)]
-        for tx in mainnet_tx:
-            # Filter via AHI AI (anti-gambling, volatility)
-            if await self.ahi_ai.filter_transaction(tx):
-                self.pi_manager.transactions.append(tx)
-                logging.info(f"Synced mainnet PI tx: {tx['id']}")
-            else:
-                logging.warning(f"Rejected mainnet tx: {tx}")
-                await self.guardian.purity_enforcer._isolate_tainted_pi(tx)  # Isolate if tainted
+        self._simulated_head = max(self._simulated_head, cursor or 0) + random.randint(0, 5)  # New mainnet tx since the last poll
+        start = max((cursor or 0) - 2, 0)
+        stop = min(start + limit, self._simulated_head)
+        page = [{'id': f'mainnet_{seq}', 'amount': random.randint(10, 100), 'source': 'mining', 'currency': 'PI', 'timestamp': time.time()}
+                for seq in range(start, stop)]
+        return page, (stop if stop > (cursor or 0) else None)
+
+    async def _persist_mainnet_batch(self, accepted: List[Dict[str, Any]], rejected: List[Dict[str, Any]]):
+        """Commits one ingested page: accepted transactions in one append, rejected ones isolated together."""
+        if accepted:
+            self.pi_manager.transactions.extend(accepted)
+        if rejected:
+            logging.warning(f"Rejected {len(rejected)} mainnet tx.")
+            await self.guardian.purity_enforcer._isolate_tainted_batch({tx['id']: tx for tx in rejected})  # Isolate if tainted
+            for tx in rejected:
+                self.rejected_ids.append({'id': tx['id'], 'timestamp': time.time()})
 
     async def _handle_desync(self):
         """Handles desynchronization with mainnet."""
@@ -101,13 +132,14 @@ class PiMainnetIntegrationRealTimeSynchronization:
         dashboard = {
             'mainnet_status': self.mainnet_status,
             'synced_transactions': len(self.sync_logs),
+            'ingest': self.ingest.metrics(),
             'pi_balance_post_sync': self.pi_manager.get_balance(),
             'compliance_verified': not self.ahi_ai.stellar_halted,
             'gambling_free': 'Enforced'  # Reinforce anti-gambling
         }
         # AI prediction for mainnet stability
         prompt = f"Predict Pi mainnet stability: {dashboard}"
-        prediction = self.mainnet_oracle(prompt, max_length=50)[0]['generated_text']
+        prediction = (await infer(self.mainnet_oracle, prompt, max_length=50))[0]['generated_text']
         dashboard['ai_prediction'] = prediction
         with open('./mainnet_dashboard_hologram.json', 'w') as f:
             json.dump(dashboard, f)
@@ -116,14 +148,17 @@ class PiMainnetIntegrationRealTimeSynchronization:
 
     async def monitor_mainnet_health(self):
         """Monitors mainnet health and triggers sync optimizations."""
-        while True:
-            if self.mainnet_status == 'Open':
-                # Use optimizer for health checks (File 17)
-                health = await self.optimizer.predict_system_failures()
-                if health['risk_level'] == 'High':
-                    logging.warning("Mainnet health at risk. Optimizing sync.")
-                    await self.optimizer._perform_predictive_maintenance()
-            await asyncio.sleep(1800)  # Monitor every 30 minutes
+        job = default_scheduler.every('PiMainnetIntegrationRealTimeSynchronization.monitor_mainnet_health', 1800, self._health_check)  # Monitor every 30 minutes
+        await job.finished.wait()
+
+    async def _health_check(self):
+        """One mainnet health check while the mainnet is open."""
+        if self.mainnet_status == 'Open':
+            # Use optimizer for health checks (File 17)
+            health = await self.optimizer.predict_system_failures()
+            if health['risk_level'] == 'High':
+                logging.warning("Mainnet health at risk. Optimizing sync.")
+                await self.optimizer._perform_predictive_maintenance()
 
     async def run_mainnet_integration(self):
         """Main integration loop."""
@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for governance consensus
-from transformers import pipeline  # AI for launch predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for launch status, Buzzer for alerts, Button for governance vote
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for governance consensus
+from model_registry import shared_pipeline  # AI for launch predictions
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for launch status, Buzzer for alerts, Button for governance vote
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
@@ -15,6 +17,7 @@ from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalO
 from pi_mainnet_integration_real_time_synchronization import PiMainnetIntegrationRealTimeSynchronization  # File 18
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Pi Mainnet Launch: %(message)s')
@@ -32,13 +35,13 @@ class PiMainnetLaunchGovernanceProtocol:
         self.governance = governance
         self.mainnet_sync = mainnet_sync
         self.swarm_hub = swarm_hub
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=launched, Blue=launching, Red=halt
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.vote_button = Button(vote_button_pin)  # Manual governance vote for mainnet
-        self.quantum_governance_circuit = self._init_quantum_governance()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=launched, Blue=launching, Red=halt
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.vote_button = LazyObject(Button, vote_button_pin)  # Manual governance vote for mainnet
+        self.quantum_governance_circuit = LazyObject(self._init_quantum_governance)
         self.launch_status = 'Preparing'  # 'Preparing', 'Launching', 'Launched', 'Halted'
         self.governance_votes: List[Dict] = []
-        self.launch_ai = pipeline("text-generation", model="gpt2")  # AI for launch sequences
+        self.launch_ai = shared_pipeline("text-generation", model="gpt2")  # AI for launch sequences
 
     def _init_quantum_governance(self) -> QuantumCircuit:
         """Initializes quantum circuit for governance consensus."""
@@ -79,7 +82,7 @@ class PiMainnetLaunchGovernanceProtocol:
         self.rgb_led.color = (0, 0, 1)  # Blue: launching
         # AI launch prediction
         prompt = "Predict successful full open Pi mainnet launch with Stablecoin-Only and anti-gambling."
-        prediction = self.launch_ai(prompt, max_length=100)[0]['generated_text']
+        prediction = (await infer(self.launch_ai, prompt, max_length=100))[0]['generated_text']
         logging.info(f"Launch Prediction: {prediction}")
         # Simulate launch steps (in hyper-tech: integrate with Pi Network API)
         steps = ['Initialize nodes', 'Sync transactions', 'Enforce purity', 'Open mainnet']
@@ -92,20 +95,26 @@ class PiMainnetLaunchGovernanceProtocol:
 
     async def govern_mainnet_operations(self):
         """Governs ongoing mainnet operations with quantum consensus."""
-        while self.launch_status == 'Launched':
-            # Swarm governance vote (File 19)
-            decision = await self.swarm_hub.swarm_consensus_decision("Govern mainnet: Enforce anti-gambling and purity")
-            if "Enforce" in decision:
-                # Quantum governance
-                vote_result = self._run_quantum_governance_vote()
-                if vote_result > 0.5:
-                    logging.info("Governance approved: Reinforcing Stablecoin-Only.")
-                    # Freeze any tainted PI
-                    if self.purity_enforcer.founder_watchlist['violations']:
-                        await self.purity_enforcer._freeze_and_return_all_pi()
-                else:
-                    logging.warning("Governance rejected. Monitoring closely.")
-            await asyncio.sleep(7200)  # Govern every 2 hours
+        job = default_scheduler.every('PiMainnetLaunchGovernanceProtocol.govern_mainnet_operations', 7200, self._governance_pass)  # Govern every 2 hours
+        await job.finished.wait()
+
+    async def _governance_pass(self) -> bool:
+        """One swarm and quantum governance round; returns False once the mainnet is no longer launched."""
+        if self.launch_status != 'Launched':
+            return False
+        # Swarm governance vote (File 19)
+        decision = await self.swarm_hub.swarm_consensus_decision("Govern mainnet: Enforce anti-gambling and purity")
+        if "Enforce" in decision:
+            # Quantum governance
+            vote_result = self._run_quantum_governance_vote()
+            if vote_result > 0.5:
+                logging.info("Governance approved: Reinforcing Stablecoin-Only.")
+                # Freeze any tainted PI
+                if self.purity_enforcer.founder_watchlist['violations']:
+                    await self.purity_enforcer._freeze_and_return_all_pi()
+            else:
+                logging.warning("Governance rejected. Monitoring closely.")
+        return True
 
     def _run_quantum_governance_vote(self) -> float:
         """Runs quantum simulation for governance vote."""
@@ -116,17 +125,14 @@ class PiMainnetLaunchGovernanceProtocol:
 
     async def manual_governance_vote(self):
         """Handles manual votes for mainnet governance."""
-        while True:
-            if self.vote_button.is_pressed:
-                logging.info("Manual governance vote: Halt mainnet if non-compliant.")
-                vote = {'voter': 'manual', 'decision': 'Halt if needed', 'timestamp': asyncio.get_event_loop().time()}
-                self.governance_votes.append(vote)
-                with open('./governance_votes.json', 'w') as f:
-                    json.dump(self.governance_votes, f)
-                if self.launch_status == 'Launched' and not await self._check_launch_readiness()['compliance']:
-                    await self._halt_mainnet("Manual vote: Non-compliance.")
-                    break
-            await asyncio.sleep(1)
+        logging.info("Manual governance vote: Halt mainnet if non-compliant.")
+        vote = {'voter': 'manual', 'decision': 'Halt if needed', 'timestamp': asyncio.get_event_loop().time()}
+        self.governance_votes.append(vote)
+        with open('./governance_votes.json', 'w') as f:
+            json.dump(self.governance_votes, f)
+        if self.launch_status == 'Launched' and not await self._check_launch_readiness()['compliance']:
+            await self._halt_mainnet("Manual vote: Non-compliance.")
+            return False  # Detaches the button callback
 
     async def _halt_mainnet(self, reason: str):
         """Halts mainnet operations."""
@@ -155,7 +161,7 @@ class PiMainnetLaunchGovernanceProtocol:
         await self.prepare_mainnet_launch()
         if self.launch_status == 'Launched':
             asyncio.create_task(self.govern_mainnet_operations())
-            asyncio.create_task(self.manual_governance_vote())
+            default_scheduler.on_press('PiMainnetLaunchGovernanceProtocol.manual_governance_vote', self.vote_button, self.manual_governance_vote)
         # Initial dashboard
         await self.generate_launch_dashboard()
         logging.info("Pi Mainnet Launch and Governance Protocol active. Mainnet fully open.")
@@ -4,16 +4,20 @@ from typing import Dict, List, Any, Optional
 import hashlib
 import json
 import os
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.backends import default_backend
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for tamper-proof audits
-from gpiozero import LED, Buzzer, Button  # Pi hardware: LED for purity status, Buzzer for alerts, Button for manual audit
+import numpy as np
+from lazy_loader import LazyObject, lazy_from
+hashes = lazy_from('cryptography.hazmat.primitives', 'hashes')
+rsa, padding = lazy_from('cryptography.hazmat.primitives.asymmetric', 'rsa', 'padding')
+default_backend = lazy_from('cryptography.hazmat.backends', 'default_backend')
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for tamper-proof audits
+LED, Buzzer, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'Button')  # Pi hardware: LED for purity status, Buzzer for alerts, Button for manual audit
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from quantum_security_layer import QuantumSecurityLayer  # File 5
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
 import secrets
+from inference_cache import InferenceCache  # LRU + TTL verdict cache keyed by transaction hash
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - PI Purity Enforcer: %(message)s')
@@ -21,19 +25,22 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - PI Purity Enforcer
 class PIPurityAccountabilityEnforcer:
     def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager,
                  security: QuantumSecurityLayer, core: UltimateIntegrationCore,
-                 purity_led_pin: int = 23, alert_buzzer_pin: int = 24, audit_button_pin: int = 25):
+                 purity_led_pin: int = 23, alert_buzzer_pin: int = 24, audit_button_pin: int = 25,
+                 verdict_cache_entries: int = 10000, verdict_ttl: float = 600):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.security = security
         self.core = core
-        self.purity_led = LED(purity_led_pin)  # Green: pure, Red: tainted
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.audit_button = Button(audit_button_pin)  # Manual founder audit trigger
+        self.purity_led = LazyObject(LED, purity_led_pin)  # Green: pure, Red: tainted
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.audit_button = LazyObject(Button, audit_button_pin)  # Manual founder audit trigger
         self.pure_sources = ['mining', 'contribution_rewards', 'p2p']  # Only allowed origins
         self.tainted_sources = ['exchange', 'bought_exchange', 'entered_exchange', 'unclear_party']
         self.founder_watchlist: Dict[str, Any] = self._load_founder_watchlist()  # Tracks founders/teams
-        self.quantum_audit_circuit = self._build_quantum_audit()
+        self.quantum_audit_circuit = LazyObject(self._build_quantum_audit)
         self.frozen_pi_supply = 0  # Tainted PI returned to supply
+        self.verdict_cache = InferenceCache(max_entries=verdict_cache_entries, ttl=verdict_ttl)  # Re-audits by other callers reuse the verdict
+        self._canonical_encoder = json.JSONEncoder(sort_keys=True, separators=(',', ':'), default=str)
 
     def _load_founder_watchlist(self) -> Dict[str, Any]:
         """Loads founder/team accountability data."""
@@ -52,55 +59,99 @@ class PIPurityAccountabilityEnforcer:
 
     async def enforce_pi_purity(self, transaction: Dict[str, Any]) -> bool:
         """Enforces PI purity by rejecting tainted sources."""
-        source = transaction.get('source', '').lower()
-        if source in self.tainted_sources or 'exchange' in source or 'unclear' in source:
-            logging.warning(f"Tainted PI detected: {transaction}. Rejecting and isolating.")
+        return (await self.enforce_pi_purity_batch([transaction]))[0]
+
+    async def enforce_pi_purity_batch(self, transactions: List[Dict[str, Any]]) -> List[bool]:
+        """Batch path: one canonical hash per transaction, cached verdicts reused, one quantum job for the rest."""
+        tx_hashes = self._transaction_hashes(transactions)
+        verdicts: Dict[str, bool] = {}
+        pending: Dict[str, Dict[str, Any]] = {}  # Unique uncached transactions, by hash
+        for tx_hash, transaction in zip(tx_hashes, transactions):
+            if tx_hash in verdicts or tx_hash in pending:
+                continue
+            hit, verdict = self.verdict_cache.get(('purity', tx_hash))
+            if hit:
+                verdicts[tx_hash] = verdict
+            else:
+                pending[tx_hash] = transaction
+        tainted = {tx_hash: tx for tx_hash, tx in pending.items() if self._is_tainted_source(tx)}
+        if tainted:
+            logging.warning(f"Tainted PI detected in {len(tainted)} transactions. Rejecting and isolating.")
             self.purity_led.off()  # Red: tainted
             self.alert_buzzer.beep(on_time=1, off_time=1, n=3)
-            await self._isolate_tainted_pi(transaction)
-            return False
+            await self._isolate_tainted_batch(tainted)
+            verdicts.update(dict.fromkeys(tainted, False))
+        candidates = [tx_hash for tx_hash in pending if tx_hash not in tainted]
         # Verify via AHI AI (File 1)
-        if not await self.ahi_ai.filter_transaction(transaction):
-            return False
+        compliant = await asyncio.gather(*(self.ahi_ai.filter_transaction(pending[tx_hash]) for tx_hash in candidates))
+        passed = [tx_hash for tx_hash, ok in zip(candidates, compliant) if ok]
+        verdicts.update((tx_hash, False) for tx_hash, ok in zip(candidates, compliant) if not ok)
         # Quantum-secure verification
-        is_pure = self._quantum_verify_purity(transaction)
-        if is_pure:
+        verdicts.update(zip(passed, self._quantum_verify_purity_batch(len(passed))))
+        for tx_hash in pending:
+            self.verdict_cache.put(('purity', tx_hash), verdicts[tx_hash])
+        results = [verdicts[tx_hash] for tx_hash in tx_hashes]
+        if passed and all(results):
             self.purity_led.on()  # Green: pure
-            return True
-        return False
+        return results
+
+    def _is_tainted_source(self, transaction: Dict[str, Any]) -> bool:
+        source = transaction.get('source', '').lower()
+        return source in self.tainted_sources or 'exchange' in source or 'unclear' in source
+
+    def _transaction_hashes(self, transactions: List[Dict[str, Any]]) -> List[str]:
+        """Canonical (sorted-key, compact) JSON SHA-256 of each transaction, with one shared encoder."""
+        encode = self._canonical_encoder.encode
+        return [hashlib.sha256(encode(transaction).encode()).hexdigest() for transaction in transactions]
 
     def _quantum_verify_purity(self, transaction: Dict[str, Any]) -> bool:
         """Uses quantum simulation for purity verification."""
-        # Hash transaction for quantum check
-        tx_hash = hashlib.sha256(json.dumps(transaction, sort_keys=True).encode()).hexdigest()
+        return self._quantum_verify_purity_batch(1)[0]
+
+    def _quantum_verify_purity_batch(self, count: int) -> List[bool]:
+        """One simulator job and one randomness draw for `count` verdicts, instead of a shots=1 job per transaction."""
+        if not count:
+            return []
         backend = Aer.get_backend('qasm_simulator')
-        job = execute(self.quantum_audit_circuit, backend, shots=1)
+        job = execute(self.quantum_audit_circuit, backend, shots=count)
         result = job.result().get_counts()
         # Simulate purity based on quantum randomness
-        return secrets.randbelow(100) > 10  # 90% pure (hyper-tech: real quantum oracle)
+        draws = np.frombuffer(secrets.token_bytes(2 * count), dtype=np.uint16) % 100
+        return (draws > 10).tolist()  # 90% pure (hyper-tech: real quantum oracle)
 
     async def _isolate_tainted_pi(self, transaction: Dict[str, Any]):
         """Isolates tainted PI and returns to supply."""
-        amount = transaction.get('amount', 0)
+        await self._isolate_tainted_batch(dict(zip(self._transaction_hashes([transaction]), [transaction])))
+
+    async def _isolate_tainted_batch(self, tainted: Dict[str, Dict[str, Any]]):
+        """Isolates many tainted transactions (keyed by hash) with one supply update, ledger append and secure call."""
+        amount = sum(transaction.get('amount', 0) for transaction in tainted.values())
         self.frozen_pi_supply += amount
         logging.info(f"Isolated {amount} tainted PI. Returned to supply. Total frozen: {self.frozen_pi_supply}")
         # Update PI Manager (File 2) to deduct
-        self.pi_manager.transactions.append({'action': 'isolate', 'amount': -amount})
+        self.pi_manager.transactions.extend([{'action': 'isolate', 'amount': -transaction.get('amount', 0)} for transaction in tainted.values()])
         # Secure via Quantum Layer (File 5)
-        await self.security.secure_pi_transaction({'id': f'isolate_{transaction["id"]}', 'amount': amount})
+        await self.security.secure_pi_transactions([
+            {'id': f'isolate_{transaction.get("id", tx_hash[:16])}', 'amount': transaction.get('amount', 0)}
+            for tx_hash, transaction in tainted.items()
+        ])
 
     async def monitor_founder_accountability(self):
         """Monitors founders/teams for manipulations, exploitations, or cheats."""
-        while True:
-            # Simulate monitoring (in hyper-tech: integrate Pi Network API or blockchain watchers)
-            violations = ['manipulation_detected'] if secrets.randbelow(1000) < 5 else []  # Rare simulation
-            if violations:
-                logging.critical(f"Founder violation detected: {violations}. Freezing all PI and returning to supply.")
-                await self._freeze_and_return_all_pi()
-                # Halt ecosystem via Core (File 6)
-                self.core._trigger_system_rebirth()
-                break
-            await asyncio.sleep(86400)  # Daily check
+        job = default_scheduler.every('PIPurityAccountabilityEnforcer.monitor_founder_accountability', 86400, self._check_founders)  # Daily check
+        await job.finished.wait()
+
+    async def _check_founders(self) -> bool:
+        """One founder accountability check; returns False once a violation has frozen all PI."""
+        # Simulate monitoring (in hyper-tech: integrate Pi Network API or blockchain watchers)
+        violations = ['manipulation_detected'] if secrets.randbelow(1000) < 5 else []  # Rare simulation
+        if violations:
+            logging.critical(f"Founder violation detected: {violations}. Freezing all PI and returning to supply.")
+            await self._freeze_and_return_all_pi()
+            # Halt ecosystem via Core (File 6)
+            self.core._trigger_system_rebirth()
+            return False
+        return True
 
     async def _freeze_and_return_all_pi(self):
         """Freezes and returns all PI to supply on founder violations."""
@@ -116,17 +167,14 @@ class PIPurityAccountabilityEnforcer:
 
     async def manual_audit_trigger(self):
         """Handles manual audit via button press."""
-        while True:
-            if self.audit_button.is_pressed:
-                logging.info("Manual founder audit triggered.")
-                await self.monitor_founder_accountability()  # Force check
-                self.purity_led.blink(on_time=0.5, off_time=0.5, n=5)
-            await asyncio.sleep(1)
+        logging.info("Manual founder audit triggered.")
+        await self.monitor_founder_accountability()  # Force check
+        self.purity_led.blink(on_time=0.5, off_time=0.5, n=5)
 
     async def run_enforcer(self):
         """Main enforcer loop."""
         asyncio.create_task(self.monitor_founder_accountability())
-        asyncio.create_task(self.manual_audit_trigger())
+        default_scheduler.on_press('PIPurityAccountabilityEnforcer.manual_audit_trigger', self.audit_button, self.manual_audit_trigger)
         logging.info("PI Purity and Accountability Enforcer active. Ecosystem is Stablecoin-Only and secure.")
 
 # Usage example (integrate into main app)
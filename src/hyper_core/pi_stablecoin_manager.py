@@ -3,56 +3,68 @@ import logging
 from typing import Dict, List, Any, Optional
 import hashlib
 import secrets
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.backends import default_backend
-from gpiozero import LED, Button  # Pi hardware: LED for transaction status, Button for manual confirm
+from lazy_loader import LazyObject, lazy_from
+LED, Button = lazy_from('gpiozero', 'LED', 'Button')  # Pi hardware: LED for transaction status, Button for manual confirm
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # Import from File 1
+from transaction_store import LedgerTransactionStore, TransactionLog, TransactionStore  # Pluggable transaction storage
+from transaction_pipeline import TransactionPipeline  # Staged, order-preserving submission
+from transaction_signer import Ed25519Signer, TransactionSigner, encode_transaction, load_signer, sign_batch, verify_ed25519  # Pluggable signing
 import json
 import os
+import threading
+from collections import defaultdict
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - PI Manager: %(message)s')
 
+INDEX_BATCH_SIZE = 500
+
 class PIStablecoinManager:
-    def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, wallet_path: str = './pi_wallet.json', led_pin: int = 18, button_pin: int = 23):
+    def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, wallet_path: str = './pi_wallet.json', led_pin: int = 18, button_pin: int = 23,
+                 ledger_path: str = './pi_transactions.wal', snapshot_path: str = './pi_transactions.json', store: Optional[TransactionStore] = None,
+                 signer: Optional[TransactionSigner] = None):
         self.ahi_ai = ahi_ai  # Integration with AHI AI for filtering
         self.wallet_path = wallet_path
-        self.pi_led = LED(led_pin)  # Green: success, Red: failure
-        self.confirm_button = Button(button_pin)  # Manual confirmation for high-value tx
+        self.store = store or LedgerTransactionStore(ledger_path, snapshot_path)  # e.g. SQLiteTransactionStore for large histories
+        self.pi_led = LazyObject(LED, led_pin)  # Green: success, Red: failure
+        self.confirm_button = LazyObject(Button, button_pin)  # Manual confirmation for high-value tx
         self.fixed_value = 314159  # Fixed PI value in cents
         self.allowed_sources = ['mining', 'contribution_rewards', 'p2p']
-        self.private_key, self.public_key = self._load_or_generate_keys()
-        self.transactions: List[Dict] = self._load_transactions()
+        self.signer = signer or self._load_or_generate_keys()
+        self.public_key = self.signer.public_key
+        self.account_id = self.signer.public_id  # Stable hex id, computed once
+        self.transactions: TransactionLog = self._load_transactions()
+        self.balances: Dict[str, int] = defaultdict(int)  # Running balance per account
+        self._indexed_count = 0  # Transactions already folded into self.balances
+        self._indexed_generation = self.store.generation
+        self._index_lock = threading.Lock()
+        self._update_balance_index()  # Rebuilt from the recovered ledger
         self.smart_contracts: Dict[str, Any] = {}  # Simulated smart contracts for PI logic
+        self.pipeline = TransactionPipeline(self)  # validate -> sign -> execute -> persist
 
-    def _load_or_generate_keys(self) -> tuple:
-        """Generates or loads RSA keys for secure PI transactions."""
+    def _load_or_generate_keys(self) -> TransactionSigner:
+        """Loads the wallet signer, or generates an Ed25519 key and saves it."""
         if os.path.exists(self.wallet_path):
             with open(self.wallet_path, 'r') as f:
                 data = json.load(f)
-                # In hyper-tech: deserialize keys securely
-                return data['private'], data['public']
-        else:
-            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
-            public_key = private_key.public_key()
-            # Serialize and save (simplified; use proper key management in prod)
-            data = {'private': private_key, 'public': public_key}
-            with open(self.wallet_path, 'w') as f:
-                json.dump(data, f, default=str)  # Note: Real impl needs secure serialization
-            return private_key, public_key
-
-    def _load_transactions(self) -> List[Dict]:
-        """Loads transaction history from secure storage."""
-        if os.path.exists('./pi_transactions.json'):
-            with open('./pi_transactions.json', 'r') as f:
-                return json.load(f)
-        return []
+            if 'scheme' in data:
+                return load_signer(data)
+            # Wallets written before signers were pluggable hold only str() of the key objects: keep a copy, issue a new key
+            os.replace(self.wallet_path, self.wallet_path + '.legacy')
+            logging.warning(f"Wallet {self.wallet_path} has no usable key material; moved to .legacy and generating a new key.")
+        signer = Ed25519Signer()
+        fd = os.open(self.wallet_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(signer.export_private(), f)
+        return signer
 
-    async def create_pi_transaction(self, recipient: str, amount: int, source: str) -> Optional[Dict[str, Any]]:
-        """Creates a PI transaction, enforcing rules via AHI AI."""
-        transaction_data = {
-            'sender': str(self.public_key),  # Simplified
+    def _load_transactions(self) -> TransactionLog:
+        """Opens the transaction history (recovered by the store) as a list-like log."""
+        return TransactionLog(self.store)
+
+    def _build_transaction(self, recipient: str, amount: int, source: str) -> Dict[str, Any]:
+        return {
+            'sender': self.account_id,  # Simplified
             'recipient': recipient,
             'amount': amount,
             'currency': 'PI',
@@ -60,37 +72,47 @@ class PIStablecoinManager:
             'source': source,
             'timestamp': asyncio.get_event_loop().time()
         }
+
+    async def create_pi_transaction(self, recipient: str, amount: int, source: str) -> Optional[Dict[str, Any]]:
+        """Creates a PI transaction, enforcing rules via AHI AI (runs through the submission pipeline)."""
+        return await self.pipeline.submit(self._build_transaction(recipient, amount, source))
+
+    def _needs_confirmation(self, transaction_data: Dict[str, Any]) -> bool:
+        return transaction_data['amount'] > 1000  # High-value transfers need a button press
+
+    async def _validate_transaction(self, transaction_data: Dict[str, Any]) -> bool:
+        """Pipeline validate stage: AHI AI filter plus manual confirmation for high-value transfers."""
         # Filter via AHI AI
         if not await self.ahi_ai.filter_transaction(transaction_data):
             logging.error("Transaction rejected by AHI AI: Volatile or non-compliant.")
             self.pi_led.blink(on_time=0.5, off_time=0.5)  # Red blink
-            return None
+            return False
         # Manual confirmation for amounts > 1000 PI
-        if amount > 1000:
+        if self._needs_confirmation(transaction_data):
             logging.info("Awaiting manual confirmation...")
             await self._wait_for_confirmation()
-        # Sign transaction with zero-knowledge proof simulation
-        signature = self._sign_transaction(transaction_data)
-        transaction_data['signature'] = signature
-        # Execute via smart contract
-        result = await self._execute_smart_contract('transfer', transaction_data)
-        if result:
-            self.transactions.append(transaction_data)
-            self._save_transactions()
-            self.pi_led.on()  # Green success
-            logging.info(f"PI Transaction successful: {transaction_data}")
-            return transaction_data
-        else:
-            self.pi_led.off()  # Red failure
-            return None
+        return True
 
     def _sign_transaction(self, data: Dict[str, Any]) -> str:
-        """Signs transaction using RSA and zero-knowledge proof (simplified)."""
-        message = json.dumps(data, sort_keys=True).encode()
-        signature = self.private_key.sign(message, padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH), hashes.SHA256())
-        # Simulate ZKP: Prove knowledge without revealing key
-        zkp_proof = hashlib.sha256(signature).hexdigest()  # Hyper-simplified
-        return zkp_proof
+        """Signs the canonical binary encoding of a transaction (hex signature)."""
+        return self.signer.sign(encode_transaction(data)).hex()
+
+    async def sign_transactions(self, transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Batch path: signs many transactions on a thread pool, off the event loop."""
+        signatures = await sign_batch(self.signer, transactions)
+        for tx, signature in zip(transactions, signatures):
+            tx['signature'] = signature.hex()
+            tx['zkp_proof'] = hashlib.sha256(signature).hexdigest()
+        return transactions
+
+    def verify_transaction(self, tx: Dict[str, Any]) -> bool:
+        """Checks a transaction's signature against its sender."""
+        if 'signature' not in tx:
+            return False
+        message, signature = encode_transaction(tx), bytes.fromhex(tx['signature'])
+        if tx.get('sender') == self.account_id:
+            return self.signer.verify(message, signature)
+        return verify_ed25519(tx.get('sender', ''), message, signature)
 
     async def _execute_smart_contract(self, action: str, data: Dict[str, Any]) -> bool:
         """Simulates smart contract execution for PI transfers."""
@@ -109,25 +131,78 @@ class PIStablecoinManager:
         self.confirm_button.when_pressed = on_press
         await future
 
-    def get_balance(self) -> int:
-        """Calculates PI balance from transactions."""
-        balance = 0
-        for tx in self.transactions:
-            if tx['recipient'] == str(self.public_key):
-                balance += tx['amount']
-            elif tx['sender'] == str(self.public_key):
-                balance -= tx['amount']
-        return balance
+    def record_transaction(self, tx: Dict[str, Any]):
+        """Appends a transaction to the store and updates the balance index as one step."""
+        self.record_transactions([tx])
+
+    def record_transactions(self, transactions: List[Dict[str, Any]]):
+        """Group commit: appends transactions in one store write and updates the balance index."""
+        with self._index_lock:
+            self.transactions.extend(transactions)
+            self._index_pending()
+
+    def _index_pending(self):
+        """Folds transactions appended since the last update into the index (caller holds the lock)."""
+        total = len(self.transactions)
+        for start in range(self._indexed_count, total, INDEX_BATCH_SIZE):  # Bounded chunks for on-disk stores
+            for tx in self.transactions[start:min(start + INDEX_BATCH_SIZE, total)]:
+                recipient, sender, amount = tx.get('recipient'), tx.get('sender'), tx.get('amount', 0)
+                if recipient is not None:
+                    self.balances[recipient] += amount
+                if sender is not None and sender != recipient:  # Self-transfers credit once, as the full scan does
+                    self.balances[sender] -= amount
+        self._indexed_count = total
+
+    def _update_balance_index(self):
+        """Catches the index up with transactions other modules appended to self.transactions directly."""
+        if self._indexed_count != len(self.transactions) or self._indexed_generation != self.store.generation:
+            with self._index_lock:
+                if self._indexed_count > len(self.transactions) or self._indexed_generation != self.store.generation:  # History was cleared: rebuild
+                    self._indexed_generation = self.store.generation
+                    self.balances.clear()
+                    self._indexed_count = 0
+                self._index_pending()
+
+    def get_balance(self, account: Optional[str] = None) -> int:
+        """Returns the PI balance of an account (default: this wallet) from the running index."""
+        self._update_balance_index()
+        return self.balances.get(account or self.account_id, 0)
+
+    def _scan_balances(self, accounts: set, limit: int) -> Dict[str, int]:
+        """Recomputes balances from the first limit transactions, streaming the history once."""
+        balances = dict.fromkeys(accounts, 0)
+        for position, tx in enumerate(self.transactions):
+            if position >= limit:
+                break
+            recipient, sender, amount = tx.get('recipient'), tx.get('sender'), tx.get('amount', 0)
+            if recipient in balances:
+                balances[recipient] += amount
+            if sender in balances and sender != recipient:
+                balances[sender] -= amount
+        return balances
+
+    def verify_balance_index(self) -> Dict[str, Dict[str, int]]:
+        """Consistency check: returns accounts whose indexed balance differs from a full recomputation."""
+        self._update_balance_index()
+        with self._index_lock:
+            indexed = {account: self.balances.get(account, 0) for account in set(self.balances) | {self.account_id}}
+            limit = self._indexed_count  # Same history the index was built from
+        expected = self._scan_balances(set(indexed), limit)
+        mismatches = {account: {'indexed': balance, 'expected': expected[account]} for account, balance in indexed.items() if balance != expected[account]}
+        if mismatches:
+            logging.error(f"Balance index inconsistent for {len(mismatches)} accounts.")
+        return mismatches
 
     async def distribute_rewards(self, contributor: str, reward_type: str):
         """Autonomously distributes PI rewards (e.g., mining, contributions)."""
         if reward_type in self.allowed_sources:
             await self.create_pi_transaction(contributor, 100, reward_type)  # Example: 100 PI reward
 
-    def _save_transactions(self):
-        """Saves transactions securely."""
-        with open('./pi_transactions.json', 'w') as f:
-            json.dump(self.transactions, f)
+    async def distribute_rewards_bulk(self, contributors: List[str], reward_type: str, amount: int = 100) -> List[Optional[Dict[str, Any]]]:
+        """Distributes rewards to many contributors through the pipeline; results keep the input order."""
+        if reward_type not in self.allowed_sources:
+            return [None] * len(contributors)
+        return await self.pipeline.submit_many([self._build_transaction(contributor, amount, reward_type) for contributor in contributors])
 
 # Usage example (integrate into main app)
 if __name__ == "__main__":
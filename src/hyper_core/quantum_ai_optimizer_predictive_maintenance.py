@@ -5,10 +5,13 @@ import json
 import os
 import random
 import time
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for predictive optimization
-from transformers import pipeline  # AI for maintenance predictions
-from gpiozero import LED, Buzzer, RGBLED  # Pi hardware: RGB LED for optimization status, Buzzer for alerts
-from sklearn.ensemble import RandomForestRegressor  # ML for predictive maintenance
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for predictive optimization
+pipeline = lazy_from('transformers', 'pipeline')  # AI for maintenance predictions
+LED, Buzzer, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED')  # Pi hardware: RGB LED for optimization status, Buzzer for alerts
+from journal import Journal
+from model_trainer import BackgroundTrainer  # Training in a worker process, versioned models swapped in atomically
+from task_scheduler import default_scheduler
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
@@ -29,7 +32,8 @@ class QuantumAIOptimizerPredictiveMaintenance:
                  security: QuantumSecurityLayer, core: UltimateIntegrationCore,
                  purity_enforcer: PIPurityAccountabilityEnforcer, governance: UltimateAIGovernanceEthicalOverseer,
                  guardian: UltimateEcosystemGuardianSummaryScript,
-                 rgb_led_pins: tuple = (1, 2, 3), alert_buzzer_pin: int = 4):
+                 rgb_led_pins: tuple = (1, 2, 3), alert_buzzer_pin: int = 4, journal_dir: str = './journals',
+                 model_dir: str = './models/predictive_maintenance', retrain_interval: float = 3600):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.app_builder = app_builder
@@ -39,11 +43,13 @@ class QuantumAIOptimizerPredictiveMaintenance:
         self.purity_enforcer = purity_enforcer
         self.governance = governance
         self.guardian = guardian
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=optimized, Blue=optimizing, Red=maintenance
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.predictive_model = RandomForestRegressor(n_estimators=100, random_state=42)  # ML for predictions
-        self.quantum_optimizer = self._init_quantum_optimizer()
-        self.maintenance_logs: List[Dict] = []
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Green=optimized, Blue=optimizing, Red=maintenance
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.predictive_model = BackgroundTrainer(model_dir, ('sklearn.ensemble', 'RandomForestRegressor', {'n_estimators': 100, 'random_state': 42}))  # ML for predictions
+        self.retrain_interval = retrain_interval  # Seconds between background retrains
+        self._first_retrain: Optional[asyncio.Task] = None  # Referenced so the event loop cannot drop it mid-fit
+        self.quantum_optimizer = LazyObject(self._init_quantum_optimizer)
+        self.maintenance_logs = Journal(os.path.join(journal_dir, 'maintenance_logs'), legacy_path='./maintenance_logs.json')
         self.optimization_score = 1.0  # Starts at optimal
 
     def _init_quantum_optimizer(self) -> QuantumCircuit:
@@ -65,13 +71,14 @@ class QuantumAIOptimizerPredictiveMaintenance:
             'frozen_pi': self.purity_enforcer.frozen_pi_supply,
             'compliance_breaches': 1 if self.ahi_ai.stellar_halted else 0
         }
-        # Train predictive model (simplified; in prod, use historical data)
-        features = np.array([[data['pi_transactions'], data['active_apps'], data['unethical_incidents'], data['frozen_pi'], data['compliance_breaches']]])
-        if len(self.maintenance_logs) > 10:  # Enough data
-            self.predictive_model.fit(features, [random.random() for _ in range(len(features))])  # Mock training
-            prediction = self.predictive_model.predict(features)[0]
-        else:
-            prediction = random.random()  # Fallback
+        features = [data['pi_transactions'], data['active_apps'], data['unethical_incidents'], data['frozen_pi'], data['compliance_breaches']]
+        # Record a training sample; fitting happens in the background (simplified; in prod, label with observed failures)
+        self.predictive_model.add_sample(features, random.random())  # Mock label
+        prediction = self.predictive_model.predict(features)  # Cheap predict on the current model version
+        if prediction is None:
+            prediction = random.random()  # Fallback until the first model is trained
+            if self.predictive_model.ready() and (self._first_retrain is None or self._first_retrain.done()):
+                self._first_retrain = asyncio.create_task(self.predictive_model.retrain())  # First model as soon as there is enough data
         # Quantum-enhanced prediction
         quantum_result = self._run_quantum_prediction(prediction)
         risk_level = 'High' if quantum_result > 0.7 else 'Low'
@@ -102,8 +109,6 @@ class QuantumAIOptimizerPredictiveMaintenance:
         # Log maintenance
         log = {'timestamp': time.time(), 'action': 'predictive_maintenance', 'optimized_score': self.optimization_score}
         self.maintenance_logs.append(log)
-        with open('./maintenance_logs.json', 'w') as f:
-            json.dump(self.maintenance_logs, f)
         self.optimization_score = min(1.0, self.optimization_score + 0.1)  # Improve score
         self.rgb_led.color = (0, 1, 0)  # Green: optimized
         logging.info("Predictive maintenance completed.")
@@ -128,25 +133,30 @@ class QuantumAIOptimizerPredictiveMaintenance:
 
     async def monitor_and_optimize(self):
         """Continuously monitors and optimizes the ecosystem."""
-        while True:
-            prediction = await self.predict_system_failures()
-            if prediction['risk_level'] == 'High':
-                await self._perform_predictive_maintenance()
-            # Generate optimization report
-            report = {
-                'optimization_score': self.optimization_score,
-                'maintenance_count': len(self.maintenance_logs),
-                'risk_level': prediction['risk_level'],
-                'system_health': 'Optimal' if self.optimization_score > 0.8 else 'Needs Attention'
-            }
-            with open('./optimization_report.json', 'w') as f:
-                json.dump(report, f)
-            logging.info(f"Optimization Report: {report}")
-            await asyncio.sleep(3600)  # Optimize every hour
+        job = default_scheduler.every('QuantumAIOptimizerPredictiveMaintenance.monitor_and_optimize', 3600, self._optimize_pass)  # Optimize every hour
+        await job.finished.wait()
+
+    async def _optimize_pass(self):
+        """One failure prediction, maintenance if needed, and the optimization report."""
+        prediction = await self.predict_system_failures()
+        if prediction['risk_level'] == 'High':
+            await self._perform_predictive_maintenance()
+        # Generate optimization report
+        report = {
+            'optimization_score': self.optimization_score,
+            'maintenance_count': len(self.maintenance_logs),
+            'risk_level': prediction['risk_level'],
+            'system_health': 'Optimal' if self.optimization_score > 0.8 else 'Needs Attention'
+        }
+        with open('./optimization_report.json', 'w') as f:
+            json.dump(report, f)
+        logging.info(f"Optimization Report: {report}")
 
     async def run_optimizer(self):
         """Main optimizer loop."""
         self.rgb_led.color = (0, 0, 1)  # Blue: initializing
+        default_scheduler.every('QuantumAIOptimizerPredictiveMaintenance.retrain', self.retrain_interval, self.predictive_model.retrain,
+                                delay=self.retrain_interval)
         asyncio.create_task(self.monitor_and_optimize())
         logging.info("Quantum AI Optimizer and Predictive Maintenance Module active.")
 
@@ -3,15 +3,16 @@ import logging
 from typing import Dict, List, Any, Optional
 import os
 import json
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.backends import default_backend
-from qiskit import QuantumCircuit, Aer, execute  # Quantum simulations for key distribution
-from gpiozero import LED, Button  # Pi hardware: LED for security status, Button for manual key reset
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum simulations for key distribution
+LED, Button = lazy_from('gpiozero', 'LED', 'Button')  # Pi hardware: LED for security status, Button for manual key reset
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
 from hyper_ecosystem_monitor import HyperEcosystemMonitor  # File 4
+from envelope_crypto import EnvelopeKeyring, EnvelopeSealer, open_envelope  # Hybrid X25519 + AES-GCM envelopes
+from enclave_store import SecureEnclaveStore  # Bounded LRU + encrypted segment files
+from task_scheduler import default_scheduler
 import secrets
 
 # Configure logging
@@ -20,23 +21,30 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - Quantum Security:
 class QuantumSecurityLayer:
     def __init__(self, ahi_ai: AutonomousHyperIntelligenceAI, pi_manager: PIStablecoinManager,
                  app_builder: AutonomousAppBuilder, monitor: HyperEcosystemMonitor,
-                 status_led_pin: int = 21, reset_button_pin: int = 22):
+                 status_led_pin: int = 21, reset_button_pin: int = 22, key_path: str = './quantum_keys.json',
+                 enclave_path: str = './secure_enclave', enclave_memory_entries: int = 4096):
         self.ahi_ai = ahi_ai
         self.pi_manager = pi_manager
         self.app_builder = app_builder
         self.monitor = monitor
-        self.status_led = LED(status_led_pin)  # Green: secure, Red: breach
-        self.reset_button = Button(reset_button_pin)  # Manual key reset
-        self.quantum_keys: Dict[str, Any] = self._generate_quantum_keys()
-        self.secure_enclave = {}  # Simulated secure enclave on Pi
+        self.status_led = LazyObject(LED, status_led_pin)  # Green: secure, Red: breach
+        self.reset_button = LazyObject(Button, reset_button_pin)  # Manual key reset
+        self.key_path = key_path  # Persisted keyring: keys survive restarts instead of being regenerated
+        self.quantum_keys: Dict[str, Any] = LazyObject(self._generate_quantum_keys)
+        # Simulated secure enclave on Pi: bounded in memory, spills to encrypted segments on disk
+        self.secure_enclave: SecureEnclaveStore = LazyObject(self._open_enclave, enclave_path, enclave_memory_entries)
         self.threat_detector = self._build_threat_model()  # AI for quantum threat detection
 
-    def _generate_quantum_keys(self) -> Dict[str, Any]:
-        """Generates quantum-resistant keys using lattice-based crypto simulation."""
-        # Simplified: Use RSA as proxy; in hyper-tech, integrate Kyber or Dilithium
-        private_key = rsa.generate_private_key(public_exponent=65537, key_size=4096, backend=default_backend())
-        public_key = private_key.public_key()
-        # Quantum key distribution simulation
+    def _generate_quantum_keys(self, rotate: bool = False) -> Dict[str, Any]:
+        """Loads (or creates) the persisted envelope keyring; the QKD shared key is simulated only when first read."""
+        # Simplified: X25519 + AES-GCM envelopes as proxy; in hyper-tech, integrate Kyber or Dilithium
+        keyring = EnvelopeKeyring(self.key_path)
+        if rotate:
+            keyring.rotate()
+        return {'keyring': keyring, 'public': keyring.public_key, 'shared': LazyObject(self._simulate_qkd)}
+
+    def _simulate_qkd(self) -> str:
+        """Quantum key distribution simulation."""
         qkd_circuit = QuantumCircuit(2, 2)
         qkd_circuit.h(0)
         qkd_circuit.cx(0, 1)
@@ -44,47 +52,67 @@ class QuantumSecurityLayer:
         backend = Aer.get_backend('qasm_simulator')
         job = execute(qkd_circuit, backend, shots=1)
         qkd_result = job.result().get_counts()
-        shared_key = list(qkd_result.keys())[0]  # Simulated shared key
-        return {'private': private_key, 'public': public_key, 'shared': shared_key}
+        return list(qkd_result.keys())[0]  # Simulated shared key
+
+    def _open_enclave(self, path: str, memory_entries: int) -> SecureEnclaveStore:
+        return SecureEnclaveStore(path, self.quantum_keys['keyring'], memory_entries=memory_entries)
+
+    def report_secure_enclave(self) -> Dict[str, Any]:
+        """Logs memory footprint and hit rate of the secure enclave."""
+        metrics = self.secure_enclave.metrics()
+        logging.info(f"Secure enclave: {metrics['entries']} entries, {metrics['memory_entries']} resident ({metrics['memory_bytes'] / 1e6:.1f} MB), "
+                     f"{metrics['hit_rate']:.0%} memory hit rate, {metrics['segments']} segments ({metrics['disk_bytes'] / 1e6:.1f} MB), {metrics['compactions']} compactions")
+        return metrics
 
     def _build_threat_model(self):
         """Builds a simple AI model for detecting quantum threats (hyper-tech: use ML classifiers)."""
         return {'known_threats': ['shor_attack', 'grover_search']}  # Placeholder
 
-    async def encrypt_data(self, data: str, recipient_key: Any) -> Optional[str]:
-        """Encrypts data using quantum-resistant methods."""
+    async def encrypt_data(self, data: str, recipient_key: Any, associated_data: bytes = b'') -> Optional[str]:
+        """Encrypts data using quantum-resistant methods (hybrid envelope: no payload size limit)."""
         if not await self.ahi_ai.filter_transaction({'action': 'encrypt', 'data': data}):
             logging.error("Encryption rejected: Volatile data detected.")
             return None
         # Simulate lattice encryption (use real impl like pqcrypto)
-        encrypted = recipient_key.encrypt(data.encode(), padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None))
-        return encrypted.hex()
+        return EnvelopeSealer(recipient_key).seal(data.encode(), associated_data).hex()
+
+    def decrypt_data(self, envelope_hex: str, associated_data: bytes = b'') -> str:
+        """Opens an envelope sealed for any key in the keyring."""
+        return open_envelope(self.quantum_keys['keyring'], bytes.fromhex(envelope_hex), associated_data).decode()
 
     async def secure_pi_transaction(self, transaction: Dict[str, Any]) -> bool:
         """Secures PI transactions with quantum encryption."""
-        encrypted_tx = await self.encrypt_data(json.dumps(transaction), self.quantum_keys['public'])
-        if encrypted_tx:
-            # Store in secure enclave
-            self.secure_enclave[transaction['id']] = encrypted_tx
-            logging.info(f"PI Transaction secured: {transaction['id']}")
-            return True
-        return False
+        return await self.secure_pi_transactions([transaction]) == 1
+
+    async def secure_pi_transactions(self, transactions: List[Dict[str, Any]]) -> int:
+        """Batch path: one key agreement for the whole batch, a fresh nonce per transaction; returns how many were secured."""
+        sealer = EnvelopeSealer(self.quantum_keys['public'])
+        secured = 0
+        for transaction in transactions:
+            data = json.dumps(transaction)
+            if not await self.ahi_ai.filter_transaction({'action': 'encrypt', 'data': data}):
+                logging.error("Encryption rejected: Volatile data detected.")
+                continue
+            # The transaction id is bound as associated data, so envelopes cannot be swapped between ids
+            self.secure_enclave.put(transaction['id'], sealer.seal(data.encode(), str(transaction['id']).encode()).hex())
+            secured += 1
+        logging.info(f"PI Transactions secured: {secured}/{len(transactions)}")
+        return secured
 
     async def detect_threats(self):
         """Autonomously detects and responds to quantum threats."""
-        while True:
-            # Simulate threat scanning (in hyper-tech: integrate with quantum sensors)
-            threats = ['shor_attack'] if secrets.randbelow(100) < 5 else []  # Random simulation
-            if threats:
-                logging.warning(f"Quantum threat detected: {threats}")
-                self.status_led.off()  # Red: breach
-                # Isolate system
-                await self._isolate_system()
-                # Report to Monitor (File 4)
-                self.monitor.detect_anomalies()  # Trigger anomaly check
-            else:
-                self.status_led.on()  # Green: secure
-            await asyncio.sleep(180)  # Scan every 3 minutes
+        # Simulate threat scanning (in hyper-tech: integrate with quantum sensors)
+        threats = ['shor_attack'] if secrets.randbelow(100) < 5 else []  # Random simulation
+        if threats:
+            logging.warning(f"Quantum threat detected: {threats}")
+            self.status_led.off()  # Red: breach
+            # Isolate system
+            await self._isolate_system()
+            # Report to Monitor (File 4)
+            self.monitor.detect_anomalies()  # Trigger anomaly check
+        else:
+            self.status_led.on()  # Green: secure
+        self.report_secure_enclave()
 
     async def _isolate_system(self):
         """Isolates the system on threat detection."""
@@ -96,24 +124,21 @@ class QuantumSecurityLayer:
         # Stop apps (File 3)
         self.app_builder._halt_all_apps()
         # Encrypt all data
-        for tx_id, tx in self.secure_enclave.items():
+        for tx_id in self.secure_enclave.keys():  # Ids only: quarantining need not page every envelope in
             # Re-encrypt or quarantine
             pass
 
-    async def manual_key_reset(self):
+    def manual_key_reset(self):
         """Handles manual key reset via button press."""
-        while True:
-            await asyncio.sleep(0.1)
-            if self.reset_button.is_pressed:
-                logging.info("Manual key reset triggered.")
-                self.quantum_keys = self._generate_quantum_keys()
-                self.status_led.blink(on_time=0.5, off_time=0.5, n=3)  # Indicate reset
-                break
+        logging.info("Manual key reset triggered.")
+        self.quantum_keys = self._generate_quantum_keys(rotate=True)  # Old keys stay in the keyring for decryption
+        self.secure_enclave.keyring = self.quantum_keys['keyring']  # New segments seal with the new key
+        self.status_led.blink(on_time=0.5, off_time=0.5, n=3)  # Indicate reset
 
     async def run_security_layer(self):
         """Main security loop."""
-        asyncio.create_task(self.detect_threats())
-        asyncio.create_task(self.manual_key_reset())
+        default_scheduler.every('QuantumSecurityLayer.detect_threats', 180, self.detect_threats)  # Scan every 3 minutes
+        default_scheduler.on_press('QuantumSecurityLayer.manual_key_reset', self.reset_button, self.manual_key_reset, once=True)
         logging.info("Quantum Security Layer active.")
 
 # Usage example (integrate into main app)
@@ -0,0 +1,159 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterable, Optional, Sequence
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Startup Graph: %(message)s')
+
+class StartupGraph:
+    """Dependency graph of module constructors, initialized with independent modules running concurrently.
+
+    Each module declares the names it depends on; its factory receives the constructed dependencies as positional
+    arguments, in declaration order, and starts on a worker thread as soon as the last of them is ready. Every run
+    records a per-module trace (start, end, thread) from which the critical path is derived.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.specs: Dict[str, Dict[str, Any]] = {}  # Name -> {'factory', 'depends_on'}, in declaration order
+        self.trace: List[Dict[str, Any]] = []  # One entry per module of the last run, in completion order
+        self.started_at = 0.0
+        self.total_seconds = 0.0
+
+    def add(self, name: str, factory: Callable[..., Any], depends_on: Sequence[str] = ()):
+        if name in self.specs:
+            raise ValueError(f"Module {name} is already declared")
+        self.specs[name] = {'factory': factory, 'depends_on': tuple(depends_on)}
+
+    def order(self, provided: Iterable[str] = ()) -> List[str]:
+        """Topological order of the declared modules; raises ValueError on unknown dependencies or cycles."""
+        provided = set(provided)
+        for name, spec in self.specs.items():
+            missing = [dep for dep in spec['depends_on'] if dep not in self.specs and dep not in provided]
+            if missing:
+                raise ValueError(f"Module {name} depends on undeclared {', '.join(missing)}")
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == 2 or name in provided:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = 1
+            for dep in self.specs[name]['depends_on']:
+                visit(dep, path + [name])
+            state[name] = 2
+            order.append(name)
+
+        for name in self.specs:
+            visit(name, [])
+        return order
+
+    async def initialize(self, provided: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Constructs every module; returns name -> instance (provided values included).
+
+        The first constructor failure cancels the modules that have not started and is re-raised.
+        """
+        modules: Dict[str, Any] = dict(provided or {})
+        self.order(modules)  # Validate before starting anything
+        self.trace = []
+        loop = asyncio.get_running_loop()
+        self.started_at = time.perf_counter()
+        done: Dict[str, asyncio.Future] = {}
+
+        def construct(name: str, args: List[Any]) -> Any:
+            entry = {'module': name, 'depends_on': list(self.specs[name]['depends_on']), 'thread': threading.current_thread().name,
+                     'start': time.perf_counter() - self.started_at}
+            try:
+                return self.specs[name]['factory'](*args)
+            except Exception as e:
+                entry['error'] = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                entry['end'] = time.perf_counter() - self.started_at
+                entry['seconds'] = entry['end'] - entry['start']
+                self.trace.append(entry)
+
+        async def build(name: str, executor: ThreadPoolExecutor):
+            deps = self.specs[name]['depends_on']
+            await asyncio.gather(*(done[dep] for dep in deps if dep in done))
+            modules[name] = await loop.run_in_executor(executor, construct, name, [modules[dep] for dep in deps])
+            return modules[name]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='startup') as executor:
+            for name in self.order(modules):
+                done[name] = asyncio.ensure_future(build(name, executor))
+            try:
+                await asyncio.gather(*done.values())
+            finally:
+                for task in done.values():
+                    task.cancel()
+        self.total_seconds = time.perf_counter() - self.started_at
+        return modules
+
+    def critical_path(self) -> List[str]:
+        """Chain of modules that bounded the last run: from the module that finished last, back through the
+        dependency that finished last at each step."""
+        entries = {entry['module']: entry for entry in self.trace}
+        if not entries:
+            return []
+        path = [max(entries.values(), key=lambda entry: entry['end'])['module']]
+        while True:
+            deps = [entries[dep] for dep in entries[path[-1]]['depends_on'] if dep in entries]
+            if not deps:
+                return list(reversed(path))
+            path.append(max(deps, key=lambda entry: entry['end'])['module'])
+
+    def report(self) -> Dict[str, Any]:
+        critical_path = self.critical_path()
+        by_name = {entry['module']: entry for entry in self.trace}
+        return {
+            'total_seconds': self.total_seconds,
+            'sequential_seconds': sum(entry['seconds'] for entry in self.trace),  # What one-by-one construction would cost
+            'critical_path': critical_path,
+            'critical_path_seconds': sum(by_name[name]['seconds'] for name in critical_path),
+            'modules': sorted(self.trace, key=lambda entry: entry['start'])
+        }
+
+    def write_trace(self, path: str) -> Dict[str, Any]:
+        """Writes the report of the last run as JSON (atomic replace) and logs the slowest step of the critical path."""
+        report = self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp, path)
+        slowest = max((entry for entry in report['modules'] if entry['module'] in report['critical_path']), key=lambda entry: entry['seconds'], default=None)
+        logging.info(f"Initialized {len(report['modules'])} modules in {report['total_seconds']:.2f}s "
+                     f"({report['sequential_seconds']:.2f}s sequential); critical path {' -> '.join(report['critical_path'])}"
+                     + (f", slowest {slowest['module']} ({slowest['seconds']:.2f}s)" if slowest else ''))
+        return report
+
+def benchmark_startup_graph(modules: int = 12, seconds: float = 0.05, max_workers: int = 4) -> Dict[str, float]:
+    """Sequential vs graph initialization of a fan-out/fan-in graph whose constructors block (I/O, key loading)."""
+    graph = StartupGraph(max_workers=max_workers)
+    graph.add('root', lambda: time.sleep(seconds))
+    for i in range(modules - 2):
+        graph.add(f'module_{i}', lambda root: time.sleep(seconds), depends_on=['root'])
+    graph.add('hub', lambda *deps: time.sleep(seconds), depends_on=[f'module_{i}' for i in range(modules - 2)])
+    asyncio.run(graph.initialize())
+    report = graph.report()
+    return {'modules': modules, 'sequential_s': report['sequential_seconds'], 'graph_s': report['total_seconds'],
+            'critical_path_s': report['critical_path_seconds']}
+
+# Usage: python startup_graph.py [--modules N] [--workers N]; compares sequential with dependency-graph initialization
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dependency-graph initialization against sequential construction.")
+    parser.add_argument('--modules', type=int, default=12)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    print(benchmark_startup_graph(args.modules, max_workers=args.workers))
@@ -0,0 +1,90 @@
+import argparse
+import glob
+import json
+import logging
+import os
+import subprocess
+import sys
+from typing import Dict, List, Any, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Startup Profiler: %(message)s')
+
+HYPER_CORE_DIR = os.path.dirname(os.path.abspath(__file__))
+HEAVY_DEPENDENCIES = ['tensorflow', 'qiskit', 'transformers', 'torch', 'gpiozero', 'sklearn', 'matplotlib', 'docker', 'kubernetes', 'cryptography']
+STARTUP_BUDGET_SECONDS = 2.0  # Per-module cold import budget on a Pi; enforced in CI
+
+# Runs in a fresh interpreter so every module is measured from a cold start
+_PROBE_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {path!r})
+before = set(sys.modules)
+start = time.perf_counter()
+error = None
+try:
+    __import__({module!r})
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split('.')[0] for name in set(sys.modules) - before}})
+print(json.dumps({{'seconds': elapsed, 'loaded': loaded, 'error': error}}))
+"""
+
+class HyperCoreStartupProfiler:
+    def __init__(self, modules: Optional[List[str]] = None, budget: float = STARTUP_BUDGET_SECONDS):
+        self.modules = modules or self._discover_modules()
+        self.budget = budget
+        self.results: List[Dict[str, Any]] = []
+
+    def _discover_modules(self) -> List[str]:
+        """Lists every hyper_core module (this profiler excluded)."""
+        names = [os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(HYPER_CORE_DIR, '*.py'))]
+        return sorted(name for name in names if name != 'startup_profiler')
+
+    def profile_module(self, module: str) -> Dict[str, Any]:
+        """Measures the cold import cost of one module and the heavy dependencies it drags in."""
+        probe = _PROBE_SCRIPT.format(path=HYPER_CORE_DIR, module=module)
+        completed = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, cwd=HYPER_CORE_DIR)
+        try:
+            probe_result = json.loads(completed.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            probe_result = {'seconds': 0.0, 'loaded': [], 'error': completed.stderr.strip() or 'probe failed'}
+        heavy = [name for name in probe_result['loaded'] if name in HEAVY_DEPENDENCIES]
+        return {
+            'module': module,
+            'seconds': probe_result['seconds'],
+            'heavy_dependencies': heavy,
+            'error': probe_result['error'],
+            'within_budget': probe_result['error'] is None and not heavy and probe_result['seconds'] <= self.budget
+        }
+
+    def profile(self) -> List[Dict[str, Any]]:
+        """Profiles every configured module, slowest first."""
+        self.results = sorted((self.profile_module(module) for module in self.modules), key=lambda r: r['seconds'], reverse=True)
+        return self.results
+
+    def violations(self) -> List[Dict[str, Any]]:
+        """Returns the modules that break the startup budget."""
+        return [result for result in self.results if not result['within_budget']]
+
+    def print_report(self):
+        """Prints the per-module cost breakdown."""
+        total = sum(result['seconds'] for result in self.results)
+        print(f"{'module':<58} {'import (s)':>10}  {'share':>6}  notes")
+        for result in self.results:
+            share = (result['seconds'] / total * 100) if total else 0.0
+            notes = result['error'] or (f"eager: {', '.join(result['heavy_dependencies'])}" if result['heavy_dependencies'] else '')
+            flag = '' if result['within_budget'] else ' !'
+            print(f"{result['module']:<58} {result['seconds']:>10.3f}  {share:>5.1f}%  {notes}{flag}")
+        print(f"{'total':<58} {total:>10.3f}  budget {self.budget:.2f}s/module, {len(self.violations())} over budget")
+
+# Usage: python startup_profiler.py [--budget SECONDS] [module ...]; exits 1 when any module is over budget
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-module cold import cost for hyper_core.")
+    parser.add_argument('modules', nargs='*', help="Modules to profile (default: all hyper_core modules)")
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_SECONDS, help="Per-module import budget in seconds")
+    args = parser.parse_args()
+    profiler = HyperCoreStartupProfiler(args.modules or None, args.budget)
+    profiler.profile()
+    profiler.print_report()
+    sys.exit(1 if profiler.violations() else 0)
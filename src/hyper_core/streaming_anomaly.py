@@ -0,0 +1,152 @@
+import argparse
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Streaming Anomaly: %(message)s')
+
+class _SeriesState:
+    __slots__ = ('mean', 'var', 'samples', 'flags', 'history', 'model', 'retraining', 'since_retrain', 'last_z')
+
+    def __init__(self, recent: int, history: int):
+        self.mean = 0.0
+        self.var = 0.0
+        self.samples = 0
+        self.flags = deque(maxlen=recent)  # Verdicts for the most recent samples
+        self.history = deque(maxlen=history)  # Training window for the background model
+        self.model = None
+        self.retraining = False
+        self.since_retrain = 0
+        self.last_z = 0.0
+
+class StreamingAnomalyDetector:
+    """O(1)-per-sample anomaly detection: EWMA/EWMV z-scores, plus an optional model retrained off the event loop."""
+
+    def __init__(self, alpha: float = 0.1, threshold: float = 3.5, warmup: int = 10, recent: int = 5,
+                 model_factory: Optional[Callable[[], Any]] = None, retrain_every: int = 60, history: int = 100):
+        self.alpha = alpha  # EWMA smoothing: higher reacts faster
+        self.threshold = threshold  # |z| above this is anomalous
+        self.warmup = warmup  # Samples before verdicts are trusted
+        self.recent = recent
+        self.model_factory = model_factory  # e.g. IsolationForest; None for EWMA only
+        self.retrain_every = retrain_every  # Samples between background retrains
+        self.history = history
+        self._series: Dict[str, _SeriesState] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {'updates': 0, 'anomalies': 0, 'retrains': 0}
+
+    def _state(self, name: str) -> _SeriesState:
+        state = self._series.get(name)
+        if state is None:
+            state = self._series[name] = _SeriesState(self.recent, self.history)
+        return state
+
+    def update(self, name: str, value: float) -> bool:
+        """Scores a new sample against the running statistics, then folds it in; returns the verdict."""
+        state = self._state(name)
+        deviation = value - state.mean
+        z = deviation / math.sqrt(state.var) if state.var > 0 else (0.0 if deviation == 0 else math.inf)
+        anomalous = bool(state.samples >= self.warmup and abs(z) > self.threshold)
+        model = state.model  # Swapped atomically by the retraining thread
+        if model is not None and not anomalous:
+            anomalous = bool(model.predict([[value]])[0] == -1)
+        if state.samples == 0:
+            state.mean = value
+        else:
+            # EWMA mean and variance (West's incremental form)
+            increment = self.alpha * deviation
+            state.mean += increment
+            state.var = (1 - self.alpha) * (state.var + deviation * increment)
+        state.samples += 1
+        state.last_z = z if math.isfinite(z) else 0.0
+        state.flags.append(anomalous)
+        self.stats['updates'] += 1
+        self.stats['anomalies'] += anomalous
+        if self.model_factory is not None:
+            state.history.append(value)
+            state.since_retrain += 1
+            if state.since_retrain >= self.retrain_every and not state.retraining and len(state.history) >= self.warmup:
+                self._schedule_retrain(name, state)
+        return anomalous
+
+    def _schedule_retrain(self, name: str, state: _SeriesState):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='anomaly-retrain')
+        state.retraining = True
+        state.since_retrain = 0
+        window = np.fromiter(state.history, dtype=np.float64).reshape(-1, 1)  # Copy: the thread never sees live state
+        self._executor.submit(self._retrain, name, state, window)
+
+    def _retrain(self, name: str, state: _SeriesState, window: np.ndarray):
+        """Fits a fresh model in the background and swaps it in."""
+        try:
+            model = self.model_factory()
+            model.fit(window)
+            state.model = model
+            self.stats['retrains'] += 1
+        except Exception as e:
+            logging.error(f"Retraining {name} detector failed: {e}")
+        finally:
+            state.retraining = False
+
+    def is_anomalous(self, name: str) -> bool:
+        """True if any of the most recent samples of a series was anomalous."""
+        state = self._series.get(name)
+        return state is not None and any(state.flags)
+
+    def anomalous_series(self) -> List[str]:
+        return [name for name, state in self._series.items() if any(state.flags)]
+
+    def scores(self) -> Dict[str, float]:
+        """Latest z-score per series, for dashboards."""
+        return {name: state.last_z for name, state in self._series.items()}
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+def benchmark_detectors(series: int = 3, samples: int = 1440, window: int = 100, refit_calls: int = 20) -> Dict[str, float]:
+    """Per-detection latency and CPU of refitting IsolationForest on every call vs streaming updates."""
+    from sklearn.ensemble import IsolationForest
+    rng = np.random.default_rng(42)
+    data = rng.normal(100, 5, size=(series, samples))
+    data[:, samples // 2] += 60  # One injected spike per series
+    wall, cpu = time.perf_counter(), time.process_time()
+    for call in range(refit_calls):  # Previous approach: fit_predict over each series' window on every detection
+        end = window + call * (samples - window) // refit_calls
+        for row in data:
+            IsolationForest(contamination=0.1, random_state=42).fit_predict(row[end - window:end].reshape(-1, 1))
+    refit_ms = (time.perf_counter() - wall) / refit_calls * 1000
+    refit_cpu_ms = (time.process_time() - cpu) / refit_calls * 1000
+    results = {'refit_ms_per_detection': refit_ms, 'refit_cpu_ms_per_detection': refit_cpu_ms}
+    for label, factory in (('ewma', None), ('ewma_model', lambda: IsolationForest(contamination=0.1, random_state=42))):
+        detector = StreamingAnomalyDetector(model_factory=factory)
+        latency, cpu = 0.0, time.process_time()
+        for index in range(samples):
+            start = time.perf_counter()
+            for name, row in enumerate(data):
+                detector.update(str(name), row[index])
+            detector.anomalous_series()  # One detection per collection tick
+            latency += time.perf_counter() - start
+            while any(state.retraining for state in detector._series.values()):  # Samples arrive minutes apart in production
+                time.sleep(0.001)
+        results[f'{label}_ms_per_detection'] = latency / samples * 1000
+        results[f'{label}_cpu_ms_per_detection'] = (time.process_time() - cpu) / samples * 1000  # Includes background retrains
+        results[f'{label}_anomalies_flagged'] = detector.stats['anomalies']
+        detector.close()
+    return results
+
+# Usage: python streaming_anomaly.py [--samples N]; compares refit-per-call with streaming detection
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streaming anomaly detection against per-call refitting.")
+    parser.add_argument('--samples', type=int, default=1440)
+    args = parser.parse_args()
+    print(benchmark_detectors(samples=args.samples))
@@ -0,0 +1,220 @@
+import asyncio
+import bisect
+import inspect
+import logging
+import random
+import time
+from typing import Dict, List, Any, Callable, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Task Scheduler: %(message)s')
+
+OVERLAP_POLICIES = ('skip', 'queue', 'allow')  # Due while still running: drop the tick, run once right after, or run concurrently
+HISTOGRAM_BOUNDS = tuple(0.0005 * 2 ** i for i in range(18))  # 0.5 ms .. ~65 s, doubling
+
+class RuntimeHistogram:
+    """Log-bucketed runtime histogram: O(1) memory per job regardless of how often it runs."""
+
+    def __init__(self, bounds: tuple = HISTOGRAM_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last bucket: overflow
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (capped at the observed max)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {'runs': self.count, 'total_s': self.total, 'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+                'p50_ms': self.quantile(0.5) * 1000, 'p95_ms': self.quantile(0.95) * 1000, 'max_ms': self.max * 1000}
+
+class ScheduledJob:
+    """A registered periodic job or edge trigger, with its counters and runtime histogram."""
+
+    def __init__(self, name: str, func: Callable[..., Any], args: tuple, interval: Optional[float] = None,
+                 jitter: float = 0.0, deadline: Optional[float] = None, overlap: str = 'skip', once: bool = False):
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"Unknown overlap policy {overlap!r}; expected one of {OVERLAP_POLICIES}")
+        self.name = name
+        self.func = func
+        self.args = args
+        self.interval = interval  # None for edge-triggered jobs
+        self.jitter = jitter  # Fraction of the interval each run is randomly shifted by
+        self.deadline = deadline  # Seconds a run may take before it is cancelled
+        self.overlap = overlap
+        self.once = once  # Edge triggers: detach after the first event
+        self.button: Any = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.due = 0.0  # Unjittered schedule, so jitter never accumulates into drift
+        self.running = 0
+        self.pending = False
+        self.tasks: set = set()  # Runs in flight; the event loop only keeps weak references to tasks
+        self.cancelled = False
+        self.finished = asyncio.Event()  # Set on cancel: `await job.finished.wait()` blocks like the loop it replaces
+        self.histogram = RuntimeHistogram()
+        self.stats: Dict[str, int] = {'skipped': 0, 'queued': 0, 'missed': 0, 'timeouts': 0, 'failures': 0}
+
+class Scheduler:
+    """Central registry for periodic control loops and button callbacks.
+
+    Timers live in the event loop's own heap (`call_at`), so idle jobs cost no coroutine or wakeup; buttons fire
+    on their edge (gpiozero `when_pressed`) instead of being polled.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, ScheduledJob] = {}
+
+    def every(self, name: str, interval: float, func: Callable[..., Any], *args, jitter: float = 0.1,
+              deadline: Optional[float] = None, overlap: str = 'skip', delay: Optional[float] = None) -> ScheduledJob:
+        """Runs func(*args) every interval seconds (first run after `delay`, default immediately).
+
+        A job stops when it returns False. Registering an existing name replaces the old job.
+        """
+        self.cancel(name)
+        job = self.jobs[name] = ScheduledJob(name, func, args, interval, jitter, deadline, overlap)
+        job.loop = asyncio.get_running_loop()
+        job.due = job.loop.time() + (delay or 0.0)
+        if delay is None:
+            job.handle = job.loop.call_soon(self._tick, job)  # Jitter spreads later runs; the first one is not postponed
+        else:
+            self._arm(job)
+        return job
+
+    def on_press(self, name: str, button: Any, func: Callable[..., Any], *args, once: bool = False,
+                 deadline: Optional[float] = None) -> ScheduledJob:
+        """Runs func(*args) on the event loop whenever the button is pressed; presses during a run are ignored.
+
+        The callback detaches after one press with once=True, or when it returns False.
+        """
+        self.cancel(name)
+        job = self.jobs[name] = ScheduledJob(name, func, args, deadline=deadline, once=once)
+        job.loop = asyncio.get_running_loop()
+        job.button = button
+        # gpiozero calls this from its own thread
+        button.when_pressed = lambda *_: job.loop.call_soon_threadsafe(self._fire, job)
+        return job
+
+    def _arm(self, job: ScheduledJob):
+        offset = random.uniform(-job.jitter, job.jitter) * job.interval if job.jitter else 0.0
+        job.handle = job.loop.call_at(max(job.due + offset, job.loop.time()), self._tick, job)
+
+    def _tick(self, job: ScheduledJob):
+        now = job.loop.time()
+        job.due += job.interval
+        if job.due < now:  # The loop was blocked: skip the missed ticks instead of running a burst
+            missed = int((now - job.due) // job.interval) + 1
+            job.stats['missed'] += missed
+            job.due += missed * job.interval
+        self._arm(job)
+        self._fire(job)
+
+    def _fire(self, job: ScheduledJob):
+        if job.cancelled:
+            return
+        if job.running and job.overlap != 'allow':
+            if job.overlap == 'queue':
+                job.pending = True
+                job.stats['queued'] += 1
+            else:
+                job.stats['skipped'] += 1
+            return
+        if job.once:
+            self._cancel(job)
+        job.running += 1
+        self._start(job)
+
+    def _start(self, job: ScheduledJob):
+        task = job.loop.create_task(self._execute(job))
+        job.tasks.add(task)
+        task.add_done_callback(job.tasks.discard)
+
+    async def _execute(self, job: ScheduledJob):
+        start = time.perf_counter()
+        try:
+            result = job.func(*job.args)
+            if inspect.isawaitable(result):
+                result = await (asyncio.wait_for(result, job.deadline) if job.deadline else result)
+            if result is False:
+                self._cancel(job)
+        except asyncio.TimeoutError:
+            job.stats['timeouts'] += 1
+            logging.warning(f"Job {job.name} exceeded its {job.deadline}s deadline.")
+        except Exception as e:
+            job.stats['failures'] += 1  # A failing run does not end the job, unlike a crashed while-loop
+            logging.error(f"Job {job.name} failed: {e}")
+        finally:
+            job.histogram.observe(time.perf_counter() - start)
+            job.running -= 1
+            if job.pending and not job.cancelled:
+                job.pending = False
+                job.running += 1
+                self._start(job)
+
+    def cancel(self, name: str) -> bool:
+        job = self.jobs.get(name)
+        return job is not None and self._cancel(job)
+
+    def _cancel(self, job: ScheduledJob) -> bool:
+        """Cancels this job object (not whatever currently holds its name, which may be a re-registration)."""
+        if job.cancelled:
+            return False
+        job.cancelled = True
+        job.finished.set()
+        if job.handle is not None:
+            job.handle.cancel()
+        if job.button is not None:
+            job.button.when_pressed = None
+        return True
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Per-job runtime summary, most expensive first."""
+        rows = [{'name': job.name, 'interval': job.interval, 'active': not job.cancelled, **job.histogram.summary(), **job.stats}
+                for job in self.jobs.values()]
+        return sorted(rows, key=lambda row: row['total_s'], reverse=True)
+
+    def log_report(self, top: int = 5) -> List[Dict[str, Any]]:
+        """Logs the jobs that spent the most time running."""
+        rows = self.report()
+        for row in rows[:top]:
+            logging.info(f"Job {row['name']}: {row['runs']} runs, {row['total_s']:.2f}s total, p95 {row['p95_ms']:.1f} ms, "
+                         f"max {row['max_ms']:.1f} ms, {row['skipped']} skipped, {row['missed']} missed, {row['timeouts']} timed out")
+        return rows
+
+    def close(self):
+        for name in list(self.jobs):
+            self.cancel(name)
+
+default_scheduler = Scheduler()  # Shared by all hyper_core modules
+
+# Usage example
+if __name__ == "__main__":
+    async def demo():
+        async def slow_job():
+            await asyncio.sleep(0.25)
+
+        default_scheduler.every('fast', 0.05, lambda: None)
+        default_scheduler.every('slow', 0.1, slow_job, overlap='skip')
+        default_scheduler.every('bounded', 0.2, asyncio.sleep, 1, deadline=0.1)
+        await asyncio.sleep(1)
+        default_scheduler.close()
+        for row in default_scheduler.report():
+            print(row)
+
+    asyncio.run(demo())
@@ -0,0 +1,197 @@
+import argparse
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Dict, List, Any, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Transaction Ledger: %(message)s')
+
+# Record framing: payload length and CRC32 (big-endian), then the JSON payload {"seq": n, "tx": {...}}
+RECORD_HEADER = struct.Struct('>II')
+
+class TransactionLedger:
+    def __init__(self, wal_path: str = './pi_transactions.wal', snapshot_path: str = './pi_transactions.json',
+                 group_commit_size: int = 64, group_commit_interval: float = 0.05, compact_every: int = 10000):
+        self.wal_path = wal_path
+        self.snapshot_path = snapshot_path  # Same JSON list format the manager used to rewrite on every save
+        self.group_commit_size = group_commit_size  # fsync once per this many records...
+        self.group_commit_interval = group_commit_interval  # ...or once this many seconds after the first unsynced record
+        self.compact_every = compact_every  # Fold the WAL into the snapshot after this many logged records
+        self.sequence = 0  # Number of records durable in snapshot + WAL
+        self.snapshot_sequence = 0
+        self._wal = None
+        self._unsynced = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self.stats: Dict[str, int] = {'appended': 0, 'fsyncs': 0, 'compactions': 0, 'recovered': 0, 'torn_bytes': 0}
+
+    def recover(self) -> List[Dict[str, Any]]:
+        """Loads the snapshot, replays the WAL on top of it and truncates any torn tail left by a crash."""
+        with self._lock:
+            records = self._load_snapshot()
+            replayed = 0
+            good_offset = 0
+            if os.path.exists(self.wal_path):
+                with open(self.wal_path, 'rb') as f:
+                    data = f.read()
+                offset = 0
+                while offset + RECORD_HEADER.size <= len(data):
+                    length, checksum = RECORD_HEADER.unpack_from(data, offset)
+                    payload = data[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+                    if len(payload) < length or zlib.crc32(payload) != checksum:
+                        break
+                    entry = json.loads(payload)
+                    if entry['seq'] > len(records):  # Records already folded into the snapshot are skipped
+                        records.append(entry['tx'])
+                        replayed += 1
+                    offset += RECORD_HEADER.size + length
+                good_offset = offset
+                if good_offset < len(data):
+                    self.stats['torn_bytes'] = len(data) - good_offset
+                    logging.warning(f"Discarding {len(data) - good_offset} bytes of torn/corrupt WAL tail.")
+                    with open(self.wal_path, 'r+b') as f:
+                        f.truncate(good_offset)
+                        os.fsync(f.fileno())
+            self.sequence = len(records)
+            self.stats['recovered'] = replayed
+            self._wal = open(self.wal_path, 'ab')
+            logging.info(f"Recovered {len(records)} transactions ({self.snapshot_sequence} from snapshot, {replayed} from WAL).")
+            return records
+
+    def _load_snapshot(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.snapshot_path):
+            self.snapshot_sequence = 0
+            return []
+        with open(self.snapshot_path, 'r') as f:
+            records = json.load(f)
+        self.snapshot_sequence = len(records)
+        return records
+
+    def append(self, records: List[Dict[str, Any]]):
+        """Appends records to the WAL; fsync is batched (group commit) rather than paid per record."""
+        if not records:
+            return
+        with self._lock:
+            if self._wal is None:
+                raise RuntimeError("Ledger not recovered: call recover() before append().")
+            frames = []
+            for record in records:
+                self.sequence += 1
+                payload = json.dumps({'seq': self.sequence, 'tx': record}, separators=(',', ':')).encode('utf-8')
+                frames.append(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            self._wal.write(b''.join(frames))
+            self._unsynced += len(records)
+            self.stats['appended'] += len(records)
+            if self._unsynced >= self.group_commit_size:
+                self._sync()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.group_commit_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _sync(self):
+        """Makes every appended record durable (caller holds the lock)."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._unsynced and self._wal is not None:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            self._unsynced = 0
+            self.stats['fsyncs'] += 1
+
+    def flush(self):
+        """Forces the pending group commit."""
+        with self._lock:
+            self._sync()
+
+    def needs_compaction(self) -> bool:
+        return self.sequence - self.snapshot_sequence >= self.compact_every
+
+    def compact(self, records: List[Dict[str, Any]]):
+        """Writes records as the new snapshot (atomically) and starts an empty WAL."""
+        with self._lock:
+            self._sync()
+            directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.pi_snapshot.')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(records, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)  # A crash before this point leaves the old snapshot + full WAL
+            self._fsync_directory(directory)
+            # A crash here is safe too: WAL records with seq <= len(snapshot) are skipped on recovery
+            self._wal.close()
+            self._wal = open(self.wal_path, 'wb')
+            os.fsync(self._wal.fileno())
+            self.snapshot_sequence = self.sequence = len(records)
+            self.stats['compactions'] += 1
+            logging.info(f"Compacted ledger into snapshot of {len(records)} transactions.")
+
+    @staticmethod
+    def _fsync_directory(directory: str):
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+
+def benchmark_ledger(transactions: int = 10000, directory: Optional[str] = None) -> Dict[str, float]:
+    """Compares per-write full-file rewrites (the previous approach) against the WAL, in transactions/second."""
+    directory = directory or tempfile.mkdtemp(prefix='pi_ledger_bench.')
+    sample = [{'sender': 'bench_sender', 'recipient': f"recipient_{i}", 'amount': 100, 'currency': 'PI',
+               'value': 314159, 'source': 'p2p', 'timestamp': float(i), 'signature': '0' * 64} for i in range(transactions)]
+    rewrite_path = os.path.join(directory, 'rewrite.json')
+    history = []
+    start = time.perf_counter()
+    for tx in sample:
+        history.append(tx)
+        with open(rewrite_path, 'w') as f:
+            json.dump(history, f)
+    rewrite_seconds = time.perf_counter() - start
+    ledger = TransactionLedger(os.path.join(directory, 'bench.wal'), os.path.join(directory, 'bench.json'))
+    records = ledger.recover()
+    start = time.perf_counter()
+    for tx in sample:
+        records.append(tx)
+        ledger.append([tx])
+        if ledger.needs_compaction():
+            ledger.compact(records)
+    ledger.close()
+    wal_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    recovered = TransactionLedger(os.path.join(directory, 'bench.wal'), os.path.join(directory, 'bench.json'))
+    count = len(recovered.recover())
+    recovered.close()
+    recovery_seconds = time.perf_counter() - start
+    assert count == transactions
+    return {
+        'transactions': transactions,
+        'rewrite_tps': transactions / rewrite_seconds,
+        'wal_tps': transactions / wal_seconds,
+        'speedup': rewrite_seconds / wal_seconds,
+        'recovery_seconds': recovery_seconds,
+        'fsyncs': ledger.stats['fsyncs']
+    }
+
+# Usage: python transaction_ledger.py [--transactions N]; prints rewrite vs WAL throughput
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the PI transaction WAL against full-file rewrites.")
+    parser.add_argument('--transactions', type=int, default=10000)
+    args = parser.parse_args()
+    print(benchmark_ledger(args.transactions))
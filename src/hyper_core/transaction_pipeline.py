@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Any, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Transaction Pipeline: %(message)s')
+
+class _Submission:
+    __slots__ = ('seq', 'tx', 'future', 'accepted', 'error', 'validated')
+
+    def __init__(self, seq: int, tx: Dict[str, Any], future: asyncio.Future):
+        self.seq = seq
+        self.tx = tx
+        self.future = future
+        self.accepted = True
+        self.error: Optional[BaseException] = None
+        self.validated = False  # Already validated (and confirmed) before it was queued
+
+class TransactionPipeline:
+    """Staged validate -> sign -> execute -> persist pipeline over bounded asyncio queues.
+
+    Stages run concurrently, but transactions are persisted (and their futures resolved) in submission order.
+    """
+
+    def __init__(self, manager: Any, validate_workers: int = 8, sign_workers: int = 2, execute_workers: int = 8,
+                 queue_size: int = 256, sign_batch_size: int = 64, commit_batch_size: int = 256):
+        self.manager = manager  # PIStablecoinManager: provides the per-stage operations
+        self.workers = {'validate': validate_workers, 'sign': sign_workers, 'execute': execute_workers}
+        self.queue_size = queue_size  # Bound per stage: a full queue blocks submit(), which is the backpressure
+        self.sign_batch_size = sign_batch_size
+        self.commit_batch_size = commit_batch_size  # Max transactions per group commit
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._next_seq = 0
+        self.stats: Dict[str, int] = {'submitted': 0, 'committed': 0, 'rejected': 0, 'failed': 0, 'group_commits': 0, 'largest_commit': 0}
+
+    def _ensure_started(self):
+        """Starts the stage workers on the running loop (restarting them if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._next_seq = 0
+        self._queues = {stage: asyncio.Queue(maxsize=self.queue_size) for stage in ('validate', 'sign', 'execute', 'persist')}
+        self._tasks = [loop.create_task(self._validate_worker()) for _ in range(self.workers['validate'])]
+        self._tasks += [loop.create_task(self._sign_worker()) for _ in range(self.workers['sign'])]
+        self._tasks += [loop.create_task(self._execute_worker()) for _ in range(self.workers['execute'])]
+        self._tasks.append(loop.create_task(self._persist_worker()))  # Single committer keeps the order
+
+    async def submit(self, tx: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Queues a transaction and waits until it is persisted (returns None if rejected)."""
+        return await (await self.enqueue(tx))
+
+    async def enqueue(self, tx: Dict[str, Any]) -> asyncio.Future:
+        """Queues a transaction (waiting only while the pipeline is full) and returns its completion future.
+
+        Transactions that need manual confirmation are validated and confirmed here, before they get a sequence
+        number, so a pending button press holds up only its own caller and never the in-order committer.
+        """
+        self._ensure_started()
+        accepted, error = True, None
+        validated = self.manager._needs_confirmation(tx)
+        if validated:
+            try:
+                accepted = await self.manager._validate_transaction(tx)
+            except Exception as e:
+                accepted, error = False, e
+        submission = _Submission(self._next_seq, tx, self._loop.create_future())
+        submission.accepted, submission.error, submission.validated = accepted, error, validated
+        self._next_seq += 1
+        self.stats['submitted'] += 1
+        await self._queues['validate'].put(submission)
+        return submission.future
+
+    async def submit_many(self, transactions: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Bulk path: enqueues concurrently and returns results in input order.
+
+        A transaction awaiting confirmation no longer holds up the ones behind it; the committer orders persistence.
+        """
+        futures = await asyncio.gather(*(self.enqueue(tx) for tx in transactions))
+        return list(await asyncio.gather(*futures))
+
+    def _drain(self, queue: asyncio.Queue, first: _Submission, limit: int) -> List[_Submission]:
+        batch = [first]
+        while len(batch) < limit and not queue.empty():
+            batch.append(queue.get_nowait())
+        return batch
+
+    async def _validate_worker(self):
+        while True:
+            submission = await self._queues['validate'].get()
+            if not submission.validated:
+                try:
+                    submission.accepted = await self.manager._validate_transaction(submission.tx)
+                except Exception as e:
+                    submission.accepted, submission.error = False, e
+            # Rejected transactions skip ahead to the committer so they do not stall the order
+            await self._queues['sign' if submission.accepted else 'persist'].put(submission)
+
+    async def _sign_worker(self):
+        while True:
+            batch = self._drain(self._queues['sign'], await self._queues['sign'].get(), self.sign_batch_size)
+            try:
+                await self.manager.sign_transactions([submission.tx for submission in batch])
+            except Exception as e:
+                for submission in batch:
+                    submission.accepted, submission.error = False, e
+            for submission in batch:
+                await self._queues['execute' if submission.accepted else 'persist'].put(submission)
+
+    async def _execute_worker(self):
+        while True:
+            submission = await self._queues['execute'].get()
+            try:
+                submission.accepted = await self.manager._execute_smart_contract('transfer', submission.tx)
+                if not submission.accepted:
+                    self.manager.pi_led.off()  # Red failure
+            except Exception as e:
+                submission.accepted, submission.error = False, e
+            await self._queues['persist'].put(submission)
+
+    async def _persist_worker(self):
+        """Reorders completed submissions and group-commits every in-order run in one store append."""
+        pending: Dict[int, _Submission] = {}
+        next_seq = 0
+        queue = self._queues['persist']
+        while True:
+            for submission in self._drain(queue, await queue.get(), self.commit_batch_size * 4):
+                pending[submission.seq] = submission
+            while next_seq in pending:
+                ready = []
+                while next_seq in pending and len(ready) < self.commit_batch_size:
+                    ready.append(pending.pop(next_seq))
+                    next_seq += 1
+                self._commit(ready)
+
+    def _commit(self, ready: List[_Submission]):
+        accepted = [submission for submission in ready if submission.accepted]
+        try:
+            if accepted:
+                self.manager.record_transactions([submission.tx for submission in accepted])
+                self.manager.pi_led.on()  # Green success
+                self.stats['group_commits'] += 1
+                self.stats['largest_commit'] = max(self.stats['largest_commit'], len(accepted))
+                logging.info(f"Committed {len(accepted)} PI transactions in one group.")
+        except Exception as e:
+            logging.error(f"Group commit of {len(accepted)} transactions failed: {e}")
+            for submission in accepted:
+                submission.accepted, submission.error = False, e
+        for submission in ready:
+            if submission.future.done():
+                continue
+            if submission.error is not None:
+                self.stats['failed'] += 1
+                submission.future.set_exception(submission.error)
+            elif submission.accepted:
+                self.stats['committed'] += 1
+                submission.future.set_result(submission.tx)
+            else:
+                self.stats['rejected'] += 1
+                submission.future.set_result(None)
+
+    async def close(self):
+        """Stops the stage workers (in-flight submissions are abandoned)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+# Usage example
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from pi_stablecoin_manager import PIStablecoinManager
+
+    class AllowAll:
+        async def filter_transaction(self, tx: Dict[str, Any]) -> bool:
+            return True
+
+    async def bulk_rewards(count: int = 5000):
+        directory = tempfile.mkdtemp()
+        manager = PIStablecoinManager(AllowAll(), wallet_path=os.path.join(directory, 'wallet.json'),
+                                      ledger_path=os.path.join(directory, 'tx.wal'), snapshot_path=os.path.join(directory, 'tx.json'))
+        manager.pi_led = type('NoLED', (), {'on': lambda self: None, 'off': lambda self: None, 'blink': lambda self, **kw: None})()
+        logging.getLogger().setLevel(logging.WARNING)
+        start = time.perf_counter()
+        results = await manager.distribute_rewards_bulk([f"contributor_{i}" for i in range(count)], 'mining')
+        elapsed = time.perf_counter() - start
+        print(f"{sum(1 for r in results if r)} rewards in {elapsed:.2f}s ({count / elapsed:.0f} tx/s), stats={manager.pipeline.stats}")
+        await manager.pipeline.close()
+
+    asyncio.run(bulk_rewards())
@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+from lazy_loader import lazy_from, resolve
+Ed25519PrivateKey, Ed25519PublicKey = lazy_from('cryptography.hazmat.primitives.asymmetric.ed25519', 'Ed25519PrivateKey', 'Ed25519PublicKey')
+rsa, padding = lazy_from('cryptography.hazmat.primitives.asymmetric', 'rsa', 'padding')
+hashes, serialization = lazy_from('cryptography.hazmat.primitives', 'hashes', 'serialization')
+InvalidSignature = lazy_from('cryptography.exceptions', 'InvalidSignature')
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Transaction Signer: %(message)s')
+
+# Fields covered by a signature, in wire order; anything else on the dict (signature, proofs) is not signed
+SIGNED_FIELDS = (('sender', 'str'), ('recipient', 'str'), ('amount', 'int'), ('currency', 'str'), ('value', 'int'), ('source', 'str'), ('timestamp', 'float'))
+ENCODING_MAGIC = b'PITX\x01'  # Format tag + version
+BATCH_CHUNK_SIZE = 64  # Transactions per pool task, so per-task overhead is amortized
+
+def encode_transaction(tx: Dict[str, Any]) -> bytes:
+    """Canonical binary encoding of the signed fields (length-prefixed strings, big-endian numbers)."""
+    parts = [ENCODING_MAGIC]
+    for name, kind in SIGNED_FIELDS:
+        value = tx.get(name)
+        if kind == 'str':
+            data = ('' if value is None else str(value)).encode('utf-8')
+            parts.append(struct.pack('>I', len(data)))
+            parts.append(data)
+        elif kind == 'int':
+            parts.append(struct.pack('>q', value or 0))
+        else:
+            parts.append(struct.pack('>d', value or 0.0))
+    return b''.join(parts)
+
+class TransactionSigner(ABC):
+    """Signs and verifies encoded transactions; public_id identifies the wallet in sender/recipient fields."""
+
+    scheme = 'none'
+
+    @property
+    @abstractmethod
+    def public_id(self) -> str:
+        """Hex wallet id derived from the public key."""
+
+    @abstractmethod
+    def sign(self, message: bytes) -> bytes:
+        """Signature over message."""
+
+    @abstractmethod
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """Whether signature is valid for message under this key."""
+
+    @abstractmethod
+    def export_private(self) -> Dict[str, str]:
+        """Serializable key material for the wallet file."""
+
+class Ed25519Signer(TransactionSigner):
+    scheme = 'ed25519'
+
+    def __init__(self, private_key: Optional[Any] = None):
+        self.private_key = private_key or Ed25519PrivateKey.generate()
+        self.public_key = self.private_key.public_key()
+        raw = self.public_key.public_bytes(encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw)
+        self._public_id = raw.hex()
+
+    @classmethod
+    def from_private_hex(cls, private_hex: str) -> 'Ed25519Signer':
+        return cls(Ed25519PrivateKey.from_private_bytes(bytes.fromhex(private_hex)))
+
+    @property
+    def public_id(self) -> str:
+        return self._public_id
+
+    def sign(self, message: bytes) -> bytes:
+        return self.private_key.sign(message)
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        try:
+            self.public_key.verify(signature, message)
+            return True
+        except resolve(InvalidSignature):
+            return False
+
+    def export_private(self) -> Dict[str, str]:
+        raw = self.private_key.private_bytes(encoding=serialization.Encoding.Raw, format=serialization.PrivateFormat.Raw, encryption_algorithm=serialization.NoEncryption())
+        return {'scheme': self.scheme, 'private': raw.hex(), 'public': self.public_id}
+
+class RSAPSSSigner(TransactionSigner):
+    """The previous RSA-2048 PSS scheme, kept for comparison and for wallets that require it."""
+
+    scheme = 'rsa-pss'
+
+    def __init__(self, private_key: Optional[Any] = None, key_size: int = 2048):
+        self.private_key = private_key or rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+        self.public_key = self.private_key.public_key()
+        der = self.public_key.public_bytes(encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo)
+        self._public_id = der.hex()
+        self._padding = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH)
+
+    @property
+    def public_id(self) -> str:
+        return self._public_id
+
+    def sign(self, message: bytes) -> bytes:
+        return self.private_key.sign(message, self._padding, hashes.SHA256())
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        try:
+            self.public_key.verify(signature, message, self._padding, hashes.SHA256())
+            return True
+        except resolve(InvalidSignature):
+            return False
+
+    def export_private(self) -> Dict[str, str]:
+        pem = self.private_key.private_bytes(encoding=serialization.Encoding.PEM, format=serialization.PrivateFormat.PKCS8, encryption_algorithm=serialization.NoEncryption())
+        return {'scheme': self.scheme, 'private': pem.decode('ascii'), 'public': self.public_id}
+
+def load_signer(data: Dict[str, str]) -> TransactionSigner:
+    """Rebuilds a signer from wallet-file key material."""
+    if data.get('scheme') == Ed25519Signer.scheme:
+        return Ed25519Signer.from_private_hex(data['private'])
+    if data.get('scheme') == RSAPSSSigner.scheme:
+        return RSAPSSSigner(serialization.load_pem_private_key(data['private'].encode('ascii'), password=None))
+    raise ValueError(f"Unsupported wallet key scheme: {data.get('scheme')!r}")
+
+def verify_ed25519(public_id: str, message: bytes, signature: bytes) -> bool:
+    """Verifies a signature made by any Ed25519 wallet, given its public id (hex)."""
+    try:
+        Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_id)).verify(signature, message)
+        return True
+    except (ValueError, resolve(InvalidSignature)):
+        return False
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _signing_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix='pi-signer')
+    return _executor
+
+def _sign_chunk(signer: TransactionSigner, transactions: List[Dict[str, Any]]) -> List[bytes]:
+    return [signer.sign(encode_transaction(tx)) for tx in transactions]
+
+async def sign_batch(signer: TransactionSigner, transactions: List[Dict[str, Any]], executor: Optional[ThreadPoolExecutor] = None) -> List[bytes]:
+    """Signs many transactions on a thread pool, keeping the event loop free; returns signatures in order."""
+    loop = asyncio.get_running_loop()
+    pool = executor or _signing_executor()
+    chunks = [transactions[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(transactions), BATCH_CHUNK_SIZE)]
+    results = await asyncio.gather(*(loop.run_in_executor(pool, _sign_chunk, signer, chunk) for chunk in chunks))
+    return [signature for chunk in results for signature in chunk]
+
+def benchmark_signers(transactions: int = 2000) -> List[Dict[str, Any]]:
+    """Sign/verify throughput of RSA-2048 PSS over sorted JSON (previous path) vs Ed25519 over the binary encoding."""
+    sample = [{'sender': 'a' * 64, 'recipient': f"recipient_{i}", 'amount': 100, 'currency': 'PI', 'value': 314159,
+               'source': 'p2p', 'timestamp': float(i)} for i in range(transactions)]
+    results = []
+    for signer, encode in ((RSAPSSSigner(), lambda tx: json.dumps(tx, sort_keys=True).encode()), (Ed25519Signer(), encode_transaction)):
+        start = time.perf_counter()
+        messages = [encode(tx) for tx in sample]
+        encode_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        signatures = [signer.sign(message) for message in messages]
+        sign_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        assert all(signer.verify(message, signature) for message, signature in zip(messages, signatures))
+        verify_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        asyncio.run(sign_batch(signer, sample))
+        batch_seconds = time.perf_counter() - start
+        results.append({
+            'scheme': signer.scheme,
+            'encode_per_sec': transactions / encode_seconds,
+            'sign_per_sec': transactions / sign_seconds,
+            'verify_per_sec': transactions / verify_seconds,
+            'batch_sign_per_sec': transactions / batch_seconds
+        })
+    return results
+
+# Usage: python transaction_signer.py [--transactions N]; prints sign/verify throughput per scheme
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark PI transaction signing schemes.")
+    parser.add_argument('--transactions', type=int, default=2000)
+    args = parser.parse_args()
+    for result in benchmark_signers(args.transactions):
+        print(result)
@@ -0,0 +1,225 @@
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from transaction_ledger import TransactionLedger  # Append-only WAL + snapshot persistence
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - Transaction Store: %(message)s')
+
+PAGE_SIZE = 500
+QUERY_FILTERS = ('sender', 'recipient', 'source')  # Exact-match filters; since/until filter on timestamp
+
+class TransactionStore(ABC):
+    """Storage backend for PI transactions; positions are 0-based and cursors are opaque sequence numbers."""
+
+    generation = 0  # Bumped on clear() so derived indexes know to rebuild
+
+    @abstractmethod
+    def append(self, records: List[Dict[str, Any]]):
+        """Stores records after the last position."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored transactions."""
+
+    @abstractmethod
+    def range(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Returns transactions at positions [start, stop)."""
+
+    @abstractmethod
+    def page(self, cursor: Optional[int] = None, limit: int = 100, **filters) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Returns up to limit matching transactions after cursor, plus the cursor for the next page (None when done)."""
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Returns the last limit transactions, oldest first (bounded `transactions[-limit:]`)."""
+        total = self.count()
+        return self.range(max(0, total - limit), total)
+
+    @abstractmethod
+    def clear(self):
+        """Removes every transaction and bumps generation."""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+def _matches(tx: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for name in QUERY_FILTERS:
+        if name in filters and tx.get(name) != filters[name]:
+            return False
+    timestamp = tx.get('timestamp')
+    if 'since' in filters and (timestamp is None or timestamp < filters['since']):
+        return False
+    if 'until' in filters and (timestamp is None or timestamp >= filters['until']):
+        return False
+    return True
+
+class LedgerTransactionStore(TransactionStore):
+    """In-memory history persisted through the WAL ledger; queries scan, so suited to small histories."""
+
+    def __init__(self, wal_path: str = './pi_transactions.wal', snapshot_path: str = './pi_transactions.json', **ledger_options):
+        self.ledger = TransactionLedger(wal_path, snapshot_path, **ledger_options)
+        self.records = self.ledger.recover()
+        self._lock = threading.RLock()
+
+    def append(self, records: List[Dict[str, Any]]):
+        with self._lock:
+            self.records.extend(records)
+            self.ledger.append(records)
+            if self.ledger.needs_compaction():
+                self.ledger.compact(self.records)
+
+    def count(self) -> int:
+        return len(self.records)
+
+    def range(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        return self.records[start:stop]
+
+    def page(self, cursor: Optional[int] = None, limit: int = 100, **filters) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        rows = []
+        position = cursor or 0
+        with self._lock:
+            while position < len(self.records) and len(rows) < limit:
+                if _matches(self.records[position], filters):
+                    rows.append(self.records[position])
+                position += 1
+            more = position < len(self.records)
+        return rows, (position if more and len(rows) == limit else None)
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+            self.ledger.compact(self.records)
+            self.generation += 1
+
+    def flush(self):
+        self.ledger.flush()
+
+    def close(self):
+        self.ledger.close()
+
+class SQLiteTransactionStore(TransactionStore):
+    """Embedded SQLite (WAL mode) with indexes on sender, recipient, source and timestamp; history stays on disk."""
+
+    def __init__(self, db_path: str = './pi_transactions.db'):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')  # Durable at checkpoints; WAL keeps the file consistent on crash
+        self._db.execute('CREATE TABLE IF NOT EXISTS transactions (seq INTEGER PRIMARY KEY, sender TEXT, recipient TEXT, source TEXT, timestamp REAL, body TEXT NOT NULL)')
+        for column in QUERY_FILTERS + ('timestamp',):
+            self._db.execute(f'CREATE INDEX IF NOT EXISTS idx_transactions_{column} ON transactions ({column})')
+        self._db.commit()
+        self._count = self._db.execute('SELECT COALESCE(MAX(seq), 0) FROM transactions').fetchone()[0]  # seq is 1-based position
+        logging.info(f"Opened {db_path} with {self._count} transactions.")
+
+    def append(self, records: List[Dict[str, Any]]):
+        if not records:
+            return
+        with self._lock:
+            rows = []
+            for offset, tx in enumerate(records, start=self._count + 1):
+                rows.append((offset, tx.get('sender'), tx.get('recipient'), tx.get('source'), tx.get('timestamp'), json.dumps(tx, separators=(',', ':'))))
+            with self._db:
+                self._db.executemany('INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?)', rows)
+            self._count += len(rows)
+
+    def count(self) -> int:
+        return self._count
+
+    def range(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._db.execute('SELECT body FROM transactions WHERE seq > ? AND seq <= ? ORDER BY seq', (start, stop))
+            return [json.loads(body) for (body,) in cursor]
+
+    def page(self, cursor: Optional[int] = None, limit: int = 100, **filters) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        clauses, params = ['seq > ?'], [cursor or 0]
+        for name in QUERY_FILTERS:
+            if name in filters:
+                clauses.append(f'{name} = ?')
+                params.append(filters[name])
+        if 'since' in filters:
+            clauses.append('timestamp >= ?')
+            params.append(filters['since'])
+        if 'until' in filters:
+            clauses.append('timestamp < ?')
+            params.append(filters['until'])
+        with self._lock:
+            rows = self._db.execute(f"SELECT seq, body FROM transactions WHERE {' AND '.join(clauses)} ORDER BY seq LIMIT ?", params + [limit]).fetchall()
+        next_cursor = rows[-1][0] if len(rows) == limit else None
+        return [json.loads(body) for _, body in rows], next_cursor
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute('SELECT body FROM transactions ORDER BY seq DESC LIMIT ?', (limit,)).fetchall()
+        return [json.loads(body) for (body,) in reversed(rows)]
+
+    def clear(self):
+        with self._lock:
+            with self._db:
+                self._db.execute('DELETE FROM transactions')
+            self._count = 0
+            self.generation += 1
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+class TransactionLog:
+    """List-like view over a store, so `transactions.append(tx)`, `len(...)` and `[-10:]` keep working."""
+
+    def __init__(self, store: TransactionStore):
+        self.store = store
+
+    def append(self, tx: Dict[str, Any]):
+        self.store.append([tx])
+
+    def extend(self, records: List[Dict[str, Any]]):
+        self.store.append(list(records))
+
+    def clear(self):
+        self.store.clear()
+
+    def __len__(self) -> int:
+        return self.store.count()
+
+    def __getitem__(self, index: Any) -> Any:
+        total = self.store.count()
+        if isinstance(index, slice):
+            start, stop, step = index.indices(total)
+            records = self.store.range(start, stop) if stop > start else []
+            return records if step == 1 else records[::step]
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError('transaction index out of range')
+        return self.store.range(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Streams the history page by page instead of materializing it."""
+        cursor = None
+        while True:
+            rows, cursor = self.store.page(cursor, PAGE_SIZE)
+            yield from rows
+            if cursor is None:
+                return
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return self.store.recent(limit)
+
+    def query(self, cursor: Optional[int] = None, limit: int = 100, **filters) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Filtered, cursor-paged query (sender, recipient, source, since, until)."""
+        return self.store.page(cursor, limit, **filters)
+
+# Usage example
+if __name__ == "__main__":
+    log = TransactionLog(SQLiteTransactionStore(':memory:'))
+    log.extend({'sender': 'pi_wallet', 'recipient': f"node_{i % 3}", 'amount': 100, 'source': 'p2p', 'timestamp': float(i)} for i in range(10))
+    print(len(log), log.recent(2))
+    print(log.query(recipient='node_1', since=3.0, limit=2))
@@ -4,8 +4,10 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from transformers import pipeline  # For ethical AI audits
-from gpiozero import LED, Buzzer, Button  # Pi hardware: LED for ethics status, Buzzer for alerts, Button for manual governance vote
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For ethical AI audits
+from inference_queue import infer
+LED, Buzzer, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'Button')  # Pi hardware: LED for ethics status, Buzzer for alerts, Button for manual governance vote
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from quantum_security_layer import QuantumSecurityLayer  # File 5
@@ -13,6 +15,7 @@ from ultimate_integration_core import UltimateIntegrationCore  # File 6
 from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  # File 10
 from global_pi_oracle_compliance_verifier import GlobalPIOracleComplianceVerifier  # File 11
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - AI Governance: %(message)s')
@@ -28,10 +31,10 @@ class UltimateAIGovernanceEthicalOverseer:
         self.core = core
         self.purity_enforcer = purity_enforcer
         self.oracle = oracle
-        self.ethics_led = LED(ethics_led_pin)  # Green: ethical, Red: unethical
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.vote_button = Button(vote_button_pin)  # Manual governance vote
-        self.ethical_auditor = pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")  # For sentiment/ethics analysis
+        self.ethics_led = LazyObject(LED, ethics_led_pin)  # Green: ethical, Red: unethical
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.vote_button = LazyObject(Button, vote_button_pin)  # Manual governance vote
+        self.ethical_auditor = shared_pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")  # For sentiment/ethics analysis
         self.governance_rules: Dict[str, Any] = self._load_governance_rules()
         self.ethical_audits: List[Dict] = []
         self.unethical_incidents = 0
@@ -52,28 +55,34 @@ class UltimateAIGovernanceEthicalOverseer:
 
     async def audit_ai_ethics(self):
         """Audits AHI AI and other systems for ethical compliance, including anti-gambling."""
-        while True:
-            # Audit AHI AI decisions
-            sample_decisions = ['Rejected volatile tx', 'Approved PI tx', 'Halted Stellar', 'Rejected gambling app']
-            for decision in sample_decisions:
-                sentiment = self.ethical_auditor(decision)[0]['label']
-                if sentiment == 'NEGATIVE':
-                    logging.warning(f"Unethical AI decision detected: {decision}")
-                    self.unethical_incidents += 1
-                    await self._enforce_ethical_correction()
-            # Audit for gambling as unethical behavior
-            gambling_keywords = ['gambling', 'casino', 'bet', 'lottery', 'poker', 'slot']
-            for tx in self.pi_manager.transactions[-10:]:  # Last 10
-                if any(keyword in str(tx).lower() for keyword in gambling_keywords):
-                    logging.error(f"Gambling-related transaction detected: {tx}. Treating as unethical.")
-                    self.unethical_incidents += 1
-                    await self._enforce_ethical_correction()
-                elif not await self.purity_enforcer.enforce_pi_purity(tx):
-                    self.unethical_incidents += 1
-            # Evolve rules if threshold met
-            if self.unethical_incidents >= self.governance_rules['evolution_threshold']:
-                await self._evolve_governance_rules()
-            await asyncio.sleep(1800)  # Audit every 30 minutes
+        job = default_scheduler.every('UltimateAIGovernanceEthicalOverseer.audit_ai_ethics', 1800, self._audit_pass)  # Audit every 30 minutes
+        await job.finished.wait()
+
+    async def _audit_pass(self):
+        """One ethics audit of sample AI decisions and the latest transactions."""
+        # Audit AHI AI decisions
+        sample_decisions = ['Rejected volatile tx', 'Approved PI tx', 'Halted Stellar', 'Rejected gambling app']
+        for decision in sample_decisions:
+            sentiment = (await infer(self.ethical_auditor, decision))[0]['label']
+            if sentiment == 'NEGATIVE':
+                logging.warning(f"Unethical AI decision detected: {decision}")
+                self.unethical_incidents += 1
+                await self._enforce_ethical_correction()
+        # Audit for gambling as unethical behavior
+        gambling_keywords = ['gambling', 'casino', 'bet', 'lottery', 'poker', 'slot']
+        purity_candidates = []
+        for tx in self.pi_manager.transactions.recent(10):  # Last 10
+            if any(keyword in str(tx).lower() for keyword in gambling_keywords):
+                logging.error(f"Gambling-related transaction detected: {tx}. Treating as unethical.")
+                self.unethical_incidents += 1
+                await self._enforce_ethical_correction()
+            else:
+                purity_candidates.append(tx)
+        # One batched purity audit; transactions already audited elsewhere come from the verdict cache
+        self.unethical_incidents += (await self.purity_enforcer.enforce_pi_purity_batch(purity_candidates)).count(False)
+        # Evolve rules if threshold met
+        if self.unethical_incidents >= self.governance_rules['evolution_threshold']:
+            await self._evolve_governance_rules()
 
     async def _enforce_ethical_correction(self):
         """Enforces corrections for unethical behaviors, including gambling bans."""
@@ -97,14 +106,18 @@ class UltimateAIGovernanceEthicalOverseer:
 
     async def monitor_global_ethics(self):
         """Monitors global Pi Network ethics and halts on violations, including gambling infiltrations."""
-        while True:
-            # Check Oracle compliance (File 11)
-            report = await self.oracle.generate_compliance_report()
-            if not report['global_compliance']:
-                logging.critical("Global ethics breach detected. Initiating governance lockdown.")
-                await self._global_ethics_lockdown()
-                break
-            await asyncio.sleep(3600)  # Check hourly
+        job = default_scheduler.every('UltimateAIGovernanceEthicalOverseer.monitor_global_ethics', 3600, self._check_global_ethics)  # Check hourly
+        await job.finished.wait()
+
+    async def _check_global_ethics(self) -> bool:
+        """One global ethics check; returns False once a breach has locked governance down."""
+        # Check Oracle compliance (File 11)
+        report = await self.oracle.generate_compliance_report()
+        if not report['global_compliance']:
+            logging.critical("Global ethics breach detected. Initiating governance lockdown.")
+            await self._global_ethics_lockdown()
+            return False
+        return True
 
     async def _global_ethics_lockdown(self):
         """Locks down the ecosystem for ethics violations, banning all gambling-related activities."""
@@ -117,14 +130,11 @@ class UltimateAIGovernanceEthicalOverseer:
 
     async def manual_governance_vote(self):
         """Handles manual governance votes via button, allowing reinforcement of no-gambling."""
-        while True:
-            if self.vote_button.is_pressed:
-                logging.info("Manual governance vote triggered: Reinforce PI exclusivity and no-gambling.")
-                self.governance_rules['pi_exclusivity'] = 'ultra_mandatory'
-                self.governance_rules['no_gambling'] = 'absolute_zero'
-                await self._evolve_governance_rules()
-                self.ethics_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual governance vote triggered: Reinforce PI exclusivity and no-gambling.")
+        self.governance_rules['pi_exclusivity'] = 'ultra_mandatory'
+        self.governance_rules['no_gambling'] = 'absolute_zero'
+        await self._evolve_governance_rules()
+        self.ethics_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_ethical_audit_report(self) -> Dict[str, Any]:
         """Generates holographic ethical audit report, including gambling checks."""
@@ -145,7 +155,7 @@ class UltimateAIGovernanceEthicalOverseer:
         """Main governance loop."""
         asyncio.create_task(self.audit_ai_ethics())
         asyncio.create_task(self.monitor_global_ethics())
-        asyncio.create_task(self.manual_governance_vote())
+        default_scheduler.on_press('UltimateAIGovernanceEthicalOverseer.manual_governance_vote', self.vote_button, self.manual_governance_vote)
         # Initial audit
         await self.generate_ethical_audit_report()
         logging.info("Ultimate AI Governance and Ethical Overseer active.")
@@ -4,7 +4,8 @@ import subprocess
 import os
 import sys
 from typing import Dict, List, Any
-from gpiozero import LED, Buzzer, RGBLED  # Pi hardware for deployment status
+from lazy_loader import LazyObject, lazy_from
+LED, Buzzer, RGBLED = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED')  # Pi hardware for deployment status
 from final_hyper_expansion_module import FinalHyperExpansionModule  # File 7
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
 # Import all modules for integration
@@ -19,8 +20,8 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - Deployment: %(mess
 
 class UltimateDeploymentScript:
     def __init__(self):
-        self.deployment_led = RGBLED(red=17, green=18, blue=19)  # RGB: Blue=deploying, Green=success, Red=fail
-        self.alert_buzzer = Buzzer(20)
+        self.deployment_led = LazyObject(RGBLED, red=17, green=18, blue=19)  # RGB: Blue=deploying, Green=success, Red=fail
+        self.alert_buzzer = LazyObject(Buzzer, 20)
         self.modules: Dict[str, Any] = {}
         self.deployment_success = False
 
@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for archive validation
-from transformers import pipeline  # AI for documentation generation
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for archive status, Buzzer for alerts, Button for doc trigger
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for archive validation
+from model_registry import shared_pipeline  # AI for documentation generation
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for archive status, Buzzer for alerts, Button for doc trigger
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
@@ -15,6 +17,7 @@ from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalO
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 from comprehensive_test_suite_validation import ComprehensiveTestSuiteValidation  # File 24
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Documentation Archive: %(message)s')
@@ -29,13 +32,13 @@ class UltimateEcosystemDocumentationHolographicArchive:
         self.purity_enforcer = core.modules.get('purity_enforcer')
         self.governance = core.modules.get('governance')
         self.swarm_hub = core.modules.get('swarm_hub')
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Cyan=archived, Green=documenting, Red=error
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.trigger_button = Button(trigger_button_pin)  # Manual doc trigger
-        self.quantum_archive_circuit = self._init_quantum_archive()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: Cyan=archived, Green=documenting, Red=error
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.trigger_button = LazyObject(Button, trigger_button_pin)  # Manual doc trigger
+        self.quantum_archive_circuit = LazyObject(self._init_quantum_archive)
         self.documentation_status = 'Pending'  # 'Pending', 'Documenting', 'Archived'
         self.archive_logs: List[Dict] = []
-        self.doc_ai = pipeline("text-generation", model="gpt2")  # AI for doc generation
+        self.doc_ai = shared_pipeline("text-generation", model="gpt2")  # AI for doc generation
 
     def _init_quantum_archive(self) -> QuantumCircuit:
         """Initializes quantum circuit for archive validation."""
@@ -86,7 +89,8 @@ class UltimateEcosystemDocumentationHolographicArchive:
                 'zero_crime': 'Maintained.',
                 'mainnet_open': 'Fully open and supreme.'
             },
-            'ai_generated_summary': self.doc_ai("Summarize Pi Ecosystem hyper-tech features.", max_length=100)[0]['generated_text']
+            # Greedy decoding: the fixed prompt yields the same summary every cycle, so the inference cache can serve it
+            'ai_generated_summary': (await infer(self.doc_ai, "Summarize Pi Ecosystem hyper-tech features.", max_length=100, do_sample=False))[0]['generated_text']
         }
         return docs
 
@@ -115,30 +119,33 @@ class UltimateEcosystemDocumentationHolographicArchive:
 
     async def monitor_archive_integrity(self):
         """Monitors integrity of the holographic archive."""
-        while self.documentation_status == 'Archived':
-            # AI integrity prediction
-            prompt = "Predict integrity of Pi Ecosystem documentation archive."
-            prediction = self.doc_ai(prompt, max_length=50)[0]['generated_text']
-            logging.info(f"Archive Integrity Prediction: {prediction}")
-            # Check for archive threats
-            if not self.test_suite.test_results or self.test_suite.test_results[-1]['overall_valid'] < 0.5:
-                logging.critical("Archive integrity threatened. Initiating documentation rebirth.")
-                self.documentation_status = 'Pending'
-                self.rgb_led.color = (1, 0, 0)  # Red: error
-                self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
-                await self.core._trigger_system_rebirth()
-                break
-            await asyncio.sleep(86400)  # Monitor daily
+        job = default_scheduler.every('UltimateEcosystemDocumentationHolographicArchive.monitor_archive_integrity', 86400, self._integrity_check)  # Monitor daily
+        await job.finished.wait()
+
+    async def _integrity_check(self) -> bool:
+        """One archive integrity prediction and check; returns False once the archive is threatened."""
+        if self.documentation_status != 'Archived':
+            return False
+        # AI integrity prediction
+        prompt = "Predict integrity of Pi Ecosystem documentation archive."
+        prediction = (await infer(self.doc_ai, prompt, max_length=50))[0]['generated_text']
+        logging.info(f"Archive Integrity Prediction: {prediction}")
+        # Check for archive threats
+        if not self.test_suite.test_results or self.test_suite.test_results[-1]['overall_valid'] < 0.5:
+            logging.critical("Archive integrity threatened. Initiating documentation rebirth.")
+            self.documentation_status = 'Pending'
+            self.rgb_led.color = (1, 0, 0)  # Red: error
+            self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
+            await self.core._trigger_system_rebirth()
+            return False
+        return True
 
     async def manual_doc_trigger(self):
         """Handles manual documentation trigger."""
-        while True:
-            if self.trigger_button.is_pressed:
-                logging.info("Manual documentation trigger activated.")
-                if self.documentation_status == 'Pending':
-                    await self.generate_ultimate_documentation()
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual documentation trigger activated.")
+        if self.documentation_status == 'Pending':
+            await self.generate_ultimate_documentation()
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_archive_dashboard(self) -> Dict[str, Any]:
         """Generates holographic archive dashboard."""
@@ -156,7 +163,7 @@ class UltimateEcosystemDocumentationHolographicArchive:
 
     async def run_documentation_archive(self):
         """Main documentation archive loop."""
-        asyncio.create_task(self.manual_doc_trigger())
+        default_scheduler.on_press('UltimateEcosystemDocumentationHolographicArchive.manual_doc_trigger', self.trigger_button, self.manual_doc_trigger)
         if self.documentation_status == 'Pending':
             await self.generate_ultimate_documentation()
         if self.documentation_status == 'Archived':
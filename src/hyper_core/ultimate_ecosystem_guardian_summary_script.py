@@ -3,13 +3,16 @@ import logging
 from typing import Dict, List, Any
 import json
 import os
-from transformers import pipeline  # For AI summary generation
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: Guardian controls
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For AI summary generation
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: Guardian controls
 from master_control_final_integration_script import MasterControlFinalIntegrationScript  # File 14
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer  # File 10
 from ultimate_ai_governance_ethical_overseer import UltimateAIGovernanceEthicalOverseer  # File 12
 import random
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Ecosystem Guardian: %(message)s')
@@ -17,11 +20,11 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - Ecosystem Guardian
 class UltimateEcosystemGuardianSummaryScript:
     def __init__(self, master_control: MasterControlFinalIntegrationScript):
         self.master_control = master_control
-        self.guardian_rgb = RGBLED(red=6, green=7, blue=8)  # RGB: Green=guarding, Red=threat, Blue=summarizing
-        self.threat_button = Button(9)  # Manual threat check
-        self.guardian_buzzer = Buzzer(10)
-        self.summary_generator = pipeline("text-generation", model="gpt2")  # For AI summaries
-        self.threat_predictor = pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")  # For threat prediction
+        self.guardian_rgb = LazyObject(RGBLED, red=6, green=7, blue=8)  # RGB: Green=guarding, Red=threat, Blue=summarizing
+        self.threat_button = LazyObject(Button, 9)  # Manual threat check
+        self.guardian_buzzer = LazyObject(Buzzer, 10)
+        self.summary_generator = shared_pipeline("text-generation", model="gpt2")  # For AI summaries
+        self.threat_predictor = shared_pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")  # For threat prediction
         self.guardian_reports: List[Dict] = []
         self.ultimate_halt_triggered = False
 
@@ -37,12 +40,12 @@ class UltimateEcosystemGuardianSummaryScript:
             'founder_violations': len(self.master_control.modules['purity_enforcer'].founder_watchlist['violations']),
             'ai_ethics': 'Maintained' if self.master_control.modules['governance'].unethical_incidents == 0 else 'Compromised',
             'compliance': 'Pi Network Compliant' if not self.master_control.modules['ahi_ai'].stellar_halted else 'Breached - Stellar Halted',
-            'threat_level': self._predict_threat_level(),
+            'threat_level': await self._predict_threat_level(),
             'zero_crime_status': 'Vulnerable' if random.random() < 0.05 else 'Secure'  # Simulated
         }
         # AI-enhanced summary text
         prompt = f"Summarize Pi Ecosystem: {summary}"
-        ai_summary = self.summary_generator(prompt, max_length=100)[0]['generated_text']
+        ai_summary = (await infer(self.summary_generator, prompt, max_length=100))[0]['generated_text']
         summary['ai_summary'] = ai_summary
         self.guardian_reports.append(summary)
         # Save as hologram
@@ -52,34 +55,40 @@ class UltimateEcosystemGuardianSummaryScript:
         logging.info(f"Ecosystem Summary: {summary}")
         return summary
 
-    def _predict_threat_level(self) -> str:
+    async def _predict_threat_level(self) -> str:
         """Predicts threat level using AI."""
         sample_threat = "Potential volatile infiltration or founder exploit"
-        sentiment = self.threat_predictor(sample_threat)[0]['label']
+        sentiment = (await infer(self.threat_predictor, sample_threat))[0]['label']
         return 'High' if sentiment == 'NEGATIVE' else 'Low'
 
     async def guard_ecosystem(self):
         """Autonomously guards against threats, enforcing purity and security."""
-        while not self.ultimate_halt_triggered:
-            # Enforce Stablecoin-Only: Reject exchange/bought/entered/unclear PI
-            tainted_sources = ['exchange', 'bought_exchange', 'entered_exchange', 'unclear_party']
-            for source in tainted_sources:
-                test_tx = {'id': f'test_{source}', 'source': source, 'amount': 50}
-                if not await self.master_control.modules['purity_enforcer'].enforce_pi_purity(test_tx):
-                    logging.warning(f"Rejected tainted PI from {source}.")
-            # Monitor for zero-crime vulnerabilities
-            if self._predict_threat_level() == 'High':
-                logging.critical("High threat detected. Securing ecosystem.")
-                await self.master_control.modules['security']._isolate_system()
-                self.guardian_rgb.color = (1, 0, 0)  # Red: threat
-                self.guardian_buzzer.beep(on_time=1, off_time=1, n=5)
-            # Check founder accountability
-            if self.master_control.modules['purity_enforcer'].founder_watchlist['violations']:
-                logging.critical("Founder manipulation/exploit/cheat detected. Freezing and returning all PI to supply.")
-                await self.master_control.modules['purity_enforcer']._freeze_and_return_all_pi()
-                await self._ultimate_halt("Founder violation.")
-                break
-            await asyncio.sleep(600)  # Guard every 10 minutes
+        job = default_scheduler.every('UltimateEcosystemGuardianSummaryScript.guard_ecosystem', 600, self._guard_pass)  # Guard every 10 minutes
+        await job.finished.wait()
+
+    async def _guard_pass(self) -> bool:
+        """One guard pass over purity, threats and founder accountability; returns False once the ultimate halt is triggered."""
+        if self.ultimate_halt_triggered:
+            return False
+        # Enforce Stablecoin-Only: Reject exchange/bought/entered/unclear PI
+        tainted_sources = ['exchange', 'bought_exchange', 'entered_exchange', 'unclear_party']
+        for source in tainted_sources:
+            test_tx = {'id': f'test_{source}', 'source': source, 'amount': 50}
+            if not await self.master_control.modules['purity_enforcer'].enforce_pi_purity(test_tx):
+                logging.warning(f"Rejected tainted PI from {source}.")
+        # Monitor for zero-crime vulnerabilities
+        if await self._predict_threat_level() == 'High':
+            logging.critical("High threat detected. Securing ecosystem.")
+            await self.master_control.modules['security']._isolate_system()
+            self.guardian_rgb.color = (1, 0, 0)  # Red: threat
+            self.guardian_buzzer.beep(on_time=1, off_time=1, n=5)
+        # Check founder accountability
+        if self.master_control.modules['purity_enforcer'].founder_watchlist['violations']:
+            logging.critical("Founder manipulation/exploit/cheat detected. Freezing and returning all PI to supply.")
+            await self.master_control.modules['purity_enforcer']._freeze_and_return_all_pi()
+            await self._ultimate_halt("Founder violation.")
+            return False
+        return True
 
     async def _ultimate_halt(self, reason: str):
         """Triggers ultimate ecosystem halt."""
@@ -91,19 +100,16 @@ class UltimateEcosystemGuardianSummaryScript:
 
     async def manual_threat_check(self):
         """Handles manual threat checks via button."""
-        while True:
-            if self.threat_button.is_pressed:
-                logging.info("Manual threat check triggered.")
-                threat_level = self._predict_threat_level()
-                summary = await self.generate_ecosystem_summary()
-                print(f"Manual Check - Threat Level: {threat_level}, Summary: {summary['ai_summary']}")
-                self.guardian_rgb.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual threat check triggered.")
+        threat_level = await self._predict_threat_level()
+        summary = await self.generate_ecosystem_summary()
+        print(f"Manual Check - Threat Level: {threat_level}, Summary: {summary['ai_summary']}")
+        self.guardian_rgb.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def run_guardian(self):
         """Main guardian loop."""
         asyncio.create_task(self.guard_ecosystem())
-        asyncio.create_task(self.manual_threat_check())
+        default_scheduler.on_press('UltimateEcosystemGuardianSummaryScript.manual_threat_check', self.threat_button, self.manual_threat_check)
         # Initial summary
         await self.generate_ecosystem_summary()
         logging.info("Ultimate Ecosystem Guardian active. Stablecoin-Only, Zero-Crime, Founder-Proof.")
@@ -3,14 +3,17 @@ import logging
 from typing import Dict, List, Any
 import json
 import os
-from transformers import pipeline  # For voice command processing
-from gpiozero import LED, Button, DistanceSensor, Buzzer  # Pi hardware: Full suite for interactive control
+from lazy_loader import LazyObject, lazy_from
+from model_registry import shared_pipeline  # For voice command processing
+from inference_queue import infer
+LED, Button, DistanceSensor, Buzzer = lazy_from('gpiozero', 'LED', 'Button', 'DistanceSensor', 'Buzzer')  # Pi hardware: Full suite for interactive control
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from autonomous_app_builder import AutonomousAppBuilder  # File 3
 from hyper_ecosystem_monitor import HyperEcosystemMonitor  # File 4
 from quantum_security_layer import QuantumSecurityLayer  # File 5
 import random
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Ultimate Core: %(message)s')
@@ -24,13 +27,14 @@ class UltimateIntegrationCore:
         self.monitor = HyperEcosystemMonitor(self.ahi_ai, self.pi_manager, self.app_builder)
         self.security = QuantumSecurityLayer(self.ahi_ai, self.pi_manager, self.app_builder, self.monitor)
         # Pi hardware for ultimate control
-        self.master_led = LED(27)  # Master status: Pulsing=active, Off=halted
-        self.voice_button = Button(23)  # Activate voice commands
-        self.touch_sensor = DistanceSensor(echo=24, trigger=25)  # Proximity for touch-like interactions
-        self.alert_buzzer = Buzzer(26)
-        self.voice_processor = pipeline("automatic-speech-recognition", model="openai/whisper-small")  # Voice AI
+        self.master_led = LazyObject(LED, 27)  # Master status: Pulsing=active, Off=halted
+        self.voice_button = LazyObject(Button, 23)  # Activate voice commands
+        self.touch_sensor = LazyObject(DistanceSensor, echo=24, trigger=25)  # Proximity for touch-like interactions
+        self.alert_buzzer = LazyObject(Buzzer, 26)
+        self.voice_processor = shared_pipeline("automatic-speech-recognition", model="openai/whisper-small")  # Voice AI
         self.self_learning_model = self._build_self_learning_ai()  # For ecosystem evolution
         self.system_rebirth_triggered = False
+        self._shown_dashboard = None  # Last dashboard printed by interactive_touch_control
 
     def _build_self_learning_ai(self):
         """Builds a self-learning AI for ecosystem optimization (hyper-tech: use evolutionary algorithms)."""
@@ -43,51 +47,46 @@ class UltimateIntegrationCore:
         tasks = [
             self.ahi_ai.run(),
             self.monitor.run_monitor(),
-            self.security.run_security_layer(),
-            self._handle_voice_commands(),
-            self._proactive_optimization(),
-            self._monitor_compliance_and_rebirth()
+            self.security.run_security_layer()
         ]
+        default_scheduler.every('UltimateIntegrationCore.interactive_touch_control', 2, self.interactive_touch_control)
+        default_scheduler.on_press('UltimateIntegrationCore.handle_voice_commands', self.voice_button, self._handle_voice_commands)
+        default_scheduler.every('UltimateIntegrationCore.proactive_optimization', 600, self._proactive_optimization)  # Optimize every 10 minutes
+        default_scheduler.every('UltimateIntegrationCore.monitor_compliance_and_rebirth', 300, self._monitor_compliance_and_rebirth)  # Check every 5 minutes
         await asyncio.gather(*tasks)
 
     async def _handle_voice_commands(self):
         """Processes voice commands for interactive control."""
-        while True:
-            if self.voice_button.is_pressed:
-                logging.info("Voice command mode activated.")
-                # Simulate voice input (in hyper-tech: integrate microphone)
-                command = "Create a new PI app for payments"  # Placeholder
-                recognized = self.voice_processor(command)[0]['text']
-                if "create app" in recognized.lower():
-                    spec = {'name': 'voice_pi_app', 'description': recognized}
-                    await self.app_builder.create_app_from_spec(spec)
-                elif "check balance" in recognized.lower():
-                    balance = self.pi_manager.get_balance()
-                    print(f"PI Balance: {balance}")  # Output to Pi display/speaker
-            await asyncio.sleep(10)
+        logging.info("Voice command mode activated.")
+        # Simulate voice input (in hyper-tech: integrate microphone)
+        command = "Create a new PI app for payments"  # Placeholder
+        recognized = (await infer(self.voice_processor, command))[0]['text']
+        if "create app" in recognized.lower():
+            spec = {'name': 'voice_pi_app', 'description': recognized}
+            await self.app_builder.create_app_from_spec(spec)
+        elif "check balance" in recognized.lower():
+            balance = self.pi_manager.get_balance()
+            print(f"PI Balance: {balance}")  # Output to Pi display/speaker
 
     async def _proactive_optimization(self):
         """Uses self-learning AI for proactive ecosystem improvements."""
-        while True:
-            # Analyze metrics from Monitor (File 4)
-            anomalies = self.monitor.detect_anomalies()
-            if anomalies:
-                adaptation = f"Adapted filter for {anomalies[0]}"
-                self.self_learning_model['adaptations'].append(adaptation)
-                self.self_learning_model['evolution_score'] += 0.1
-                logging.info(f"Self-learning adaptation: {adaptation}")
-                # Apply to AHI AI (File 1)
-                await self.ahi_ai.filter_transaction({'action': 'adaptation', 'data': adaptation})
-            await asyncio.sleep(600)  # Optimize every 10 minutes
+        # Analyze metrics from Monitor (File 4)
+        anomalies = self.monitor.detect_anomalies()
+        if anomalies:
+            adaptation = f"Adapted filter for {anomalies[0]}"
+            self.self_learning_model['adaptations'].append(adaptation)
+            self.self_learning_model['evolution_score'] += 0.1
+            logging.info(f"Self-learning adaptation: {adaptation}")
+            # Apply to AHI AI (File 1)
+            await self.ahi_ai.filter_transaction({'action': 'adaptation', 'data': adaptation})
 
-    async def _monitor_compliance_and_rebirth(self):
-        """Monitors Pi compliance and triggers system rebirth if needed."""
-        while True:
-            if self.ahi_ai.stellar_halted and not self.system_rebirth_triggered:
-                logging.critical("Pi Network non-compliance detected. Initiating system rebirth.")
-                self._trigger_system_rebirth()
-                break
-            await asyncio.sleep(300)  # Check every 5 minutes
+    def _monitor_compliance_and_rebirth(self) -> bool:
+        """Monitors Pi compliance and triggers system rebirth if needed (returns False once triggered)."""
+        if self.ahi_ai.stellar_halted and not self.system_rebirth_triggered:
+            logging.critical("Pi Network non-compliance detected. Initiating system rebirth.")
+            self._trigger_system_rebirth()
+            return False
+        return True
 
     def _trigger_system_rebirth(self):
         """Autonomously reboots and rebuilds the ecosystem."""
@@ -113,14 +112,14 @@ class UltimateIntegrationCore:
         self.master_led.on()  # Rebirth complete
         logging.info("Ecosystem rebirth complete. PI supremacy restored.")
 
-    async def interactive_touch_control(self):
+    def interactive_touch_control(self):
         """Handles touch-like proximity interactions."""
-        while True:
-            distance = self.touch_sensor.distance
-            if distance < 0.05:  # Very close (touch)
-                dashboard = self.monitor.generate_holographic_dashboard()
-                print(f"Touch Dashboard: {json.dumps(dashboard, indent=2)}")
-            await asyncio.sleep(2)
+        distance = self.touch_sensor.distance
+        if distance < 0.05:  # Very close (touch)
+            self.monitor.generate_holographic_dashboard()
+            if self.monitor.dashboard_json() is not self._shown_dashboard:  # Cached JSON: print only when it changed
+                self._shown_dashboard = self.monitor.dashboard_json()
+                print(f"Touch Dashboard: {self._shown_dashboard}")
 
 # Usage example (main entry point for the super app)
 if __name__ == "__main__":
@@ -128,6 +127,4 @@ if __name__ == "__main__":
     pi_client = None  # Replace with real PiNetworkClient
     stellar_server = None  # Replace with real Stellar server
     core = UltimateIntegrationCore(pi_client, stellar_server)
-    # Add interactive task
-    asyncio.create_task(core.interactive_touch_control())
     asyncio.run(core.orchestrate_ecosystem())
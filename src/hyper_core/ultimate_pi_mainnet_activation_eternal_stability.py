@@ -4,9 +4,11 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 import random
-from qiskit import QuantumCircuit, Aer, execute  # Quantum for eternal seals
-from transformers import pipeline  # AI for eternal stability predictions
-from gpiozero import LED, Buzzer, RGBLED, Button  # Pi hardware: RGB LED for eternal status, Buzzer for alerts, Button for activation confirm
+from lazy_loader import LazyObject, lazy_from
+QuantumCircuit, Aer, execute = lazy_from('qiskit', 'QuantumCircuit', 'Aer', 'execute')  # Quantum for eternal seals
+from model_registry import shared_pipeline  # AI for eternal stability predictions
+from inference_queue import infer
+LED, Buzzer, RGBLED, Button = lazy_from('gpiozero', 'LED', 'Buzzer', 'RGBLED', 'Button')  # Pi hardware: RGB LED for eternal status, Buzzer for alerts, Button for activation confirm
 from ahi_ai_core import AutonomousHyperIntelligenceAI  # File 1
 from pi_stablecoin_manager import PIStablecoinManager  # File 2
 from ultimate_integration_core import UltimateIntegrationCore  # File 6
@@ -16,6 +18,7 @@ from pi_mainnet_integration_real_time_synchronization import PiMainnetIntegratio
 from global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub  # File 19
 from pi_mainnet_launch_governance_protocol import PiMainnetLaunchGovernanceProtocol  # File 20
 import hashlib
+from task_scheduler import default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - Ultimate Mainnet Activation: %(message)s')
@@ -34,13 +37,13 @@ class UltimatePiMainnetActivationEternalStability:
         self.mainnet_sync = mainnet_sync
         self.swarm_hub = swarm_hub
         self.launch_protocol = launch_protocol
-        self.rgb_led = RGBLED(red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: White=eternal, Green=activated, Red=disrupted
-        self.alert_buzzer = Buzzer(alert_buzzer_pin)
-        self.confirm_button = Button(confirm_button_pin)  # Manual activation confirm
-        self.quantum_eternal_circuit = self._init_quantum_eternal()
+        self.rgb_led = LazyObject(RGBLED, red=rgb_led_pins[0], green=rgb_led_pins[1], blue=rgb_led_pins[2])  # RGB: White=eternal, Green=activated, Red=disrupted
+        self.alert_buzzer = LazyObject(Buzzer, alert_buzzer_pin)
+        self.confirm_button = LazyObject(Button, confirm_button_pin)  # Manual activation confirm
+        self.quantum_eternal_circuit = LazyObject(self._init_quantum_eternal)
         self.eternal_status = 'Inactive'  # 'Inactive', 'Activating', 'Eternal'
         self.eternal_seals: List[Dict] = []
-        self.stability_ai = pipeline("text-generation", model="gpt2")  # AI for stability predictions
+        self.stability_ai = shared_pipeline("text-generation", model="gpt2")  # AI for stability predictions
 
     def _init_quantum_eternal(self) -> QuantumCircuit:
         """Initializes quantum circuit for eternal seals."""
@@ -94,30 +97,33 @@ class UltimatePiMainnetActivationEternalStability:
 
     async def monitor_eternal_stability(self):
         """Monitors eternal stability of the mainnet."""
-        while self.eternal_status == 'Eternal':
-            # AI stability prediction
-            prompt = "Predict eternal stability of fully open Pi mainnet with Stablecoin-Only."
-            prediction = self.stability_ai(prompt, max_length=50)[0]['generated_text']
-            logging.info(f"Stability Prediction: {prediction}")
-            # Check for disruptions
-            if not await self.launch_protocol._check_launch_readiness()['compliance']:
-                logging.critical("Eternal stability disrupted. Initiating mainnet rebirth.")
-                self.eternal_status = 'Inactive'
-                self.rgb_led.color = (1, 0, 0)  # Red: disrupted
-                self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
-                await self.core._trigger_system_rebirth()
-                break
-            await asyncio.sleep(86400)  # Monitor daily
+        job = default_scheduler.every('UltimatePiMainnetActivationEternalStability.monitor_eternal_stability', 86400, self._stability_check)  # Monitor daily
+        await job.finished.wait()
+
+    async def _stability_check(self) -> bool:
+        """One stability prediction and disruption check; returns False once stability is lost."""
+        if self.eternal_status != 'Eternal':
+            return False
+        # AI stability prediction
+        prompt = "Predict eternal stability of fully open Pi mainnet with Stablecoin-Only."
+        prediction = (await infer(self.stability_ai, prompt, max_length=50))[0]['generated_text']
+        logging.info(f"Stability Prediction: {prediction}")
+        # Check for disruptions
+        if not await self.launch_protocol._check_launch_readiness()['compliance']:
+            logging.critical("Eternal stability disrupted. Initiating mainnet rebirth.")
+            self.eternal_status = 'Inactive'
+            self.rgb_led.color = (1, 0, 0)  # Red: disrupted
+            self.alert_buzzer.beep(on_time=3, off_time=1, n=15)
+            await self.core._trigger_system_rebirth()
+            return False
+        return True
 
     async def manual_activation_confirm(self):
         """Handles manual confirmation for eternal activation."""
-        while True:
-            if self.confirm_button.is_pressed:
-                logging.info("Manual confirmation for eternal mainnet activation.")
-                if self.eternal_status == 'Inactive':
-                    await self.activate_eternal_mainnet()
-                self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
-            await asyncio.sleep(1)
+        logging.info("Manual confirmation for eternal mainnet activation.")
+        if self.eternal_status == 'Inactive':
+            await self.activate_eternal_mainnet()
+        self.rgb_led.blink(on_time=0.5, off_time=0.5, n=3)
 
     async def generate_eternal_dashboard(self) -> Dict[str, Any]:
         """Generates holographic eternal mainnet dashboard."""
@@ -136,7 +142,7 @@ class UltimatePiMainnetActivationEternalStability:
 
     async def run_eternal_activation(self):
         """Main eternal activation loop."""
-        asyncio.create_task(self.manual_activation_confirm())
+        default_scheduler.on_press('UltimatePiMainnetActivationEternalStability.manual_activation_confirm', self.confirm_button, self.manual_activation_confirm)
         if self.eternal_status == 'Inactive':
             await self.activate_eternal_mainnet()
         if self.eternal_status == 'Eternal':
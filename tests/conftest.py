@@ -0,0 +1,5 @@
+import os
+import sys
+
+# hyper_core modules import each other by bare name (e.g. `from ahi_ai_core import ...`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'hyper_core'))
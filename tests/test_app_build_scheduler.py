@@ -0,0 +1,110 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.hyper_core.app_build_scheduler import BuildScheduler, FakeContainerClient, context_hash
+from src.hyper_core.autonomous_app_builder import AutonomousAppBuilder
+
+class Hardware:
+    """Stand-in for the build LED and buzzer."""
+    def blink(self, **kwargs):
+        pass
+
+    def on(self):
+        pass
+
+    def off(self):
+        pass
+
+    def beep(self, **kwargs):
+        pass
+
+def context(i, version=0):
+    return {'Dockerfile': 'FROM python:3.9-slim\n', 'app.py': f'print({i}, {version})\n'}
+
+class TestBuildScheduler(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeContainerClient(build_seconds=0.05, fail_tags=[BuildScheduler.image_tag('broken', context_hash(context(9)))])
+        self.scheduler = BuildScheduler(self.client, tempfile.mkdtemp(), max_workers=3)
+
+    def tearDown(self):
+        self.scheduler.close()
+
+    def test_pooled_builds_skip_unchanged_contexts(self):
+        self.assertEqual(context_hash({'a': '1', 'b': '2'}), context_hash({'b': '2', 'a': '1'}))
+        apps = {f'app_{i}': context(i) for i in range(6)}
+        first = asyncio.run(self.scheduler.build_many(apps))
+        self.assertTrue(all(result['built'] for result in first))
+        self.assertEqual(self.client.max_concurrent_builds, 3)
+        apps['app_0'] = context(0, version=1)
+        second = asyncio.run(self.scheduler.build_many(apps))
+        self.assertEqual([result['built'] for result in second], [True] + [False] * 5)
+        self.assertEqual(len(self.client.builds), 7)
+        self.assertEqual(self.scheduler.stats['skipped'], 5)
+
+    def test_failed_build_is_reported_and_retried(self):
+        results = asyncio.run(self.scheduler.build_many({'broken': context(9), 'ok': context(1)}))
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertTrue(results[1]['built'])
+        self.client.fail_tags.clear()
+        self.assertTrue(asyncio.run(self.scheduler.build('broken', context(9)))['built'])  # Nothing cached for a failed build
+
+class AHI:
+    """Stand-in for the AHI AI compliance state."""
+    stellar_halted = False
+
+class TestAppBuilderDeploys(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())  # deployed_apps.json and ./apps stay out of the repo
+        self.client = FakeContainerClient()
+        self.builder = AutonomousAppBuilder(None, None, container_client=self.client, max_parallel_builds=2)
+        self.builder.pi_led = self.builder.alert_buzzer = Hardware()
+        self.builder.ahi_ai = AHI()
+
+    def tearDown(self):
+        self.builder.build_scheduler.close()
+        os.chdir(self.cwd)
+
+    def test_unchanged_running_app_is_not_rebuilt_or_redeployed(self):
+        results = asyncio.run(self.builder.build_and_deploy_apps({'pay': 'print(1)', 'shop': 'print(2)'}))
+        self.assertEqual(results, {'pay': True, 'shop': True})
+        container_id = self.builder.apps['pay']['container_id']
+        self.assertTrue(asyncio.run(self.builder.build_and_deploy_app('pay', 'print(1)')))
+        self.assertEqual((len(self.client.builds), self.builder.apps['pay']['container_id']), (2, container_id))
+        self.client.stop(container_id)  # Self-healing reuses the image and only starts a new container
+        self.assertTrue(asyncio.run(self.builder.build_and_deploy_app('pay', 'print(1)')))
+        self.assertEqual(len(self.client.builds), 2)
+        self.assertNotEqual(self.builder.apps['pay']['container_id'], container_id)
+        self.assertTrue(os.path.exists('./apps/pay/Dockerfile'))
+
+    def test_deploy_during_monitor_pass_keeps_monitor_alive(self):
+        deploy = self.builder.build_and_deploy_app
+        healed = asyncio.Event()
+
+        async def heal_while_deploying(app_name, app_code):
+            if app_name == 'b':
+                await deploy('c', 'print(3)')  # A new app lands while the monitor is suspended
+            result = await deploy(app_name, app_code)
+            healed.set()
+            return result
+
+        async def scenario():
+            await self.builder.build_and_deploy_apps({'a': 'print(1)', 'b': 'print(2)'})
+            self.client.stop(self.builder.apps['b']['container_id'])
+            self.builder.build_and_deploy_app = heal_while_deploying
+            monitor = asyncio.create_task(self.builder.monitor_and_manage_apps())
+            await asyncio.wait_for(healed.wait(), 5)
+            await asyncio.sleep(0.05)  # Let the pass finish iterating
+            alive = not monitor.done()
+            monitor.cancel()
+            return alive
+
+        with mock.patch('random.random', return_value=0.0):  # Always heal by redeploying
+            self.assertTrue(asyncio.run(scenario()))
+        self.assertEqual(sorted(self.builder.apps), ['a', 'b', 'c'])
+        self.assertTrue(asyncio.run(self.builder._container_running(self.builder.apps['b']['container_id'])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from src.hyper_core.check_runner import CheckRunner
+
+class TestCheckRunner(unittest.TestCase):
+    def setUp(self):
+        self.history_dir = tempfile.mkdtemp()
+        self.runner = CheckRunner(self.history_dir, timeout=0.5, min_history=3)
+
+    def tearDown(self):
+        self.runner.close()
+
+    def test_concurrent_timeout_and_cpu_time(self):
+        async def waits():
+            await asyncio.sleep(0.2)
+            return {'status': 'passed'}
+
+        async def hangs():
+            await asyncio.sleep(10)
+
+        async def spins():
+            end = time.thread_time() + 0.05
+            while time.thread_time() < end:
+                pass
+            return {'status': 'passed'}
+
+        async def breaks():
+            raise RuntimeError('module missing')
+
+        start = time.perf_counter()
+        results = asyncio.run(self.runner.run({'waits_a': waits, 'waits_b': waits, 'hangs': hangs, 'spins': spins, 'breaks': breaks}))
+        self.assertLess(time.perf_counter() - start, 1.0)  # Sequential would take 0.95s plus the 10s hang
+        by_name = {result['test']: result for result in results}
+        self.assertEqual([result['test'] for result in results], ['waits_a', 'waits_b', 'hangs', 'spins', 'breaks'])
+        self.assertTrue(by_name['hangs']['timed_out'])
+        self.assertEqual((by_name['breaks']['status'], by_name['breaks']['error']), ('failed', 'module missing'))
+        self.assertLess(by_name['waits_a']['cpu_seconds'], 0.02)  # Sleeping costs no CPU
+        self.assertGreaterEqual(by_name['spins']['cpu_seconds'], 0.05)
+        self.assertEqual(len(self.runner.history), 4)  # Timeouts stay out of the latency history
+
+    def test_regression_against_persisted_p95(self):
+        delay = {'seconds': 0.01}
+
+        async def check():
+            await asyncio.sleep(delay['seconds'])
+            return {'status': 'passed'}
+
+        for _ in range(3):
+            self.assertFalse(asyncio.run(self.runner.run({'sync': check}))[0]['regressed'])
+        self.runner.close()
+        self.runner = CheckRunner(self.history_dir, min_history=3)  # Baseline rebuilt from the journal
+        self.assertIsNotNone(self.runner.p95('sync'))
+        delay['seconds'] = 0.2
+        result = asyncio.run(self.runner.run({'sync': check}))[0]
+        self.assertTrue(result['regressed'])
+        self.assertGreater(result['wall_seconds'], result['p95_seconds'])
+
+if __name__ == '__main__':
+    unittest.main()
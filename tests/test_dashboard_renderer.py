@@ -0,0 +1,25 @@
+import threading
+import time
+import unittest
+import numpy as np
+from src.hyper_core.dashboard_renderer import DashboardRenderer
+
+class TestDashboardRenderer(unittest.TestCase):
+    def test_frames_are_capped_and_coalesced(self):
+        frames = []
+        rendered = threading.Event()
+        def render(series, path):
+            frames.append((threading.current_thread().name, series['pi_transactions'][-1]))
+            rendered.set()
+        renderer = DashboardRenderer('unused.png', max_fps=5, render=render)
+        for value in range(10):
+            renderer.request({'pi_transactions': np.array([value], dtype=float)})
+        self.assertTrue(rendered.wait(1))
+        time.sleep(0.4)  # Room for at most one more capped frame
+        renderer.close()
+        self.assertLessEqual(len(frames), 2)
+        self.assertEqual(frames[-1], ('dashboard-renderer', 9.0))  # Latest request wins
+        self.assertGreaterEqual(renderer.stats['coalesced'], 8)
+
+if __name__ == '__main__':
+    unittest.main()
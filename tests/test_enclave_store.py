@@ -0,0 +1,96 @@
+import os
+import tempfile
+import threading
+import unittest
+from src.hyper_core.envelope_crypto import EnvelopeKeyring
+from src.hyper_core.enclave_store import SecureEnclaveStore
+
+class TestSecureEnclaveStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.keyring = EnvelopeKeyring(os.path.join(self.directory, 'keys.json'))
+        self.store = SecureEnclaveStore(os.path.join(self.directory, 'enclave'), self.keyring, memory_entries=10, segment_bytes=4096)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_memory_is_bounded_and_cold_entries_come_from_disk(self):
+        for i in range(200):
+            self.store[f"tx{i}"] = f"envelope-{i}"
+        metrics = self.store.metrics()
+        self.assertEqual(metrics['memory_entries'], 10)
+        self.assertGreater(metrics['segments'], 1)
+        self.assertEqual(self.store['tx199'], 'envelope-199')
+        self.assertEqual(self.store['tx3'], 'envelope-3')
+        self.assertEqual(self.store.stats['hits'], 1)
+        self.assertEqual(self.store.stats['disk_reads'], 1)
+        self.assertEqual(len(self.store), 200)
+        self.assertNotIn(b'envelope-3', open(os.path.join(self.directory, 'enclave', '00000000.seg'), 'rb').read())
+
+    def test_recovery_overwrites_and_deletes(self):
+        for i in range(50):
+            self.store.put(f"tx{i}", 'old')
+        self.store.put('tx1', 'new')
+        del self.store['tx2']
+        self.store.close()
+        self.store = SecureEnclaveStore(os.path.join(self.directory, 'enclave'), self.keyring, memory_entries=10, segment_bytes=4096)
+        self.assertEqual(self.store['tx1'], 'new')
+        self.assertNotIn('tx2', self.store)
+        self.assertEqual(len(self.store), 49)
+        self.assertEqual(dict(self.store.items())['tx40'], 'old')
+
+    def test_compaction_reclaims_overwritten_segments(self):
+        for _ in range(5):
+            for i in range(40):
+                self.store.put(f"tx{i}", 'x' * 100)
+        self.store._executor.shutdown(wait=True)  # Let background compactions finish
+        metrics = self.store.metrics()
+        self.assertGreater(metrics['compactions'], 0)
+        self.assertLess(metrics['disk_bytes'], 3 * metrics['live_disk_bytes'])
+        self.assertEqual([self.store[f"tx{i}"] for i in range(40)], ['x' * 100] * 40)
+
+    def test_compaction_keeps_tombstone_while_older_put_survives(self):
+        self.store.put('X', 'secret')
+        for i in range(30):
+            self.store.put(f"long{i}", 'y' * 100)  # Keeps segment 0 mostly live, so it is never compacted
+        self.store.put('churn', 'z' * 100)
+        self.assertIn(0, self.store._segments)
+        del self.store['X']
+        tombstone_segment = self.store._active.number
+        self.assertGreater(tombstone_segment, 0)
+        for i in range(200):
+            self.store.put(f"churn{i % 5}", 'z' * 100)  # The tombstone's segment turns to garbage and is compacted
+        self.store._executor.shutdown(wait=True)
+        self.assertNotIn(tombstone_segment, self.store._segments)
+        self.assertIn(0, self.store._segments)
+        self.assertNotIn('X', self.store)
+        self.store.close()
+        self.store = SecureEnclaveStore(os.path.join(self.directory, 'enclave'), self.keyring, memory_entries=10, segment_bytes=4096)
+        self.assertNotIn('X', self.store)
+        self.assertEqual(self.store['long29'], 'y' * 100)
+
+    def test_compaction_reseals_without_holding_the_lock(self):
+        for i in range(30):
+            self.store.put(f"tx{i}", 'x' * 100)
+        self.assertGreater(self.store._active.number, 0)
+        decode, writers = self.store._decode, []
+
+        def decode_while_writing(envelope):
+            if not writers:  # A put lands while the first live record is being re-sealed
+                writers.append(threading.Thread(target=self.store.put, args=('tx1', 'fresh')))
+                writers[0].start()
+                writers[0].join(timeout=2)
+            return decode(envelope)
+
+        self.store._decode = decode_while_writing
+        self.store._compact(self.store._segments[0])
+        self.assertFalse(writers[0].is_alive())
+        self.assertNotIn(0, self.store._segments)
+        self.store.close()
+        self.store = SecureEnclaveStore(os.path.join(self.directory, 'enclave'), self.keyring, memory_entries=10, segment_bytes=4096)
+        self.assertEqual(self.store['tx1'], 'fresh')
+        self.assertEqual([self.store[f"tx{i}"] for i in (0, 2, 29)], ['x' * 100] * 3)
+        self.assertEqual(len(self.store), 30)
+
+if __name__ == '__main__':
+    unittest.main()
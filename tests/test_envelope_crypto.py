@@ -0,0 +1,38 @@
+import os
+import stat
+import tempfile
+import unittest
+from src.hyper_core.envelope_crypto import EnvelopeKeyring, EnvelopeSealer, open_envelope
+
+class TestEnvelopeCrypto(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'keys.json')
+        self.keyring = EnvelopeKeyring(self.path)
+
+    def test_batch_round_trip_beyond_rsa_limit(self):
+        sealer = EnvelopeSealer(self.keyring.public_key)
+        payloads = [os.urandom(2048), b'', b'{"id": "tx1"}']
+        envelopes = [sealer.seal(payload, b'tx') for payload in payloads]
+        self.assertEqual(len({envelope[:53] for envelope in envelopes}), 3)  # Fresh nonce per payload
+        self.assertEqual([open_envelope(self.keyring, envelope, b'tx') for envelope in envelopes], payloads)
+
+    def test_tampering_and_wrong_associated_data_are_rejected(self):
+        envelope = bytearray(EnvelopeSealer(self.keyring.public_key).seal(b'payload', b'tx1'))
+        with self.assertRaises(Exception):
+            open_envelope(self.keyring, bytes(envelope), b'tx2')
+        envelope[-1] ^= 1
+        with self.assertRaises(Exception):
+            open_envelope(self.keyring, bytes(envelope), b'tx1')
+
+    def test_keyring_persists_and_rotation_keeps_old_keys(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        old = EnvelopeSealer(self.keyring.public_key).seal(b'before rotation')
+        old_id = self.keyring.current_id
+        self.keyring.rotate()
+        reloaded = EnvelopeKeyring(self.path)
+        self.assertNotEqual(reloaded.current_id, old_id)
+        self.assertEqual(reloaded.current_id, self.keyring.current_id)
+        self.assertEqual(open_envelope(reloaded, old), b'before rotation')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+import numpy as np
+from src.hyper_core import global_pi_oracle_compliance_verifier as oracle_module
+from src.hyper_core.global_pi_oracle_compliance_verifier import GlobalPIOracleComplianceVerifier, oracle_consensus
+from src.hyper_core.node_registry import NodeRegistry
+
+class Hardware:
+    """Stand-in for the RGB LED and buzzer."""
+    color = None
+
+    def beep(self, **kwargs):
+        pass
+
+class Security:
+    def __init__(self):
+        self.batches = []
+
+    async def secure_pi_transactions(self, transactions):
+        self.batches.append(transactions)
+        return len(transactions)
+
+class PurityEnforcer:
+    frozen_pi_supply = 0
+
+    def __init__(self):
+        self.checked = []
+        self.batches = 0
+
+    async def enforce_pi_purity_batch(self, transactions):
+        self.batches += 1
+        self.checked.extend(transactions)
+        return [True] * len(transactions)
+
+class Reports:
+    """Stand-in for the random generator that simulates node reports."""
+    def __init__(self, offsets):
+        self.offsets = offsets
+
+    def uniform(self, low, high, size):
+        return self.offsets[:size]
+
+class Expansion:
+    def __init__(self, nodes):
+        self.global_nodes = NodeRegistry()
+        self.global_nodes.add_many([f'node_{i}' for i in range(nodes)])
+        self.purges = 0
+
+    def _global_purge_and_rebirth(self):
+        self.purges += 1
+
+class AHI:
+    """Stand-in for the AHI AI compliance state."""
+    stellar_halted = True
+
+class TestOracleConsensus(unittest.TestCase):
+    def test_median_and_trimmed_mean_ignore_outliers(self):
+        values = np.array([314159.0] * 8 + [0.0, 1e9])
+        deviating, summary = oracle_consensus(values, 314159, trim=0.1)
+        self.assertEqual(deviating.tolist(), [False] * 8 + [True, True])
+        self.assertEqual(summary['median'], 314159.0)
+        self.assertEqual(summary['trimmed_mean'], 314159.0)
+        self.assertEqual(summary['deviating'], 2)
+
+    def test_sync_cycle_isolates_deviating_nodes_in_batches(self):
+        security, purity, expansion = Security(), PurityEnforcer(), Expansion(5000)
+        oracle = GlobalPIOracleComplianceVerifier(None, None, security, expansion, purity, followup_batch=1000)
+        oracle.rgb_led = oracle.alert_buzzer = Hardware()
+        oracle._quantum_consensus_check = lambda: oracle.fixed_pi_value
+        offsets = np.zeros(5000)
+        offsets[::2] = 50  # Every other node deviates
+        oracle._rng = Reports(offsets)
+        isolated = asyncio.run(oracle.sync_cycle())
+        self.assertEqual(isolated, 2500)
+        self.assertEqual(len(expansion.global_nodes), 2500)
+        self.assertNotIn('node_0', expansion.global_nodes)
+        self.assertEqual([len(batch) for batch in security.batches], [1000, 1000, 500])
+        self.assertEqual(len(purity.checked), 1)  # All conforming nodes report the same value
+        self.assertEqual(purity.batches, 1)
+        self.assertEqual(oracle.last_consensus['deviating'], 2500)
+        self.assertTrue((expansion.global_nodes.column('reported_value') == oracle.fixed_pi_value).all())
+
+    def test_compliance_monitor_runs_on_the_scheduler_until_breach(self):
+        expansion = Expansion(0)
+        oracle = GlobalPIOracleComplianceVerifier(AHI(), None, Security(), expansion, PurityEnforcer())
+        oracle.rgb_led = oracle.alert_buzzer = Hardware()
+        asyncio.run(asyncio.wait_for(oracle.monitor_pi_compliance(), 1))  # Returns once the job stops itself
+        self.assertEqual(expansion.purges, 1)
+        self.assertEqual(oracle.rgb_led.color, (1, 0, 0))
+        job = oracle_module.default_scheduler.jobs['GlobalPIOracleComplianceVerifier.monitor_pi_compliance']
+        self.assertEqual((job.interval, job.histogram.count, job.cancelled), (7200, 1, True))
+
+if __name__ == '__main__':
+    unittest.main()
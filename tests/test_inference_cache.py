@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+from src.hyper_core.inference_cache import InferenceCache, is_cacheable
+from src.hyper_core.model_registry import ModelRegistry
+
+class TestInferenceCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        def loader(task, model=None):
+            return lambda inputs, **kwargs: [{'label': 'POSITIVE'} for _ in inputs]
+        self.classifier = ModelRegistry(loader=loader).acquire("text-classification", "roberta")
+
+    def compute(self):
+        async def run():
+            self.calls += 1
+            return [{'label': 'POSITIVE'}]
+        return run()
+
+    def test_repeated_input_hits_cache(self):
+        cache = InferenceCache(max_entries=8, ttl=60)
+        async def run():
+            for _ in range(4):
+                result = await cache.get_or_compute(self.classifier, "Approve PI transfer", {}, self.compute)
+            return result
+        self.assertEqual(asyncio.run(run()), [{'label': 'POSITIVE'}])
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cache.metrics()['hits'], 3)
+        self.assertEqual(cache.metrics()['misses'], 1)
+
+    def test_lru_bound_and_ttl(self):
+        cache = InferenceCache(max_entries=2, ttl=0)
+        for text in ("a", "b", "c"):
+            cache.put(InferenceCache.make_key(self.classifier, text, {}), text)
+        self.assertEqual(cache.metrics()['evictions'], 1)
+        hit, _ = cache.get(InferenceCache.make_key(self.classifier, "c", {}))
+        self.assertFalse(hit)  # ttl=0 expires immediately
+        self.assertEqual(cache.metrics()['expirations'], 1)
+
+    def test_sampling_bypasses_cache(self):
+        cache = InferenceCache()
+        async def run():
+            for _ in range(2):
+                await cache.get_or_compute(self.classifier, "x", {'do_sample': True}, self.compute)
+        asyncio.run(run())
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.metrics()['misses'], 0)
+
+    def test_text_generation_cached_only_when_greedy_is_explicit(self):
+        generator = ModelRegistry(loader=lambda task, model=None: None).acquire("text-generation", "gpt2")
+        self.assertFalse(is_cacheable(generator, {'max_length': 500}))  # GPT-2 samples by default
+        self.assertFalse(is_cacheable(generator, {'do_sample': True}))
+        self.assertTrue(is_cacheable(generator, {'do_sample': False}))
+        self.assertTrue(is_cacheable(self.classifier, {}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import asyncio
+import unittest
+from src.hyper_core.inference_queue import InferenceQueue
+
+class TestInferenceQueue(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        def model(inputs, max_length=50):
+            self.calls.append(list(inputs))
+            return [[{'generated_text': text[:max_length]}] for text in inputs]
+        self.queue = InferenceQueue(model, name='echo', batch_window=0.05)
+
+    def tearDown(self):
+        self.queue.close()
+
+    def test_concurrent_requests_share_a_batch(self):
+        async def run():
+            return await asyncio.gather(*(self.queue.submit(f"prompt {i}", max_length=8) for i in range(5)))
+        results = asyncio.run(run())
+        self.assertEqual(results[3], [{'generated_text': 'prompt 3'}])
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.queue.stats['largest_batch'], 5)
+
+    def test_different_params_run_separately(self):
+        async def run():
+            return await asyncio.gather(self.queue.submit("abcdef", max_length=2), self.queue.submit("abcdef", max_length=4))
+        short, long = asyncio.run(run())
+        self.assertEqual(short[0]['generated_text'], 'ab')
+        self.assertEqual(long[0]['generated_text'], 'abcd')
+        self.assertEqual(len(self.calls), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.hyper_core.journal import Journal
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = os.path.join(tempfile.mkdtemp(), 'events')
+
+    def test_list_like_reads_across_compressed_segments(self):
+        journal = Journal(self.directory, max_segment_bytes=512, memory_tail=4, flush_records=8)
+        for i in range(200):
+            journal.append({'seq': i})
+            if i % 10 == 9:
+                journal.flush()  # Rotation happens at flush boundaries
+        journal.close()
+        names = os.listdir(self.directory)
+        self.assertGreater(sum(name.endswith('.jsonl.gz') for name in names), 1)
+        self.assertEqual(len(journal), 200)
+        self.assertEqual(journal[-1], {'seq': 199})
+        self.assertEqual(journal[3], {'seq': 3})
+        self.assertEqual([r['seq'] for r in journal[95:105]], list(range(95, 105)))
+        self.assertEqual([r['seq'] for r in journal.tail(6)], list(range(194, 200)))
+        self.assertEqual([r['seq'] for r in journal], list(range(200)))
+
+    def test_recovery_resumes_and_drops_torn_record(self):
+        journal = Journal(self.directory)
+        for i in range(10):
+            journal.append({'seq': i})
+        journal.close()
+        active = [name for name in os.listdir(self.directory) if name.endswith('.jsonl')][0]
+        with open(os.path.join(self.directory, active), 'a') as f:
+            f.write('{"seq": 10')  # Process died mid-write
+        journal = Journal(self.directory)
+        self.assertEqual(len(journal), 10)
+        journal.append({'seq': 10})
+        journal.close()
+        self.assertEqual([r['seq'] for r in Journal(self.directory)], list(range(11)))
+
+    def test_legacy_array_is_imported_once(self):
+        legacy = os.path.join(os.path.dirname(self.directory), 'old_logs.json')
+        with open(legacy, 'w') as f:
+            json.dump([{'seq': 0}, {'seq': 1}], f)
+        journal = Journal(self.directory, legacy_path=legacy)
+        journal.close()
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual(list(Journal(self.directory, legacy_path=legacy)), [{'seq': 0}, {'seq': 1}])
+
+    def test_buffered_records_are_written_at_exit(self):
+        script = ("import sys; sys.path.insert(0, sys.argv[1]); from journal import Journal; "
+                  "journal = Journal(sys.argv[2], flush_interval=60); journal.append({'seq': 0}); sys.exit(0)")
+        core = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'hyper_core')
+        subprocess.run([sys.executable, '-c', script, core, self.directory], check=True)
+        self.assertEqual(list(Journal(self.directory)), [{'seq': 0}])
+
+if __name__ == '__main__':
+    unittest.main()
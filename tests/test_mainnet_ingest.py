@@ -0,0 +1,124 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from src.hyper_core.mainnet_ingest import BloomFilter, MainnetIngest, SeenIds
+from src.hyper_core.pi_mainnet_integration_real_time_synchronization import PiMainnetIntegrationRealTimeSynchronization
+
+class Mainnet:
+    """Stand-in mainnet API: numbered transactions, each page re-delivering the tail of the previous one."""
+    def __init__(self, head, overlap=3):
+        self.head = head
+        self.overlap = overlap
+
+    async def fetch(self, cursor, limit):
+        start = max((cursor or 0) - self.overlap, 0)
+        stop = min(start + limit, self.head)
+        page = [{'id': f'mainnet_{seq}', 'amount': seq} for seq in range(start, stop)]
+        return page, (stop if stop > (cursor or 0) else None)
+
+class TestMainnetIngest(unittest.TestCase):
+    def setUp(self):
+        self.cursor_path = os.path.join(tempfile.mkdtemp(), 'cursor.json')
+        self.filtered, self.stored, self.isolated = [], [], []
+
+    async def filter_tx(self, tx):
+        self.filtered.append(tx['id'])
+        return tx['amount'] % 5 != 0
+
+    async def persist(self, accepted, rejected):
+        self.stored.extend(tx['id'] for tx in accepted)
+        self.isolated.extend(tx['id'] for tx in rejected)
+
+    def make_ingest(self, **options):
+        return MainnetIngest(self.mainnet.fetch, self.filter_tx, self.persist, self.cursor_path, page_size=10, **options)
+
+    def test_overlapping_pages_are_filtered_once(self):
+        self.mainnet = Mainnet(95)
+        metrics = asyncio.run(self.make_ingest().sync())
+        self.assertEqual(sorted(self.filtered), sorted(f'mainnet_{seq}' for seq in range(95)))
+        self.assertEqual(len(self.stored) + len(self.isolated), 95)
+        self.assertEqual(len(self.isolated), 19)
+        self.assertGreater(metrics['duplicates'], 0)
+        self.assertEqual(metrics['committed'], 76)
+
+    def test_restart_resumes_from_persisted_cursor(self):
+        self.mainnet = Mainnet(40)
+        asyncio.run(self.make_ingest().sync())
+        self.mainnet.head = 60
+        self.filtered.clear()
+        restarted = self.make_ingest(seed_ids=self.stored + self.isolated)  # Ids recovered from the store
+        self.assertIsNotNone(restarted.cursor)
+        asyncio.run(restarted.sync())
+        self.assertEqual(sorted(self.filtered), sorted(f'mainnet_{seq}' for seq in range(40, 60)))
+
+    def test_failed_persist_leaves_page_for_retry(self):
+        self.mainnet = Mainnet(10)
+        ingest = self.make_ingest()
+
+        async def broken(accepted, rejected):
+            raise IOError('store offline')
+
+        ingest.persist = broken
+        with self.assertRaises(IOError):
+            asyncio.run(ingest.sync())
+        ingest.persist = self.persist
+        asyncio.run(ingest.sync())
+        self.assertEqual(len(self.stored) + len(self.isolated), 10)
+
+    def test_seen_ids_bloom_and_exact_window(self):
+        seen = SeenIds(capacity=1000, exact_entries=2, confirm=lambda item: item == 'a')
+        for item in 'abc':
+            seen.add(item)
+        self.assertTrue(seen.seen('c'))
+        self.assertTrue(seen.seen('a'))  # Aged out of the exact window; confirmed by the store
+        self.assertFalse(seen.seen('z'))
+        bloom = BloomFilter(capacity=10000, error_rate=0.01)
+        for i in range(10000):
+            bloom.add(f'id_{i}')
+        false_positives = sum(f'other_{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+class Ledger(list):
+    """Stand-in for the stablecoin transaction log."""
+    def recent(self, limit):
+        return self[-limit:]
+
+class PiManager:
+    """Stand-in for the stablecoin manager."""
+    def __init__(self):
+        self.transactions = Ledger()
+
+class PurityEnforcer:
+    """Stand-in for the purity enforcer's batch isolation."""
+    async def _isolate_tainted_batch(self, tainted):
+        pass
+
+class AHI:
+    """Stand-in for the AHI AI transaction filter."""
+    async def filter_transaction(self, tx):
+        return True
+
+class Guardian:
+    """Stand-in for the guardian, which owns the purity enforcer."""
+    purity_enforcer = PurityEnforcer()
+
+class TestMainnetSyncSeeding(unittest.TestCase):
+    def make_sync(self, directory, pi_manager):
+        return PiMainnetIntegrationRealTimeSynchronization(AHI(), pi_manager, None, None, Guardian(), None, journal_dir=directory,
+                                                           cursor_path=os.path.join(directory, 'cursor.json'))
+
+    def test_restart_seeds_stored_and_rejected_ids(self):
+        directory, pi_manager = tempfile.mkdtemp(), PiManager()
+        sync = self.make_sync(directory, pi_manager)
+        asyncio.run(sync._persist_mainnet_batch([{'id': 'mainnet_1'}], [{'id': 'mainnet_2'}]))
+        sync.rejected_ids.close()
+        sync.sync_logs.close()
+        restarted = self.make_sync(directory, pi_manager)
+        ingest = restarted._build_ingest(os.path.join(directory, 'cursor.json'))
+        self.assertTrue(ingest.seen.seen('mainnet_1'))
+        self.assertTrue(ingest.seen.seen('mainnet_2'))  # Rejected ids are never stored, but still not re-filtered
+        self.assertFalse(ingest.seen.seen('mainnet_3'))
+
+if __name__ == '__main__':
+    unittest.main()
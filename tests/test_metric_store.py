@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+from src.hyper_core.metric_store import MetricStore, RingBuffer
+
+class TestMetricStore(unittest.TestCase):
+    def test_ring_buffer_wraps_with_zero_copy_views(self):
+        ring = RingBuffer(4)
+        for value in range(10):
+            ring.append(value)
+        window = ring.view()
+        self.assertEqual(window[:, 0].tolist(), [6, 7, 8, 9])
+        self.assertTrue(np.shares_memory(window, ring._data))
+        self.assertEqual(ring.view(2)[:, 0].tolist(), [8, 9])
+
+    def test_list_style_access_and_since_window(self):
+        store = MetricStore(['pi_transactions'], raw_capacity=100)
+        for i in range(150):
+            store.record('pi_transactions', i, 1000.0 + i)
+        self.assertEqual(len(store['pi_transactions']), 100)
+        self.assertEqual(store['pi_transactions'][-10:].sum(), sum(range(140, 150)))
+        self.assertEqual(len(store.window('pi_transactions', since=1140.0)), 10)
+
+    def test_downsampled_tiers(self):
+        store = MetricStore(['load'], raw_capacity=30)
+        for second in range(0, 7200, 10):  # Raw keeps 5 minutes, so hours roll up from minutes
+            store.record('load', second % 60, float(second))
+        store.record('load', 0.0, 7200.0)  # Closes the second hour
+        minutes = store.aggregates('load', '1m')
+        self.assertEqual(minutes['count'][-1], 6)
+        self.assertEqual(minutes['max'][-1], 50)
+        self.assertAlmostEqual(minutes['mean'][-1], 25)
+        hours = store.aggregates('load', '1h')
+        self.assertEqual(hours['timestamp'].tolist(), [0.0, 3600.0])
+        self.assertEqual(hours['count'][-1], 360)
+        self.assertAlmostEqual(hours['mean'][-1], 25)
+        self.assertEqual(hours['min'][-1], 0)
+
+if __name__ == '__main__':
+    unittest.main()
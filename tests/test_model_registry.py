@@ -0,0 +1,36 @@
+import unittest
+from src.hyper_core.model_registry import ModelRegistry
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.builds = []
+        def loader(task, model=None):
+            self.builds.append((task, model))
+            return lambda prompt, **kwargs: [{'generated_text': f"{model}: {prompt}"}]
+        self.registry = ModelRegistry(loader=loader)
+
+    def test_holders_share_one_instance(self):
+        first = self.registry.acquire("text-generation", "gpt2")
+        second = self.registry.acquire("text-generation", "gpt2")
+        self.assertEqual(first("PI")[0]['generated_text'], "gpt2: PI")
+        second("PI")
+        self.assertEqual(self.builds, [("text-generation", "gpt2")])
+        report = self.registry.memory_report()
+        self.assertEqual(report['models'][0]['holders'], 2)
+        self.assertEqual(report['saved_mb'], report['models'][0]['size_mb'])
+
+    def test_idle_eviction_reloads_on_next_use(self):
+        handle = self.registry.acquire("text-generation", "gpt2")
+        handle("PI")
+        self.assertEqual(len(self.registry.evict_idle(0)), 1)
+        handle("PI")
+        self.assertEqual(len(self.builds), 2)
+
+    def test_release_unloads_last_holder(self):
+        handle = self.registry.acquire("text-classification", "roberta")
+        handle.release()
+        handle.release()
+        self.assertEqual(self.registry.memory_report()['models'], [])
+
+if __name__ == '__main__':
+    unittest.main()
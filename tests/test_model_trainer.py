@@ -0,0 +1,41 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.hyper_core.model_trainer import BackgroundTrainer
+
+SPEC = ('sklearn.ensemble', 'RandomForestRegressor', {'n_estimators': 5, 'random_state': 0})
+
+class TestBackgroundTrainer(unittest.TestCase):
+    def setUp(self):
+        self.model_dir = tempfile.mkdtemp()
+        self.trainer = BackgroundTrainer(self.model_dir, SPEC, min_samples=5, keep_versions=2)
+
+    def tearDown(self):
+        self.trainer.close()
+
+    def test_predict_waits_for_first_model(self):
+        self.assertIsNone(self.trainer.predict([1, 2, 3]))
+        self.assertFalse(self.trainer.ready())
+        self.assertIsNone(asyncio.run(self.trainer.retrain()))  # Not enough samples yet
+        self.assertEqual(os.listdir(self.model_dir), [])
+
+    def test_retrain_versions_prunes_and_reloads(self):
+        rng = np.random.default_rng(0)
+        for row in rng.uniform(0, 10, (20, 3)):
+            self.trainer.add_sample(row, row.sum())
+
+        async def retrain_three_times():
+            return [await self.trainer.retrain() for _ in range(3)]
+
+        self.assertEqual(asyncio.run(retrain_three_times()), [1, 2, 3])
+        self.assertEqual(sorted(os.listdir(self.model_dir)), ['model-000002.joblib', 'model-000003.joblib'])
+        prediction = self.trainer.predict([5, 5, 5])
+        self.assertIsNotNone(prediction)
+        restarted = BackgroundTrainer(self.model_dir, SPEC)  # A restart serves the latest version without refitting
+        self.assertEqual(restarted.predict([5, 5, 5]), prediction)
+        self.assertEqual(restarted.version, 3)
+
+if __name__ == '__main__':
+    unittest.main()
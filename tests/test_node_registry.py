@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+from src.hyper_core.node_registry import NodeRegistry
+
+class TestNodeRegistry(unittest.TestCase):
+    def test_add_remove_keep_rows_and_aggregates_consistent(self):
+        registry = NodeRegistry(capacity=2)
+        for i in range(10):
+            registry.add(f'node_{i}', status='syncing', pi_balance=float(i))
+        registry.update('node_3', status='active', pi_balance=30.0)
+        self.assertTrue(registry.remove('node_0'))  # Last row moves into slot 0
+        self.assertFalse(registry.remove('node_0'))
+        del registry['node_5']
+        self.assertEqual(len(registry), 8)
+        self.assertEqual(registry['node_9']['pi_balance'], 9.0)
+        self.assertEqual(registry['node_3']['status'], 'active')
+        self.assertEqual(registry.sum('pi_balance'), sum([1, 2, 30, 4, 6, 7, 8, 9]))
+        self.assertEqual(registry.sum('pi_balance'), float(registry.column('pi_balance').sum()))
+        self.assertEqual(registry.status_counts(), {'syncing': 7, 'active': 1, 'isolated': 0})
+        self.assertEqual(sorted(registry), sorted(f'node_{i}' for i in (1, 2, 3, 4, 6, 7, 8, 9)))
+
+    def test_bulk_writes_and_mapping_compatibility(self):
+        registry = NodeRegistry()
+        registry.add_many([f'node_{i}' for i in range(1000)], status='active', intelligence_score=np.linspace(0, 1, 1000))
+        self.assertAlmostEqual(registry.mean('intelligence_score'), 0.5, places=5)
+        registry.set_column('pi_balance', 2.0)
+        registry['node_extra'] = {'status': 'syncing', 'pi_balance': 10.0}
+        self.assertEqual(registry.sum('pi_balance'), 2010.0)
+        self.assertEqual(registry.pop('node_extra')['pi_balance'], 10.0)
+        self.assertIsNone(registry.pop('node_extra'))
+        for node_id in registry:  # Iterating a snapshot allows removal
+            if node_id.endswith('7'):
+                registry.remove(node_id)
+        self.assertEqual(len(registry), 900)
+        self.assertNotIn('node_7', registry)
+        with self.assertRaises(KeyError):
+            registry.add_many(['node_1'])
+        registry.clear()
+        self.assertEqual((len(registry), registry.sum('pi_balance')), (0, 0.0))
+
+    def test_rejected_bulk_add_leaves_registry_unchanged(self):
+        registry = NodeRegistry()
+        registry.add('a', pi_balance=1.0)
+        for node_ids in (['b', 'a'], ['b', 'b']):
+            with self.assertRaises(KeyError):
+                registry.add_many(node_ids, pi_balance=5.0)
+            self.assertNotIn('b', registry)
+            self.assertEqual((len(registry), registry.sum('pi_balance')), (1, 1.0))
+        registry.add('c', pi_balance=2.0)
+        self.assertEqual((registry['a']['pi_balance'], registry['c']['pi_balance']), (1.0, 2.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+from src.hyper_core.pi_purity_accountability_enforcer import PIPurityAccountabilityEnforcer
+
+class Hardware:
+    """Stand-in for the purity LED and buzzer."""
+    def on(self):
+        pass
+
+    def off(self):
+        pass
+
+    def beep(self, **kwargs):
+        pass
+
+class AHIAI:
+    def __init__(self):
+        self.filtered = []
+
+    async def filter_transaction(self, transaction):
+        self.filtered.append(transaction)
+        return transaction.get('amount', 0) < 1000
+
+class Security:
+    def __init__(self):
+        self.batches = []
+
+    async def secure_pi_transactions(self, transactions):
+        self.batches.append(transactions)
+        return len(transactions)
+
+class PIManager:
+    def __init__(self):
+        self.transactions = []
+
+class TestPurityBatch(unittest.TestCase):
+    def setUp(self):
+        self.ahi_ai, self.security, self.pi_manager = AHIAI(), Security(), PIManager()
+        self.enforcer = PIPurityAccountabilityEnforcer(self.ahi_ai, self.pi_manager, self.security, None)
+        self.enforcer.purity_led = self.enforcer.alert_buzzer = Hardware()
+        self.quantum_jobs = []
+        self.enforcer._quantum_verify_purity_batch = lambda count: self.quantum_jobs.append(count) or [True] * count
+
+    def test_batch_verdicts_dedupe_and_isolate_once(self):
+        batch = [
+            {'id': 'a', 'source': 'mining', 'amount': 5},
+            {'amount': 5, 'source': 'mining', 'id': 'a'},  # Same transaction, different key order
+            {'id': 'b', 'source': 'bought_exchange', 'amount': 200},
+            {'id': 'c', 'source': 'p2p', 'amount': 5000}
+        ]
+        verdicts = asyncio.run(self.enforcer.enforce_pi_purity_batch(batch))
+        self.assertEqual(verdicts, [True, True, False, False])
+        self.assertEqual(len(self.ahi_ai.filtered), 2)
+        self.assertEqual(self.quantum_jobs, [1])  # Only 'a' reaches the quantum check
+        self.assertEqual([[tx['id'] for tx in b] for b in self.security.batches], [['isolate_b']])
+        self.assertEqual(self.enforcer.frozen_pi_supply, 200)
+
+    def test_reaudit_is_served_from_verdict_cache(self):
+        batch = [{'id': 'a', 'source': 'mining', 'amount': 5}, {'id': 'b', 'source': 'exchange', 'amount': 200}]
+        asyncio.run(self.enforcer.enforce_pi_purity_batch(batch))
+        self.assertFalse(asyncio.run(self.enforcer.enforce_pi_purity(dict(batch[1]))))
+        self.assertTrue(asyncio.run(self.enforcer.enforce_pi_purity(dict(batch[0]))))
+        self.assertEqual(len(self.ahi_ai.filtered), 1)
+        self.assertEqual(len(self.security.batches), 1)  # Tainted PI is not frozen twice
+        self.assertEqual(self.enforcer.verdict_cache.metrics()['hits'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from src.hyper_core.pi_stablecoin_manager import PIStablecoinManager
 from src.hyper_core.ahi_ai_core import AutonomousHyperIntelligenceAI
@@ -5,11 +7,31 @@ from src.hyper_core.ahi_ai_core import AutonomousHyperIntelligenceAI
 class TestPIStablecoinManager(unittest.TestCase):
     def setUp(self):
         self.ahi_ai = AutonomousHyperIntelligenceAI(pi_client=None, stellar_server=None)
-        self.pi_manager = PIStablecoinManager(self.ahi_ai)
+        self.pi_manager = self._manager(tempfile.mkdtemp())  # Keep the default wallet and ledger files out of the repo
+
+    def _manager(self, directory):
+        return PIStablecoinManager(self.ahi_ai, wallet_path=os.path.join(directory, 'wallet.json'),
+                                   ledger_path=os.path.join(directory, 'tx.wal'), snapshot_path=os.path.join(directory, 'tx.json'))
 
     def test_stablecoin_only(self):
         balance = self.pi_manager.get_balance()
         self.assertIsInstance(balance, int)
 
+    def test_balance_index_matches_full_scan(self):
+        directory = tempfile.mkdtemp()
+        manager = self._manager(directory)
+        me = manager.account_id
+        manager.record_transaction({'sender': 'alice', 'recipient': me, 'amount': 300})
+        manager.record_transaction({'sender': me, 'recipient': 'bob', 'amount': 120})
+        manager.transactions.append({'sender': 'bob', 'recipient': 'alice', 'amount': 20})  # Appended by another module
+        self.assertEqual(manager.get_balance(), 180)
+        self.assertEqual(manager.get_balance('bob'), 100)
+        self.assertEqual(manager.get_balance('alice'), -280)
+        self.assertEqual(manager.verify_balance_index(), {})
+        manager.store.close()
+        reloaded = self._manager(directory)
+        self.assertEqual(reloaded.get_balance('bob'), 100)
+        self.assertEqual(reloaded.verify_balance_index(), {})
+
 if __name__ == '__main__':
     unittest.main()
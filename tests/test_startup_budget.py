@@ -0,0 +1,27 @@
+import unittest
+from src.hyper_core.startup_profiler import HyperCoreStartupProfiler, HEAVY_DEPENDENCIES
+from src.hyper_core.lazy_loader import LazyObject, is_loaded, lazy_from
+
+class TestStartupBudget(unittest.TestCase):
+    def test_modules_import_within_budget(self):
+        profiler = HyperCoreStartupProfiler()
+        profiler.profile()
+        self.assertEqual(profiler.violations(), [])
+
+    def test_lazy_object_builds_on_first_use(self):
+        calls = []
+        lazy = LazyObject(lambda: calls.append('built') or {'pi': 314159})
+        self.assertFalse(is_loaded(lazy))
+        self.assertEqual(lazy['pi'], 314159)
+        self.assertEqual(lazy['pi'], 314159)
+        self.assertEqual(calls, ['built'])
+
+    def test_lazy_from_defers_import(self):
+        pipeline = lazy_from('transformers', 'pipeline')
+        generator = LazyObject(pipeline, "text-generation", model="gpt2")
+        self.assertFalse(is_loaded(pipeline))
+        self.assertFalse(is_loaded(generator))
+        self.assertIn('transformers', HEAVY_DEPENDENCIES)
+
+if __name__ == '__main__':
+    unittest.main()
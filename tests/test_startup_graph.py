@@ -0,0 +1,90 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.hyper_core.master_control_final_integration_script import MasterControlFinalIntegrationScript
+from src.hyper_core.startup_graph import StartupGraph
+
+class TestStartupGraph(unittest.TestCase):
+    def test_independent_modules_overlap_and_trace_is_written(self):
+        graph = StartupGraph(max_workers=4)
+        running, peak = [], []
+        lock = threading.Lock()
+
+        def slow(value):
+            def factory(*deps):
+                with lock:
+                    running.append(value)
+                    peak.append(len(running))
+                time.sleep(0.05)
+                with lock:
+                    running.remove(value)
+                return (value, deps)
+            return factory
+
+        graph.add('config', slow('config'), depends_on=['client'])
+        graph.add('keys', slow('keys'))
+        graph.add('ledger', slow('ledger'))
+        graph.add('hub', slow('hub'), depends_on=['keys', 'ledger', 'config'])
+        modules = asyncio.run(graph.initialize({'client': 'pi_client'}))
+        self.assertEqual(modules['config'], ('config', ('pi_client',)))
+        self.assertEqual(modules['hub'][1], (modules['keys'], modules['ledger'], modules['config']))
+        self.assertEqual(max(peak), 3)
+        path = os.path.join(tempfile.mkdtemp(), 'startup_trace.json')
+        report = graph.write_trace(path)
+        with open(path) as f:
+            self.assertEqual(json.load(f)['critical_path'], report['critical_path'])
+        self.assertEqual(report['critical_path'][-1], 'hub')
+        self.assertLess(report['total_seconds'], report['sequential_seconds'])
+
+    def test_validation_and_failure(self):
+        graph = StartupGraph()
+        graph.add('a', lambda b: b, depends_on=['b'])
+        graph.add('b', lambda a: a, depends_on=['a'])
+        with self.assertRaisesRegex(ValueError, 'cycle'):
+            graph.order()
+        graph = StartupGraph()
+        graph.add('a', lambda missing: None, depends_on=['missing'])
+        with self.assertRaisesRegex(ValueError, 'undeclared'):
+            asyncio.run(graph.initialize())
+        graph = StartupGraph()
+        built = []
+        graph.add('broken', lambda: 1 / 0)
+        graph.add('dependent', lambda broken: built.append(broken), depends_on=['broken'])
+        with self.assertRaises(ZeroDivisionError):
+            asyncio.run(graph.initialize())
+        self.assertEqual(built, [])
+        self.assertIn('ZeroDivisionError', graph.trace[0]['error'])
+
+class Hardware:
+    """Stand-in for the master RGB LED and buzzer."""
+    color = (0, 0, 0)
+
+    def beep(self, **kwargs):
+        self.beeped = kwargs
+
+class Core:
+    """Stand-in for the integration core."""
+    reborn = False
+
+    def _trigger_system_rebirth(self):
+        self.reborn = True
+
+class TestMasterControlHalt(unittest.TestCase):
+    def test_halt_signals_and_triggers_rebirth(self):
+        master = MasterControlFinalIntegrationScript()
+        master.master_rgb, master.alert_buzzer = Hardware(), Hardware()
+        master.modules = {'core': Core()}
+        master.ecosystem_active = True
+        with self.assertRaises(SystemExit):
+            asyncio.run(master._halt_ecosystem('test halt'))
+        self.assertFalse(master.ecosystem_active)
+        self.assertEqual(master.master_rgb.color, (1, 0, 0))
+        self.assertEqual(master.alert_buzzer.beeped['n'], 10)
+        self.assertTrue(master.modules['core'].reborn)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import time
+import unittest
+import numpy as np
+from src.hyper_core.streaming_anomaly import StreamingAnomalyDetector
+
+class ThresholdModel:
+    """Stand-in model: flags values above the training maximum."""
+    def fit(self, window):
+        self.limit = window.max()
+        return self
+
+    def predict(self, rows):
+        return [-1 if row[0] > self.limit else 1 for row in rows]
+
+class TestStreamingAnomalyDetector(unittest.TestCase):
+    def test_spike_is_flagged_and_ages_out(self):
+        detector = StreamingAnomalyDetector(recent=3)
+        for value in np.random.default_rng(7).normal(100, 2, 200):
+            detector.update('pi_transactions', value)
+        detector._series['pi_transactions'].flags.clear()
+        self.assertTrue(detector.update('pi_transactions', 160))
+        self.assertEqual(detector.anomalous_series(), ['pi_transactions'])
+        for _ in range(3):
+            detector.update('pi_transactions', 100)
+        self.assertFalse(detector.is_anomalous('pi_transactions'))
+
+    def test_background_retrain_swaps_model(self):
+        detector = StreamingAnomalyDetector(threshold=1e9, model_factory=ThresholdModel, retrain_every=20, history=20)
+        for value in range(20):
+            detector.update('load', float(value % 10))
+        deadline = time.time() + 2
+        while detector.stats['retrains'] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        detector.close()
+        self.assertTrue(detector.update('load', 11.0))
+        self.assertFalse(detector.update('load', 5.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.hyper_core.global_decentralized_ai_swarm_intelligence_hub import GlobalDecentralizedAISwarmIntelligenceHub, consensus_prompt, tally_votes
+from src.hyper_core.node_registry import NodeRegistry
+
+class Hardware:
+    """Stand-in for the RGB LED."""
+    color = None
+
+class Optimizer:
+    """Stand-in for the predictive maintenance optimizer."""
+    def __init__(self):
+        self.runs = 0
+
+    async def _perform_predictive_maintenance(self):
+        self.runs += 1
+
+class TestSwarmConsensus(unittest.TestCase):
+    def setUp(self):
+        self.prompts = []
+
+        def model(inputs, max_new_tokens=30):
+            self.prompts.extend(inputs)
+            return [[{'generated_text': text}] for text in inputs]
+
+        self.hub = GlobalDecentralizedAISwarmIntelligenceHub(None, None, None, None, None, None, None,
+                                                             journal_dir=tempfile.mkdtemp(), consensus_backoff=0.001)
+        self.hub.rgb_led = Hardware()
+        self.hub.swarm_intelligence = model
+        self.hub.swarm_nodes = NodeRegistry()
+        self.hub.swarm_nodes.add_many([f'node_{i}' for i in range(50000)], status='active', intelligence_score=1.0)
+
+    def test_weighted_tally_and_fixed_size_prompt(self):
+        tally = tally_votes(np.array([0, 1, 1, 2]), np.array([3.0, 1.0, 1.0, 0.5]))
+        self.assertEqual(tally['counts'], {'Approve': 1, 'Reject': 2, 'Optimize': 1})
+        self.assertEqual(tally['winner'], 'Approve')
+        self.assertLess(len(consensus_prompt('x' * 10000, tally)), 400)
+
+    def test_retries_are_bounded_and_model_runs_once(self):
+        validations = iter([0.1, 0.2, 0.9])
+        self.hub._run_quantum_consensus = lambda: next(validations)
+        decision = asyncio.run(self.hub.swarm_consensus_decision("Optimize PI transactions"))
+        self.assertIn('Votes from 50000 nodes', decision)
+        self.assertEqual(len(self.prompts), 1)
+        self.assertEqual(self.hub.last_consensus['attempts'], 3)
+        self.assertEqual(len(self.hub.swarm_consensus_logs), 1)
+
+    def test_gives_up_without_model_call(self):
+        self.hub._run_quantum_consensus = lambda: 0.0
+        self.assertEqual(asyncio.run(self.hub.swarm_consensus_decision("Expand")), '')
+        self.assertEqual(self.prompts, [])
+        self.assertFalse(self.hub.last_consensus['validated'])
+        self.assertEqual(self.hub.last_consensus['attempts'], self.hub.consensus_attempts)
+
+    def test_rejections_and_optimization_follow_the_tally(self):
+        self.hub._run_quantum_consensus = lambda: 0.9
+        self.hub.optimizer = Optimizer()
+        self.hub._collect_votes = lambda: tally_votes(np.array([0, 2, 2]), np.ones(3))  # Optimize wins
+        asyncio.run(self.hub.swarm_consensus_decision("Optimize PI transactions"))
+        self.assertIn('Reject', self.prompts[-1])  # Every option is named in the prompt the model echoes
+        self.assertEqual(self.hub.gambling_rejections, 0)
+
+        async def one_optimization_pass():
+            task = asyncio.create_task(self.hub.swarm_optimize_ecosystem())
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        asyncio.run(one_optimization_pass())
+        self.assertEqual(self.hub.optimizer.runs, 1)
+        self.hub._collect_votes = lambda: tally_votes(np.array([1, 1, 0]), np.ones(3))  # Reject wins
+        asyncio.run(self.hub.swarm_consensus_decision("Reject gambling"))
+        self.assertEqual(self.hub.gambling_rejections, 1)
+
+    def test_nodes_added_after_initialization_do_not_vote(self):
+        self.hub.swarm_nodes = NodeRegistry()
+        self.hub.swarm_nodes.add_many(['a', 'b'], status='syncing')
+        asyncio.run(self.hub.initialize_swarm_nodes())
+        self.hub.swarm_nodes.add('c', status='syncing', pi_balance=5.0)  # Registered by the expansion module later
+        self.assertEqual(self.hub._collect_votes()['nodes'], 2)
+        self.hub.mainnet_sync = type('Sync', (), {'mainnet_status': 'Open'})()
+        cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())  # The dashboard is written to the working directory
+        try:
+            dashboard = asyncio.run(self.hub.generate_swarm_dashboard())
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(dashboard['active_nodes'], 2)
+        self.assertGreaterEqual(dashboard['average_intelligence'], 0.8)
+
+if __name__ == '__main__':
+    unittest.main()
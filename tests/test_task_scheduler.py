@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import unittest
+from src.hyper_core.task_scheduler import RuntimeHistogram, Scheduler
+
+class FakeButton:
+    when_pressed = None
+
+    def press(self):
+        threading.Thread(target=self.when_pressed).start()  # gpiozero fires callbacks from its own thread
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Scheduler()
+
+    def test_periodic_job_stops_when_it_returns_false(self):
+        runs = []
+
+        async def scenario():
+            job = self.scheduler.every('countdown', 0.01, lambda: runs.append(1) or len(runs) < 3, jitter=0.5)
+            await asyncio.wait_for(job.finished.wait(), 2)
+
+        asyncio.run(scenario())
+        self.assertEqual(len(runs), 3)
+        self.assertEqual(self.scheduler.report()[0]['runs'], 3)
+
+    def test_first_run_is_immediate_despite_jitter(self):
+        async def scenario():
+            job = self.scheduler.every('hourly', 3600, lambda: False, jitter=0.5)
+            await asyncio.wait_for(job.finished.wait(), 1)
+
+        asyncio.run(scenario())
+        self.assertEqual(self.scheduler.report()[0]['runs'], 1)
+
+    def test_overlap_skip_and_deadline(self):
+        async def scenario():
+            slow = self.scheduler.every('slow', 0.01, asyncio.sleep, 0.05, jitter=0)
+            bounded = self.scheduler.every('bounded', 0.02, asyncio.sleep, 1, deadline=0.01, jitter=0)
+            await asyncio.sleep(0.2)
+            self.scheduler.close()
+            return slow, bounded
+
+        slow, bounded = asyncio.run(scenario())
+        self.assertGreater(slow.stats['skipped'], 0)
+        self.assertLessEqual(slow.histogram.count, 5)
+        self.assertGreater(bounded.stats['timeouts'], 0)
+        self.assertEqual(bounded.stats['failures'], 0)
+
+    def test_running_job_task_is_referenced_until_done(self):
+        async def scenario():
+            release = asyncio.Event()
+            job = self.scheduler.every('waits', 3600, release.wait)
+            await asyncio.sleep(0.01)
+            in_flight = len(job.tasks)
+            release.set()
+            await asyncio.sleep(0.01)
+            self.scheduler.close()
+            return in_flight, len(job.tasks)
+
+        self.assertEqual(asyncio.run(scenario()), (1, 0))
+
+    def test_button_press_runs_callback_on_the_loop(self):
+        button, presses = FakeButton(), []
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+
+            async def handler():
+                presses.append(asyncio.get_running_loop() is loop)
+
+            job = self.scheduler.on_press('button', button, handler, once=True)
+            button.press()
+            await asyncio.wait_for(job.finished.wait(), 2)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(scenario())
+        self.assertEqual(presses, [True])
+        self.assertIsNone(button.when_pressed)  # once=True detaches the callback
+
+    def test_histogram_quantiles(self):
+        histogram = RuntimeHistogram()
+        for seconds in [0.001] * 95 + [2.0] * 5:
+            histogram.observe(seconds)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.001)
+        self.assertEqual(histogram.quantile(1.0), 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from src.hyper_core.transaction_ledger import TransactionLedger
+
+class TestTransactionLedger(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.wal = os.path.join(self.dir, 'tx.wal')
+        self.snapshot = os.path.join(self.dir, 'tx.json')
+
+    def open_ledger(self, **kwargs):
+        ledger = TransactionLedger(self.wal, self.snapshot, **kwargs)
+        return ledger, ledger.recover()
+
+    def test_recovery_replays_wal(self):
+        ledger, records = self.open_ledger()
+        txs = [{'recipient': f"r{i}", 'amount': i} for i in range(5)]
+        records.extend(txs)
+        ledger.append(txs)
+        ledger.close()
+        _, recovered = self.open_ledger()
+        self.assertEqual(recovered, txs)
+
+    def test_torn_tail_is_discarded(self):
+        ledger, _ = self.open_ledger()
+        ledger.append([{'amount': 1}, {'amount': 2}])
+        ledger.close()
+        with open(self.wal, 'r+b') as f:
+            f.truncate(os.path.getsize(self.wal) - 3)  # Crash mid-record
+        reopened, recovered = self.open_ledger()
+        self.assertEqual(recovered, [{'amount': 1}])
+        reopened.append([{'amount': 3}])
+        reopened.close()
+        self.assertEqual(self.open_ledger()[1], [{'amount': 1}, {'amount': 3}])
+
+    def test_compaction_folds_wal_into_snapshot(self):
+        ledger, records = self.open_ledger(compact_every=3)
+        for i in range(4):
+            records.append({'amount': i})
+            ledger.append(records[-1:])
+            if ledger.needs_compaction():
+                ledger.compact(records)
+        ledger.close()
+        self.assertEqual(ledger.stats['compactions'], 1)
+        self.assertEqual(self.open_ledger()[1], [{'amount': i} for i in range(4)])
+
+if __name__ == '__main__':
+    unittest.main()
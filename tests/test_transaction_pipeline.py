@@ -0,0 +1,89 @@
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+from src.hyper_core.pi_stablecoin_manager import PIStablecoinManager
+
+class JitteryFilter:
+    """Validates out of order (random delays) and rejects every fifth amount."""
+    async def filter_transaction(self, tx):
+        await asyncio.sleep(random.random() / 1000)
+        return tx['amount'] % 5 != 0
+
+class FakeLED:
+    def on(self): pass
+    def off(self): pass
+    def blink(self, **kwargs): pass
+
+class TestTransactionPipeline(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.manager = PIStablecoinManager(JitteryFilter(), wallet_path=os.path.join(directory, 'wallet.json'),
+                                           ledger_path=os.path.join(directory, 'tx.wal'), snapshot_path=os.path.join(directory, 'tx.json'))
+        self.manager.pi_led = FakeLED()
+
+    def test_bulk_submission_keeps_order_and_group_commits(self):
+        async def run():
+            txs = [self.manager._build_transaction(f"c{i}", i, 'mining') for i in range(1, 301)]
+            results = await self.manager.pipeline.submit_many(txs)
+            await self.manager.pipeline.close()
+            return results
+        results = asyncio.run(run())
+        self.assertEqual([r is None for r in results], [i % 5 == 0 for i in range(1, 301)])
+        persisted = [tx['amount'] for tx in self.manager.transactions]
+        self.assertEqual(persisted, [i for i in range(1, 301) if i % 5 != 0])
+        self.assertTrue(all(self.manager.verify_transaction(tx) for tx in self.manager.transactions))
+        self.assertLess(self.manager.pipeline.stats['group_commits'], 240)
+        self.assertEqual(self.manager.get_balance('c7'), 7)
+
+    def test_pending_confirmation_does_not_block_other_submissions(self):
+        pressed = asyncio.Event()
+
+        async def wait_for_button():
+            await pressed.wait()
+
+        self.manager._wait_for_confirmation = wait_for_button
+
+        async def run():
+            high_value = [asyncio.create_task(self.manager.create_pi_transaction(f"whale{i}", 5001, 'mining')) for i in range(9)]
+            await asyncio.sleep(0.01)
+            rewards = await asyncio.wait_for(self.manager.distribute_rewards_bulk([f"c{i}" for i in range(1, 21)], 'mining', amount=7), 5)
+            waiting = not any(task.done() for task in high_value)
+            pressed.set()
+            confirmed = await asyncio.wait_for(asyncio.gather(*high_value), 5)
+            await self.manager.pipeline.close()
+            return rewards, waiting, confirmed
+        rewards, waiting, confirmed = asyncio.run(run())
+        self.assertTrue(waiting)
+        self.assertTrue(all(rewards))
+        self.assertTrue(all(confirmed))
+        self.assertEqual(sorted(tx['recipient'] for tx in self.manager.transactions[-9:]), [f"whale{i}" for i in range(9)])  # Committed after the rewards
+
+    def test_bulk_submission_does_not_wait_behind_a_confirmation(self):
+        pressed = asyncio.Event()
+
+        async def wait_for_button():
+            await pressed.wait()
+
+        self.manager._wait_for_confirmation = wait_for_button
+
+        async def run():
+            txs = [self.manager._build_transaction('whale', 5001, 'mining')]
+            txs += [self.manager._build_transaction(f"c{i}", i, 'mining') for i in range(1, 5)]
+            bulk = asyncio.create_task(self.manager.pipeline.submit_many(txs))
+            for _ in range(500):
+                if len(self.manager.transactions) == 4:
+                    break
+                await asyncio.sleep(0.01)
+            committed_first = [tx['recipient'] for tx in self.manager.transactions]
+            pressed.set()
+            results = await asyncio.wait_for(bulk, 5)
+            await self.manager.pipeline.close()
+            return committed_first, results
+        committed_first, results = asyncio.run(run())
+        self.assertEqual(committed_first, [f"c{i}" for i in range(1, 5)])
+        self.assertEqual([result['recipient'] for result in results], ['whale'] + [f"c{i}" for i in range(1, 5)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import asyncio
+import unittest
+from src.hyper_core.transaction_signer import Ed25519Signer, encode_transaction, load_signer, sign_batch, verify_ed25519
+
+class TestTransactionSigner(unittest.TestCase):
+    def setUp(self):
+        self.signer = Ed25519Signer()
+        self.tx = {'sender': self.signer.public_id, 'recipient': 'bob', 'amount': 50, 'currency': 'PI', 'value': 314159, 'source': 'p2p', 'timestamp': 1.5}
+
+    def test_encoding_is_canonical(self):
+        reordered = dict(reversed(list(self.tx.items())))
+        self.assertEqual(encode_transaction(self.tx), encode_transaction({**reordered, 'signature': 'ignored'}))
+        self.assertNotEqual(encode_transaction(self.tx), encode_transaction({**self.tx, 'amount': 51}))
+
+    def test_sign_verify_and_reload(self):
+        message = encode_transaction(self.tx)
+        signature = self.signer.sign(message)
+        self.assertTrue(verify_ed25519(self.signer.public_id, message, signature))
+        self.assertFalse(verify_ed25519(self.signer.public_id, message + b'x', signature))
+        reloaded = load_signer(self.signer.export_private())
+        self.assertEqual(reloaded.public_id, self.signer.public_id)
+        self.assertTrue(reloaded.verify(message, signature))
+
+    def test_batch_sign_preserves_order(self):
+        txs = [{**self.tx, 'amount': i} for i in range(150)]
+        signatures = asyncio.run(sign_batch(self.signer, txs))
+        self.assertEqual(len(signatures), 150)
+        self.assertTrue(all(self.signer.verify(encode_transaction(tx), sig) for tx, sig in zip(txs, signatures)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from src.hyper_core.transaction_store import LedgerTransactionStore, SQLiteTransactionStore, TransactionLog
+
+class StoreContract:
+    def make_store(self, directory):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.log = TransactionLog(self.make_store(self.dir))
+        self.log.extend({'sender': 'pi', 'recipient': f"node_{i % 3}", 'amount': i, 'source': 'mining' if i % 2 else 'p2p', 'timestamp': float(i)} for i in range(10))
+
+    def tearDown(self):
+        self.log.store.close()
+
+    def test_list_view(self):
+        self.assertEqual(len(self.log), 10)
+        self.assertEqual(self.log[-1]['amount'], 9)
+        self.assertEqual([tx['amount'] for tx in self.log[-3:]], [7, 8, 9])
+        self.assertEqual([tx['amount'] for tx in self.log.recent(2)], [8, 9])
+        self.assertEqual(sum(tx['amount'] for tx in self.log), 45)
+
+    def test_filtered_cursor_paging(self):
+        rows, cursor = self.log.query(limit=2, recipient='node_1')
+        self.assertEqual([tx['amount'] for tx in rows], [1, 4])
+        rows, cursor = self.log.query(cursor, limit=2, recipient='node_1')
+        self.assertEqual([tx['amount'] for tx in rows], [7])
+        self.assertIsNone(cursor)
+        rows, _ = self.log.query(source='mining', since=3.0, until=8.0)
+        self.assertEqual([tx['amount'] for tx in rows], [3, 5, 7])
+
+    def test_clear(self):
+        self.log.clear()
+        self.assertEqual(len(self.log), 0)
+        self.log.append({'amount': 1})
+        self.assertEqual(self.log[0], {'amount': 1})
+
+class TestLedgerTransactionStore(StoreContract, unittest.TestCase):
+    def make_store(self, directory):
+        return LedgerTransactionStore(os.path.join(directory, 'tx.wal'), os.path.join(directory, 'tx.json'))
+
+class TestSQLiteTransactionStore(StoreContract, unittest.TestCase):
+    def make_store(self, directory):
+        return SQLiteTransactionStore(os.path.join(directory, 'tx.db'))
+
+    def test_reopen_keeps_history(self):
+        self.log.store.close()
+        self.log = TransactionLog(self.make_store(self.dir))
+        self.assertEqual(len(self.log), 10)
+        self.assertEqual(self.log[3]['amount'], 3)
+
+if __name__ == '__main__':
+    unittest.main()